@@ -1,11 +1,14 @@
 """
 Synthesis.MCP Bridge
 Connects Unity MCP servers to Synthesis.Pro's Python backend
+
+MCP servers run as a supervised pool of long-lived subprocesses
+(mcp_pool.py), so execution requests reuse a ready server instead of
+paying spawn and handshake costs, and fail fast if a server died.
 """
 
 import asyncio
 import json
-import subprocess
 from pathlib import Path
 from typing import Optional, Dict, Any
 import sys
@@ -14,6 +17,8 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "Server"))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "RAG" / "core"))
 
+from mcp_pool import MCPServerPool, MCPServerError
+
 
 class MCPBridge:
     """Bridge between Synthesis.Pro and Unity MCP servers"""
@@ -25,36 +30,47 @@ class MCPBridge:
         with open(config_path, 'r') as f:
             self.config = json.load(f)
 
-        self.servers = {}
+        self.pool = MCPServerPool(self.config['servers'])
         self.rag = None
 
-    async def start_mcp_server(self, server_name: str):
-        """Start an MCP server subprocess"""
+    @property
+    def servers(self) -> Dict[str, Any]:
+        """Started servers: name -> pool metrics"""
+        return self.pool.metrics()
+
+    async def start_mcp_server(self, server_name: str) -> bool:
+        """
+        Start an MCP server (supervised; restarted automatically if it dies)
+
+        Returns:
+            True if the server is ready
+        """
         server_config = self.config['servers'].get(server_name)
 
         if not server_config or not server_config.get('enabled'):
             print(f"[MCP] Server {server_name} not enabled")
-            return None
+            return False
 
         print(f"[MCP] Starting {server_name} server...")
 
-        env = {**subprocess.os.environ, **server_config.get('env', {})}
-
-        process = await asyncio.create_subprocess_exec(
-            server_config['command'],
-            *server_config['args'],
-            env=env,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-
-        self.servers[server_name] = {
-            'process': process,
-            'config': server_config
-        }
-
-        print(f"[MCP] {server_name} started (PID: {process.pid})")
-        return process
+        timeout = float(server_config.get('startup_timeout', 60))
+        ready = await self.pool.start_server(server_name, wait=True, timeout=timeout)
+        if not ready:
+            print(f"[MCP] {server_name} not ready after {timeout:.0f}s (still retrying in the background)")
+        return ready
+
+    def _csharp_tool(self, server_name: str) -> Optional[str]:
+        """Tool that executes C# on a server (config 'csharp_tool', else discovered)"""
+        configured = self.config['servers'][server_name].get('csharp_tool')
+        if configured:
+            return configured
+
+        names = [tool.get('name', '') for tool in self.pool.tools(server_name)]
+        for name in names:
+            lowered = name.lower()
+            if 'execute' in lowered and ('csharp' in lowered or 'code' in lowered or 'script' in lowered):
+                return name
+        return None
 
     async def execute_csharp(self, code: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -67,7 +83,7 @@ class MCPBridge:
         Returns:
             Execution result with success status and output
         """
-        if 'arodoid' not in self.servers:
+        if 'arodoid' not in self.pool.processes:
             return {
                 'success': False,
                 'error': 'Arodoid MCP server not running'
@@ -86,11 +102,29 @@ class MCPBridge:
         if self.rag and self.config['integration'].get('log_executions'):
             await self._log_execution(code, context)
 
-        # TODO: Implement actual MCP protocol communication
-        # For now, return structure
+        timeout = float(self.config['integration'].get('execution_timeout', 30))
+        try:
+            tool = self._csharp_tool('arodoid')
+            if tool is None:
+                return {
+                    'success': False,
+                    'error': 'Arodoid MCP server has no C# execution tool (set "csharp_tool" in mcp_config.json)'
+                }
+
+            result = await self.pool.call_tool('arodoid', tool, {'code': code}, timeout=timeout)
+        except MCPServerError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+        # MCP tool results: {"content": [{"type": "text", "text": ...}], "isError": bool}
+        content = (result or {}).get('content', [])
+        output = "\n".join(item.get('text', '') for item in content if item.get('type') == 'text')
+
         return {
-            'success': True,
-            'output': 'Execution placeholder - MCP protocol implementation needed',
+            'success': not (result or {}).get('isError', False),
+            'output': output,
             'context': context
         }
 
@@ -167,10 +201,9 @@ class MCPBridge:
         """Stop all MCP servers"""
         print("\n[MCP] Stopping servers...")
 
-        for server_name, server_data in self.servers.items():
-            process = server_data['process']
-            process.terminate()
-            await process.wait()
+        names = list(self.pool.processes)
+        await self.pool.stop()
+        for server_name in names:
             print(f"[MCP] {server_name} stopped")
 
 
@@ -189,6 +222,7 @@ async def main():
 
         result = await bridge.execute_csharp(test_code, context={'test': True})
         print(f"\n[TEST] Execution result: {result}")
+        print(f"[TEST] Servers: {json.dumps(bridge.servers, indent=2)}")
 
         # Keep running
         print("\n[MCP] Press Ctrl+C to stop")
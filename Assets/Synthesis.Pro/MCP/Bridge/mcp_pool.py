@@ -0,0 +1,520 @@
+"""
+Synthesis.MCP Server Pool
+Supervised, long-lived MCP server subprocesses spoken to over stdio
+
+Starting an MCP server (npx + Node + the Unity handshake) takes seconds,
+so the pool starts each configured server once, keeps it running and
+sends every request over the same stdin/stdout pipe:
+
+- Handshake (initialize + notifications/initialized) before a process
+  is marked ready; tools/list is cached
+- Requests are multiplexed by JSON-RPC id, so concurrent callers share
+  one process without waiting on each other
+- A supervisor restarts crashed or unresponsive processes with
+  exponential backoff and pings idle ones
+- Pending requests fail immediately when their process dies instead of
+  hanging until a timeout
+- Per-server latency metrics (count, errors, timeouts, p50/p95/max)
+
+Protocol: newline-delimited JSON-RPC 2.0 (MCP stdio transport).
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import shutil
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+MCP_PROTOCOL_VERSION = "2024-11-05"
+CLIENT_INFO = {"name": "synthesis-mcp-bridge", "version": "1.0"}
+
+# Largest stdout line accepted from a server (tool results can be large)
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+class MCPServerError(Exception):
+    """Raised when an MCP server cannot serve a request"""
+    pass
+
+
+class MCPServerProcess:
+    """One MCP server subprocess and the requests in flight on it"""
+
+    # States
+    STARTING = "starting"
+    READY = "ready"
+    FAILED = "failed"      # Output closed; waiting for the supervisor to restart it
+    STOPPED = "stopped"
+
+    def __init__(self, name: str, config: Dict[str, Any], index: int = 0):
+        self.name = name
+        self.config = config
+        self.index = index
+        self.state = self.STOPPED
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.tools: List[Dict[str, Any]] = []
+        self.started_at: Optional[float] = None
+        self.last_response: Optional[float] = None
+
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._write_lock = asyncio.Lock()
+        self._tasks: List[asyncio.Task] = []
+        self.stderr_tail: deque = deque(maxlen=50)
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}#{self.index}"
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self, startup_timeout: float = 60.0):
+        """
+        Spawn the server and complete the MCP handshake
+
+        Raises:
+            MCPServerError: Spawn or handshake failed
+        """
+        self.state = self.STARTING
+        self.started_at = None
+        command = self.config['command']
+        # npx is npx.cmd on Windows, which exec() won't find by bare name
+        executable = shutil.which(command) or command
+        env = {**os.environ, **self.config.get('env', {})}
+
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                executable,
+                *self.config.get('args', []),
+                env=env,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=MAX_LINE_BYTES
+            )
+        except OSError as e:
+            self.state = self.STOPPED
+            raise MCPServerError(f"{self.label}: could not start {command}: {e}")
+
+        self.started_at = time.monotonic()
+        self._tasks = [
+            asyncio.ensure_future(self._read_stdout()),
+            asyncio.ensure_future(self._drain_stderr())
+        ]
+
+        try:
+            await self.request("initialize", {
+                "protocolVersion": MCP_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": CLIENT_INFO
+            }, timeout=startup_timeout)
+            await self.notify("notifications/initialized")
+
+            tools = await self.request("tools/list", timeout=startup_timeout)
+            self.tools = (tools or {}).get('tools', [])
+        except MCPServerError:
+            await self.stop()
+            raise
+
+        self.state = self.READY
+
+    async def request(self, method: str, params: Optional[Dict[str, Any]] = None,
+                      timeout: float = 30.0) -> Any:
+        """
+        Send a request and wait for its response
+
+        Raises:
+            MCPServerError: Process died, timed out or returned an error
+        """
+        if not self.is_alive():
+            raise MCPServerError(f"{self.label} is not running")
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+
+        try:
+            await self._write(message)
+            response = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise MCPServerError(f"{self.label}: {method} timed out after {timeout:g}s")
+        finally:
+            self._pending.pop(request_id, None)
+
+        if response.get('error'):
+            error = response['error']
+            raise MCPServerError(f"{self.label}: {method} failed: {error.get('message', error)}")
+        return response.get('result')
+
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """Send a notification (no response)"""
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        await self._write(message)
+
+    async def _write(self, message: Dict[str, Any]):
+        data = json.dumps(message).encode('utf-8') + b"\n"
+        async with self._write_lock:
+            try:
+                self.process.stdin.write(data)
+                await self.process.stdin.drain()
+            except (ConnectionError, BrokenPipeError, AttributeError) as e:
+                raise MCPServerError(f"{self.label}: write failed: {e}")
+
+    async def _read_stdout(self):
+        """Dispatch responses to waiting requests until the process exits"""
+        try:
+            while True:
+                line = await self.process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    # Servers sometimes print banners to stdout
+                    self.stderr_tail.append(line.decode('utf-8', 'replace').rstrip())
+                    continue
+                if not isinstance(message, dict):
+                    continue
+
+                if 'method' in message:
+                    await self._handle_server_message(message)
+                    continue
+
+                future = self._pending.get(message.get('id'))
+                if future and not future.done():
+                    future.set_result(message)
+                self.last_response = time.monotonic()
+        except (asyncio.CancelledError, ValueError):
+            pass
+        finally:
+            self._fail_pending(f"{self.label} exited")
+            # No response can arrive any more: take it out of rotation now,
+            # not when the supervisor notices the exit
+            if self.state == self.READY:
+                self.state = self.FAILED
+            # Unreadable output (e.g. an oversized line): let the supervisor restart it
+            if self.state != self.STOPPED and self.is_alive():
+                self.process.kill()
+
+    async def _handle_server_message(self, message: Dict[str, Any]):
+        """Answer server-to-client requests (notifications need no answer)"""
+        if 'id' not in message:
+            return
+        if message['method'] == 'ping':
+            reply = {"jsonrpc": "2.0", "id": message['id'], "result": {}}
+        else:
+            reply = {"jsonrpc": "2.0", "id": message['id'],
+                     "error": {"code": -32601, "message": f"Method not supported: {message['method']}"}}
+        try:
+            await self._write(reply)
+        except MCPServerError:
+            pass
+
+    async def _drain_stderr(self):
+        """Keep stderr flowing (a full pipe would block the server) and keep the tail"""
+        try:
+            while True:
+                line = await self.process.stderr.readline()
+                if not line:
+                    return
+                self.stderr_tail.append(line.decode('utf-8', 'replace').rstrip())
+        except (asyncio.CancelledError, ValueError):
+            pass
+
+    def _fail_pending(self, reason: str):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(MCPServerError(reason))
+        self._pending.clear()
+
+    async def stop(self, timeout: float = 5.0):
+        """Terminate the process (kill if it doesn't exit in time)"""
+        self.state = self.STOPPED
+        if self.is_alive():
+            try:
+                self.process.stdin.close()
+                self.process.terminate()
+                await asyncio.wait_for(self.process.wait(), timeout)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+            except ProcessLookupError:
+                pass
+
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._fail_pending(f"{self.label} stopped")
+
+
+class LatencyStats:
+    """Request latency counters for one server"""
+
+    def __init__(self, window: int = 200):
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: deque = deque(maxlen=window)
+
+    def record(self, seconds: float, error: Optional[Exception] = None):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+        if error is not None:
+            self.errors += 1
+            if "timed out" in str(error):
+                self.timeouts += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.recent)
+
+        def percentile(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+        return {
+            'requests': self.count,
+            'errors': self.errors,
+            'timeouts': self.timeouts,
+            'avg_ms': (self.total / self.count * 1000) if self.count else 0.0,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'max_ms': self.max * 1000
+        }
+
+
+class MCPServerPool:
+    """
+    Long-lived MCP server processes, supervised and shared by all callers.
+
+    Server config (mcp_config.json "servers" entries) may add:
+        pool_size        - processes per server (default 1)
+        startup_timeout  - handshake timeout in seconds (default 60)
+    """
+
+    def __init__(self, servers: Dict[str, Dict[str, Any]], health_interval: float = 15.0,
+                 probe_timeout: float = 5.0, max_backoff: float = 60.0):
+        """
+        Args:
+            servers: Server name -> config (command, args, env, ...)
+            health_interval: Seconds between readiness probes of idle processes
+            probe_timeout: Seconds a ping may take before the process is restarted
+            max_backoff: Longest wait between restart attempts
+        """
+        self.server_configs = servers
+        self.health_interval = health_interval
+        self.probe_timeout = probe_timeout
+        self.max_backoff = max_backoff
+
+        self.processes: Dict[str, List[MCPServerProcess]] = {}
+        self.latency: Dict[str, LatencyStats] = {}
+        self.restarts: Dict[str, int] = {}
+        self._supervisors: List[asyncio.Task] = []
+        self._ready_events: Dict[str, asyncio.Event] = {}
+        self._closed = False
+
+    async def start_server(self, name: str, wait: bool = True, timeout: float = 60.0) -> bool:
+        """
+        Start (and supervise) a server's processes
+
+        Args:
+            name: Server name from the config
+            wait: Wait until at least one process is ready
+            timeout: Seconds to wait
+
+        Returns:
+            True if a process is ready (or wait=False)
+        """
+        config = self.server_configs.get(name)
+        if not config:
+            raise MCPServerError(f"Unknown MCP server: {name}")
+
+        if name not in self.processes:
+            size = max(1, int(config.get('pool_size', 1)))
+            self.processes[name] = [MCPServerProcess(name, config, i) for i in range(size)]
+            self.latency[name] = LatencyStats()
+            self.restarts[name] = 0
+            self._ready_events[name] = asyncio.Event()
+            for process in self.processes[name]:
+                self._supervisors.append(asyncio.ensure_future(self._supervise(process)))
+
+        if not wait:
+            return True
+        try:
+            await asyncio.wait_for(self._ready_events[name].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _supervise(self, proc: MCPServerProcess):
+        """Keep one process running: start, probe, restart with backoff"""
+        failures = 0
+        startup_timeout = float(proc.config.get('startup_timeout', 60))
+
+        while not self._closed:
+            try:
+                await proc.start(startup_timeout)
+                print(f"[MCP] {proc.label} ready (PID: {proc.process.pid}, {len(proc.tools)} tools)")
+                self._update_ready(proc.name)
+
+                await self._watch(proc)
+            except MCPServerError as e:
+                print(f"[MCP] {e}")
+            except asyncio.CancelledError:
+                break
+
+            # Stop first: while it still counts as ready, callers waiting
+            # for a ready process would be woken only to find none
+            await proc.stop()
+            self._update_ready(proc.name)
+            if self._closed:
+                break
+
+            # Healthy for a while: restart promptly; crash-looping: back off
+            healthy_for = time.monotonic() - (proc.started_at or time.monotonic())
+            failures = 0 if healthy_for > 60 else failures + 1
+            delay = min(self.max_backoff, 0.5 * 2 ** failures)
+
+            if proc.stderr_tail:
+                print(f"[MCP] {proc.label} stderr: {proc.stderr_tail[-1]}")
+            print(f"[MCP] Restarting {proc.label} in {delay:.1f}s")
+            self.restarts[proc.name] += 1
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                break
+
+        await proc.stop()
+
+    async def _watch(self, proc: MCPServerProcess):
+        """Return when the process exits or stops answering pings"""
+        while not self._closed:
+            try:
+                await asyncio.wait_for(asyncio.shield(proc.process.wait()), self.health_interval)
+                print(f"[MCP] {proc.label} exited (code {proc.process.returncode})")
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            # Busy processes are evidently alive; only probe idle ones
+            idle_for = time.monotonic() - (proc.last_response or 0)
+            if proc.in_flight or idle_for < self.health_interval:
+                continue
+            try:
+                await proc.request("ping", timeout=self.probe_timeout)
+            except MCPServerError as e:
+                print(f"[MCP] {proc.label} failed readiness probe: {e}")
+                return
+
+    def _update_ready(self, name: str):
+        event = self._ready_events.get(name)
+        if event is None:
+            return
+        if any(p.state == MCPServerProcess.READY for p in self.processes.get(name, [])):
+            event.set()
+        else:
+            event.clear()
+
+    def _pick(self, name: str) -> Optional[MCPServerProcess]:
+        """Least busy ready process of a server"""
+        ready = [p for p in self.processes.get(name, []) if p.state == MCPServerProcess.READY and p.is_alive()]
+        return min(ready, key=lambda p: p.in_flight) if ready else None
+
+    async def request(self, name: str, method: str, params: Optional[Dict[str, Any]] = None,
+                      timeout: float = 30.0, wait_ready: float = 10.0) -> Any:
+        """
+        Send a request to a server
+
+        Args:
+            name: Server name
+            method: JSON-RPC method
+            params: Method params
+            timeout: Response timeout
+            wait_ready: Seconds to wait for a (re)starting server to become ready
+
+        Raises:
+            MCPServerError: Server not running/ready, timed out or returned an error
+        """
+        if name not in self.processes:
+            raise MCPServerError(f"MCP server {name} not running")
+
+        proc = self._pick(name)
+        deadline = time.monotonic() + wait_ready
+        while proc is None and time.monotonic() < deadline:
+            try:
+                await asyncio.wait_for(self._ready_events[name].wait(), deadline - time.monotonic())
+            except asyncio.TimeoutError:
+                break
+            proc = self._pick(name)
+            if proc is None:
+                # Still flagged ready by a process that just died: let the supervisor catch up
+                await asyncio.sleep(0.05)
+        if proc is None:
+            raise MCPServerError(f"MCP server {name} is not ready")
+
+        start = time.perf_counter()
+        try:
+            result = await proc.request(method, params, timeout)
+        except MCPServerError as e:
+            self.latency[name].record(time.perf_counter() - start, e)
+            raise
+        self.latency[name].record(time.perf_counter() - start)
+        return result
+
+    async def call_tool(self, name: str, tool: str, arguments: Dict[str, Any], timeout: float = 30.0) -> Any:
+        """tools/call on a server"""
+        return await self.request(name, "tools/call", {"name": tool, "arguments": arguments}, timeout)
+
+    def tools(self, name: str) -> List[Dict[str, Any]]:
+        """Tools advertised by a server (from the handshake)"""
+        proc = self._pick(name)
+        return proc.tools if proc else []
+
+    def is_ready(self, name: str) -> bool:
+        return self._pick(name) is not None
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-server process state, restarts and request latency"""
+        result = {}
+        for name, procs in self.processes.items():
+            result[name] = {
+                'processes': [{
+                    'index': p.index,
+                    'state': p.state,
+                    'pid': p.process.pid if p.is_alive() else None,
+                    'in_flight': p.in_flight,
+                    'uptime_s': round(time.monotonic() - p.started_at, 1) if p.is_alive() and p.started_at else 0
+                } for p in procs],
+                'restarts': self.restarts.get(name, 0),
+                'latency': self.latency[name].to_dict()
+            }
+        return result
+
+    async def stop(self):
+        """Stop supervision and all processes"""
+        self._closed = True
+        for task in self._supervisors:
+            task.cancel()
+        await asyncio.gather(*self._supervisors, return_exceptions=True)
+        self._supervisors = []
+        for procs in self.processes.values():
+            for proc in procs:
+                await proc.stop()
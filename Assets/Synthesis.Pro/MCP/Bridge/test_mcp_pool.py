@@ -0,0 +1,139 @@
+"""
+Tests for MCPServerPool (handshake, multiplexing, supervision)
+A small Python script stands in for the MCP server on stdio
+
+    python -m pytest test_mcp_pool.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from mcp_pool import MCPServerError, MCPServerPool
+
+STUB_SERVER = r'''
+import json, os, sys, threading, time
+
+print("stub MCP server starting")            # Banner on stdout (not JSON)
+sys.stdout.flush()
+lock = threading.Lock()
+
+def reply(message, result):
+    with lock:
+        sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}) + "\n")
+        sys.stdout.flush()
+
+def slow(message, seconds):
+    time.sleep(seconds)
+    reply(message, {"slept": seconds})
+
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+    message = json.loads(line)
+    if "id" not in message:
+        continue
+    method = message["method"]
+    if method == "initialize":
+        reply(message, {"protocolVersion": "2024-11-05", "serverInfo": {"name": "stub"}})
+    elif method == "tools/list":
+        reply(message, {"tools": [{"name": "execute_csharp"}, {"name": "echo"}]})
+    elif method == "ping":
+        if not os.environ.get("STUB_IGNORE_PING"):
+            reply(message, {})
+    elif method == "tools/call":
+        name, arguments = message["params"]["name"], message["params"]["arguments"]
+        if name == "crash":
+            os._exit(3)
+        elif name == "hang":
+            pass
+        elif name == "sleep":
+            threading.Thread(target=slow, args=(message, arguments["seconds"])).start()
+        else:
+            reply(message, {"echo": arguments, "pid": os.getpid()})
+'''
+
+
+def _run(test, tmp_path, **config):
+    script = tmp_path / "stub_server.py"
+    script.write_text(STUB_SERVER, encoding="utf-8")
+
+    async def run():
+        pool = MCPServerPool({"stub": {"command": sys.executable, "args": [str(script)], **config}},
+                             health_interval=0.2, probe_timeout=0.5)
+        try:
+            assert await pool.start_server("stub", timeout=10)
+            await test(pool)
+        finally:
+            await pool.stop()
+
+    asyncio.run(asyncio.wait_for(run(), timeout=60))
+
+
+def test_handshake_and_multiplexed_requests(tmp_path):
+    """Concurrent calls share one process; slow calls do not hold up fast ones"""
+    async def test(pool):
+        assert [tool["name"] for tool in pool.tools("stub")] == ["execute_csharp", "echo"]
+
+        slow = asyncio.ensure_future(pool.call_tool("stub", "sleep", {"seconds": 1.0}))
+        start = time.monotonic()
+        results = await asyncio.gather(*(pool.call_tool("stub", "echo", {"n": i}) for i in range(10)))
+        assert [r["echo"]["n"] for r in results] == list(range(10))
+        assert time.monotonic() - start < 0.9 and not slow.done()
+        assert len({r["pid"] for r in results}) == 1
+        assert (await slow) == {"slept": 1.0}
+
+        metrics = pool.metrics()["stub"]
+        assert metrics["latency"]["requests"] == 11 and metrics["restarts"] == 0
+
+        try:
+            await pool.request("other", "tools/list")
+        except MCPServerError:
+            pass
+        else:
+            raise AssertionError("unknown server accepted")
+
+    _run(test, tmp_path)
+
+
+def test_child_death_fails_pending_and_restarts(tmp_path):
+    """Requests in flight fail as soon as the process dies; the supervisor starts a new one"""
+    async def test(pool):
+        first_pid = (await pool.call_tool("stub", "echo", {}))["pid"]
+        hanging = asyncio.ensure_future(pool.call_tool("stub", "hang", {}, timeout=30))
+        await asyncio.sleep(0.1)
+
+        start = time.monotonic()
+        for call in (pool.call_tool("stub", "crash", {}), hanging):
+            try:
+                await call
+            except MCPServerError:
+                pass
+            else:
+                raise AssertionError("request on a dead process succeeded")
+        assert time.monotonic() - start < 5
+
+        result = await pool.call_tool("stub", "echo", {}, timeout=5)  # Waits for the restart
+        assert result["pid"] != first_pid
+        assert pool.restarts["stub"] == 1
+        assert pool.metrics()["stub"]["latency"]["errors"] == 2
+
+    _run(test, tmp_path)
+
+
+def test_unresponsive_process_is_restarted(tmp_path):
+    """An idle process that stops answering pings is replaced"""
+    async def test(pool):
+        first_pid = (await pool.call_tool("stub", "echo", {}))["pid"]
+        deadline = time.monotonic() + 15
+        while pool.restarts["stub"] == 0 and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        assert pool.restarts["stub"] >= 1
+        assert await pool.start_server("stub", timeout=10)
+        assert (await pool.call_tool("stub", "echo", {}))["pid"] != first_pid
+
+    _run(test, tmp_path, env={"STUB_IGNORE_PING": "1"})
@@ -0,0 +1,195 @@
+"""
+Synthesis.Pro RAG Client
+LightweightRAG API backed by the shared RAG host (rag_host.py)
+
+Importing this module is cheap (no numpy, torch or model), so short
+CLI tools start instantly once a host is running.
+
+    from rag_client import connect_rag
+    rag = connect_rag(database=..., private_database=...)
+    rag.search("NullReferenceException", top_k=5)
+
+connect_rag() returns a RemoteRAG when the host is reachable (starting
+it if needed) and falls back to an in-process SynthesisRAG otherwise.
+Set SYNTHESIS_RAG_HOST=0 to always use the in-process engine.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+# Server/ for core.local_rpc
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "Server"))
+
+from core.local_rpc import LocalRPCClient, LocalRPCError, ensure_server
+
+RAG_HOST_PORT = int(os.environ.get("SYNTHESIS_RAG_HOST_PORT", "8768"))
+RAG_HOST_SCRIPT = Path(__file__).parent / "rag_host.py"
+
+
+class RemoteRAG:
+    """
+    Drop-in replacement for LightweightRAG that runs on the RAG host.
+
+    Database paths are resolved here (relative to this process's working
+    directory) so every client addresses the same files.
+
+    Each thread gets its own connection, so searches issued from an
+    executor run concurrently on the host instead of queueing on one socket.
+    """
+
+    def __init__(self, database: str = "synthesis_knowledge.db",
+                 private_database: Optional[str] = None,
+                 client: Optional[LocalRPCClient] = None):
+        self.public_database = os.path.abspath(database)
+        self.private_database = os.path.abspath(
+            private_database or f"{database.replace('.db', '')}_private.db"
+        )
+        self._local = threading.local()
+        self._local.client = client or _start_host()
+
+        # Same hook as LightweightRAG: the host's stage timings for each call,
+        # plus the round trip as 'rag_rpc'
+        self.on_timing: Optional[Callable[[str, float], None]] = None
+
+        # Engine cache counters as of the last response (never fetched on read)
+        self.cache_stats: Dict[str, int] = {}
+
+    def _call(self, method: str, **kwargs):
+        request = {
+            "method": method,
+            "database": self.public_database,
+            "private_database": self.private_database,
+            "kwargs": kwargs
+        }
+
+        start = time.perf_counter()
+        client = getattr(self._local, 'client', None)
+        try:
+            if client is None:
+                raise LocalRPCError("No connection for this thread yet")
+            response = client.call(request)
+        except LocalRPCError:
+            # New thread, or host stopped (e.g. idle timeout) - (re)start and retry once
+            client = self._local.client = _start_host()
+            response = client.call(request)
+
+        elapsed = time.perf_counter() - start
+        if self.on_timing:
+            try:
+                for stage, seconds in response.get('timings') or ():
+                    self.on_timing(stage, seconds)
+                self.on_timing('rag_rpc', elapsed)
+            except Exception:
+                pass
+
+        if response.get('cache_stats') is not None:
+            self.cache_stats = response['cache_stats']
+
+        if not response.get('success'):
+            raise RuntimeError(response.get('message', f"RAG host {method} failed"))
+        return response.get('result')
+
+    # ========== LightweightRAG API ==========
+
+    def search(self, query: str, top_k: int = 5, search_type: str = "hybrid",
+               scope: str = "both") -> List[Dict[str, Union[str, float]]]:
+        """Search knowledge base (see LightweightRAG.search)."""
+        return self._call("search", query=query, top_k=top_k, search_type=search_type, scope=scope)
+
+    def add_text(self, text: str, private: bool = True, metadata: Optional[str] = None,
+                 fingerprint: Optional[str] = None) -> bool:
+        """Add text to knowledge base (see LightweightRAG.add_text)."""
+        return self._call("add_text", text=text, private=private, metadata=metadata, fingerprint=fingerprint)
+
+    def add_texts(self, texts: List[str], private: bool = True,
+                  metadata: Union[str, List[Optional[str]], None] = None,
+                  fingerprints: Optional[List[Optional[str]]] = None) -> List[bool]:
+        """Add many texts in one batch (see LightweightRAG.add_texts)."""
+        return self._call("add_texts", texts=texts, private=private, metadata=metadata,
+                          fingerprints=fingerprints)
+
+    @staticmethod
+    def doc_hash(text: str) -> str:
+        """Hash that identifies a stored document (same as LightweightRAG.doc_hash)."""
+        return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Unit-length embeddings for texts (see LightweightRAG.embed)."""
+        return self._call("embed", texts=texts)
+
+    def get_metadata(self, doc_ids: List[int], private: bool = True) -> List[Optional[Dict]]:
+        """Stored metadata for documents (see LightweightRAG.get_metadata)."""
+        return self._call("get_metadata", doc_ids=doc_ids, private=private)
+
+    def get_added_at(self, doc_ids: List[int], private: bool = True) -> List[Optional[str]]:
+        """When documents were stored (see LightweightRAG.get_added_at)."""
+        return self._call("get_added_at", doc_ids=doc_ids, private=private)
+
+    def find_by_fingerprint(self, fingerprint: str, limit: int = 10) -> List[Dict]:
+        """Private documents with a stack fingerprint (see LightweightRAG.find_by_fingerprint)."""
+        return self._call("find_by_fingerprint", fingerprint=fingerprint, limit=limit)
+
+    def record_occurrences(self, counts: Dict[str, int], private: bool = True,
+                           last_seen: Optional[str] = None) -> int:
+        """Count repeats of stored documents (see LightweightRAG.record_occurrences)."""
+        return self._call("record_occurrences", counts=counts, private=private, last_seen=last_seen)
+
+    def add_ai_note(self, note: str, category: str = "general") -> bool:
+        """Add AI internal note to private database."""
+        return self._call("add_ai_note", note=note, category=category)
+
+    def add_project_data(self, data: str, description: str = "") -> bool:
+        """Add project-specific data to private database."""
+        return self._call("add_project_data", data=data, description=description)
+
+    def quick_note(self, note: str) -> bool:
+        """Ultra-fast note taking."""
+        return self._call("quick_note", note=note)
+
+    def log_decision(self, what: str, why: str = "", alternatives: str = "") -> bool:
+        """Log architectural or design decision."""
+        return self._call("log_decision", what=what, why=why, alternatives=alternatives)
+
+    def checkpoint(self, phase: str, status: str, next_steps: str = "") -> bool:
+        """Quick project checkpoint/milestone marker."""
+        return self._call("checkpoint", phase=phase, status=status, next_steps=next_steps)
+
+    def reload(self, database: Optional[str] = None, wait: bool = False) -> bool:
+        """Rebuild host indexes after a database file was replaced."""
+        return self._call("reload", database=os.path.abspath(database) if database else None, wait=wait)
+
+
+def _start_host() -> LocalRPCClient:
+    return ensure_server(RAG_HOST_PORT, [sys.executable, str(RAG_HOST_SCRIPT), "--serve"])
+
+
+def connect_rag(database: str = "synthesis_knowledge.db", private_database: Optional[str] = None,
+                use_host: Optional[bool] = None, **kwargs):
+    """
+    Get a RAG engine for a database pair.
+
+    Args:
+        database: Public database path
+        private_database: Private database path
+        use_host: Use the shared host (default: SYNTHESIS_RAG_HOST env, on unless "0")
+        **kwargs: Passed to SynthesisRAG for the in-process fallback
+
+    Returns:
+        RemoteRAG, or SynthesisRAG if the host is disabled or cannot start
+    """
+    if use_host is None:
+        use_host = os.environ.get("SYNTHESIS_RAG_HOST", "1") != "0"
+
+    if use_host:
+        try:
+            return RemoteRAG(database, private_database)
+        except LocalRPCError as e:
+            print(f"[RAG] Shared host unavailable ({e}) - loading in-process", file=sys.stderr)
+
+    from rag_engine_lite import SynthesisRAG
+    return SynthesisRAG(database=database, private_database=private_database, **kwargs)
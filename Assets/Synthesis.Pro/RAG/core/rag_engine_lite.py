@@ -25,10 +25,14 @@ os.environ['TQDM_DISABLE'] = '1'  # Suppress progress bars
 
 import sqlite3
 import pickle
-from typing import List, Dict, Union, Optional, Tuple
+import threading
+import time
+from typing import List, Dict, Union, Optional, Tuple, Callable
 from pathlib import Path
 from datetime import datetime
+import copy
 import hashlib
+import json
 
 # Check if dependencies are available
 try:
@@ -41,6 +45,32 @@ except ImportError:
     print("Warning: RAG dependencies not available. Install: numpy, bm25s, sentence-transformers")
 
 
+class IndexSnapshot:
+    """
+    In-memory search indexes for one generation of a database file.
+
+    Never mutated after construction: a search holds on to the snapshot it
+    started with, so swapping in a newer one cannot affect it.
+    """
+
+    def __init__(self, generation: Tuple, retriever, doc_ids: List[int], texts: List[str],
+                 vector_ids: List[int], vector_texts: List[str], vectors):
+        self.generation = generation
+        self.retriever = retriever          # BM25 (None if database empty)
+        self.doc_ids = doc_ids
+        self.texts = texts
+        self.vector_ids = vector_ids        # Rows that have embeddings
+        self.vector_texts = vector_texts
+        self.vectors = vectors              # Normalized embedding matrix (or None)
+        self.built_at = time.time()
+
+    def with_generation(self, generation: Tuple) -> 'IndexSnapshot':
+        """Same indexes, valid for another file generation (writes that left them unchanged)."""
+        snapshot = copy.copy(self)
+        snapshot.generation = generation
+        return snapshot
+
+
 class LightweightRAG:
     """
     Fast and reliable RAG engine using BM25S + GTE-Tiny embeddings.
@@ -54,7 +84,8 @@ class LightweightRAG:
         database: str = "synthesis_knowledge.db",
         private_database: Optional[str] = None,
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
-        cache_dir: Optional[str] = None
+        cache_dir: Optional[str] = None,
+        model=None
     ):
         """
         Initialize lightweight RAG engine.
@@ -68,6 +99,7 @@ class LightweightRAG:
                        - "BAAI/bge-small-en-v1.5" (~130MB, better quality)
                        - "thenlper/gte-small" (~130MB, good balance)
             cache_dir: Directory to cache models and indexes
+            model: Already-loaded SentenceTransformer to share (skips loading)
         """
         if not DEPS_AVAILABLE:
             raise RuntimeError("Missing dependencies. Install: pip install numpy bm25s sentence-transformers")
@@ -91,13 +123,38 @@ class LightweightRAG:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # Load or create embedding model
-        print(f"Loading embedding model: {model_name}")
-        self.model = SentenceTransformer(model_name, cache_folder=str(self.cache_dir))
-        print(f"Model loaded: {model_name}")
+        if model is not None:
+            self.model = model
+        else:
+            print(f"Loading embedding model: {model_name}")
+            self.model = SentenceTransformer(model_name, cache_folder=str(self.cache_dir))
+            print(f"Model loaded: {model_name}")
+
+        # Search indexes per database path (built lazily, swapped atomically)
+        self.snapshots: Dict[str, IndexSnapshot] = {}
+        self._reloading: Dict[str, threading.Event] = {}  # Set when that rebuild finishes
+        self._epochs: Dict[str, int] = {}  # Bumped by our own writes (see _install_snapshot)
+        self._reload_lock = threading.Lock()
+
+        # Instrumentation: cache hit counters and optional timing hook
+        # (servers set on_timing to feed their latency histograms)
+        self.cache_stats = {'bm25_hits': 0, 'bm25_misses': 0, 'reloads': 0}
+        self.on_timing: Optional[Callable[[str, float], None]] = None
+
+    def _record_timing(self, stage: str, start: float):
+        """Report stage duration to on_timing hook (if set)."""
+        if self.on_timing:
+            try:
+                self.on_timing(stage, time.perf_counter() - start)
+            except Exception:
+                pass
 
-        # BM25 indexes (loaded lazily)
-        self.bm25_indexes = {}
-        self.doc_maps = {}
+    def _encode(self, text):
+        """Encode text with the embedding model (timed as 'embedding')."""
+        start = time.perf_counter()
+        embedding = self.model.encode(text)
+        self._record_timing('embedding', start)
+        return embedding
 
     def _init_database(self, db_path: str):
         """Initialize database schema if needed."""
@@ -121,38 +178,58 @@ class LightweightRAG:
             CREATE INDEX IF NOT EXISTS idx_doc_hash ON documents(doc_hash)
         """)
 
+        # Stack fingerprints of captured errors (private only: the public
+        # database is a verified download and must stay byte-identical)
+        if db_path == self.private_database:
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(documents)")}
+            if 'fingerprint' not in columns:
+                cursor.execute("ALTER TABLE documents ADD COLUMN fingerprint TEXT")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_fingerprint ON documents(fingerprint)
+            """)
+
         conn.commit()
         conn.close()
 
+    @staticmethod
+    def doc_hash(text: str) -> str:
+        """Hash that identifies a stored document (used for deduplication)."""
+        return hashlib.md5(text.encode('utf-8')).hexdigest()
+
     def _get_doc_hash(self, text: str) -> str:
         """Generate hash for deduplication."""
-        return hashlib.md5(text.encode('utf-8')).hexdigest()
+        return self.doc_hash(text)
+
+    @staticmethod
+    def _db_generation(db_path: str) -> Tuple:
+        """
+        Identity of the current database file contents.
 
-    def _build_bm25_index(self, db_path: str) -> Tuple:
-        """Build or load BM25 index for a database."""
+        Changes when the file is replaced (new inode) or written
+        (size/mtime), so a swapped-in download is always noticed.
+        """
+        try:
+            st = os.stat(db_path)
+        except OSError:
+            return (None,)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _build_bm25_index(self, db_path: str, generation: Tuple, doc_ids: List[int], texts: List[str]):
+        """Build or load BM25 index for a database generation."""
         cache_file = self.cache_dir / f"{Path(db_path).stem}_bm25.pkl"
 
-        # Try to load cached index
+        # Try to load cached index (only valid for the same file generation)
         if cache_file.exists():
             try:
                 with open(cache_file, 'rb') as f:
                     data = pickle.load(f)
-                    return data['index'], data['doc_ids'], data['texts']
+                if data.get('generation') == generation and data['doc_ids'] == doc_ids:
+                    return data['index']
             except Exception as e:
                 print(f"Warning: Could not load cached BM25 index: {e}")
 
-        # Build new index
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, content FROM documents ORDER BY id")
-        rows = cursor.fetchall()
-        conn.close()
-
-        if not rows:
-            return None, [], []
-
-        doc_ids = [row[0] for row in rows]
-        texts = [row[1] for row in rows]
+        if not texts:
+            return None
 
         # Tokenize for BM25
         corpus_tokens = bm25s.tokenize(texts, stopwords="en")
@@ -161,20 +238,161 @@ class LightweightRAG:
         retriever = bm25s.BM25()
         retriever.index(corpus_tokens)
 
-        # Cache for next time
+        # Cache for next time (write-then-rename so other processes never read half a file)
         try:
-            with open(cache_file, 'wb') as f:
+            temp_file = cache_file.with_suffix('.pkl.tmp')
+            with open(temp_file, 'wb') as f:
                 pickle.dump({
+                    'generation': generation,
                     'index': retriever,
-                    'doc_ids': doc_ids,
-                    'texts': texts
+                    'doc_ids': doc_ids
                 }, f)
+            os.replace(temp_file, cache_file)
         except Exception as e:
             print(f"Warning: Could not cache BM25 index: {e}")
 
-        return retriever, doc_ids, texts
+        return retriever
+
+    def _build_snapshot(self, db_path: str) -> IndexSnapshot:
+        """Read a database once and build BM25 + vector indexes from it."""
+        self._init_database(db_path)  # Recreate schema if the file was deleted
+        generation = self._db_generation(db_path)
 
-    def add_text(self, text: str, private: bool = True, metadata: Optional[str] = None) -> bool:
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute("SELECT id, content, embedding FROM documents ORDER BY id").fetchall()
+        finally:
+            conn.close()
+
+        doc_ids = [row[0] for row in rows]
+        texts = [row[1] for row in rows]
+        retriever = self._build_bm25_index(db_path, generation, doc_ids, texts)
+
+        vector_ids, vector_texts, embeddings = [], [], []
+        for row_id, content, embedding_bytes in rows:
+            if embedding_bytes is not None:
+                vector_ids.append(row_id)
+                vector_texts.append(content)
+                embeddings.append(pickle.loads(embedding_bytes))
+
+        vectors = None
+        if embeddings:
+            vectors = np.vstack(embeddings).astype(np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            vectors /= norms
+
+        return IndexSnapshot(generation, retriever, doc_ids, texts, vector_ids, vector_texts, vectors)
+
+    def _get_snapshot(self, db_path: str) -> IndexSnapshot:
+        """
+        Current indexes for a database.
+
+        If the file changed underneath us (e.g. a new public database was
+        swapped in by DatabaseManager), the old snapshot keeps serving while
+        a new one is built in the background. Only a database with no
+        snapshot at all is built synchronously.
+        """
+        snapshot = self.snapshots.get(db_path)
+
+        if snapshot is None:
+            self.cache_stats['bm25_misses'] += 1
+            epoch = self._epochs.get(db_path, 0)
+            snapshot = self._build_snapshot(db_path)
+            self._install_snapshot(db_path, snapshot, epoch)
+            return snapshot
+
+        self.cache_stats['bm25_hits'] += 1
+        if snapshot.generation != self._db_generation(db_path):
+            self.reload(db_path)
+
+        return snapshot
+
+    def reload(self, database: Optional[str] = None, wait: bool = False) -> bool:
+        """
+        Rebuild indexes after a database file was replaced or changed.
+
+        Searches keep using the previous snapshot until the new one is
+        ready, then it is swapped in atomically. The embedding model is
+        not touched, so this is far cheaper than a restart.
+
+        Args:
+            database: Database path (default: public database)
+            wait: Block until the new indexes are in place (waiting for a
+                  rebuild already in progress, then rebuilding again if it
+                  started before the file last changed)
+
+        Returns:
+            False if a reload of this database was already running (wait=False only)
+        """
+        db_path = database or self.public_database
+
+        while True:
+            with self._reload_lock:
+                running = self._reloading.get(db_path)
+                if running is None:
+                    done = self._reloading[db_path] = threading.Event()
+                    break
+            if not wait:
+                return False
+            running.wait()
+            snapshot = self.snapshots.get(db_path)
+            if snapshot is not None and snapshot.generation == self._db_generation(db_path):
+                return True
+
+        def rebuild():
+            try:
+                start = time.perf_counter()
+                epoch = self._epochs.get(db_path, 0)
+                if self._install_snapshot(db_path, self._build_snapshot(db_path), epoch):
+                    self.cache_stats['reloads'] += 1
+                self._record_timing('reload', start)
+            except Exception as e:
+                print(f"Warning: Could not reload indexes for {db_path}: {e}")
+            finally:
+                with self._reload_lock:
+                    del self._reloading[db_path]
+                done.set()
+
+        if wait:
+            rebuild()
+        else:
+            threading.Thread(target=rebuild, name="rag-reload", daemon=True).start()
+        return True
+
+    def _install_snapshot(self, db_path: str, snapshot: IndexSnapshot, epoch: int) -> bool:
+        """
+        Swap in indexes built from the database as of `epoch`.
+
+        A build that started before one of our own writes is dropped, so a
+        slow background rebuild cannot replace the indexes that already
+        include the write (read-your-writes).
+        """
+        with self._reload_lock:
+            if self._epochs.get(db_path, 0) != epoch:
+                return False
+            self.snapshots[db_path] = snapshot
+            return True
+
+    def _invalidate(self, db_path: str):
+        """Drop indexes after our own write (next search rebuilds synchronously)."""
+        with self._reload_lock:
+            self._epochs[db_path] = self._epochs.get(db_path, 0) + 1
+            self.snapshots.pop(db_path, None)
+
+    def _keep_snapshot(self, db_path: str, generation_before: Tuple):
+        """
+        Keep indexes after our own write that only touched metadata.
+
+        The file's new generation is adopted only if the snapshot was
+        current before the write, so other changes still trigger a reload.
+        """
+        snapshot = self.snapshots.get(db_path)
+        if snapshot is not None and snapshot.generation == generation_before:
+            self.snapshots[db_path] = snapshot.with_generation(self._db_generation(db_path))
+
+    def add_text(self, text: str, private: bool = True, metadata: Optional[str] = None,
+                 fingerprint: Optional[str] = None) -> bool:
         """
         Add text to knowledge base.
 
@@ -182,6 +400,7 @@ class LightweightRAG:
             text: Text content to add
             private: If True, adds to private database (default for safety)
             metadata: Optional metadata JSON string
+            fingerprint: Optional stack fingerprint (private database only, see find_by_fingerprint)
 
         Returns:
             Success status
@@ -192,7 +411,7 @@ class LightweightRAG:
         doc_hash = self._get_doc_hash(text)
 
         # Generate embedding
-        embedding = self.model.encode(text)
+        embedding = self._encode(text)
         embedding_bytes = pickle.dumps(embedding)
 
         try:
@@ -200,19 +419,24 @@ class LightweightRAG:
             cursor = conn.cursor()
 
             # Insert (ignore duplicates)
-            cursor.execute("""
-                INSERT OR IGNORE INTO documents (content, embedding, metadata, doc_hash)
-                VALUES (?, ?, ?, ?)
-            """, (text, embedding_bytes, metadata, doc_hash))
+            if private:
+                cursor.execute("""
+                    INSERT OR IGNORE INTO documents (content, embedding, metadata, doc_hash, fingerprint)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (text, embedding_bytes, metadata, doc_hash, fingerprint))
+            else:
+                cursor.execute("""
+                    INSERT OR IGNORE INTO documents (content, embedding, metadata, doc_hash)
+                    VALUES (?, ?, ?, ?)
+                """, (text, embedding_bytes, metadata, doc_hash))
 
             conn.commit()
             rows_affected = cursor.rowcount
             conn.close()
 
-            # Invalidate BM25 cache for this database
-            if database in self.bm25_indexes:
-                del self.bm25_indexes[database]
-                del self.doc_maps[database]
+            # Invalidate indexes for this database (read-your-writes)
+            if rows_affected > 0:
+                self._invalidate(database)
 
             if rows_affected > 0:
                 db_type = "PRIVATE" if private else "PUBLIC"
@@ -225,18 +449,281 @@ class LightweightRAG:
             print(f"Error adding text: {e}")
             return False
 
-    def _search_bm25(self, query: str, db_path: str, top_k: int = 5) -> List[Dict]:
+    def add_texts(self, texts: List[str], private: bool = True,
+                  metadata: Union[str, List[Optional[str]], None] = None,
+                  fingerprints: Optional[List[Optional[str]]] = None) -> List[bool]:
+        """
+        Add many texts with one embedding batch and one transaction.
+
+        Texts already stored (or repeated within the batch) are skipped
+        before embedding.
+
+        Args:
+            texts: Text contents to add
+            private: If True, adds to private database (default for safety)
+            metadata: Optional metadata JSON string for every text, or a list with one per text
+            fingerprints: Optional stack fingerprint per text (private database only)
+
+        Returns:
+            Per text: True if inserted, False if duplicate or failed
+        """
+        results = [False] * len(texts)
+        if not texts:
+            return results
+
+        database = self.private_database if private else self.public_database
+        hashes = [self._get_doc_hash(text) for text in texts]
+        if not isinstance(metadata, list):
+            metadata = [metadata] * len(texts)
+        fingerprints = fingerprints or [None] * len(texts)
+
+        try:
+            conn = sqlite3.connect(database)
+            try:
+                # Hashes already in the database (chunked to stay under SQLite's variable limit)
+                known = set()
+                unique = list(dict.fromkeys(hashes))
+                for i in range(0, len(unique), 500):
+                    chunk = unique[i:i + 500]
+                    rows = conn.execute(
+                        f"SELECT doc_hash FROM documents WHERE doc_hash IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    known.update(row[0] for row in rows)
+
+                new_indexes = []
+                for i, doc_hash in enumerate(hashes):
+                    if doc_hash not in known:
+                        known.add(doc_hash)
+                        new_indexes.append(i)
+
+                if new_indexes:
+                    embeddings = self._encode([texts[i] for i in new_indexes])
+                    with conn:
+                        if private:
+                            conn.executemany("""
+                                INSERT OR IGNORE INTO documents (content, embedding, metadata, doc_hash, fingerprint)
+                                VALUES (?, ?, ?, ?, ?)
+                            """, [
+                                (texts[i], pickle.dumps(embedding), metadata[i], hashes[i], fingerprints[i])
+                                for i, embedding in zip(new_indexes, embeddings)
+                            ])
+                        else:
+                            conn.executemany("""
+                                INSERT OR IGNORE INTO documents (content, embedding, metadata, doc_hash)
+                                VALUES (?, ?, ?, ?)
+                            """, [
+                                (texts[i], pickle.dumps(embedding), metadata[i], hashes[i])
+                                for i, embedding in zip(new_indexes, embeddings)
+                            ])
+                    for i in new_indexes:
+                        results[i] = True
+            finally:
+                conn.close()
+
+        except Exception as e:
+            print(f"Error adding texts: {e}")
+            return [False] * len(texts)
+
+        added = sum(results)
+        if added:
+            self._invalidate(database)
+            db_type = "PRIVATE" if private else "PUBLIC"
+            print(f"Added {added} document(s) to {db_type} database")
+
+        return results
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Unit-length embeddings for texts (one model batch).
+
+        For callers that compare texts themselves, e.g. error clustering.
+        """
+        if not texts:
+            return []
+        vectors = np.asarray(self._encode(list(texts)), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).tolist()
+
+    def get_metadata(self, doc_ids: List[int], private: bool = True) -> List[Optional[Dict]]:
+        """
+        Stored metadata for documents (e.g. search result 'id's).
+
+        Args:
+            doc_ids: Document ids
+            private: If True, reads the private database
+
+        Returns:
+            Per id: metadata dict, or None if missing or not a JSON object
+        """
+        database = self.private_database if private else self.public_database
+        found = {}
+
+        try:
+            conn = sqlite3.connect(database)
+            try:
+                unique = list(dict.fromkeys(doc_ids))
+                for i in range(0, len(unique), 500):
+                    chunk = unique[i:i + 500]
+                    rows = conn.execute(
+                        f"SELECT id, metadata FROM documents WHERE id IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    found.update(rows)
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"Error reading metadata: {e}")
+
+        results = []
+        for doc_id in doc_ids:
+            try:
+                meta = json.loads(found[doc_id]) if found.get(doc_id) else None
+            except ValueError:
+                meta = None
+            results.append(meta if isinstance(meta, dict) else None)
+        return results
+
+    def get_added_at(self, doc_ids: List[int], private: bool = True) -> List[Optional[str]]:
+        """
+        When documents were stored (e.g. for search result 'id's).
+
+        Args:
+            doc_ids: Document ids
+            private: If True, reads the private database
+
+        Returns:
+            Per id: UTC timestamp "YYYY-MM-DD HH:MM:SS", or None if missing
+        """
+        database = self.private_database if private else self.public_database
+        found = {}
+
+        try:
+            conn = sqlite3.connect(database)
+            try:
+                unique = list(dict.fromkeys(doc_ids))
+                for i in range(0, len(unique), 500):
+                    chunk = unique[i:i + 500]
+                    rows = conn.execute(
+                        f"SELECT id, added_at FROM documents WHERE id IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    found.update(rows)
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"Error reading document times: {e}")
+
+        return [found.get(doc_id) for doc_id in doc_ids]
+
+    def find_by_fingerprint(self, fingerprint: str, limit: int = 10) -> List[Dict]:
+        """
+        Private documents stored with a stack fingerprint (same crash),
+        newest first. An index lookup: no embedding, no search indexes.
+
+        Returns:
+            [{'id', 'text', 'metadata' (dict or None), 'added_at'}, ...]
+        """
+        if not fingerprint:
+            return []
+
+        try:
+            conn = sqlite3.connect(self.private_database)
+            try:
+                rows = conn.execute("""
+                    SELECT id, content, metadata, added_at FROM documents
+                    WHERE fingerprint = ? ORDER BY id DESC LIMIT ?
+                """, (fingerprint, limit)).fetchall()
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"Error finding fingerprint: {e}")
+            return []
+
+        results = []
+        for doc_id, content, metadata, added_at in rows:
+            try:
+                meta = json.loads(metadata) if metadata else None
+            except ValueError:
+                meta = None
+            results.append({
+                'id': doc_id,
+                'text': content,
+                'metadata': meta if isinstance(meta, dict) else None,
+                'added_at': added_at
+            })
+        return results
+
+    def record_occurrences(self, counts: Dict[str, int], private: bool = True,
+                           last_seen: Optional[str] = None) -> int:
+        """
+        Count repeats of stored documents without storing them again.
+
+        Adds to the 'occurrences' field of each document's metadata (a
+        document starts at 1) and sets 'last_seen'. Content and embeddings
+        are untouched, so search indexes stay valid.
+
+        Args:
+            counts: Extra occurrences by doc hash (see doc_hash)
+            private: If True, updates the private database
+            last_seen: ISO timestamp of the latest repeat (default: now)
+
+        Returns:
+            Number of documents updated
+        """
+        if not counts:
+            return 0
+
+        database = self.private_database if private else self.public_database
+        last_seen = last_seen or datetime.now().isoformat()
+        updated = 0
+        generation_before = self._db_generation(database)
+
+        try:
+            conn = sqlite3.connect(database)
+            try:
+                with conn:
+                    for doc_hash, count in counts.items():
+                        row = conn.execute(
+                            "SELECT metadata FROM documents WHERE doc_hash = ?", (doc_hash,)
+                        ).fetchone()
+                        if row is None:
+                            continue
+
+                        try:
+                            meta = json.loads(row[0]) if row[0] else {}
+                        except ValueError:
+                            meta = {'note': row[0]}
+                        if not isinstance(meta, dict):
+                            meta = {'value': meta}
+
+                        meta['occurrences'] = int(meta.get('occurrences', 1)) + count
+                        meta['last_seen'] = last_seen
+                        conn.execute(
+                            "UPDATE documents SET metadata = ? WHERE doc_hash = ?",
+                            (json.dumps(meta), doc_hash)
+                        )
+                        updated += 1
+            finally:
+                conn.close()
+
+        except Exception as e:
+            print(f"Error recording occurrences: {e}")
+            return 0
+
+        if updated:
+            self._keep_snapshot(database, generation_before)
+        return updated
+
+    def _search_bm25(self, query: str, snapshot: IndexSnapshot, top_k: int = 5) -> List[Dict]:
         """Search using BM25 keyword matching."""
-        # Get or build index
-        if db_path not in self.bm25_indexes:
-            retriever, doc_ids, texts = self._build_bm25_index(db_path)
-            if retriever is None:
-                return []
-            self.bm25_indexes[db_path] = retriever
-            self.doc_maps[db_path] = (doc_ids, texts)
-        else:
-            retriever = self.bm25_indexes[db_path]
-            doc_ids, texts = self.doc_maps[db_path]
+        start = time.perf_counter()
+
+        retriever = snapshot.retriever
+        if retriever is None:
+            return []
+        doc_ids, texts = snapshot.doc_ids, snapshot.texts
 
         # Tokenize query
         query_tokens = bm25s.tokenize(query, stopwords="en")
@@ -255,43 +742,34 @@ class LightweightRAG:
                 'score': score
             })
 
+        self._record_timing('bm25', start)
         return search_results
 
-    def _search_vector(self, query: str, db_path: str, top_k: int = 5) -> List[Dict]:
+    def _search_vector(self, query: str, snapshot: IndexSnapshot, top_k: int = 5) -> List[Dict]:
         """Search using semantic vector similarity."""
-        # Encode query
-        query_embedding = self.model.encode(query)
-
-        # Get all documents with embeddings
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, content, embedding FROM documents WHERE embedding IS NOT NULL")
-        rows = cursor.fetchall()
-        conn.close()
-
-        if not rows:
+        if snapshot.vectors is None:
             return []
 
-        # Calculate similarities
-        similarities = []
-        for row_id, content, embedding_bytes in rows:
-            doc_embedding = pickle.loads(embedding_bytes)
+        # Encode query
+        query_embedding = np.asarray(self._encode(query), dtype=np.float32)
+        start = time.perf_counter()
 
-            # Cosine similarity
-            similarity = np.dot(query_embedding, doc_embedding) / (
-                np.linalg.norm(query_embedding) * np.linalg.norm(doc_embedding)
-            )
+        # Cosine similarity against the pre-normalized matrix
+        norm = np.linalg.norm(query_embedding)
+        similarities = snapshot.vectors @ (query_embedding / (norm if norm else 1.0))
 
-            similarities.append({
-                'id': row_id,
-                'text': content,
-                'score': float(similarity)
-            })
+        k = min(top_k, len(similarities))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
 
-        # Sort by similarity
-        similarities.sort(key=lambda x: x['score'], reverse=True)
+        results = [{
+            'id': snapshot.vector_ids[i],
+            'text': snapshot.vector_texts[i],
+            'score': float(similarities[i])
+        } for i in top]
 
-        return similarities[:top_k]
+        self._record_timing('vector', start)
+        return results
 
     def _reciprocal_rank_fusion(
         self,
@@ -357,17 +835,20 @@ class LightweightRAG:
         # Search each database
         for source, db_path in databases:
             try:
+                # One snapshot per query, even if a reload swaps mid-search
+                snapshot = self._get_snapshot(db_path)
+
                 if search_type == "hybrid":
                     # Hybrid search with RRF
-                    bm25_results = self._search_bm25(query, db_path, top_k=top_k * 2)
-                    vector_results = self._search_vector(query, db_path, top_k=top_k * 2)
+                    bm25_results = self._search_bm25(query, snapshot, top_k=top_k * 2)
+                    vector_results = self._search_vector(query, snapshot, top_k=top_k * 2)
                     results = self._reciprocal_rank_fusion(bm25_results, vector_results)
 
                 elif search_type == "bm25":
-                    results = self._search_bm25(query, db_path, top_k=top_k)
+                    results = self._search_bm25(query, snapshot, top_k=top_k)
 
                 elif search_type == "vector":
-                    results = self._search_vector(query, db_path, top_k=top_k)
+                    results = self._search_vector(query, snapshot, top_k=top_k)
 
                 else:
                     raise ValueError(f"Unknown search_type: {search_type}")
@@ -0,0 +1,195 @@
+"""
+Synthesis.Pro RAG Host
+One process that owns the embedding model and search indexes
+
+Without it, the WebSocket server, MCP server, rag_bridge and every CLI
+tool each load their own copy of the model and build their own indexes
+over the same database files. The host loads the model once, keeps one
+LightweightRAG per database pair (all sharing that model) and serves
+them to RemoteRAG clients (rag_client.py) over a localhost socket.
+
+All writes go through the host, so they are visible to every reader on
+the next search.
+
+Usage:
+    python rag_host.py --serve     Run in the foreground
+    python rag_host.py --status    Show whether a host is running
+    python rag_host.py --stop      Stop a running host
+
+Clients start the host automatically on first use.
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Server/ for core.local_rpc
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "Server"))
+
+from core.local_rpc import LocalRPCServer, LocalRPCClient, LocalRPCError
+
+# Port 8765 = WebSocket, 8766 = metrics, 8767 = rag_bridge
+RAG_HOST_PORT = int(os.environ.get("SYNTHESIS_RAG_HOST_PORT", "8768"))
+RAG_HOST_IDLE_TIMEOUT = float(os.environ.get("SYNTHESIS_RAG_HOST_IDLE_TIMEOUT", "1800"))
+
+# LightweightRAG methods clients may call
+READ_METHODS = {"search", "get_metadata", "get_added_at", "embed", "find_by_fingerprint"}
+WRITE_METHODS = {"add_text", "add_texts", "record_occurrences", "add_ai_note", "add_project_data",
+                 "quick_note", "log_decision", "checkpoint", "reload"}
+
+
+class RAGHost:
+    """Shared LightweightRAG instances, one per (public, private) database pair"""
+
+    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+        self.model_name = model_name
+        self.model = None
+        self.engines: Dict[Tuple[str, str], object] = {}
+        self.write_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.requests = {'search': 0, 'read': 0, 'write': 0}
+
+        # Stage timings of the request running on this thread (returned to the client)
+        self._timings = threading.local()
+
+    def initialize(self):
+        """Load the embedding model (slow - done once, before serving)."""
+        from rag_engine_lite import DEPS_AVAILABLE
+        if not DEPS_AVAILABLE:
+            raise RuntimeError("Missing dependencies. Install: pip install numpy bm25s sentence-transformers")
+        from rag_engine_lite import SentenceTransformer
+
+        cache_dir = Path(__file__).parent.parent.parent / "Server" / "models"
+        print(f"[RAG Host] Loading embedding model: {self.model_name}")
+        self.model = SentenceTransformer(self.model_name, cache_folder=str(cache_dir))
+        print("[RAG Host] Model loaded")
+
+    def get_engine(self, database: str, private_database: str):
+        """Engine for a database pair (created on first use, sharing the model)"""
+        key = (database, private_database)
+        engine = self.engines.get(key)
+        if engine is None:
+            with self._lock:
+                engine = self.engines.get(key)
+                if engine is None:
+                    from rag_engine_lite import LightweightRAG
+                    engine = LightweightRAG(
+                        database=database,
+                        private_database=private_database,
+                        model_name=self.model_name,
+                        model=self.model
+                    )
+                    engine.on_timing = self._record_timing
+                    self.write_locks[key] = threading.Lock()
+                    self.engines[key] = engine
+        return engine
+
+    def _record_timing(self, stage: str, seconds: float):
+        """Engine timing hook: collect stages for the current request's response"""
+        stages = getattr(self._timings, 'stages', None)
+        if stages is not None:
+            stages.append((stage, seconds))
+
+    def handle(self, request: Dict) -> Dict:
+        """
+        Execute one client request.
+
+        Request:
+            {"method": "search", "database": ..., "private_database": ..., "kwargs": {...}}
+        """
+        method = request.get('method')
+
+        if method == 'stats':
+            return {"success": True, "result": self.get_stats()}
+
+        if method not in READ_METHODS and method not in WRITE_METHODS:
+            return {"success": False, "message": f"Unknown method: {method}"}
+
+        database = request.get('database')
+        private_database = request.get('private_database')
+        if not database or not private_database:
+            return {"success": False, "message": "Missing 'database' or 'private_database'"}
+
+        engine = self.get_engine(database, private_database)
+        kwargs = request.get('kwargs') or {}
+
+        self._timings.stages = []
+        try:
+            if method in READ_METHODS:
+                # Searches run concurrently on immutable index snapshots
+                self.requests['search' if method == 'search' else 'read'] += 1
+                result = getattr(engine, method)(**kwargs)
+            else:
+                self.requests['write'] += 1
+                with self.write_locks[(database, private_database)]:
+                    result = getattr(engine, method)(**kwargs)
+            timings = self._timings.stages
+        finally:
+            self._timings.stages = None
+
+        # Stage timings and cache counters ride along, so clients never need
+        # a separate round trip to feed their metrics
+        return {
+            "success": True,
+            "result": result,
+            "timings": timings,
+            "cache_stats": dict(engine.cache_stats)
+        }
+
+    def get_stats(self) -> Dict:
+        """Host statistics (engines, request counts, cache counters)"""
+        cache_stats = {}
+        for engine in self.engines.values():
+            for key, value in engine.cache_stats.items():
+                cache_stats[key] = cache_stats.get(key, 0) + value
+
+        return {
+            'engines': len(self.engines),
+            'model': self.model_name,
+            'requests': dict(self.requests),
+            'cache_stats': cache_stats
+        }
+
+
+def serve(port: int = RAG_HOST_PORT, idle_timeout: float = RAG_HOST_IDLE_TIMEOUT):
+    """Run the host until idle for idle_timeout seconds."""
+    host = RAGHost()
+    server = LocalRPCServer(host.handle, port, name="rag_host", idle_timeout=idle_timeout)
+    print(f"[RAG Host] Listening on 127.0.0.1:{port}")
+    server.serve_forever(initializer=host.initialize)
+
+
+def main():
+    """Main entry point"""
+    command = sys.argv[1] if len(sys.argv) > 1 else "--serve"
+
+    if command == "--serve":
+        try:
+            serve()
+        except OSError as e:
+            print(f"[RAG Host] Could not bind port {RAG_HOST_PORT} (already running?): {e}")
+            sys.exit(1)
+
+    elif command in ("--status", "--stop"):
+        client = LocalRPCClient(RAG_HOST_PORT)
+        try:
+            if command == "--stop":
+                print(client.call({"rpc": "shutdown"}).get('message'))
+            else:
+                ping = client.call({"rpc": "ping"})
+                stats = client.call({"method": "stats"}).get('result', {}) if ping.get('ready') else {}
+                print(f"[RAG Host] Running (pid {ping.get('pid')}, ready: {ping.get('ready')})")
+                for key, value in stats.items():
+                    print(f"  {key}: {value}")
+        except LocalRPCError:
+            print("[RAG Host] Not running")
+
+    else:
+        print("Usage: rag_host.py [--serve | --status | --stop]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
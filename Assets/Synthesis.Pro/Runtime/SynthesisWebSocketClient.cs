@@ -20,6 +20,7 @@ namespace Synthesis.Bridge
     /// - Command queueing
     /// - Connection health monitoring
     /// - Event-based result handling
+    /// - Server event subscriptions (push instead of polling)
     /// </summary>
     [AddComponentMenu("Synthesis/WebSocket Client")]
     public class SynthesisWebSocketClient : MonoBehaviour
@@ -75,6 +76,11 @@ namespace Synthesis.Bridge
         public event Action<BridgeResult> OnCommandResult;
         public event Action<string> OnError;
 
+        /// <summary>
+        /// Server-initiated event (topic, data) for subscribed topics
+        /// </summary>
+        public event Action<string, Dictionary<string, object>> OnServerEvent;
+
         #endregion
 
         #region Unity Lifecycle
@@ -305,6 +311,15 @@ namespace Synthesis.Bridge
                     // Connection acknowledgment
                     Log($"Server: {data.GetValueOrDefault("message")}");
                 }
+                else if (messageType == "event")
+                {
+                    // Server push for a subscribed topic
+                    string topic = data.GetValueOrDefault("topic")?.ToString() ?? "";
+                    var eventData = data.GetValueOrDefault("data") is Newtonsoft.Json.Linq.JObject obj
+                        ? obj.ToObject<Dictionary<string, object>>()
+                        : new Dictionary<string, object>();
+                    OnServerEvent?.Invoke(topic, eventData);
+                }
                 else
                 {
                     // Command result
@@ -420,6 +435,38 @@ namespace Synthesis.Bridge
             });
         }
 
+        /// <summary>
+        /// Subscribe to server events (e.g. "console.patterns", "jobs.*")
+        /// </summary>
+        public void Subscribe(params string[] topics)
+        {
+            SendCommand(new BridgeCommand
+            {
+                id = $"subscribe_{DateTime.Now.Ticks}",
+                type = "subscribe",
+                parameters = new Dictionary<string, object> { { "topics", topics } }
+            });
+        }
+
+        /// <summary>
+        /// Unsubscribe from server events (no topics = all)
+        /// </summary>
+        public void Unsubscribe(params string[] topics)
+        {
+            var parameters = new Dictionary<string, object>();
+            if (topics != null && topics.Length > 0)
+            {
+                parameters["topics"] = topics;
+            }
+
+            SendCommand(new BridgeCommand
+            {
+                id = $"unsubscribe_{DateTime.Now.Ticks}",
+                type = "unsubscribe",
+                parameters = parameters
+            });
+        }
+
         /// <summary>
         /// Get connection statistics
         /// </summary>
@@ -19,7 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "RAG" / "core"))
 
 try:
-    from rag_engine_lite import SynthesisRAG
+    from rag_client import connect_rag  # Shared RAG host (falls back to in-process)
 except ImportError:
     print("[ERROR] ERROR: RAG engine not available")
     sys.exit(1)
@@ -122,7 +122,7 @@ def save_observation():
     print("[INFO] Initializing RAG...")
     db_dir = script_dir / "database"
     try:
-        rag = SynthesisRAG(
+        rag = connect_rag(
             database=str(db_dir / "synthesis_knowledge.db"),
             private_database=str(db_dir / "synthesis_private.db")
         )
@@ -0,0 +1,157 @@
+"""
+Micro-benchmark: WebSocket message serialization
+Compares the stdlib and orjson paths of core/serialization.py on
+realistic Synthesis.Pro payloads.
+
+Usage:
+    python benchmark_serialization.py [--iterations 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+
+sys.path.insert(0, str(Path(__file__).parent / "core"))
+
+from serialization import MessageSerializer, ORJSON_AVAILABLE
+
+
+def make_console_burst(count: int = 100) -> dict:
+    """console_log command as sent by ConsoleWatcher during an error burst"""
+    entries = []
+    for i in range(count):
+        entries.append({
+            'type': 'error' if i % 3 == 0 else 'warning',
+            'message': f'NullReferenceException: Object reference not set to an instance of an object ({i})',
+            'file': 'Assets/Scripts/PlayerController.cs',
+            'line': 40 + i % 7,
+            'stackTrace': '\n'.join(
+                f'at PlayerController.Update () [0x000{j}] in Assets/Scripts/PlayerController.cs:{42 + j}'
+                for j in range(8)
+            ),
+            'timestamp': datetime.now().isoformat(),
+            'sceneName': 'MainGame',
+            'sceneObjectCount': 37,
+            'gameObjectName': 'Player',
+            'gameObjectPath': 'GameManager/Characters/Player',
+            'componentNames': ['Transform', 'PlayerController', 'Rigidbody', 'Animator'],
+            'componentStates': [
+                'Rigidbody: mass=1.0, isKinematic=False, velocity=(0.0, -9.8, 0.0)',
+                'Animator: state=Run, speed=1.0, enabled=True',
+                'PlayerController: speed=5.0, grounded=False'
+            ],
+            'recentLogs': [f'12:34:{50 + j:02d} Event {j} processed' for j in range(10)],
+            'memoryUsageMB': 245.3,
+            'fps': 58
+        })
+    return {'id': 'console_1', 'type': 'console_log', 'parameters': {'entries': entries}}
+
+
+def make_search_response(count: int = 10) -> dict:
+    """search_knowledge response with long document texts"""
+    text = ("[CONSOLE:ERROR] 2026-02-06T14:50:22\nMessage: IndexOutOfRangeException\n"
+            "=== SCENE CONTEXT ===\nScene: MainMenu\n") * 25
+    return {
+        'commandId': 'search_1',
+        'success': True,
+        'message': f'Found {count} results',
+        'data': {
+            'results': [
+                {'id': i, 'text': text, 'score': 0.0312 - i * 0.001, 'source': 'private'}
+                for i in range(count)
+            ],
+            'count': count,
+            'query': 'IndexOutOfRangeException inventory'
+        },
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def make_ping_response() -> dict:
+    """Small, frequent message"""
+    return {
+        'commandId': 'ping_1',
+        'success': True,
+        'message': 'Pong! Server is alive!',
+        'data': {'server_time': datetime.now().isoformat(), 'active_connections': 1, 'uptime_seconds': 12.5},
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def bench(func, iterations: int) -> float:
+    """Return microseconds per call"""
+    func()  # Warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialization micro-benchmark")
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    backends = ['json'] + (['orjson'] if ORJSON_AVAILABLE else [])
+    serializers = {name: MessageSerializer(name) for name in backends}
+
+    payloads = {
+        'ping response': make_ping_response(),
+        'search response (10 x 2KB)': make_search_response(),
+        'console burst (100 entries)': make_console_burst(),
+    }
+
+    print("=" * 70)
+    print("Serialization Benchmark")
+    print("=" * 70)
+    if not ORJSON_AVAILABLE:
+        print("orjson not installed - only stdlib path measured (pip install orjson)")
+    print()
+
+    header = f"{'Payload':<30} {'Op':<8}" + "".join(f"{name:>12}" for name in backends)
+    if len(backends) > 1:
+        header += f"{'speedup':>10}"
+    print(header + "   (us/op)")
+    print("-" * len(header))
+
+    for label, payload in payloads.items():
+        encoded = serializers['json'].dumps(payload)
+        size_kb = len(encoded) / 1024
+
+        for op in ('dumps', 'loads'):
+            timings = []
+            for name in backends:
+                serializer = serializers[name]
+                if op == 'dumps':
+                    timings.append(bench(lambda: serializer.encode(payload), args.iterations))
+                else:
+                    timings.append(bench(lambda: serializer.loads(encoded), args.iterations))
+
+            row = f"{label[:30]:<30} {op:<8}" + "".join(f"{t:>12.1f}" for t in timings)
+            if len(timings) > 1:
+                row += f"{timings[0] / timings[1]:>9.1f}x"
+            print(row)
+        print(f"{'':<30} size: {size_kb:.1f} KB")
+
+    # Error envelope: pre-encoded vs full dict encode
+    print()
+    print("Error envelope")
+    print("-" * len(header))
+    timestamp = datetime.now().isoformat()
+    for name in backends:
+        serializer = serializers[name]
+        full = bench(lambda: serializer.dumps({
+            'commandId': 'cmd_1', 'success': False,
+            'message': 'Unknown command: foo', 'timestamp': timestamp
+        }), args.iterations * 5)
+        pre = bench(lambda: serializer.encode_error('cmd_1', 'Unknown command: foo', timestamp),
+                    args.iterations * 5)
+        print(f"{name:<10} full dict: {full:6.2f} us   pre-encoded: {pre:6.2f} us")
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Console Filter - allow/deny rules for console capture
+
+Rules live in a JSON file (console_filter.json next to this module, or
+SYNTHESIS_CONSOLE_FILTER) and are compiled into one regex per entry type,
+so each message is scanned once no matter how many rules there are.
+Edits to the file are picked up while the server runs.
+
+    {
+      "defaults": {"error": true, "warning": true, "log": false},
+      "rules": [
+        {"name": "obsolete", "action": "deny", "types": ["warning"], "pattern": "obsolete"},
+        {"name": "rag-tag", "action": "allow", "types": ["log"], "pattern": "[rag]"},
+        {"name": "shader", "action": "deny", "pattern": "Shader .+ is not supported", "regex": true}
+      ]
+    }
+
+Patterns are case-insensitive substrings unless "regex" is true. When
+several rules match, the one matching earliest in the message wins (ties
+go to the rule listed first). Entries no rule matches get the type's
+default. Regex rules are joined into one pattern, so they cannot use
+capturing groups or global flags: write (?:...) and (?i:...) instead.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_FILTER_PATH = Path(os.environ.get(
+    "SYNTHESIS_CONSOLE_FILTER", str(Path(__file__).parent / "console_filter.json")
+))
+
+ENTRY_TYPES = ("error", "warning", "log")
+
+# Used when the rules file is missing (same rules as the shipped file)
+DEFAULT_CONFIG = {
+    "defaults": {"error": True, "warning": True, "log": False},
+    "rules": [
+        {"name": "mesh-colors", "action": "deny", "types": ["warning"], "pattern": "Mesh.colors"},
+        {"name": "obsolete", "action": "deny", "types": ["warning"], "pattern": "obsolete"},
+        {"name": "synthesis-tag", "action": "allow", "types": ["log"], "pattern": "[synthesis"},
+        {"name": "rag-tag", "action": "allow", "types": ["log"], "pattern": "[rag]"},
+        {"name": "initialized", "action": "allow", "types": ["log"], "pattern": "initialized"},
+        {"name": "connected", "action": "allow", "types": ["log"], "pattern": "connected"},
+        {"name": "failed", "action": "allow", "types": ["log"], "pattern": "failed"},
+        {"name": "success", "action": "allow", "types": ["log"], "pattern": "success"}
+    ]
+}
+
+
+class FilterRule:
+    """One allow/deny rule with its hit counter"""
+
+    __slots__ = ('name', 'action', 'types', 'pattern', 'regex', 'hits')
+
+    def __init__(self, name: str, action: str, types: List[str], pattern: str, regex: bool = False):
+        self.name = name
+        self.action = action
+        self.types = types
+        self.pattern = pattern
+        self.regex = regex
+        self.hits = 0
+
+    @property
+    def allow(self) -> bool:
+        return self.action == "allow"
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'action': self.action,
+            'types': self.types,
+            'pattern': self.pattern,
+            'regex': self.regex,
+            'hits': self.hits
+        }
+
+
+class ConsoleFilter:
+    """
+    Compiled allow/deny rules for console entries, reloaded when the file changes.
+
+    Usage:
+        console_filter = ConsoleFilter()
+        if console_filter.allows('warning', message): ...
+    """
+
+    def __init__(self, path: Optional[Path] = DEFAULT_FILTER_PATH, reload_interval: float = 2.0):
+        self.path = Path(path) if path else None
+        self.reload_interval = reload_interval  # Seconds between file checks
+        self.errors: List[str] = []  # Problems from the last load
+
+        self._lock = threading.Lock()
+        self._file_state = None
+        self._next_check = 0.0
+
+        self.rules: List[FilterRule] = []
+        self.defaults: Dict[str, bool] = dict(DEFAULT_CONFIG['defaults'])
+        self._compiled: Dict[str, tuple] = {}  # Entry type -> (regex or None, rules by group name)
+        self.reload()
+
+    def allows(self, entry_type: str, message: str) -> bool:
+        """Capture decision for one entry (one regex scan of the message)"""
+        self.check_reload()
+
+        compiled = self._compiled.get(entry_type)
+        if compiled is None:
+            return False
+        regex, rules = compiled
+
+        if regex is not None:
+            match = regex.search(message)
+            if match:
+                rule = rules[match.lastgroup]
+                rule.hits += 1
+                return rule.allow
+
+        return self.defaults.get(entry_type, False)
+
+    def check_reload(self) -> bool:
+        """Reload if the rules file changed (checked at most every reload_interval seconds)"""
+        if self.path is None:
+            return False
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.reload_interval
+
+        if self._stat() == self._file_state:
+            return False
+        return self.reload()
+
+    def reload(self) -> bool:
+        """
+        Load and compile the rules file.
+
+        On a bad file the previous rules stay active and the problem is
+        kept in self.errors. Hit counters carry over for rules with the
+        same name.
+
+        Returns True if new rules were installed.
+        """
+        with self._lock:
+            file_state = self._stat()
+            self._file_state = file_state
+            errors = []
+
+            if file_state is None:
+                config = DEFAULT_CONFIG
+            else:
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        config = json.load(f)
+                    if not isinstance(config, dict):
+                        raise ValueError("top level must be an object")
+                except (OSError, ValueError) as e:
+                    self.errors = [f"{self.path}: {e}"]
+                    print(f"[ConsoleFilter] Keeping previous rules: {self.errors[0]}")
+                    return False
+
+            old_hits = {rule.name: rule.hits for rule in self.rules}
+            rules = []
+            for index, spec in enumerate(config.get('rules', [])):
+                rule = self._parse_rule(index, spec, errors)
+                if rule:
+                    rule.hits = old_hits.get(rule.name, 0)
+                    rules.append(rule)
+
+            defaults = dict(DEFAULT_CONFIG['defaults'])
+            defaults.update({
+                str(entry_type).lower(): bool(value)
+                for entry_type, value in (config.get('defaults') or {}).items()
+            })
+
+            try:
+                compiled = self._compile(rules, defaults)
+            except re.error as e:
+                self.errors = errors + [f"{self.path or 'rules'}: {e}"]
+                print(f"[ConsoleFilter] Keeping previous rules: {self.errors[-1]}")
+                return False
+
+            self._compiled = compiled
+            self.rules = rules
+            self.defaults = defaults
+            self.errors = errors
+            for error in errors:
+                print(f"[ConsoleFilter] Skipped rule: {error}")
+            return True
+
+    def stats(self) -> Dict:
+        """Rules with hit counters, plus load problems"""
+        return {
+            'path': str(self.path) if self.path else None,
+            'defaults': dict(self.defaults),
+            'rules': [rule.to_dict() for rule in self.rules],
+            'errors': list(self.errors)
+        }
+
+    def _stat(self):
+        try:
+            stat = self.path.stat()
+        except (OSError, AttributeError):
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _parse_rule(index: int, spec: Dict, errors: List[str]) -> Optional[FilterRule]:
+        if not isinstance(spec, dict) or not spec.get('pattern'):
+            errors.append(f"rule {index}: needs a 'pattern'")
+            return None
+
+        name = str(spec.get('name') or f"rule-{index}")
+        action = str(spec.get('action', 'deny')).lower()
+        if action not in ("allow", "deny"):
+            errors.append(f"{name}: action must be 'allow' or 'deny'")
+            return None
+
+        types = [str(t).lower() for t in spec.get('types') or ENTRY_TYPES]
+        pattern = str(spec['pattern'])
+        regex = bool(spec.get('regex', False))
+
+        if regex:
+            try:
+                compiled = re.compile(pattern)
+            except re.error as e:
+                errors.append(f"{name}: {e}")
+                return None
+            if compiled.groups:
+                # Groups would shift the combined regex's group numbers
+                errors.append(f"{name}: use (?:...) instead of capturing groups")
+                return None
+            try:
+                # Compiled as one branch of a combined regex: global flags
+                # like (?i) are only valid at the start of the whole pattern
+                re.compile(f"(?:)|(?P<r{index}>{pattern})")
+            except re.error as e:
+                errors.append(f"{name}: {e} (use scoped flags like (?i:...))")
+                return None
+
+        return FilterRule(name, action, types, pattern, regex)
+
+    @staticmethod
+    def _compile(rules: List[FilterRule], defaults: Dict[str, bool]) -> Dict[str, tuple]:
+        """One alternation per entry type, one named group per rule"""
+        compiled = {}
+        for entry_type in set(ENTRY_TYPES) | set(defaults):
+            parts = []
+            by_group = {}
+            for index, rule in enumerate(rules):
+                if entry_type not in rule.types:
+                    continue
+                group = f"r{index}"
+                body = rule.pattern if rule.regex else re.escape(rule.pattern)
+                parts.append(f"(?P<{group}>{body})")
+                by_group[group] = rule
+
+            regex = re.compile("|".join(parts), re.IGNORECASE) if parts else None
+            compiled[entry_type] = (regex, by_group)
+        return compiled
@@ -15,6 +15,8 @@ Result: 13x context reduction (3400 → 250 tokens) with richer information.
 
 import sys
 import os
+import json
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -24,6 +26,11 @@ import time
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "RAG" / "core"))
 from rag_engine_lite import SynthesisRAG
 
+# Sibling modules (also when imported as context_systems.console_monitor)
+sys.path.insert(0, str(Path(__file__).parent))
+from console_filter import ConsoleFilter
+from stack_fingerprint import entry_fingerprint
+
 # Import Phase 3: Intelligent Pattern Matching
 try:
     from error_pattern_matcher import ErrorPatternMatcher
@@ -31,6 +38,103 @@ try:
 except ImportError:
     PATTERN_MATCHING_AVAILABLE = False
 
+# Repeats within this many seconds of the last sighting count toward the stored document
+DEDUP_WINDOW = float(os.environ.get("SYNTHESIS_CONSOLE_DEDUP_WINDOW", "300"))
+DEDUP_MAX_ENTRIES = int(os.environ.get("SYNTHESIS_CONSOLE_DEDUP_MAX", "5000"))
+
+
+class _DedupRecord:
+    __slots__ = ('doc_hash', 'last_seen', 'pending', 'last_flush')
+
+    def __init__(self, doc_hash: str, now: float):
+        self.doc_hash = doc_hash
+        self.last_seen = now
+        self.pending = 0  # Repeats not yet written to the document
+        self.last_flush = None
+
+
+class DedupCache:
+    """
+    Recently captured console entries, bounded by size (LRU) and age.
+
+    An entry stays known while it keeps repeating; after `window` quiet
+    seconds it expires and its next sighting is captured as a new
+    document. Repeats are counted per stored document until
+    take_pending() hands them out for writing.
+    """
+
+    def __init__(self, window: float = DEDUP_WINDOW, max_entries: int = DEDUP_MAX_ENTRIES):
+        self.window = window
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[int, _DedupRecord]" = OrderedDict()  # Oldest sighting first
+        self._dirty = set()  # Keys with pending repeats
+        self._retired: Dict[str, int] = {}  # Pending repeats of expired/evicted entries, by doc hash
+        self.stats = {'repeats': 0, 'expired': 0, 'evicted': 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: int, now: float) -> Optional[_DedupRecord]:
+        """Record for a key seen within the window, or None"""
+        self._expire(now)
+        return self._entries.get(key)
+
+    def add(self, key: int, doc_hash: str, now: float) -> _DedupRecord:
+        """Remember a newly stored document"""
+        record = self._entries[key] = _DedupRecord(doc_hash, now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            old_key, old = self._entries.popitem(last=False)
+            self._retire(old_key, old)
+            self.stats['evicted'] += 1
+        return record
+
+    def repeat(self, key: int, record: _DedupRecord, now: float, count: int = 1):
+        """Count repeats of a known entry and restart its window"""
+        record.pending += count
+        record.last_seen = now
+        self._entries.move_to_end(key)
+        self._dirty.add(key)
+        self.stats['repeats'] += count
+
+    def take_pending(self, now: float, min_interval: float = 0.0) -> Dict[str, int]:
+        """
+        Pending repeat counts by doc hash, reset as they are taken.
+
+        Documents written less than min_interval seconds ago keep
+        accumulating (retired entries are always included).
+        """
+        counts, self._retired = self._retired, {}
+        for key in list(self._dirty):
+            record = self._entries[key]
+            if record.last_flush is not None and now - record.last_flush < min_interval:
+                continue
+            counts[record.doc_hash] = counts.get(record.doc_hash, 0) + record.pending
+            record.pending = 0
+            record.last_flush = now
+            self._dirty.discard(key)
+        return counts
+
+    def clear(self):
+        self._entries.clear()
+        self._dirty.clear()
+        self._retired.clear()
+
+    def _expire(self, now: float):
+        # Entries are ordered by last sighting, so expired ones are at the front
+        while self._entries:
+            key, record = next(iter(self._entries.items()))
+            if now - record.last_seen <= self.window:
+                break
+            del self._entries[key]
+            self._retire(key, record)
+            self.stats['expired'] += 1
+
+    def _retire(self, key: int, record: _DedupRecord):
+        if key in self._dirty:
+            self._dirty.discard(key)
+            self._retired[record.doc_hash] = self._retired.get(record.doc_hash, 0) + record.pending
+
 
 class ConsoleMonitor:
     """
@@ -40,259 +144,309 @@ class ConsoleMonitor:
     patterns should be learned from.
     """
 
-    def __init__(self, rag_engine: SynthesisRAG):
+    def __init__(self, rag_engine: SynthesisRAG, dedup_window: float = DEDUP_WINDOW,
+                 dedup_max_entries: int = DEDUP_MAX_ENTRIES,
+                 console_filter: Optional[ConsoleFilter] = None):
         self.rag = rag_engine
         self.last_check = datetime.now()
-        self.seen_hashes = set()  # Deduplicate identical messages
+        self.dedup = DedupCache(dedup_window, dedup_max_entries)  # Deduplicate identical messages
 
         # Phase 3: Intelligent Pattern Matching
         self.pattern_matcher = ErrorPatternMatcher(rag_engine) if PATTERN_MATCHING_AVAILABLE else None
 
+        # Noise filter: allow/deny rules from console_filter.json (hot-reloaded)
+        self.filter = console_filter or ConsoleFilter()
+
         # Configuration
         self.capture_errors = True
         self.capture_warnings = True
         self.capture_important_logs = False  # Only special logs
-        self.min_error_interval = 1.0  # Don't spam identical errors
+        self.min_error_interval = 1.0  # Don't spam identical errors (min seconds between count updates)
 
     def should_capture(self, entry: Dict) -> bool:
         """Decide if this console entry should be captured to memory."""
         entry_type = entry.get('type', 'log').lower()
-        message = entry.get('message', '')
 
-        # Always capture errors
-        if entry_type == 'error' and self.capture_errors:
-            return True
-
-        # Capture warnings (but we might want to filter common ones)
-        if entry_type == 'warning' and self.capture_warnings:
-            # Skip common noisy warnings
-            noisy_warnings = [
-                'Mesh.colors',  # Common Unity warning
-                'obsolete',  # Deprecation warnings
-            ]
-            if any(noise.lower() in message.lower() for noise in noisy_warnings):
-                return False
-            return True
-
-        # For logs, only capture if they seem important
-        if entry_type == 'log' and self.capture_important_logs:
-            important_keywords = [
-                '[synthesis',
-                '[rag]',
-                'initialized',
-                'connected',
-                'failed',
-                'success',
-            ]
-            return any(keyword.lower() in message.lower() for keyword in important_keywords)
-
-        return False
-
-    def capture_entry(self, entry: Dict) -> bool:
+        # Type switches first, then the allow/deny rules (one scan of the message)
+        if entry_type == 'error' and not self.capture_errors:
+            return False
+        if entry_type == 'warning' and not self.capture_warnings:
+            return False
+        if entry_type == 'log' and not self.capture_important_logs:
+            return False
+
+        return self.filter.allows(entry_type, entry.get('message', ''))
+
+    def capture_entry(self, entry: Dict, pattern_matches: Optional[List[Dict]] = None) -> bool:
         """
         Capture a console entry with FULL Unity context to RAG memory.
 
         PHASE 1: Now captures scene, GameObject, components, recent logs, and performance.
 
-        Returns True if captured, False if skipped.
+        Args:
+            entry: Console entry from Unity
+            pattern_matches: Optional list that known-pattern matches are appended to
+
+        Returns True if captured, False if skipped (a recent repeat is
+        counted on the stored document instead).
         """
         if not self.should_capture(entry):
             return False
 
-        # Create hash for deduplication
-        entry_hash = hash((
+        now = time.monotonic()
+        entry_hash = self._entry_hash(entry)
+
+        record = self.dedup.lookup(entry_hash, now)
+        if record is not None:
+            # Already captured this exact entry recently
+            self.dedup.repeat(entry_hash, record, now)
+            self._flush_occurrences(now)
+            self._record_errors([entry])
+            return False
+
+        fields = self.entry_fields(entry)
+        formatted = self._document(fields, entry, pattern_matches)
+        self._record_errors([entry])
+
+        # Store in PRIVATE database (this is project-specific context)
+        success = self.rag.add_text(formatted, private=True, metadata=self._document_metadata(fields),
+                                    fingerprint=entry_fingerprint(entry))
+
+        if success:
+            self.dedup.add(entry_hash, self.rag.doc_hash(formatted), now)
+
+        self._flush_occurrences(now)
+        return success
+
+    @staticmethod
+    def _document_metadata(fields: Dict) -> str:
+        """Metadata stored with a console document (its structured fields)"""
+        return json.dumps({'kind': 'console', 'fields': fields}, default=str)
+
+    @staticmethod
+    def _entry_hash(entry: Dict) -> int:
+        """Hash for deduplication (type, message, file, line)"""
+        return hash((
             entry.get('type'),
             entry.get('message'),
             entry.get('file'),
             entry.get('line')
         ))
 
-        if entry_hash in self.seen_hashes:
-            return False  # Already captured this exact entry
-
-        # Extract basic fields
-        timestamp = entry.get('timestamp', datetime.now().isoformat())
-        entry_type = entry.get('type', 'log').upper()
-        message = entry.get('message', '')
-        file_path = entry.get('file', 'unknown')
-        line = entry.get('line', 0)
-        stack_trace = entry.get('stackTrace', '')
-
-        # Extract ENHANCED context (Phase 1 - Deep Omniscience)
+    # Entry fields kept (as metadata) with each console document, with defaults
+    ENTRY_FIELDS = {
+        'timestamp': None, 'type': 'log', 'message': '', 'file': 'unknown', 'line': 0, 'stackTrace': '',
         # Scene context
-        scene_name = entry.get('sceneName', '')
-        scene_object_count = entry.get('sceneObjectCount', 0)
-        scene_path = entry.get('scenePath', '')
-        scene_loaded_time = entry.get('sceneLoadedTime', 0)
-
+        'sceneName': '', 'sceneObjectCount': 0, 'scenePath': '', 'sceneLoadedTime': 0,
         # GameObject context
-        game_object_name = entry.get('gameObjectName', '')
-        game_object_path = entry.get('gameObjectPath', '')
-        component_names = entry.get('componentNames', [])
-        component_states = entry.get('componentStates', [])
-        game_object_active = entry.get('gameObjectActive', True)
-        game_object_active_hierarchy = entry.get('gameObjectActiveInHierarchy', True)
-        game_object_layer = entry.get('gameObjectLayer', '')
-        game_object_tag = entry.get('gameObjectTag', '')
-        child_count = entry.get('childCount', 0)
-
+        'gameObjectName': '', 'gameObjectPath': '', 'componentNames': [], 'componentStates': [],
+        'gameObjectActive': True, 'gameObjectActiveInHierarchy': True, 'gameObjectLayer': '',
+        'gameObjectTag': '', 'childCount': 0,
         # Transform state
-        position = entry.get('position', '')
-        rotation = entry.get('rotation', '')
-        scale = entry.get('scale', '')
-
+        'position': '', 'rotation': '', 'scale': '',
         # Prefab context
-        is_prefab_instance = entry.get('isPrefabInstance', False)
-        prefab_path = entry.get('prefabPath', '')
-
+        'isPrefabInstance': False, 'prefabPath': '',
         # Activity context
-        recent_logs = entry.get('recentLogs', [])
-
+        'recentLogs': [],
         # Performance snapshot
-        memory_usage_mb = entry.get('memoryUsageMB', 0)
-        fps = entry.get('fps', 0)
-
+        'memoryUsageMB': 0, 'fps': 0,
         # Time context
-        time_scale = entry.get('timeScale', 1.0)
-        frame_count = entry.get('frameCount', 0)
-        realtime_since_startup = entry.get('realtimeSinceStartup', 0)
-
+        'timeScale': 1.0, 'frameCount': 0, 'realtimeSinceStartup': 0,
         # Build context
-        is_editor = entry.get('isEditor', False)
-        is_development_build = entry.get('isDevelopmentBuild', False)
-        platform = entry.get('platform', '')
-        unity_version = entry.get('unityVersion', '')
-
+        'isEditor': False, 'isDevelopmentBuild': False, 'platform': '', 'unityVersion': '',
         # Input context
-        mouse_position = entry.get('mousePosition', '')
-        any_key_pressed = entry.get('anyKeyPressed', False)
+        'mousePosition': '', 'anyKeyPressed': False,
+    }
 
-        # Create rich, searchable text with FULL DEEP context
-        formatted = f"[CONSOLE:{entry_type}] {timestamp}\n"
-        formatted += f"Message: {message}\n"
+    def entry_fields(self, entry: Dict) -> Dict:
+        """
+        Structured copy of a console entry: known fields that differ from
+        their defaults, with the timestamp filled in. format_entry(fields)
+        renders the same document as the original entry.
+        """
+        fields = {
+            key: entry[key] for key, default in self.ENTRY_FIELDS.items()
+            if key in entry and entry[key] != default
+        }
+        fields['timestamp'] = entry.get('timestamp') or datetime.now().isoformat()
+        return fields
 
-        # Code location
-        if file_path and file_path != 'unknown':
-            formatted += f"Location: {file_path}:{line}\n"
+    def format_entry(self, entry: Dict) -> str:
+        """
+        Build the searchable document for a console entry with FULL DEEP context
+        (scene, GameObject, components, recent activity, performance, stack trace).
 
-        # Scene context (enhanced)
-        if scene_name:
-            formatted += f"\n=== SCENE CONTEXT ===\n"
-            formatted += f"Scene: {scene_name}\n"
-            if scene_path:
-                formatted += f"Path: {scene_path}\n"
-            formatted += f"Root Objects: {scene_object_count}\n"
-            formatted += f"Time Since Loaded: {scene_loaded_time:.1f}s\n"
-
-        # GameObject context (massively enhanced)
-        if game_object_name:
-            formatted += f"\n=== GAMEOBJECT CONTEXT ===\n"
-            formatted += f"Name: {game_object_name}\n"
-            if game_object_path:
-                formatted += f"Hierarchy: {game_object_path}\n"
-            formatted += f"Active: {game_object_active} (in hierarchy: {game_object_active_hierarchy})\n"
-            if game_object_layer:
-                formatted += f"Layer: {game_object_layer}\n"
-            if game_object_tag:
-                formatted += f"Tag: {game_object_tag}\n"
-            formatted += f"Children: {child_count}\n"
-
-            # Transform
-            if position or rotation or scale:
-                formatted += f"\n--- Transform ---\n"
-                if position:
-                    formatted += f"Position: {position}\n"
-                if rotation:
-                    formatted += f"Rotation: {rotation}\n"
-                if scale:
-                    formatted += f"Scale: {scale}\n"
-
-            # Prefab
-            if is_prefab_instance:
-                formatted += f"\n--- Prefab ---\n"
-                formatted += f"Instance of: {prefab_path}\n"
-
-            # Components (with states!)
-            if component_states:
-                formatted += f"\n--- Components & States ---\n"
-                for state in component_states:
-                    formatted += f"  • {state}\n"
-            elif component_names:
-                # Fallback to just names if states not available
-                formatted += f"\n--- Components ---\n"
-                formatted += f"[{', '.join(component_names)}]\n"
+        Accepts a raw entry or its entry_fields(). Sections append to one
+        list of parts that is joined once.
+        """
+        return "".join(self._entry_parts(entry))
+
+    def _entry_parts(self, entry: Dict) -> List[str]:
+        e = dict(self.ENTRY_FIELDS)
+        e.update(entry)
+        if e['timestamp'] is None:
+            e['timestamp'] = datetime.now().isoformat()
 
+        parts = []
+        for section in self._sections:
+            section(e, parts)
+        return parts
+
+    def _document(self, fields: Dict, entry: Dict, pattern_matches: Optional[List[Dict]] = None,
+                  analyses: Optional[Dict] = None) -> str:
+        """Stored document: format_entry() followed by the pattern analysis, joined once"""
+        parts = self._entry_parts(fields)
+        self._pattern_section(entry, parts, pattern_matches, analyses)
+        return "".join(parts)
+
+    @staticmethod
+    def _header_section(e: Dict, parts: List[str]):
+        parts += (f"[CONSOLE:{e['type'].upper()}] {e['timestamp']}\n", f"Message: {e['message']}\n")
+
+        # Code location
+        if e['file'] and e['file'] != 'unknown':
+            parts.append(f"Location: {e['file']}:{e['line']}\n")
+
+    @staticmethod
+    def _scene_section(e: Dict, parts: List[str]):
+        if not e['sceneName']:
+            return
+        parts += ("\n=== SCENE CONTEXT ===\n", f"Scene: {e['sceneName']}\n")
+        if e['scenePath']:
+            parts.append(f"Path: {e['scenePath']}\n")
+        parts += (f"Root Objects: {e['sceneObjectCount']}\n",
+                  f"Time Since Loaded: {e['sceneLoadedTime']:.1f}s\n")
+
+    @staticmethod
+    def _gameobject_section(e: Dict, parts: List[str]):
+        if not e['gameObjectName']:
+            return
+        parts += ("\n=== GAMEOBJECT CONTEXT ===\n", f"Name: {e['gameObjectName']}\n")
+        if e['gameObjectPath']:
+            parts.append(f"Hierarchy: {e['gameObjectPath']}\n")
+        parts.append(f"Active: {e['gameObjectActive']} (in hierarchy: {e['gameObjectActiveInHierarchy']})\n")
+        if e['gameObjectLayer']:
+            parts.append(f"Layer: {e['gameObjectLayer']}\n")
+        if e['gameObjectTag']:
+            parts.append(f"Tag: {e['gameObjectTag']}\n")
+        parts.append(f"Children: {e['childCount']}\n")
+
+        # Transform
+        if e['position'] or e['rotation'] or e['scale']:
+            parts.append("\n--- Transform ---\n")
+            for label, key in (("Position", 'position'), ("Rotation", 'rotation'), ("Scale", 'scale')):
+                if e[key]:
+                    parts.append(f"{label}: {e[key]}\n")
+
+        # Prefab
+        if e['isPrefabInstance']:
+            parts += ("\n--- Prefab ---\n", f"Instance of: {e['prefabPath']}\n")
+
+        # Components (with states!)
+        if e['componentStates']:
+            parts.append("\n--- Components & States ---\n")
+            parts += [f"  • {state}\n" for state in e['componentStates']]
+        elif e['componentNames']:
+            # Fallback to just names if states not available
+            parts += ("\n--- Components ---\n", f"[{', '.join(e['componentNames'])}]\n")
+
+    @staticmethod
+    def _activity_section(e: Dict, parts: List[str]):
         # Recent activity (what happened just before)
-        if recent_logs:
-            formatted += f"\n=== RECENT ACTIVITY ===\n"
-            for log in recent_logs:
-                formatted += f"  {log}\n"
+        if e['recentLogs']:
+            parts.append("\n=== RECENT ACTIVITY ===\n")
+            parts += [f"  {log}\n" for log in e['recentLogs']]
 
+    @staticmethod
+    def _runtime_section(e: Dict, parts: List[str]):
         # Performance snapshot
-        if memory_usage_mb > 0 or fps > 0:
-            formatted += f"\n=== PERFORMANCE ===\n"
-            formatted += f"Memory: {memory_usage_mb:.1f}MB\n"
-            formatted += f"FPS: {fps}\n"
+        if e['memoryUsageMB'] > 0 or e['fps'] > 0:
+            parts += ("\n=== PERFORMANCE ===\n", f"Memory: {e['memoryUsageMB']:.1f}MB\n", f"FPS: {e['fps']}\n")
 
         # Time context
-        if time_scale != 1.0 or frame_count > 0:
-            formatted += f"\n=== TIME CONTEXT ===\n"
-            formatted += f"Frame: {frame_count}\n"
-            formatted += f"Time Scale: {time_scale}\n"
-            formatted += f"Runtime: {realtime_since_startup:.1f}s\n"
+        if e['timeScale'] != 1.0 or e['frameCount'] > 0:
+            parts += ("\n=== TIME CONTEXT ===\n", f"Frame: {e['frameCount']}\n",
+                      f"Time Scale: {e['timeScale']}\n", f"Runtime: {e['realtimeSinceStartup']:.1f}s\n")
 
         # Build context
-        if platform or unity_version:
-            formatted += f"\n=== BUILD CONTEXT ===\n"
-            formatted += f"Platform: {platform}\n"
-            formatted += f"Unity: {unity_version}\n"
-            formatted += f"Editor: {is_editor}\n"
-            formatted += f"Development: {is_development_build}\n"
+        if e['platform'] or e['unityVersion']:
+            parts += ("\n=== BUILD CONTEXT ===\n", f"Platform: {e['platform']}\n", f"Unity: {e['unityVersion']}\n",
+                      f"Editor: {e['isEditor']}\n", f"Development: {e['isDevelopmentBuild']}\n")
 
         # Input context
-        if mouse_position or any_key_pressed:
-            formatted += f"\n=== INPUT STATE ===\n"
-            formatted += f"Mouse: {mouse_position}\n"
-            formatted += f"Key Pressed: {any_key_pressed}\n"
+        if e['mousePosition'] or e['anyKeyPressed']:
+            parts += ("\n=== INPUT STATE ===\n", f"Mouse: {e['mousePosition']}\n",
+                      f"Key Pressed: {e['anyKeyPressed']}\n")
 
+    @staticmethod
+    def _stack_section(e: Dict, parts: List[str]):
         # Full stack trace
-        if stack_trace:
-            formatted += f"\n=== STACK TRACE ===\n{stack_trace}\n"
+        if e['stackTrace']:
+            parts.append(f"\n=== STACK TRACE ===\n{e['stackTrace']}\n")
 
-        # PHASE 3: Intelligent Pattern Matching
-        if self.pattern_matcher and entry_type == 'ERROR':
-            try:
-                analysis = self.pattern_matcher.analyze_new_error(entry)
-
-                if analysis['is_known_pattern']:
-                    formatted += f"\n--- PATTERN ANALYSIS ---\n"
-                    formatted += f"Historical Context: {analysis['historical_context']}\n"
-                    formatted += f"Confidence: {analysis['confidence']:.2f}\n"
-
-                    if analysis['suggested_fixes']:
-                        formatted += f"Suggested Fixes:\n"
-                        for fix in analysis['suggested_fixes']:
-                            formatted += f"  • {fix}\n"
-
-                    pattern = analysis.get('pattern_match', {})
-                    if pattern:
-                        formatted += f"Pattern Strength: {pattern.get('pattern_strength', 'unknown').upper()}\n"
-                        formatted += f"Occurrences: {pattern.get('occurrences', 0)}\n"
-            except Exception as e:
-                # Don't fail capture if pattern matching fails
-                formatted += f"\n[Pattern matching failed: {str(e)}]\n"
+    # Document layout, in order
+    _sections = (_header_section.__func__, _scene_section.__func__, _gameobject_section.__func__,
+                 _activity_section.__func__, _runtime_section.__func__, _stack_section.__func__)
 
-        # Store in PRIVATE database (this is project-specific context)
-        success = self.rag.add_text(formatted, private=True)
+    def _pattern_section(self, entry: Dict, parts: List[str], pattern_matches: Optional[List[Dict]] = None,
+                         analyses: Optional[Dict] = None):
+        """
+        PHASE 3: Pattern analysis text for an error entry (nothing for non-errors).
 
-        if success:
-            self.seen_hashes.add(entry_hash)
+        Args:
+            entry: Console entry
+            parts: Document parts the section is appended to
+            pattern_matches: Optional list that known-pattern matches are appended to
+            analyses: Optional cache of analyses by pattern key, shared across a batch
+                      so each distinct error is analyzed (one RAG search) only once
+        """
+        if not self.pattern_matcher or entry.get('type', 'log').upper() != 'ERROR':
+            return
 
-        return success
+        message = entry.get('message', '')
+        try:
+            key = self.pattern_matcher.analysis_key(entry)
+            if analyses is not None and key in analyses:
+                analysis = analyses[key]
+            else:
+                analysis = self.pattern_matcher.analyze_new_error(entry)
+                if analyses is not None:
+                    analyses[key] = analysis
+
+            if analysis['is_known_pattern']:
+                parts += ("\n--- PATTERN ANALYSIS ---\n",
+                          f"Historical Context: {analysis['historical_context']}\n",
+                          f"Confidence: {analysis['confidence']:.2f}\n")
+
+                if analysis['suggested_fixes']:
+                    parts.append("Suggested Fixes:\n")
+                    parts += [f"  • {fix}\n" for fix in analysis['suggested_fixes']]
+
+                pattern = analysis.get('pattern_match', {})
+                if pattern:
+                    parts += (f"Pattern Strength: {pattern.get('pattern_strength', 'unknown').upper()}\n",
+                              f"Occurrences: {pattern.get('occurrences', 0)}\n")
+
+                if pattern_matches is not None:
+                    pattern_matches.append({
+                        'signature': self.extract_error_signature(entry),
+                        'message': message[:200],
+                        'confidence': analysis['confidence'],
+                        'occurrences': (pattern or {}).get('occurrences', 0),
+                        'suggested_fixes': analysis['suggested_fixes']
+                    })
+        except Exception as e:
+            # Don't fail capture if pattern matching fails
+            parts.append(f"\n[Pattern matching failed: {str(e)}]\n")
 
     def capture_batch(self, entries: List[Dict]) -> Dict[str, int]:
         """
-        Capture multiple console entries.
+        Capture multiple console entries as one batch.
+
+        Pipeline: filter and deduplicate all entries, analyze each distinct
+        error pattern once, format documents, then store them with one
+        batched embedding and one transaction. Repeats (recent or within
+        the batch) are counted on the stored documents.
 
         Returns stats about what was captured.
         """
@@ -300,20 +454,69 @@ class ConsoleMonitor:
             'total': len(entries),
             'captured': 0,
             'skipped': 0,
+            'repeats': 0,
             'errors': 0,
             'warnings': 0,
             'logs': 0
         }
-
+        pattern_matches = []
+        now = time.monotonic()
+
+        # 1. Filter and deduplicate (against recent history and within the batch)
+        selected = []
+        batch_index = {}  # Entry hash -> index in selected
+        batch_repeats = []  # Repeats of each selected entry within the batch
+        errors = []  # Every captured error occurrence, for the pattern store
         for entry in entries:
             entry_type = entry.get('type', 'log').lower()
             stats[entry_type + 's'] = stats.get(entry_type + 's', 0) + 1
 
-            if self.capture_entry(entry):
-                stats['captured'] += 1
+            if not self.should_capture(entry):
+                continue
+            if entry_type == 'error':
+                errors.append(entry)
+            entry_hash = self._entry_hash(entry)
+
+            record = self.dedup.lookup(entry_hash, now)
+            if record is not None:
+                self.dedup.repeat(entry_hash, record, now)
+                stats['repeats'] += 1
+            elif entry_hash in batch_index:
+                batch_repeats[batch_index[entry_hash]] += 1
+                stats['repeats'] += 1
             else:
-                stats['skipped'] += 1
+                batch_index[entry_hash] = len(selected)
+                selected.append((entry_hash, entry))
+                batch_repeats.append(0)
+
+        # 2-3. Pattern analysis (once per distinct pattern) and formatting
+        analyses = {}
+        documents = []
+        metadata = []
+        fingerprints = []
+        for _, entry in selected:
+            fields = self.entry_fields(entry)
+            documents.append(self._document(fields, entry, pattern_matches, analyses))
+            metadata.append(self._document_metadata(fields))
+            fingerprints.append(entry_fingerprint(entry))
+        self._record_errors(errors)
+
+        # 4. One embedding batch, one transaction
+        results = self.rag.add_texts(documents, private=True, metadata=metadata,
+                                     fingerprints=fingerprints) if documents else []
+
+        for (entry_hash, _), document, repeats, success in zip(selected, documents, batch_repeats, results):
+            if success:
+                record = self.dedup.add(entry_hash, self.rag.doc_hash(document), now)
+                if repeats:
+                    self.dedup.repeat(entry_hash, record, now, repeats)
+                stats['captured'] += 1
+
+        self._flush_occurrences(now)
 
+        stats['skipped'] = stats['total'] - stats['captured']
+        stats['pattern_matches'] = pattern_matches
+        stats['patterns_analyzed'] = len(analyses)
         self.last_check = datetime.now()
         return stats
 
@@ -326,7 +529,9 @@ class ConsoleMonitor:
             top_k: Number of results to return
 
         Returns:
-            List of relevant console entries from memory
+            List of relevant console entries from memory. Entries captured
+            with structured fields also carry 'fields' (render them again
+            with format_entry) and 'occurrences'.
         """
         # Search only private database for console entries
         results = self.rag.search(query, top_k=top_k, scope="private")
@@ -337,8 +542,41 @@ class ConsoleMonitor:
             if result['text'].startswith('[CONSOLE:'):
                 console_entries.append(result)
 
+        if console_entries and 'id' in console_entries[0]:
+            try:
+                stored = self.rag.get_metadata([result['id'] for result in console_entries], private=True)
+            except Exception as e:
+                print(f"[ConsoleMonitor] Failed to load entry fields: {e}")
+                stored = []
+            for result, meta in zip(console_entries, stored):
+                if meta and meta.get('kind') == 'console':
+                    result['fields'] = meta.get('fields', {})
+                    result['occurrences'] = meta.get('occurrences', 1)
+
         return console_entries
 
+    def find_same_crash(self, entry: Dict, limit: int = 5) -> List[Dict]:
+        """
+        Captured console entries with the same stack fingerprint as this
+        entry (same crash, any line numbers), newest first. An indexed
+        lookup, no search; empty if the entry has no stack trace.
+        """
+        fingerprint = entry_fingerprint(entry)
+        if not fingerprint:
+            return []
+        try:
+            matches = self.rag.find_by_fingerprint(fingerprint, limit=limit)
+        except Exception as e:
+            print(f"[ConsoleMonitor] Fingerprint lookup failed: {e}")
+            return []
+
+        for match in matches:
+            meta = match.pop('metadata', None) or {}
+            if meta.get('kind') == 'console':
+                match['fields'] = meta.get('fields', {})
+                match['occurrences'] = meta.get('occurrences', 1)
+        return matches
+
     def find_error_pattern(self, error_message: str, scene_name: str = "", game_object: str = "") -> Optional[Dict]:
         """
         Look for this error pattern in history with enhanced context matching.
@@ -408,9 +646,31 @@ class ConsoleMonitor:
 
         return " | ".join(parts) if parts else message[:100]
 
+    def _record_errors(self, entries: List[Dict]):
+        """Count error occurrences in the pattern store (after they were analyzed)"""
+        if self.pattern_matcher:
+            self.pattern_matcher.record_errors([
+                entry for entry in entries if entry.get('type', 'log').upper() == 'ERROR'
+            ])
+
+    def _flush_occurrences(self, now: float, force: bool = False):
+        """Write pending repeat counts, at most once per min_error_interval per document"""
+        counts = self.dedup.take_pending(now, 0.0 if force else self.min_error_interval)
+        if not counts:
+            return
+        try:
+            self.rag.record_occurrences(counts, private=True)
+        except Exception as e:
+            print(f"[ConsoleMonitor] Failed to record repeats: {e}")
+
+    def flush_occurrences(self):
+        """Write all pending repeat counts now."""
+        self._flush_occurrences(time.monotonic(), force=True)
+
     def reset_deduplication(self):
         """Clear the deduplication cache (e.g., at start of new session)."""
-        self.seen_hashes.clear()
+        self.flush_occurrences()
+        self.dedup.clear()
 
 
 # Integration with websocket or standalone usage
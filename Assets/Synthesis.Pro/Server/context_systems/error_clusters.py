@@ -0,0 +1,281 @@
+"""
+Error Clusters - online grouping of console errors by meaning
+
+Each new error signature is embedded once and joins the nearest cluster
+(cosine similarity to its centroid) or opens a new one. Centroids,
+member signatures and occurrence counts are persisted next to the
+error_patterns table, so pattern detection and trend views read clusters
+directly instead of searching the corpus again.
+
+    clusters = ErrorClusterer(store.db_path, rag.embed)
+    clusters.observe(error_entries)           # On capture
+    clusters.nearest("NullReferenceException in PlayerController")
+    clusters.top(10)                          # Busiest clusters
+"""
+
+import math
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from error_pattern_store import normalize_signature
+
+# Vectors embedded during analysis, kept for the capture that follows
+VECTOR_CACHE_SIZE = 256
+
+
+def cluster_text(entry: Dict) -> str:
+    """Text embedded for an error: exception line and script"""
+    message = entry.get('message', '').split('\n')[0][:200]
+    script = Path(entry['file']).stem if entry.get('file') else ""
+    return f"{message} in {script}" if script else message
+
+
+class ErrorClusterer:
+    """
+    Incremental (leader-style) clustering of error signatures.
+
+    A signature is assigned once, when first seen; later occurrences only
+    add to its cluster's counts.
+    """
+
+    def __init__(self, db_path: str, embed: Callable[[List[str]], List[List[float]]],
+                 threshold: float = 0.7):
+        self.db_path = str(db_path)
+        self.embed = embed
+        self.threshold = threshold  # Min cosine similarity to join a cluster
+
+        self._lock = threading.Lock()
+        self._vectors: "OrderedDict[str, List[float]]" = OrderedDict()  # text -> embedding
+        self._init_database()
+
+        # Centroids in memory (few hundred at most in practice)
+        self._ids: List[int] = []
+        self._centroids: List[List[float]] = []
+        self._sizes: List[int] = []
+        self._matrix = None
+        self._members: Dict[str, int] = {}
+        self._load()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS error_clusters (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        label TEXT NOT NULL,
+                        centroid BLOB NOT NULL,
+                        members INTEGER NOT NULL DEFAULT 0,
+                        occurrences INTEGER NOT NULL DEFAULT 0,
+                        first_seen TEXT NOT NULL,
+                        last_seen TEXT NOT NULL
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS error_cluster_members (
+                        signature TEXT PRIMARY KEY,
+                        cluster_id INTEGER NOT NULL,
+                        similarity REAL
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_error_cluster_members_cluster ON error_cluster_members(cluster_id)"
+                )
+        finally:
+            conn.close()
+
+    def _load(self):
+        conn = self._connect()
+        try:
+            for row in conn.execute("SELECT id, centroid, members FROM error_clusters ORDER BY id"):
+                self._ids.append(row['id'])
+                self._centroids.append(array('f', row['centroid']).tolist())
+                self._sizes.append(row['members'])
+            self._members = dict(conn.execute("SELECT signature, cluster_id FROM error_cluster_members").fetchall())
+        finally:
+            conn.close()
+
+    # ========== Assignment ==========
+
+    def observe(self, entries: List[Dict], seen_at: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Add error occurrences: new signatures are embedded (one batch) and
+        assigned, every occurrence counts toward its cluster.
+
+        Returns:
+            Cluster id by signature for the entries given
+        """
+        if not entries:
+            return {}
+        now = (seen_at or datetime.now()).isoformat()
+
+        counts: Dict[str, int] = {}
+        texts: Dict[str, str] = {}
+        for entry in entries:
+            signature = normalize_signature(entry.get('message', ''), entry.get('file', ''))
+            counts[signature] = counts.get(signature, 0) + 1
+            texts.setdefault(signature, cluster_text(entry))
+
+        with self._lock:
+            new = [signature for signature in counts if signature not in self._members]
+            vectors = self._embed([texts[signature] for signature in new]) if new else []
+
+            conn = self._connect()
+            try:
+                with conn:
+                    # New signatures, one at a time so clusters opened in this batch can attract the rest
+                    for signature, vector in zip(new, vectors):
+                        index, similarity = self._nearest_index(vector)
+                        if index is None or similarity < self.threshold:
+                            index = self._open_cluster(conn, signature, vector, now)
+                            similarity = 1.0
+                        else:
+                            self._absorb(conn, index, vector)
+                        self._members[signature] = self._ids[index]
+                        conn.execute(
+                            "INSERT OR REPLACE INTO error_cluster_members (signature, cluster_id, similarity) VALUES (?, ?, ?)",
+                            (signature, self._ids[index], similarity)
+                        )
+
+                    # Occurrence counts per cluster
+                    per_cluster: Dict[int, int] = {}
+                    for signature, count in counts.items():
+                        cluster_id = self._members[signature]
+                        per_cluster[cluster_id] = per_cluster.get(cluster_id, 0) + count
+                    conn.executemany(
+                        "UPDATE error_clusters SET occurrences = occurrences + ?, last_seen = ? WHERE id = ?",
+                        [(count, now, cluster_id) for cluster_id, count in per_cluster.items()]
+                    )
+            finally:
+                conn.close()
+
+        return {signature: self._members[signature] for signature in counts}
+
+    def _open_cluster(self, conn: sqlite3.Connection, label: str, vector: List[float], now: str) -> int:
+        cursor = conn.execute("""
+            INSERT INTO error_clusters (label, centroid, members, occurrences, first_seen, last_seen)
+            VALUES (?, ?, 1, 0, ?, ?)
+        """, (label, array('f', vector).tobytes(), now, now))
+        self._ids.append(cursor.lastrowid)
+        self._centroids.append(list(vector))
+        self._sizes.append(1)
+        self._matrix = None
+        return len(self._ids) - 1
+
+    def _absorb(self, conn: sqlite3.Connection, index: int, vector: List[float]):
+        """Move a centroid toward a new member (running mean, re-normalized)"""
+        size = self._sizes[index]
+        centroid = [(c * size + v) / (size + 1) for c, v in zip(self._centroids[index], vector)]
+        norm = math.sqrt(sum(c * c for c in centroid)) or 1.0
+        centroid = [c / norm for c in centroid]
+
+        self._centroids[index] = centroid
+        self._sizes[index] = size + 1
+        self._matrix = None
+        conn.execute(
+            "UPDATE error_clusters SET centroid = ?, members = ? WHERE id = ?",
+            (array('f', centroid).tobytes(), size + 1, self._ids[index])
+        )
+
+    # ========== Queries ==========
+
+    def nearest(self, text: str) -> Optional[Tuple[Dict, float]]:
+        """
+        Closest cluster for an error text, if within the threshold.
+
+        The embedding is kept briefly, so capturing the same error right
+        after analyzing it does not embed it again.
+        """
+        with self._lock:
+            if not self._ids:
+                return None
+            vector = self._embed([text])[0]
+            index, similarity = self._nearest_index(vector)
+            cluster_id = self._ids[index] if index is not None else None
+        if cluster_id is None or similarity < self.threshold:
+            return None
+        cluster = self.get(cluster_id)
+        return (cluster, similarity) if cluster else None
+
+    def cluster_of(self, signature: str) -> Optional[Dict]:
+        """Cluster a signature was assigned to"""
+        cluster_id = self._members.get(signature)
+        return self.get(cluster_id) if cluster_id is not None else None
+
+    def get(self, cluster_id: int) -> Optional[Dict]:
+        conn = self._connect()
+        try:
+            row = conn.execute("""
+                SELECT id, label, members, occurrences, first_seen, last_seen
+                FROM error_clusters WHERE id = ?
+            """, (cluster_id,)).fetchone()
+        finally:
+            conn.close()
+        return dict(row) if row else None
+
+    def top(self, limit: int = 10, order_by: str = "occurrences") -> List[Dict]:
+        """Clusters by occurrences (or last_seen), with their member signatures"""
+        order = "last_seen" if order_by == "last_seen" else "occurrences"
+        conn = self._connect()
+        try:
+            rows = conn.execute(f"""
+                SELECT id, label, members, occurrences, first_seen, last_seen
+                FROM error_clusters ORDER BY {order} DESC LIMIT ?
+            """, (limit,)).fetchall()
+            clusters = [dict(row) for row in rows]
+            for cluster in clusters:
+                cluster['signatures'] = [
+                    row[0] for row in conn.execute(
+                        "SELECT signature FROM error_cluster_members WHERE cluster_id = ? ORDER BY similarity DESC",
+                        (cluster['id'],)
+                    )
+                ]
+        finally:
+            conn.close()
+        return clusters
+
+    # ========== Internals ==========
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """Embeddings via the RAG engine, reusing recently embedded texts"""
+        missing = [text for text in dict.fromkeys(texts) if text not in self._vectors]
+        if missing:
+            for text, vector in zip(missing, self.embed(missing)):
+                self._vectors[text] = vector
+                while len(self._vectors) > VECTOR_CACHE_SIZE:
+                    self._vectors.popitem(last=False)
+        return [self._vectors[text] if text in self._vectors else self.embed([text])[0] for text in texts]
+
+    def _nearest_index(self, vector: List[float]) -> Tuple[Optional[int], float]:
+        if not self._centroids:
+            return None, -1.0
+
+        if NUMPY_AVAILABLE:
+            if self._matrix is None:
+                self._matrix = np.asarray(self._centroids, dtype=np.float32)
+            similarities = self._matrix @ np.asarray(vector, dtype=np.float32)
+            index = int(np.argmax(similarities))
+            return index, float(similarities[index])
+
+        best, best_similarity = None, -1.0
+        for index, centroid in enumerate(self._centroids):
+            similarity = sum(c * v for c, v in zip(centroid, vector))
+            if similarity > best_similarity:
+                best, best_similarity = index, similarity
+        return best, best_similarity
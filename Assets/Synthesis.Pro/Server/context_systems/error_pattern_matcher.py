@@ -15,25 +15,17 @@ Philosophy: Not just capturing errors, but learning from them.
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 import json
 
 # Add RAG core to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "RAG" / "core"))
 from rag_engine_lite import SynthesisRAG
 
-
-class ErrorPattern:
-    """Represents a pattern of errors with resolution tracking"""
-
-    def __init__(self, signature: str, first_seen: datetime, last_seen: datetime):
-        self.signature = signature
-        self.first_seen = first_seen
-        self.last_seen = last_seen
-        self.occurrence_count = 1
-        self.resolved = False
-        self.resolution_date = None
-        self.resolution_confidence = 0.0
+sys.path.insert(0, str(Path(__file__).parent))
+from error_pattern_store import ErrorPattern, ErrorPatternStore, normalize_signature
+from error_clusters import ErrorClusterer, cluster_text
+from stack_fingerprint import entry_fingerprint
 
 
 class ErrorPatternMatcher:
@@ -43,18 +35,40 @@ class ErrorPatternMatcher:
     Phase 3: Makes errors tell you not just what happened, but what to do about it.
     """
 
-    def __init__(self, rag_engine: SynthesisRAG):
+    def __init__(self, rag_engine: SynthesisRAG, store: Optional[ErrorPatternStore] = None):
         self.rag = rag_engine
 
+        # Known patterns by signature (next to the private database)
+        self.store = store
+        if self.store is None and getattr(rag_engine, 'private_database', None):
+            try:
+                self.store = ErrorPatternStore.for_database(rag_engine.private_database)
+            except Exception as e:
+                print(f"[ErrorPatternMatcher] Pattern store unavailable: {e}")
+
         # Configuration
         self.resolution_threshold_days = 7  # If error doesn't appear for 7 days, consider resolved
         self.pattern_match_threshold = 0.7  # Similarity threshold for pattern matching
         self.min_occurrences_for_pattern = 2  # Need 2+ occurrences to be a "pattern"
 
+        # Semantic groups of signatures (needs the RAG engine's embedding model)
+        self.clusters = None
+        if self.store is not None and hasattr(rag_engine, 'embed'):
+            try:
+                self.clusters = ErrorClusterer(self.store.db_path, rag_engine.embed,
+                                               threshold=self.pattern_match_threshold)
+            except Exception as e:
+                print(f"[ErrorPatternMatcher] Error clustering unavailable: {e}")
+
     def analyze_new_error(self, error_entry: Dict) -> Dict:
         """
         Analyze a new error and provide intelligent insights.
 
+        A signature already in the pattern store is answered from its row
+        (as is a new signature with a stored stack fingerprint: the same
+        crash, reworded), an unseen one from the nearest error cluster;
+        only errors unlike any cluster fall back to a semantic search.
+
         Returns:
             {
                 'is_known_pattern': bool,
@@ -64,23 +78,33 @@ class ErrorPatternMatcher:
                 'historical_context': str
             }
         """
-        # Extract error signature
-        signature = self._extract_signature(error_entry)
+        # Known signature or stack: index hits, no search
+        pattern = self.get_pattern(error_entry) or self.find_same_crash(error_entry)
+        cluster_match = None if pattern is not None else self._nearest_cluster(error_entry)
+        if pattern is not None and pattern.occurrence_count > 0:
+            similar_errors = []
+            pattern_analysis = self._analyze_stored_pattern(pattern, error_entry)
+        elif cluster_match is not None:
+            similar_errors = []
+            pattern_analysis = self._analyze_cluster(*cluster_match)
+        else:
+            # Extract error signature
+            signature = self._extract_signature(error_entry)
 
-        # Search for similar historical errors
-        similar_errors = self._find_similar_errors(signature, error_entry)
+            # Search for similar historical errors
+            similar_errors = self._find_similar_errors(signature, error_entry)
 
-        if not similar_errors:
-            return {
-                'is_known_pattern': False,
-                'pattern_match': None,
-                'suggested_fixes': [],
-                'confidence': 0.0,
-                'historical_context': 'First time seeing this error.'
-            }
+            if not similar_errors:
+                return {
+                    'is_known_pattern': False,
+                    'pattern_match': None,
+                    'suggested_fixes': [],
+                    'confidence': 0.0,
+                    'historical_context': 'First time seeing this error.'
+                }
 
-        # Analyze pattern
-        pattern_analysis = self._analyze_pattern(similar_errors, error_entry)
+            # Analyze pattern
+            pattern_analysis = self._analyze_pattern(similar_errors, error_entry)
 
         # Generate fix suggestions
         suggested_fixes = self._generate_fix_suggestions(
@@ -97,6 +121,75 @@ class ErrorPatternMatcher:
             'historical_context': self._generate_historical_context(similar_errors, pattern_analysis)
         }
 
+    def get_pattern(self, error_entry: Dict) -> Optional[ErrorPattern]:
+        """Stored pattern for an error's normalized signature (None if unseen or no store)"""
+        if self.store is None:
+            return None
+        try:
+            return self.store.get(self.pattern_signature(error_entry))
+        except Exception as e:
+            print(f"[ErrorPatternMatcher] Pattern lookup failed: {e}")
+            return None
+
+    def find_same_crash(self, error_entry: Dict) -> Optional[ErrorPattern]:
+        """Most recent stored pattern with the error's stack fingerprint (None without a stack)"""
+        if self.store is None:
+            return None
+        try:
+            matches = self.store.find_by_fingerprint(entry_fingerprint(error_entry), limit=1)
+        except Exception as e:
+            print(f"[ErrorPatternMatcher] Fingerprint lookup failed: {e}")
+            return None
+        return matches[0] if matches else None
+
+    def record_errors(self, error_entries: List[Dict]) -> int:
+        """
+        Count captured errors in the pattern store (call after analyzing
+        them, so a first occurrence is not reported as known).
+        """
+        if self.store is None or not error_entries:
+            return 0
+        try:
+            recorded = self.store.record(error_entries)
+        except Exception as e:
+            print(f"[ErrorPatternMatcher] Failed to record errors: {e}")
+            return 0
+
+        if self.clusters is not None:
+            try:
+                self.clusters.observe(error_entries)
+            except Exception as e:
+                print(f"[ErrorPatternMatcher] Failed to cluster errors: {e}")
+        return recorded
+
+    def _nearest_cluster(self, error_entry: Dict) -> Optional[Tuple[Dict, float]]:
+        if self.clusters is None:
+            return None
+        try:
+            return self.clusters.nearest(cluster_text(error_entry))
+        except Exception as e:
+            print(f"[ErrorPatternMatcher] Cluster lookup failed: {e}")
+            return None
+
+    @staticmethod
+    def pattern_signature(error_entry: Dict) -> str:
+        """Normalized signature the pattern store is keyed by"""
+        return normalize_signature(error_entry.get('message', ''), error_entry.get('file', ''))
+
+    def analysis_key(self, error_entry: Dict) -> Tuple[str, str, str, str, Optional[str]]:
+        """
+        Everything analyze_new_error depends on: entries with the same key get
+        the same analysis (search query, context, exception type and stack).
+        """
+        message = error_entry.get('message', '')
+        return (
+            self._extract_signature(error_entry),
+            error_entry.get('sceneName', ''),
+            error_entry.get('gameObjectName', ''),
+            message.split(':')[0] if ':' in message else '',
+            entry_fingerprint(error_entry)
+        )
+
     def _extract_signature(self, error_entry: Dict) -> str:
         """
         Extract searchable signature from error.
@@ -192,6 +285,44 @@ class ErrorPatternMatcher:
             'pattern_strength': 'strong' if avg_score > 0.8 else 'moderate' if avg_score > 0.5 else 'weak'
         }
 
+    def _analyze_stored_pattern(self, pattern: ErrorPattern, current_error: Dict) -> Dict:
+        """Pattern details from the pattern store (same shape as _analyze_pattern)"""
+        current_scene = current_error.get('sceneName', '')
+        current_object = current_error.get('gameObjectName', '')
+
+        same_scene_count = pattern.scenes.get(current_scene, 0) if current_scene else 0
+        same_object_count = pattern.objects.get(current_object, 0) if current_object else 0
+        same_stack = pattern.fingerprint is not None and pattern.fingerprint == entry_fingerprint(current_error)
+
+        # Exact signature match; same scene/object makes it stronger
+        confidence = 0.8 + (0.1 if same_scene_count else 0.0) + (0.1 if same_object_count else 0.0)
+
+        return {
+            'occurrences': pattern.occurrence_count,
+            'first_seen': pattern.first_seen.isoformat(),
+            'last_seen': pattern.last_seen.isoformat(),
+            'same_scene_occurrences': same_scene_count,
+            'same_object_occurrences': same_object_count,
+            'same_stack': same_stack,
+            'confidence': confidence,
+            'pattern_strength': 'strong' if confidence > 0.8 else 'moderate',
+            'resolved': pattern.resolved,
+            'resolution_date': pattern.resolution_date.isoformat() if pattern.resolution_date else None
+        }
+
+    def _analyze_cluster(self, cluster: Dict, similarity: float) -> Dict:
+        """Pattern details from the nearest error cluster (same shape as _analyze_pattern)"""
+        return {
+            'occurrences': cluster['occurrences'],
+            'first_seen': cluster['first_seen'],
+            'last_seen': cluster['last_seen'],
+            'same_scene_occurrences': 0,
+            'same_object_occurrences': 0,
+            'confidence': similarity,
+            'pattern_strength': 'strong' if similarity > 0.8 else 'moderate' if similarity > 0.5 else 'weak',
+            'cluster': cluster['label']
+        }
+
     def _extract_timestamps_from_errors(self, errors: List[Dict]) -> List[str]:
         """Extract timestamps from error text"""
         timestamps = []
@@ -257,10 +388,10 @@ class ErrorPatternMatcher:
     def _generate_historical_context(self, similar_errors: List[Dict], pattern_analysis: Dict) -> str:
         """Generate human-readable historical context"""
 
-        if not similar_errors:
+        if not similar_errors and not pattern_analysis:
             return "First occurrence of this error."
 
-        occurrences = len(similar_errors)
+        occurrences = pattern_analysis.get('occurrences', len(similar_errors))
         confidence = pattern_analysis.get('confidence', 0.0)
 
         context = f"Seen {occurrences} time(s) before. "
@@ -287,15 +418,44 @@ class ErrorPatternMatcher:
         if same_scene > 0:
             context += f"{same_scene} occurrence(s) in same scene. "
 
+        if pattern_analysis.get('same_stack'):
+            context += "Same stack trace as before. "
+
+        if pattern_analysis.get('cluster'):
+            context += f"Similar to error group '{pattern_analysis['cluster']}'. "
+
+        resolution_date = pattern_analysis.get('resolution_date')
+        if pattern_analysis.get('resolved') and resolution_date:
+            context += f"Was marked resolved on {resolution_date[:10]} - possible regression. "
+
         return context.strip()
 
-    def track_error_resolution(self, signature: str, resolved: bool = True):
+    def track_error_resolution(self, error: Union[Dict, str], resolved: bool = True) -> bool:
         """
         Mark an error pattern as resolved (or not).
 
         This can be called manually or automatically detected when
         an error stops appearing for threshold_days.
+
+        Args:
+            error: Error entry, or a signature as stored (see pattern_signature)
+            resolved: New resolution state
+
+        Returns:
+            True if a stored pattern was updated
         """
+        signature = self.pattern_signature(error) if isinstance(error, dict) else error
+
+        updated = False
+        if self.store is not None:
+            try:
+                updated = self.store.mark_resolved(signature, resolved)
+            except Exception as e:
+                print(f"[ErrorPatternMatcher] Failed to update pattern store: {e}")
+            else:
+                if not updated:
+                    print(f"[ErrorPatternMatcher] No stored pattern for signature: {signature}")
+
         # Store resolution in RAG
         resolution_note = f"""
         [ERROR_RESOLUTION]
@@ -305,6 +465,7 @@ class ErrorPatternMatcher:
         """
 
         self.rag.add_text(resolution_note.strip(), private=True)
+        return updated
 
 
 # Testing
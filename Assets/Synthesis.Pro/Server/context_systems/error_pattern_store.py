@@ -0,0 +1,376 @@
+"""
+Error Pattern Store - persistent, signature-indexed error patterns
+
+One row per normalized error signature (exception type + script, with
+volatile details like numbers, addresses and quoted names stripped):
+occurrence count, first/last seen, and the scenes and GameObjects it
+appeared in. Updated on every captured error, so "have I seen this
+before?" is a primary key lookup instead of a semantic search.
+
+Lives in its own SQLite file next to the private knowledge database
+(<private>_patterns.db): pattern updates happen on every capture and must
+not invalidate the search indexes of the documents database.
+
+Each pattern also keeps the stack fingerprint of its latest occurrence
+(see stack_fingerprint), indexed, so the same crash reported with a
+different message or file is still found by an equality query.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from stack_fingerprint import entry_fingerprint
+
+# Scenes/objects remembered per pattern (most frequent kept)
+MAX_CONTEXT_NAMES = 20
+
+# State key of the resolution scan position ("last_seen\tsignature", see ResolutionDetector)
+RESOLUTION_WATERMARK = "resolution_watermark"
+
+_HEX = re.compile(r"0x[0-9a-f]+|\b[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}\b")
+_QUOTED = re.compile(r"'[^']*'|\"[^\"]*\"")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize_signature(message: str, file_path: str = "") -> str:
+    """
+    Stable key for an error: exception type (or normalized message) and script.
+
+    "NullReferenceException: ... at 'Enemy (12)'" in Assets/AI/Enemy.cs
+    -> "nullreferenceexception in enemy"
+    """
+    # Exception type (or the whole message), volatile details stripped either way
+    head = message.split(':')[0] if "Exception" in message else message
+    head = _HEX.sub('#', head.lower())
+    head = _QUOTED.sub('"*"', head)
+    head = _NUMBER.sub('#', head)
+    head = head[:80]
+
+    head = _SPACE.sub(' ', head).strip().lower()
+    script = Path(file_path).stem.lower() if file_path else ""
+    return f"{head} in {script}" if script else head
+
+
+class ErrorPattern:
+    """Represents a pattern of errors with resolution tracking"""
+
+    def __init__(self, signature: str, first_seen: datetime, last_seen: datetime):
+        self.signature = signature
+        self.first_seen = first_seen
+        self.last_seen = last_seen
+        self.occurrence_count = 1
+        self.resolved = False
+        self.resolution_date = None
+        self.resolution_confidence = 0.0
+        self.resolution_context: List[Dict] = []  # Related documents found when resolved
+
+        # Occurrences by scene / GameObject name
+        self.scenes: Dict[str, int] = {}
+        self.objects: Dict[str, int] = {}
+        self.sample_message = ""
+        self.fingerprint: Optional[str] = None  # Stack fingerprint of the latest occurrence
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'ErrorPattern':
+        pattern = cls(
+            row['signature'],
+            datetime.fromisoformat(row['first_seen']),
+            datetime.fromisoformat(row['last_seen'])
+        )
+        pattern.occurrence_count = row['occurrences']
+        pattern.resolved = bool(row['resolved'])
+        pattern.resolution_date = datetime.fromisoformat(row['resolved_at']) if row['resolved_at'] else None
+        pattern.resolution_confidence = row['resolution_confidence'] or 0.0
+        pattern.resolution_context = json.loads(row['resolution_context'] or '[]')
+        pattern.scenes = json.loads(row['scenes'] or '{}')
+        pattern.objects = json.loads(row['objects'] or '{}')
+        pattern.sample_message = row['sample_message'] or ""
+        pattern.fingerprint = row['fingerprint']
+        return pattern
+
+    def to_dict(self) -> Dict:
+        return {
+            'signature': self.signature,
+            'occurrences': self.occurrence_count,
+            'first_seen': self.first_seen.isoformat(),
+            'last_seen': self.last_seen.isoformat(),
+            'scenes': self.scenes,
+            'objects': self.objects,
+            'resolved': self.resolved,
+            'resolution_date': self.resolution_date.isoformat() if self.resolution_date else None,
+            'resolution_confidence': self.resolution_confidence,
+            'resolution_context': self.resolution_context,
+            'sample_message': self.sample_message,
+            'fingerprint': self.fingerprint
+        }
+
+
+class ErrorPatternStore:
+    """
+    error_patterns table: one row per normalized signature.
+
+    Usage:
+        store = ErrorPatternStore.for_database(rag.private_database)
+        store.record([entry, ...])       # On capture
+        store.get(signature)             # ErrorPattern or None
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()  # One writer per process (SQLite locks across processes)
+        self._init_database()
+
+    @classmethod
+    def for_database(cls, private_database: str) -> 'ErrorPatternStore':
+        """Store next to a knowledge database (synthesis_private.db -> synthesis_private_patterns.db)"""
+        path = Path(private_database)
+        return cls(path.with_name(f"{path.stem}_patterns.db"))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS error_patterns (
+                        signature TEXT PRIMARY KEY,
+                        sample_message TEXT,
+                        occurrences INTEGER NOT NULL DEFAULT 0,
+                        first_seen TEXT NOT NULL,
+                        last_seen TEXT NOT NULL,
+                        scenes TEXT,
+                        objects TEXT,
+                        resolved INTEGER NOT NULL DEFAULT 0,
+                        resolved_at TEXT,
+                        resolution_confidence REAL,
+                        resolution_context TEXT,
+                        fingerprint TEXT
+                    )
+                """)
+                columns = {row['name'] for row in conn.execute("PRAGMA table_info(error_patterns)")}
+                if 'resolution_context' not in columns:
+                    conn.execute("ALTER TABLE error_patterns ADD COLUMN resolution_context TEXT")
+                if 'fingerprint' not in columns:
+                    conn.execute("ALTER TABLE error_patterns ADD COLUMN fingerprint TEXT")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_error_patterns_last_seen ON error_patterns(last_seen)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_error_patterns_fingerprint ON error_patterns(fingerprint)")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS error_pattern_state (
+                        key TEXT PRIMARY KEY,
+                        value TEXT
+                    )
+                """)
+        finally:
+            conn.close()
+
+    def get(self, signature: str) -> Optional[ErrorPattern]:
+        """Pattern for a normalized signature (primary key lookup)"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM error_patterns WHERE signature = ?", (signature,)).fetchone()
+        finally:
+            conn.close()
+        return ErrorPattern.from_row(row) if row else None
+
+    def find_by_fingerprint(self, fingerprint: str, limit: int = 5) -> List[ErrorPattern]:
+        """Patterns whose latest occurrence had this stack fingerprint, most recent first"""
+        if not fingerprint:
+            return []
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT * FROM error_patterns WHERE fingerprint = ? ORDER BY last_seen DESC LIMIT ?",
+                (fingerprint, limit)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [ErrorPattern.from_row(row) for row in rows]
+
+    def record(self, entries: List[Dict], seen_at: Optional[datetime] = None) -> int:
+        """
+        Count error occurrences (one transaction, one row update per signature).
+
+        A resolved pattern that occurs again is reopened.
+
+        Returns:
+            Number of signatures updated
+        """
+        if not entries:
+            return 0
+        now = (seen_at or datetime.now()).isoformat()
+
+        # Aggregate the batch per signature first
+        batch: Dict[str, Dict] = {}
+        for entry in entries:
+            message = entry.get('message', '')
+            signature = normalize_signature(message, entry.get('file', ''))
+            agg = batch.setdefault(signature, {'count': 0, 'scenes': {}, 'objects': {}, 'message': message})
+            agg['count'] += 1
+            agg['latest'] = entry
+            for key, name in (('scenes', entry.get('sceneName')), ('objects', entry.get('gameObjectName'))):
+                if name:
+                    agg[key][name] = agg[key].get(name, 0) + 1
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    for signature, agg in batch.items():
+                        row = conn.execute(
+                            "SELECT occurrences, first_seen, scenes, objects, fingerprint FROM error_patterns WHERE signature = ?",
+                            (signature,)
+                        ).fetchone()
+                        fingerprint = entry_fingerprint(agg['latest'])  # Once per signature
+                        if row:
+                            occurrences = row['occurrences'] + agg['count']
+                            first_seen = row['first_seen']
+                            fingerprint = fingerprint or row['fingerprint']
+                            scenes = self._merge_names(json.loads(row['scenes'] or '{}'), agg['scenes'])
+                            objects = self._merge_names(json.loads(row['objects'] or '{}'), agg['objects'])
+                        else:
+                            occurrences, first_seen = agg['count'], now
+                            scenes = self._merge_names({}, agg['scenes'])
+                            objects = self._merge_names({}, agg['objects'])
+
+                        conn.execute("""
+                            INSERT OR REPLACE INTO error_patterns
+                                (signature, sample_message, occurrences, first_seen, last_seen,
+                                 scenes, objects, resolved, resolved_at, resolution_confidence, fingerprint)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, 0, NULL, NULL, ?)
+                        """, (signature, agg['message'][:500], occurrences, first_seen, now,
+                              json.dumps(scenes), json.dumps(objects), fingerprint))
+            finally:
+                conn.close()
+
+        return len(batch)
+
+    def mark_resolved(self, signature: str, resolved: bool = True, confidence: float = 1.0,
+                      resolved_at: Optional[datetime] = None, context: Optional[List[Dict]] = None,
+                      last_seen: Optional[datetime] = None) -> bool:
+        """
+        Set a pattern's resolution state.
+
+        Args:
+            signature: Normalized signature
+            resolved: Resolved (True) or reopened (False)
+            confidence: How sure the resolution is (0-1)
+            resolved_at: When it was resolved (default: now)
+            context: Related documents (e.g. decisions around the fix)
+            last_seen: Only update if the pattern was not seen since (guards
+                       against an occurrence recorded while deciding)
+
+        A reopened pattern keeps its last_seen, so the resolution scan
+        position is moved back to it; otherwise the scan, which only moves
+        forward, would never look at the pattern again.
+
+        Returns:
+            False if the signature is unknown (or was seen again)
+        """
+        query = """
+            UPDATE error_patterns SET resolved = ?, resolved_at = ?, resolution_confidence = ?, resolution_context = ?
+            WHERE signature = ?
+        """
+        params = [
+            int(resolved),
+            (resolved_at or datetime.now()).isoformat() if resolved else None,
+            confidence if resolved else None,
+            json.dumps(context) if resolved and context else None,
+            signature
+        ]
+        if last_seen is not None:
+            query += " AND last_seen = ?"
+            params.append(last_seen.isoformat())
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    cursor = conn.execute(query, params)
+                    if not resolved and cursor.rowcount > 0:
+                        self._rewind_watermark(conn, signature)
+            finally:
+                conn.close()
+        return cursor.rowcount > 0
+
+    @staticmethod
+    def _rewind_watermark(conn: sqlite3.Connection, signature: str):
+        """Move the resolution scan position back before a reopened pattern"""
+        row = conn.execute("SELECT last_seen FROM error_patterns WHERE signature = ?", (signature,)).fetchone()
+        state = conn.execute("SELECT value FROM error_pattern_state WHERE key = ?",
+                             (RESOLUTION_WATERMARK,)).fetchone()
+        if not row or not state or not state['value']:
+            return
+        if tuple(state['value'].split('\t', 1)) >= (row['last_seen'], signature):
+            # Empty signature sorts first: the scan resumes with every pattern of that last_seen
+            conn.execute("UPDATE error_pattern_state SET value = ? WHERE key = ?",
+                         (f"{row['last_seen']}\t", RESOLUTION_WATERMARK))
+
+    def unresolved_before(self, cutoff: datetime, after: Optional[Tuple[str, str]] = None,
+                          limit: int = 100) -> List[ErrorPattern]:
+        """
+        Unresolved patterns last seen at or before cutoff, oldest first.
+
+        Pages by (last_seen, signature) on the last_seen index: pass the
+        last pattern's key as `after` to continue.
+        """
+        query = "SELECT * FROM error_patterns WHERE resolved = 0 AND last_seen <= ?"
+        params: List = [cutoff.isoformat()]
+        if after:
+            query += " AND last_seen >= ? AND (last_seen > ? OR signature > ?)"
+            params += [after[0], after[0], after[1]]
+        query += " ORDER BY last_seen, signature LIMIT ?"
+        params.append(limit)
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+        return [ErrorPattern.from_row(row) for row in rows]
+
+    def get_state(self, key: str) -> Optional[str]:
+        """Small persisted value for background jobs (e.g. scan positions)"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM error_pattern_state WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+        return row['value'] if row else None
+
+    def set_state(self, key: str, value: Optional[str]):
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("INSERT OR REPLACE INTO error_pattern_state (key, value) VALUES (?, ?)", (key, value))
+            finally:
+                conn.close()
+
+    def recent(self, limit: int = 20) -> List[ErrorPattern]:
+        """Most recently seen patterns"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT * FROM error_patterns ORDER BY last_seen DESC LIMIT ?", (limit,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [ErrorPattern.from_row(row) for row in rows]
+
+    @staticmethod
+    def _merge_names(stored: Dict[str, int], new: Dict[str, int]) -> Dict[str, int]:
+        for name, count in new.items():
+            stored[name] = stored.get(name, 0) + count
+        if len(stored) > MAX_CONTEXT_NAMES:
+            stored = dict(sorted(stored.items(), key=lambda item: item[1], reverse=True)[:MAX_CONTEXT_NAMES])
+        return stored
@@ -0,0 +1,222 @@
+"""
+Resolution Detector - marks error patterns resolved once they stop occurring
+
+A background thread wakes up every `interval` seconds and walks the
+error_patterns table along its last_seen index, picking up only patterns
+that crossed the quiet threshold (ErrorPatternMatcher.resolution_threshold_days)
+since the previous run. Each newly quiet pattern is marked resolved, with
+conversations, decisions and notes from around the time it stopped
+attached as likely context for the fix.
+
+Runs on its own thread and only takes short store transactions, so
+console capture and searches never wait for it.
+"""
+
+import re
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+from error_pattern_store import ErrorPattern, RESOLUTION_WATERMARK
+
+# Documents that may explain a fix
+RELATED_PREFIXES = ('[CONVERSATION]', '[DECISION', '[LEARNING', '[QUICK-NOTE', '[CHECKPOINT', '[AI-NOTE')
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+WATERMARK_KEY = RESOLUTION_WATERMARK
+
+
+class ResolutionDetector:
+    """
+    Scheduled job: pattern store -> resolved patterns (+ [ERROR_RESOLUTION] notes).
+
+    Usage:
+        detector = ResolutionDetector(monitor.pattern_matcher)
+        detector.start()
+        ...
+        detector.stop()
+    """
+
+    def __init__(self, matcher, interval: float = 3600.0, batch_size: int = 100,
+                 correlation_days: float = 2.0,
+                 on_resolved: Optional[Callable[[List[Dict]], None]] = None):
+        """
+        Args:
+            matcher: ErrorPatternMatcher (store, RAG engine, threshold)
+            interval: Seconds between scans
+            batch_size: Patterns read per store query
+            correlation_days: Related documents may be this many days after the last occurrence
+            on_resolved: Called (on the job thread) with the patterns resolved by a run
+        """
+        self.matcher = matcher
+        self.store = matcher.store
+        self.rag = matcher.rag
+        self.interval = interval
+        self.batch_size = batch_size
+        self.correlation_days = correlation_days
+        self.on_resolved = on_resolved
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {'runs': 0, 'scanned': 0, 'resolved': 0, 'last_run': None}
+
+    def start(self):
+        """Start the job thread (first scan right away)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="resolution-detector", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"[ResolutionDetector] Scan failed: {e}")
+            self._stop.wait(self.interval)
+
+    def run_once(self, now: Optional[datetime] = None) -> List[Dict]:
+        """
+        Resolve patterns that went quiet since the last run.
+
+        Returns:
+            Resolved patterns (dicts)
+        """
+        now = now or datetime.now()
+        cutoff = now - timedelta(days=self.matcher.resolution_threshold_days)
+
+        watermark = self.store.get_state(WATERMARK_KEY)
+        after = tuple(watermark.split('\t', 1)) if watermark else None
+
+        resolved = []
+        while not self._stop.is_set():
+            batch = self.store.unresolved_before(cutoff, after, self.batch_size)
+            if not batch:
+                break
+
+            for pattern in batch:
+                self.stats['scanned'] += 1
+                related = self._related_documents(pattern)
+                confidence = self._confidence(pattern, related)
+                if self.store.mark_resolved(pattern.signature, True, confidence,
+                                            resolved_at=pattern.last_seen, context=related,
+                                            last_seen=pattern.last_seen):
+                    pattern.resolved = True
+                    pattern.resolution_date = pattern.last_seen
+                    pattern.resolution_confidence = confidence
+                    pattern.resolution_context = related
+                    resolved.append(pattern.to_dict())
+
+            # Patterns seen again later get a newer last_seen, so they are found again
+            # (reopened patterns move the watermark back, see mark_resolved)
+            after = (batch[-1].last_seen.isoformat(), batch[-1].signature)
+            self.store.set_state(WATERMARK_KEY, '\t'.join(after))
+
+        self.stats['runs'] += 1
+        self.stats['resolved'] += len(resolved)
+        self.stats['last_run'] = now.isoformat()
+
+        if resolved:
+            self._record_notes(resolved)
+            if self.on_resolved:
+                self.on_resolved(resolved)
+        return resolved
+
+    def _related_documents(self, pattern: ErrorPattern) -> List[Dict]:
+        """Conversations/decisions/notes about this error from around when it stopped"""
+        query = f"{pattern.signature} {pattern.sample_message[:200]} fix"
+        try:
+            results = self.rag.search(query, top_k=10, scope="private")
+        except Exception as e:
+            print(f"[ResolutionDetector] Search failed: {e}")
+            return []
+
+        start = (pattern.last_seen - timedelta(days=1)).date()
+        end = (pattern.last_seen + timedelta(days=self.correlation_days)).date()
+
+        # Dated in the text ([CONVERSATION] ... 2026-03-01), else when it was stored ([AI-NOTE:...])
+        candidates = [result for result in results if result['text'].startswith(RELATED_PREFIXES)]
+        days = [self._text_day(result['text']) for result in candidates]
+        undated = [result.get('id') for result, day in zip(candidates, days)
+                   if day is None and result.get('id') is not None]
+        stored_days = self._stored_days(undated)
+
+        related = []
+        for result, day in zip(candidates, days):
+            if day is None:
+                day = stored_days.get(result.get('id'))
+            if day is not None and start <= day <= end:
+                text = result['text']
+                related.append({
+                    'id': result.get('id'),
+                    'kind': text[1:text.find(']')].split(':')[0],
+                    'date': day.isoformat(),
+                    'excerpt': text[:200],
+                    'score': result.get('score', 0.0)
+                })
+        return related[:3]
+
+    @staticmethod
+    def _text_day(text: str) -> Optional[date]:
+        match = _DATE.search(text[:300])
+        if not match:
+            return None
+        try:
+            return datetime.strptime(match.group(0), "%Y-%m-%d").date()
+        except ValueError:
+            return None
+
+    def _stored_days(self, doc_ids: List[int]) -> Dict[int, date]:
+        """Local day each private document was stored (added_at is UTC)"""
+        if not doc_ids or not hasattr(self.rag, 'get_added_at'):
+            return {}
+        try:
+            stamps = self.rag.get_added_at(doc_ids, private=True)
+        except Exception as e:
+            print(f"[ResolutionDetector] Failed to read document times: {e}")
+            return {}
+
+        days = {}
+        for doc_id, stamp in zip(doc_ids, stamps):
+            try:
+                added = datetime.fromisoformat(stamp).replace(tzinfo=timezone.utc)
+            except (TypeError, ValueError):
+                continue
+            days[doc_id] = added.astimezone().date()
+        return days
+
+    @staticmethod
+    def _confidence(pattern: ErrorPattern, related: List[Dict]) -> float:
+        # Frequent errors that stop are more likely fixed; a nearby decision/conversation helps
+        confidence = 1.0 - 1.0 / (1 + pattern.occurrence_count)
+        if related:
+            confidence += 0.1
+        return round(min(confidence, 0.99), 2)
+
+    def _record_notes(self, resolved: List[Dict]):
+        """[ERROR_RESOLUTION] documents, one batch (same format as track_error_resolution)"""
+        notes = []
+        for pattern in resolved:
+            note = (
+                f"[ERROR_RESOLUTION]\n"
+                f"Signature: {pattern['signature']}\n"
+                f"Status: RESOLVED\n"
+                f"Date: {pattern['resolution_date']}\n"
+                f"Detected: no occurrences for {self.matcher.resolution_threshold_days} days "
+                f"(after {pattern['occurrences']})\n"
+                f"Confidence: {pattern['resolution_confidence']:.2f}"
+            )
+            for doc in pattern['resolution_context']:
+                note += f"\nRelated {doc['kind']} ({doc['date']}): {doc['excerpt'][:120]}"
+            notes.append(note)
+        try:
+            self.rag.add_texts(notes, private=True)
+        except Exception as e:
+            print(f"[ResolutionDetector] Failed to store resolution notes: {e}")
@@ -0,0 +1,143 @@
+"""
+Stack Fingerprint - canonical stack frames and a "same crash" key
+
+Unity reports the same crash with different stack text depending on where
+it comes from: the console ("Player.Update () (at Assets/Player.cs:42)"),
+Editor.log / Mono ("at Player.Update () [0x00012] in /abs/Player.cs:42")
+or .NET style ("at Player.Update() in Assets/Player.cs:42"). Line numbers
+move on every edit, IL offsets and compiler-generated names on every
+recompile.
+
+Frames are reduced to their method path (no parameters, line numbers,
+addresses, generic arity or compiler-generated ordinals), and the top
+frames plus the exception type are hashed. Stores keep the hash in an
+indexed column, so "have I seen this exact crash?" is an equality query.
+
+    fingerprint = stack_fingerprint(entry['message'], entry['stackTrace'])
+
+Zero external dependencies - uses only Python standard library.
+"""
+
+import hashlib
+import re
+from typing import Dict, Iterable, List, Optional
+
+# Frames hashed (deeper frames are mostly engine/player loop)
+FINGERPRINT_FRAMES = 8
+
+# Logging plumbing above the frame that actually logged
+_SKIPPED_FRAMES = (
+    'UnityEngine.Debug.', 'UnityEngine.Logger.', 'UnityEngine.DebugLogHandler.',
+    'UnityEngine.StackTraceUtility.', 'System.Environment.',
+)
+
+# "  at Ns.Type.Method (args) [0x00012] in /path/File.cs:42"  (Mono / .NET)
+_AT_FRAME = re.compile(
+    r"^\s*at\s+(?P<method>[^\s(]+)\s*\([^)]*\)(?:\s*\[0x[0-9a-fA-F]+\])?"
+    r"(?:\s+in\s+(?P<file>.*?):(?:line\s*)?(?P<line>\d+))?"
+)
+# "Ns.Type:Method(args) (at Assets/File.cs:42)"  (Unity console)
+_UNITY_FRAME = re.compile(
+    r"^\s*(?P<method>[\w.`<>\[\],:+$]+?)\s*\([^)]*\)(?:\s*\(at\s+(?P<file>.*?):(?P<line>\d+)\))?\s*$"
+)
+_EXCEPTION = re.compile(r"^\s*([\w.]+(?:Exception|Error))\b")
+
+_ARITY = re.compile(r"`\d+")
+_GENERIC_ARGS = re.compile(r"\[[^\[\]]*\]|<[^<>]*,[^<>]*>")
+_GENERATED = re.compile(r"<([^<>]*)>([a-z])__\d+(?:_\d+)?")
+_ORDINAL = re.compile(r"\|\d+_\d+|(?<=DisplayClass)\d+(?:_\d+)?")
+_DIGIT_SUFFIX = re.compile(r"(__|\$)\d+")
+
+
+def parse_frame(line: str) -> Optional[Dict]:
+    """
+    One stack frame line, any of the formats above.
+
+    Returns:
+        {'method': ..., 'file': ... or None, 'line': int or None}, or None if not a frame
+    """
+    match = _AT_FRAME.match(line) or _UNITY_FRAME.match(line)
+    if not match:
+        return None
+    return {
+        'method': match.group('method'),
+        'file': match.group('file'),
+        'line': int(match.group('line')) if match.group('line') else None
+    }
+
+
+def parse_frames(stack_trace: str) -> List[Dict]:
+    """Frames of a stack trace (lines that are not frames are skipped)"""
+    frames = []
+    for raw in stack_trace.splitlines():
+        frame = parse_frame(raw)
+        if frame:
+            frames.append(frame)
+    return frames
+
+
+def normalize_frame(method: str) -> str:
+    """
+    Canonical method path of a frame.
+
+    "Game.Inventory`1[T].<Load>d__12.MoveNext" -> "Game.Inventory.<Load>d.MoveNext"
+    "UnityEngine.Debug:LogError"               -> "UnityEngine.Debug.LogError"
+    """
+    method = method.split('(')[0].strip()  # Parameters, if the frame text kept them
+    method = method.replace(':', '.').replace('+', '.').replace('/', '.')
+    method = _ARITY.sub('', method)
+    previous = None
+    while previous != method:  # Nested generic arguments
+        previous = method
+        method = _GENERIC_ARGS.sub('', method)
+    method = _GENERATED.sub(r'<\1>\2', method)
+    method = _ORDINAL.sub('', method)
+    method = _DIGIT_SUFFIX.sub(r'\1', method)
+    return method.strip('.')
+
+
+def canonical_frames(methods: Iterable[str], limit: int = FINGERPRINT_FRAMES) -> List[str]:
+    """Top normalized frames, logging plumbing skipped"""
+    frames = []
+    for method in methods:
+        frame = normalize_frame(method)
+        if not frame or frame.startswith(_SKIPPED_FRAMES):
+            continue
+        frames.append(frame)
+        if len(frames) >= limit:
+            break
+    return frames
+
+
+def exception_type(message: str) -> str:
+    """'System.NullReferenceException: Object reference...' -> 'System.NullReferenceException' ('' if none)"""
+    match = _EXCEPTION.match(message or '')
+    return match.group(1) if match else ''
+
+
+def fingerprint(exception: str, methods: Iterable[str]) -> Optional[str]:
+    """
+    Fingerprint of an exception type and its frames' methods.
+
+    Returns:
+        16 hex chars, or None without frames (type alone is not a crash identity)
+    """
+    frames = canonical_frames(methods)
+    if not frames:
+        return None
+    key = '\n'.join([exception.split('.')[-1]] + frames)
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def stack_fingerprint(message: str, stack_trace: str) -> Optional[str]:
+    """Fingerprint of a console entry / log error (message + stack trace text)"""
+    if not stack_trace:
+        return None
+    return fingerprint(exception_type(message), (frame['method'] for frame in parse_frames(stack_trace)))
+
+
+def entry_fingerprint(entry: Dict) -> Optional[str]:
+    """Fingerprint of a console entry (or the one already computed for it)"""
+    if entry.get('fingerprint'):
+        return entry['fingerprint']
+    return stack_fingerprint(entry.get('message', ''), entry.get('stackTrace', ''))
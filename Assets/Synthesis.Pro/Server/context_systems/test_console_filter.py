@@ -0,0 +1,129 @@
+"""
+Tests for ConsoleFilter rule precedence and hot reload
+
+    python -m pytest test_console_filter.py
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from console_filter import ConsoleFilter
+
+
+def _write_rules(path: Path, config: dict, mtime: float):
+    path.write_text(json.dumps(config), encoding='utf-8')
+    os.utime(path, (mtime, mtime))  # Distinct mtime even on coarse filesystem clocks
+
+
+def _filter_for(config: dict):
+    directory = Path(tempfile.mkdtemp())
+    path = directory / "console_filter.json"
+    _write_rules(path, config, 1_000_000)
+    return directory, path, ConsoleFilter(path, reload_interval=0)
+
+
+def test_earliest_match_wins():
+    """The rule matching earliest in the message decides, whatever the rule order"""
+    directory, _, console_filter = _filter_for({"rules": [
+        {"name": "deny-shader", "action": "deny", "pattern": "shader"},
+        {"name": "allow-failed", "action": "allow", "pattern": "failed"},
+    ]})
+    try:
+        assert not console_filter.allows("warning", "Shader compile failed")
+        assert console_filter.allows("warning", "Failed to load shader")
+        hits = {rule['name']: rule['hits'] for rule in console_filter.stats()['rules']}
+        assert hits == {"deny-shader": 1, "allow-failed": 1}, hits
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_tie_goes_to_first_rule():
+    """Rules matching at the same position: the one listed first wins"""
+    directory, _, console_filter = _filter_for({"rules": [
+        {"name": "allow", "action": "allow", "pattern": "mesh"},
+        {"name": "deny", "action": "deny", "pattern": "mesh.colors"},
+    ]})
+    try:
+        assert console_filter.allows("warning", "Mesh.colors is out of bounds")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_types_regex_and_defaults():
+    """Rules apply to their entry types only; unmatched entries get the type's default"""
+    directory, _, console_filter = _filter_for({
+        "defaults": {"log": False},
+        "rules": [
+            {"name": "rag", "action": "allow", "types": ["log"], "pattern": "[rag]"},
+            {"name": "shader", "action": "deny", "pattern": "Shader .+ is not supported", "regex": True},
+        ]
+    })
+    try:
+        assert console_filter.allows("log", "[RAG] index ready")
+        assert not console_filter.allows("log", "Player moved")
+        assert console_filter.allows("warning", "[RAG] index ready")       # Rule is log-only; default allows
+        assert not console_filter.allows("error", "Shader Foo/Bar is not supported on this GPU")
+        assert not console_filter.allows("unknown", "anything")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_hot_reload_keeps_hits():
+    """An edited file is picked up on the next check; hit counters carry over by rule name"""
+    directory, path, console_filter = _filter_for({"rules": [
+        {"name": "obsolete", "action": "deny", "pattern": "obsolete"},
+    ]})
+    try:
+        assert not console_filter.allows("warning", "API is obsolete")
+
+        _write_rules(path, {"rules": [
+            {"name": "obsolete", "action": "allow", "pattern": "obsolete"},
+        ]}, 1_000_100)
+        assert console_filter.allows("warning", "API is obsolete")
+        assert console_filter.rules[0].hits == 2
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_bad_file_keeps_previous_rules():
+    """Invalid JSON keeps the active rules; bad rules are skipped and reported"""
+    directory, path, console_filter = _filter_for({"rules": [
+        {"name": "obsolete", "action": "deny", "pattern": "obsolete"},
+    ]})
+    try:
+        path.write_text("{not json", encoding='utf-8')
+        os.utime(path, (1_000_100, 1_000_100))
+        assert not console_filter.allows("warning", "API is obsolete")
+        assert console_filter.errors
+
+        _write_rules(path, {"rules": [
+            {"name": "grouped", "action": "deny", "pattern": "(a|b)", "regex": True},
+            {"name": "noisy", "action": "deny", "pattern": "noisy"},
+        ]}, 1_000_200)
+        assert not console_filter.allows("warning", "noisy warning")
+        assert console_filter.allows("warning", "API is obsolete")
+        assert [rule.name for rule in console_filter.rules] == ["noisy"]
+        assert len(console_filter.errors) == 1
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_inline_global_flags_are_rejected():
+    """A regex rule with (?i) is skipped instead of breaking the combined regex"""
+    directory, path, console_filter = _filter_for({"rules": [
+        {"name": "global-flag", "action": "deny", "pattern": "(?i)shader", "regex": True},
+        {"name": "scoped-flag", "action": "deny", "pattern": "(?i:mesh)", "regex": True},
+    ]})
+    try:
+        assert [rule.name for rule in console_filter.rules] == ["scoped-flag"]
+        assert len(console_filter.errors) == 1 and "global-flag" in console_filter.errors[0]
+        assert console_filter.allows("warning", "Shader error")
+        assert not console_filter.allows("warning", "Mesh has no normals")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
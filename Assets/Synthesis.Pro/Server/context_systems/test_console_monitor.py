@@ -0,0 +1,208 @@
+"""
+Tests for ConsoleMonitor batch capture and DedupCache
+Runs without the embedding model (a recording stand-in replaces the RAG engine)
+
+    python -m pytest test_console_monitor.py
+"""
+
+import hashlib
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from console_filter import ConsoleFilter
+from console_monitor import ConsoleMonitor, DedupCache
+
+
+class RecordingRAG:
+    """Stores documents in memory and records every call"""
+
+    def __init__(self, directory: str):
+        self.private_database = str(Path(directory) / "test_private.db")
+        self.batches = []
+        self.single_adds = 0
+        self.occurrences = {}
+
+    @staticmethod
+    def doc_hash(text: str) -> str:
+        return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+    def add_texts(self, texts, private=True, metadata=None, fingerprints=None):
+        self.batches.append(list(texts))
+        return [True] * len(texts)
+
+    def add_text(self, text, private=True, metadata=None, fingerprint=None):
+        self.single_adds += 1
+        return True
+
+    def record_occurrences(self, counts, private=True, last_seen=None):
+        for doc_hash, count in counts.items():
+            self.occurrences[doc_hash] = self.occurrences.get(doc_hash, 0) + count
+        return len(counts)
+
+    def search(self, query, top_k=5, search_type="hybrid", scope="both"):
+        return []
+
+
+def _error(message: str, line: int = 10) -> dict:
+    return {
+        'type': 'error',
+        'message': message,
+        'file': 'Assets/Scripts/Player.cs',
+        'line': line,
+        'stackTrace': f'Player.Update () (at Assets/Scripts/Player.cs:{line})'
+    }
+
+
+def _monitor(directory: str) -> ConsoleMonitor:
+    return ConsoleMonitor(RecordingRAG(directory), console_filter=ConsoleFilter(path=None))
+
+
+def test_batch_is_one_store_call():
+    """Distinct entries of a batch are stored with one add_texts call"""
+    directory = tempfile.mkdtemp()
+    try:
+        monitor = _monitor(directory)
+        stats = monitor.capture_batch([
+            _error("NullReferenceException: a", 1),
+            _error("IndexOutOfRangeException: b", 2),
+            {'type': 'warning', 'message': 'Texture is not readable'},
+        ])
+        assert stats['captured'] == 3, stats
+        assert len(monitor.rag.batches) == 1 and len(monitor.rag.batches[0]) == 3
+        assert monitor.rag.single_adds == 0
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_batch_filters_and_dedups_within_batch():
+    """Filtered entries are skipped; repeats inside a batch are counted, not stored"""
+    directory = tempfile.mkdtemp()
+    try:
+        monitor = _monitor(directory)
+        entry = _error("NullReferenceException: a")
+        stats = monitor.capture_batch([
+            entry, dict(entry), dict(entry),
+            {'type': 'log', 'message': 'Player moved'},              # Logs are off by default
+            {'type': 'warning', 'message': 'API is obsolete'},       # Denied by a rule
+        ])
+        assert stats['captured'] == 1, stats
+        assert stats['repeats'] == 2, stats
+        assert stats['skipped'] == 4, stats
+
+        monitor.flush_occurrences()
+        document = monitor.rag.batches[0][0]
+        assert monitor.rag.occurrences == {monitor.rag.doc_hash(document): 2}
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_batch_repeats_recent_entries():
+    """An entry captured by an earlier batch is counted on its document"""
+    directory = tempfile.mkdtemp()
+    try:
+        monitor = _monitor(directory)
+        entry = _error("NullReferenceException: a")
+        monitor.capture_batch([entry])
+        stats = monitor.capture_batch([dict(entry)])
+        assert stats['captured'] == 0 and stats['repeats'] == 1, stats
+        assert len(monitor.rag.batches) == 1  # Nothing new to store
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_dedup_expires_after_quiet_window():
+    """Entries are known while they repeat and expire after `window` quiet seconds"""
+    cache = DedupCache(window=10, max_entries=100)
+    record = cache.add(1, "doc-a", now=0)
+    assert cache.lookup(1, now=5) is record
+    cache.repeat(1, record, now=8)            # Restarts the window
+    assert cache.lookup(1, now=17) is record
+    assert cache.lookup(1, now=28.5) is None
+    assert cache.stats['expired'] == 1 and len(cache) == 0
+
+
+def test_dedup_evicts_least_recently_seen():
+    """Over max_entries, the entry seen longest ago goes first"""
+    cache = DedupCache(window=100, max_entries=2)
+    first = cache.add(1, "doc-a", now=0)
+    cache.add(2, "doc-b", now=1)
+    cache.repeat(1, first, now=2)             # 1 is now the most recent
+    cache.add(3, "doc-c", now=3)
+    assert cache.lookup(2, now=3) is None
+    assert cache.lookup(1, now=3) is not None and cache.lookup(3, now=3) is not None
+    assert cache.stats['evicted'] == 1
+
+
+def test_dedup_keeps_counts_of_dropped_entries():
+    """Pending repeats of expired or evicted entries are still handed out"""
+    cache = DedupCache(window=10, max_entries=1)
+    record = cache.add(1, "doc-a", now=0)
+    cache.repeat(1, record, now=1, count=3)
+    cache.add(2, "doc-b", now=2)              # Evicts 1
+    assert cache.take_pending(now=2) == {"doc-a": 3}
+
+    record = cache.lookup(2, now=2)
+    cache.repeat(2, record, now=3)
+    cache.lookup(2, now=20)                   # Expires 2
+    assert cache.take_pending(now=20) == {"doc-b": 1}
+
+
+def test_dedup_take_pending_min_interval():
+    """A document written less than min_interval ago keeps accumulating"""
+    cache = DedupCache(window=100, max_entries=10)
+    record = cache.add(1, "doc-a", now=0)
+    cache.repeat(1, record, now=1)
+    assert cache.take_pending(now=1, min_interval=5) == {"doc-a": 1}
+
+    cache.repeat(1, record, now=2)
+    cache.repeat(1, record, now=3)
+    assert cache.take_pending(now=3, min_interval=5) == {}
+    assert cache.take_pending(now=6, min_interval=5) == {"doc-a": 2}
+    assert cache.take_pending(now=20, min_interval=5) == {}
+
+
+class KnownPatternMatcher:
+    """Pattern matcher stand-in: every error is a known pattern"""
+
+    def __init__(self):
+        self.analyzed = 0
+
+    def analysis_key(self, entry):
+        return entry['message']
+
+    def analyze_new_error(self, entry):
+        self.analyzed += 1
+        return {
+            'is_known_pattern': True,
+            'historical_context': 'Seen 3 times',
+            'confidence': 0.9,
+            'suggested_fixes': ['Check for null', 'Add a guard'],
+            'pattern_match': {'pattern_strength': 'strong', 'occurrences': 3}
+        }
+
+    def record_errors(self, entries):
+        return len(entries)
+
+
+def test_documents_end_with_pattern_analysis():
+    """Known patterns add an analysis section after the entry text (analyzed once per batch)"""
+    directory = tempfile.mkdtemp()
+    try:
+        monitor = _monitor(directory)
+        monitor.pattern_matcher = KnownPatternMatcher()
+        entry = dict(_error("NullReferenceException: a"), timestamp="2026-03-01T12:00:00")
+        stats = monitor.capture_batch([entry, _error("NullReferenceException: a", 11)])
+
+        document = monitor.rag.batches[0][0]
+        head, analysis = document.split("\n--- PATTERN ANALYSIS ---\n")
+        assert head == monitor.format_entry(monitor.entry_fields(entry))
+        assert analysis == ("Historical Context: Seen 3 times\nConfidence: 0.90\n"
+                            "Suggested Fixes:\n  • Check for null\n  • Add a guard\n"
+                            "Pattern Strength: STRONG\nOccurrences: 3\n")
+        assert monitor.pattern_matcher.analyzed == 1 and len(stats['pattern_matches']) == 2
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
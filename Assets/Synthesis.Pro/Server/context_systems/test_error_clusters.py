@@ -0,0 +1,103 @@
+"""
+Tests for ErrorClusterer (online clustering of error signatures)
+Uses a keyword embedding instead of the sentence model
+
+    python -m pytest test_error_clusters.py
+"""
+
+import math
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from error_clusters import ErrorClusterer
+
+_AXES = ("nullreference", "indexoutofrange", "shader")
+
+
+class KeywordEmbedder:
+    """Unit vectors from keyword counts; counts the texts it embeds"""
+
+    def __init__(self):
+        self.embedded = []
+
+    def __call__(self, texts):
+        self.embedded += texts
+        vectors = []
+        for text in texts:
+            lower = text.lower()
+            vector = [float(lower.count(axis)) for axis in _AXES] + [0.1]
+            norm = math.sqrt(sum(v * v for v in vector))
+            vectors.append([v / norm for v in vector])
+        return vectors
+
+
+def _clusterer(directory: str):
+    embed = KeywordEmbedder()
+    return embed, ErrorClusterer(Path(directory) / "test_patterns.db", embed, threshold=0.7)
+
+
+def test_similar_errors_share_a_cluster():
+    """Signatures with nearby embeddings join one cluster, others open new ones"""
+    directory = tempfile.mkdtemp()
+    try:
+        _, clusters = _clusterer(directory)
+        assigned = clusters.observe([
+            {'message': 'NullReferenceException: a', 'file': 'Assets/Player.cs'},
+            {'message': 'NullReferenceException: b', 'file': 'Assets/Enemy.cs'},
+            {'message': 'IndexOutOfRangeException: c', 'file': 'Assets/Inventory.cs'},
+        ])
+        ids = list(assigned.values())
+        assert ids[0] == ids[1] != ids[2], assigned
+        assert len(clusters.top()) == 2
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_signatures_embedded_once():
+    """Repeats only add to counts; a signature is embedded when first seen"""
+    directory = tempfile.mkdtemp()
+    try:
+        embed, clusters = _clusterer(directory)
+        entry = {'message': 'NullReferenceException: a', 'file': 'Assets/Player.cs'}
+        clusters.observe([entry, dict(entry)])
+        clusters.observe([entry])
+        assert len(embed.embedded) == 1
+
+        top = clusters.top(1)[0]
+        assert top['occurrences'] == 3 and top['members'] == 1
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_nearest_respects_threshold():
+    """nearest() returns a cluster only within the similarity threshold"""
+    directory = tempfile.mkdtemp()
+    try:
+        _, clusters = _clusterer(directory)
+        assert clusters.nearest("NullReferenceException in Player") is None  # No clusters yet
+        clusters.observe([{'message': 'NullReferenceException: a', 'file': 'Assets/Player.cs'}])
+
+        cluster, similarity = clusters.nearest("NullReferenceException in Camera")
+        assert similarity >= 0.7 and cluster['members'] == 1
+        assert clusters.nearest("Shader error in Water") is None
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_clusters_persist():
+    """A new clusterer on the same file knows existing members"""
+    directory = tempfile.mkdtemp()
+    try:
+        _, clusters = _clusterer(directory)
+        entry = {'message': 'NullReferenceException: a', 'file': 'Assets/Player.cs'}
+        cluster_id = clusters.observe([entry])
+
+        embed, reopened = _clusterer(directory)
+        assert reopened.observe([entry]) == cluster_id
+        assert embed.embedded == []
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
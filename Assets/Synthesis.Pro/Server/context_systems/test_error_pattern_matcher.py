@@ -0,0 +1,43 @@
+"""
+Tests for ErrorPatternMatcher's use of the pattern store
+
+    python -m pytest test_error_pattern_matcher.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from error_pattern_matcher import ErrorPatternMatcher
+from error_pattern_store import ErrorPatternStore
+
+
+class StubRAG:
+    def __init__(self):
+        self.notes = []
+
+    def add_text(self, text, private=True, metadata=None, fingerprint=None):
+        self.notes.append(text)
+        return True
+
+
+def test_track_error_resolution_uses_store_signature(tmp_path):
+    """An error entry (with scene and object) resolves the pattern it was recorded under"""
+    store = ErrorPatternStore(tmp_path / "test_patterns.db")
+    matcher = ErrorPatternMatcher(StubRAG(), store=store)
+    entry = {'message': "NullReferenceException: 'Enemy (3)' has no target", 'file': 'Assets/AI/Enemy.cs',
+             'sceneName': 'Level1', 'gameObjectName': 'Enemy (3)'}
+    store.record([entry])
+    signature = matcher.pattern_signature(entry)
+
+    assert matcher.track_error_resolution(entry)
+    assert store.get(signature).resolved
+    assert f"Signature: {signature}" in matcher.rag.notes[-1]
+
+    assert matcher.track_error_resolution(signature, resolved=False)
+    assert not store.get(signature).resolved
+
+    # Unknown pattern: still noted, but reported as not updated
+    assert not matcher.track_error_resolution({'message': 'Never seen', 'file': 'Assets/X.cs'})
+    assert len(matcher.rag.notes) == 3
@@ -0,0 +1,92 @@
+"""
+Tests for ErrorPatternStore (signatures, occurrence counts, paging)
+
+    python -m pytest test_error_pattern_store.py
+"""
+
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from error_pattern_store import ErrorPatternStore, normalize_signature
+
+
+def _store():
+    directory = tempfile.mkdtemp()
+    return directory, ErrorPatternStore(Path(directory) / "test_patterns.db")
+
+
+def test_signature_ignores_volatile_details():
+    """Numbers, addresses and quoted names do not split a pattern"""
+    assert normalize_signature(
+        "NullReferenceException: Object reference not set at 'Enemy (12)'", "Assets/AI/Enemy.cs"
+    ) == "nullreferenceexception in enemy"
+    assert normalize_signature("Texture 'Grass' has 2048 mips at 0x7ff3a2", "") == \
+        normalize_signature("Texture 'Rock' has 512 mips at 0x1b", "")
+    # Mentions an exception without a "Type:" prefix
+    assert normalize_signature("Unhandled Exception in job 17 for 'Enemy (3)'", "") == \
+        normalize_signature("Unhandled Exception in job 4 for 'Boss'", "")
+
+
+def test_record_aggregates_per_signature():
+    """One row per signature, with counts, scenes and objects merged across batches"""
+    directory, store = _store()
+    try:
+        entry = {'message': 'NullReferenceException: x', 'file': 'Assets/Player.cs',
+                 'sceneName': 'Main', 'gameObjectName': 'Player'}
+        assert store.record([entry, dict(entry, gameObjectName='Enemy')]) == 1
+        store.record([entry])
+
+        pattern = store.get(normalize_signature(entry['message'], entry['file']))
+        assert pattern.occurrence_count == 3
+        assert pattern.scenes == {'Main': 3}
+        assert pattern.objects == {'Player': 2, 'Enemy': 1}
+        assert store.get("unknown signature") is None
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_record_reopens_resolved_pattern():
+    """A resolved pattern that occurs again is unresolved"""
+    directory, store = _store()
+    try:
+        entry = {'message': 'IndexOutOfRangeException: y', 'file': 'Assets/Inventory.cs'}
+        store.record([entry])
+        signature = normalize_signature(entry['message'], entry['file'])
+        assert store.mark_resolved(signature, True, 0.9)
+        assert store.get(signature).resolved
+
+        store.record([entry])
+        assert not store.get(signature).resolved
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_unresolved_before_pages_by_last_seen():
+    """Patterns at or before the cutoff come oldest first and page by (last_seen, signature)"""
+    directory, store = _store()
+    try:
+        start = datetime(2026, 1, 1)
+        for day in range(5):
+            store.record([{'message': f'Error number {chr(97 + day)}x'}], seen_at=start + timedelta(days=day))
+            store.record([{'message': f'Other error {chr(97 + day)}y'}], seen_at=start + timedelta(days=day))
+
+        cutoff = start + timedelta(days=3)
+        seen = []
+        after = None
+        while True:
+            batch = store.unresolved_before(cutoff, after, limit=3)
+            if not batch:
+                break
+            seen += [pattern.signature for pattern in batch]
+            after = (batch[-1].last_seen.isoformat(), batch[-1].signature)
+
+        assert len(seen) == 8 == len(set(seen)), seen
+        keys = [(store.get(signature).last_seen, signature) for signature in seen]
+        assert keys == sorted(keys)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,139 @@
+"""
+Tests for ResolutionDetector (scan watermark, compare-and-set resolve)
+
+    python -m pytest test_resolution_detector.py
+"""
+
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from error_pattern_store import ErrorPatternStore, RESOLUTION_WATERMARK, normalize_signature
+from resolution_detector import ResolutionDetector
+
+NOW = datetime(2026, 3, 1, 12, 0)
+
+
+class StubRAG:
+    def __init__(self):
+        self.notes = []
+        self.documents = []
+        self.added_at = {}
+
+    def search(self, query, top_k=5, search_type="hybrid", scope="both"):
+        return self.documents
+
+    def get_added_at(self, doc_ids, private=True):
+        return [self.added_at.get(doc_id) for doc_id in doc_ids]
+
+    def add_texts(self, texts, private=True, metadata=None, fingerprints=None):
+        self.notes += texts
+        return [True] * len(texts)
+
+
+class StubMatcher:
+    resolution_threshold_days = 7
+
+    def __init__(self, store):
+        self.store = store
+        self.rag = StubRAG()
+
+
+def _detector():
+    directory = tempfile.mkdtemp()
+    store = ErrorPatternStore(Path(directory) / "test_patterns.db")
+    return directory, store, ResolutionDetector(StubMatcher(store), batch_size=2)
+
+
+def _record(store, message, days_ago):
+    store.record([{'message': message}], seen_at=NOW - timedelta(days=days_ago))
+    return normalize_signature(message)
+
+
+def test_resolves_quiet_patterns_only():
+    """Patterns quiet for the threshold are resolved; recent ones are left alone"""
+    directory, store, detector = _detector()
+    try:
+        old = [_record(store, f"Old error {name}", 10 + i) for i, name in enumerate("abc")]
+        recent = _record(store, "Recent error", 1)
+
+        resolved = detector.run_once(now=NOW)
+        assert sorted(p['signature'] for p in resolved) == sorted(old)
+        assert all(store.get(signature).resolved for signature in old)
+        assert not store.get(recent).resolved
+        assert len(detector.matcher.rag.notes) == 3
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_watermark_skips_scanned_patterns():
+    """The next run starts after the persisted watermark instead of rescanning"""
+    directory, store, detector = _detector()
+    try:
+        _record(store, "Old error a", 10)
+        detector.run_once(now=NOW)
+        assert store.get_state(RESOLUTION_WATERMARK)
+
+        scanned = detector.stats['scanned']
+        assert detector.run_once(now=NOW) == []
+        assert detector.stats['scanned'] == scanned
+
+        # A pattern that goes quiet later is picked up from the watermark on
+        later = _record(store, "Later error", 3)
+        resolved = detector.run_once(now=NOW + timedelta(days=5))
+        assert [p['signature'] for p in resolved] == [later]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_reopened_pattern_is_scanned_again():
+    """Reopening a pattern moves the watermark back, so it can be resolved again"""
+    directory, store, detector = _detector()
+    try:
+        signatures = [_record(store, f"Old error {name}", 10 + i) for i, name in enumerate("abc")]
+        detector.run_once(now=NOW)
+
+        assert store.mark_resolved(signatures[1], False)
+        resolved = detector.run_once(now=NOW)
+        assert [p['signature'] for p in resolved] == [signatures[1]]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_resolve_is_compare_and_set():
+    """A pattern seen again after it was read is not resolved"""
+    directory, store, detector = _detector()
+    try:
+        signature = _record(store, "Old error a", 10)
+        pattern = store.unresolved_before(NOW - timedelta(days=7))[0]
+
+        _record(store, "Old error a", 0)  # Occurs again while the job decides
+        assert not store.mark_resolved(signature, True, 0.9, last_seen=pattern.last_seen)
+        assert not store.get(signature).resolved
+
+        latest = store.get(signature).last_seen
+        assert store.mark_resolved(signature, True, 0.9, last_seen=latest)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_undated_notes_use_stored_time():
+    """[AI-NOTE] documents carry no date in their text, so their stored time places them"""
+    directory, store, detector = _detector()
+    try:
+        signature = _record(store, "Old error a", 10)
+        rag = detector.matcher.rag
+        rag.documents = [{'id': 1, 'text': "[AI-NOTE:fix] Null check added in PlayerController", 'score': 0.9},
+                         {'id': 2, 'text': "[AI-NOTE:fix] Unrelated note from long ago", 'score': 0.8}]
+        rag.added_at = {1: "2026-02-19 12:00:00", 2: "2025-01-01 00:00:00"}
+
+        resolved = detector.run_once(now=NOW)
+        assert [p['signature'] for p in resolved] == [signature]
+        context = resolved[0]['resolution_context']
+        assert [(doc['id'], doc['kind']) for doc in context] == [(1, 'AI-NOTE')]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,86 @@
+"""
+Tests for stack_fingerprint (frame parsing, normalization, crash identity)
+
+    python -m pytest test_stack_fingerprint.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stack_fingerprint import (
+    entry_fingerprint, normalize_frame, parse_frame, stack_fingerprint
+)
+
+CONSOLE_TRACE = """UnityEngine.Debug:LogException(Exception)
+Game.Inventory`1:Load(String) (at Assets/Scripts/Inventory.cs:42)
+Game.Player:Update() (at Assets/Scripts/Player.cs:17)
+"""
+
+MONO_TRACE = """  at UnityEngine.Debug.LogException (System.Exception exception) [0x00000] in <a1b2c3>:0
+  at Game.Inventory`1[T].Load (System.String path) [0x0001c] in /Users/dev/Project/Assets/Scripts/Inventory.cs:45
+  at Game.Player.Update () [0x00008] in /Users/dev/Project/Assets/Scripts/Player.cs:19
+"""
+
+DOTNET_TRACE = """   at Game.Inventory`1.Load(String path) in C:\\Project\\Assets\\Scripts\\Inventory.cs:line 48
+   at Game.Player.Update() in C:\\Project\\Assets\\Scripts\\Player.cs:line 20
+"""
+
+
+def test_parse_console_frame():
+    frame = parse_frame("Game.Player:Update() (at Assets/Scripts/Player.cs:17)")
+    assert frame == {'method': 'Game.Player:Update', 'file': 'Assets/Scripts/Player.cs', 'line': 17}
+
+
+def test_parse_mono_frame():
+    frame = parse_frame("  at Game.Player.Update () [0x00008] in /abs/Assets/Scripts/Player.cs:19")
+    assert frame == {'method': 'Game.Player.Update', 'file': '/abs/Assets/Scripts/Player.cs', 'line': 19}
+
+
+def test_parse_dotnet_frame():
+    frame = parse_frame("   at Game.Player.Update() in C:\\Project\\Player.cs:line 20")
+    assert frame == {'method': 'Game.Player.Update', 'file': 'C:\\Project\\Player.cs', 'line': 20}
+    assert parse_frame("NullReferenceException: Object reference not set") is None
+
+
+def test_normalize_console_frame():
+    assert normalize_frame("UnityEngine.Debug:LogError") == "UnityEngine.Debug.LogError"
+    assert normalize_frame("Game.Player:Update (UnityEngine.Vector3)") == "Game.Player.Update"
+
+
+def test_normalize_mono_frame():
+    """Generic arity/arguments and compiler-generated ordinals are dropped"""
+    assert normalize_frame("Game.Inventory`1[T].<Load>d__12.MoveNext") == "Game.Inventory.<Load>d.MoveNext"
+    assert normalize_frame("Game.Loader+<>c__DisplayClass3_0.<Start>b__0") == \
+        normalize_frame("Game.Loader+<>c__DisplayClass7_1.<Start>b__2")
+    assert normalize_frame("Game.Cache`2[System.String,System.Int32].Get") == "Game.Cache.Get"
+
+
+def test_normalize_dotnet_frame():
+    assert normalize_frame("Game.Inventory`1.Load") == "Game.Inventory.Load"
+    assert normalize_frame("Game.Outer+Inner.Run") == "Game.Outer.Inner.Run"
+
+
+def test_same_crash_across_formats():
+    """Console, Mono and .NET text of one crash share a fingerprint (line numbers ignored)"""
+    message = "System.NullReferenceException: Object reference not set to an instance of an object"
+    fingerprints = {stack_fingerprint(message, trace) for trace in (CONSOLE_TRACE, MONO_TRACE, DOTNET_TRACE)}
+    assert len(fingerprints) == 1 and None not in fingerprints, fingerprints
+
+    # Unqualified exception name in the console message: same crash
+    assert stack_fingerprint("NullReferenceException: Object reference", CONSOLE_TRACE) in fingerprints
+
+
+def test_different_crash_differs():
+    message = "NullReferenceException: Object reference not set"
+    other_frames = CONSOLE_TRACE.replace("Player:Update", "Player:LateUpdate")
+    assert stack_fingerprint(message, CONSOLE_TRACE) != stack_fingerprint(message, other_frames)
+    assert stack_fingerprint(message, CONSOLE_TRACE) != \
+        stack_fingerprint("IndexOutOfRangeException: Index was outside", CONSOLE_TRACE)
+
+
+def test_no_frames_no_fingerprint():
+    assert stack_fingerprint("Some warning", "") is None
+    assert stack_fingerprint("Some warning", "UnityEngine.Debug:LogWarning(Object)\n") is None
+    assert entry_fingerprint({'message': 'x', 'stackTrace': CONSOLE_TRACE, 'fingerprint': 'abc'}) == 'abc'
@@ -14,9 +14,11 @@ import os
 import sys
 import json
 import hashlib
+import shutil
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import urllib.request
 import urllib.error
 
@@ -31,6 +33,14 @@ MODEL_FILE_NAME = "embeddinggemma-300M-Q8_0.gguf"  # NOT USED - kept for compati
 
 VERSION_FILE = "db_version.json"
 
+# Read size for streamed downloads (progress/cancellation granularity)
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
+class DownloadCancelled(Exception):
+    """Raised when a download is aborted through its cancel event"""
+    pass
+
 
 class DatabaseManager:
     """Manages public database downloads, updates, and contributions"""
@@ -160,34 +170,86 @@ class DatabaseManager:
 
         return None
 
-    def _download_database(self, url: str, version: str) -> bool:
-        """Download database from URL"""
-        try:
-            print(f"Downloading public database (version {version})...")
+    def _fetch_to_file(self, url: str, dest: Path,
+                       progress: Optional[Callable[[str, int, int], None]] = None,
+                       cancel_event: Optional[threading.Event] = None) -> str:
+        """
+        Stream a URL to a file, hashing while downloading
 
-            # Download to temporary file
-            temp_path = self.public_db_path.with_suffix('.db.download')
+        Args:
+            url: Source URL
+            dest: Destination file (overwritten)
+            progress: Callback(stage, bytes_done, bytes_total) - defaults to console output
+            cancel_event: Set to abort the download (raises DownloadCancelled)
 
-            # Create progress callback
-            def progress_hook(block_count, block_size, total_size):
-                if total_size > 0:
-                    percent = min(100, block_count * block_size * 100 / total_size)
-                    print(f"\rProgress: {percent:.1f}%", end='', flush=True)
+        Returns:
+            SHA256 checksum of the downloaded file
+        """
+        sha256 = hashlib.sha256()
+        done = 0
 
-            urllib.request.urlretrieve(url, temp_path, progress_hook)
+        with urllib.request.urlopen(url, timeout=30) as response, open(dest, 'wb') as f:
+            total = int(response.headers.get('Content-Length') or 0)
+
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise DownloadCancelled("Download cancelled")
+
+                chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                f.write(chunk)
+                sha256.update(chunk)
+                done += len(chunk)
+
+                if progress:
+                    progress("download", done, total)
+                elif total > 0:
+                    print(f"\rProgress: {min(100, done * 100 / total):.1f}%", end='', flush=True)
+
+        if not progress:
             print()  # New line after progress
 
-            # Calculate checksum
-            checksum = self._calculate_checksum(temp_path)
+        return sha256.hexdigest()
 
-            # Move to final location
-            if self.public_db_path.exists():
-                # Backup existing database
-                backup_path = self.public_db_path.with_suffix('.db.backup')
-                self.public_db_path.rename(backup_path)
-                print(f"Previous database backed up to: {backup_path.name}")
+    def _install_file(self, temp_path: Path, final_path: Path, backup_path: Path):
+        """
+        Swap a downloaded file into place
+
+        The existing file is copied to the backup first, then replaced in a
+        single os.replace() - readers see either the old or the new file,
+        never a missing one.
+        """
+        if final_path.exists():
+            shutil.copy2(final_path, backup_path)
+            print(f"Previous file backed up to: {backup_path.name}")
 
-            temp_path.rename(self.public_db_path)
+        os.replace(temp_path, final_path)
+
+    def _download_database(self, url: str, version: str,
+                           progress: Optional[Callable[[str, int, int], None]] = None,
+                           cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Download database from URL
+
+        The download goes to a temporary file and is only swapped in once
+        complete, so the current database keeps serving meanwhile.
+
+        Raises:
+            DownloadCancelled: If cancel_event was set (temporary file removed)
+        """
+        temp_path = self.public_db_path.with_suffix('.db.download')
+
+        try:
+            print(f"Downloading public database (version {version})...")
+
+            checksum = self._fetch_to_file(url, temp_path, progress, cancel_event)
+
+            if progress:
+                progress("install", 0, 0)
+            self._install_file(temp_path, self.public_db_path,
+                               self.public_db_path.with_suffix('.db.backup'))
 
             # Save version info
             size = self.public_db_path.stat().st_size
@@ -200,11 +262,16 @@ class DatabaseManager:
 
             return True
 
+        except DownloadCancelled:
+            print("Database download cancelled")
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
         except Exception as e:
             print(f"Error downloading database: {e}")
 
             # Clean up temp file if it exists
-            temp_path = self.public_db_path.with_suffix('.db.download')
             if temp_path.exists():
                 temp_path.unlink()
 
@@ -288,12 +355,16 @@ class DatabaseManager:
         # Models auto-download via sentence-transformers - no manual setup needed
         return True
 
-    def setup_database(self, force: bool = False) -> bool:
+    def setup_database(self, force: bool = False,
+                       progress: Optional[Callable[[str, int, int], None]] = None,
+                       cancel_event: Optional[threading.Event] = None) -> bool:
         """
         Ensure public database is set up (download if needed)
 
         Args:
             force: Force download even if database exists
+            progress: Download progress callback(stage, bytes_done, bytes_total)
+            cancel_event: Set to abort the download
 
         Returns:
             True if setup successful, False otherwise
@@ -332,7 +403,7 @@ class DatabaseManager:
         print(f"general C# programming knowledge to help you code faster.")
 
         # Download
-        return self._download_database(asset['url'], asset['version'])
+        return self._download_database(asset['url'], asset['version'], progress, cancel_event)
 
     def setup_model(self, force: bool = False) -> bool:
         """
@@ -413,10 +484,15 @@ class DatabaseManager:
 
         return updates
 
-    def update_all(self) -> bool:
+    def update_all(self, progress: Optional[Callable[[str, int, int], None]] = None,
+                   cancel_event: Optional[threading.Event] = None) -> bool:
         """
         Update both database and model to latest versions
 
+        Args:
+            progress: Download progress callback(stage, bytes_done, bytes_total)
+            cancel_event: Set to abort the download (raises DownloadCancelled)
+
         Returns:
             True if all updates successful, False otherwise
         """
@@ -452,7 +528,7 @@ class DatabaseManager:
 
             asset = self._find_database_asset(release_data)
             if asset:
-                if not self._download_database(asset['url'], asset['version']):
+                if not self._download_database(asset['url'], asset['version'], progress, cancel_event):
                     success = False
             else:
                 print("Warning: Database asset not found in release")
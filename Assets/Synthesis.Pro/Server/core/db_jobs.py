@@ -0,0 +1,249 @@
+"""
+Database Jobs - Synthesis.Pro
+Background jobs for public database setup, update checks and downloads
+
+DatabaseManager does network and disk I/O (downloads, SHA256 hashing)
+that can take minutes. Running it on the event loop would freeze every
+connected client, so servers submit it here instead:
+
+- Each job gets an ID and runs on a dedicated worker thread
+- Progress is reported through an event callback (throttled)
+- Jobs can be cancelled while downloading
+- The current database keeps serving until the new file is swapped in
+
+Events (topic, data):
+    jobs.started   - job dict
+    jobs.progress  - job dict with progress
+    jobs.finished  - job dict with final status, result or error
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from database_manager import DownloadCancelled
+
+
+class DatabaseJob:
+    """One background database operation"""
+
+    # Status values
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    FINAL_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+    def __init__(self, kind: str, on_event: Optional[Callable[[str, Dict], None]] = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.status = self.PENDING
+        self.message = ""
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.progress = {'stage': None, 'bytes_done': 0, 'bytes_total': 0, 'percent': 0.0}
+        self.created = datetime.now().isoformat()
+        self.started: Optional[str] = None
+        self.finished: Optional[str] = None
+
+        self.cancel_event = threading.Event()
+        self.done = asyncio.Event()
+
+        self._on_event = on_event
+        self._last_report = 0.0
+        self._last_percent = -1.0
+
+    @property
+    def is_active(self) -> bool:
+        return self.status not in self.FINAL_STATES
+
+    def report(self, stage: str, done: int, total: int):
+        """
+        Progress callback for DatabaseManager (called from the worker thread).
+
+        Events are throttled to whole-percent steps or 0.5s, whichever
+        comes later, plus every stage change.
+        """
+        percent = round(done * 100.0 / total, 1) if total > 0 else 0.0
+        stage_changed = stage != self.progress['stage']
+
+        self.progress = {
+            'stage': stage,
+            'bytes_done': done,
+            'bytes_total': total,
+            'percent': percent
+        }
+
+        now = time.monotonic()
+        if stage_changed or (now - self._last_report >= 0.5 and int(percent) != int(self._last_percent)):
+            self._last_report = now
+            self._last_percent = percent
+            self._emit("jobs.progress")
+
+    def _emit(self, topic: str):
+        if self._on_event:
+            try:
+                self._on_event(topic, self.to_dict())
+            except Exception:
+                pass
+
+    def to_dict(self) -> Dict:
+        """JSON friendly view of the job"""
+        return {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'message': self.message,
+            'progress': dict(self.progress),
+            'result': self.result,
+            'error': self.error,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished
+        }
+
+
+class DatabaseJobManager:
+    """
+    Runs DatabaseManager work off the event loop.
+
+    Jobs of the same group never run twice at once: submitting while one
+    is active returns the active job. Setup and update share the "install"
+    group so two downloads can never race to swap the same file.
+
+    All methods must be called from the event loop.
+    """
+
+    JOB_GROUPS = {
+        'setup': 'install',
+        'update': 'install',
+        'check_updates': 'check_updates'
+    }
+
+    def __init__(self, on_event: Optional[Callable[[str, Dict], None]] = None,
+                 max_workers: int = 2, max_history: int = 20):
+        """
+        Args:
+            on_event: Callback(topic, job_dict) for job events. May be called
+                      from worker threads - must be thread-safe.
+            max_workers: Worker threads (kept separate from request executors
+                         so a long download never starves searches)
+            max_history: Finished jobs kept for status queries
+        """
+        self.on_event = on_event
+        self.max_history = max_history
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="synthesis-db")
+        self.jobs: "OrderedDict[str, DatabaseJob]" = OrderedDict()
+        self.logger = logging.getLogger("SynthesisDBJobs")
+
+    def submit(self, kind: str, func: Callable[[DatabaseJob], Any],
+               on_success: Optional[Callable[[DatabaseJob], Awaitable[None]]] = None) -> DatabaseJob:
+        """
+        Start a job (or return the active job of the same group).
+
+        Args:
+            kind: Job kind ('setup', 'update', 'check_updates')
+            func: Blocking function run in a worker thread. Receives the job
+                  (use job.report and job.cancel_event). Its return value
+                  becomes job.result.
+            on_success: Coroutine run on the event loop after func returns,
+                        before the job is marked succeeded (e.g. swap in
+                        the new database)
+
+        Returns:
+            The job
+        """
+        group = self.JOB_GROUPS.get(kind, kind)
+        for job in self.jobs.values():
+            if job.is_active and self.JOB_GROUPS.get(job.kind, job.kind) == group:
+                return job
+
+        job = DatabaseJob(kind, self.on_event)
+        self.jobs[job.id] = job
+        self._trim_history()
+
+        asyncio.get_running_loop().create_task(self._run(job, func, on_success))
+        return job
+
+    async def _run(self, job: DatabaseJob, func: Callable, on_success: Optional[Callable]):
+        loop = asyncio.get_running_loop()
+
+        try:
+            if job.cancel_event.is_set():
+                raise DownloadCancelled("Cancelled before start")
+
+            job.status = DatabaseJob.RUNNING
+            job.started = datetime.now().isoformat()
+            job._emit("jobs.started")
+
+            job.result = await loop.run_in_executor(self.executor, func, job)
+
+            if on_success:
+                await on_success(job)
+
+            job.status = DatabaseJob.SUCCEEDED
+            job.message = job.message or "Completed"
+
+        except DownloadCancelled as e:
+            job.status = DatabaseJob.CANCELLED
+            job.message = str(e)
+
+        except Exception as e:
+            self.logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+            job.status = DatabaseJob.FAILED
+            job.error = str(e)
+            job.message = "Failed"
+
+        finally:
+            job.finished = datetime.now().isoformat()
+            job.done.set()
+            job._emit("jobs.finished")
+
+    def get(self, job_id: str) -> Optional[DatabaseJob]:
+        """Look up a job by ID"""
+        return self.jobs.get(job_id)
+
+    def list(self) -> List[Dict]:
+        """All known jobs, newest first"""
+        return [job.to_dict() for job in reversed(self.jobs.values())]
+
+    def cancel(self, job_id: str) -> Optional[DatabaseJob]:
+        """
+        Request cancellation.
+
+        Takes effect at the next download chunk; the current database is
+        left untouched. Returns None if the job is unknown.
+        """
+        job = self.jobs.get(job_id)
+        if job and job.is_active:
+            job.cancel_event.set()
+            job.message = "Cancelling..."
+        return job
+
+    async def wait(self, job: DatabaseJob, timeout: Optional[float] = None) -> bool:
+        """Wait for a job to finish. Returns False on timeout."""
+        try:
+            await asyncio.wait_for(job.done.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def shutdown(self):
+        """Cancel active jobs and stop worker threads"""
+        for job in self.jobs.values():
+            if job.is_active:
+                job.cancel_event.set()
+        self.executor.shutdown(wait=False)
+
+    def _trim_history(self):
+        finished = [job_id for job_id, job in self.jobs.items() if not job.is_active]
+        while len(self.jobs) > self.max_history and finished:
+            self.jobs.pop(finished.pop(0), None)
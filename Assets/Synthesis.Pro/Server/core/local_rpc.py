@@ -0,0 +1,294 @@
+"""
+Local RPC - Synthesis.Pro
+Newline-delimited JSON over a localhost TCP socket
+
+Lets a long-lived process (which has already paid for loading the
+embedding model and indexes) serve many short-lived callers. A localhost
+TCP socket works the same on Windows, macOS and Linux, unlike named
+pipes or Unix sockets.
+
+The port is bound before the (slow) initializer runs, so a second copy
+started by a racing caller fails fast instead of loading a second model.
+
+Protocol: one JSON object per line in each direction.
+    {"rpc": "ping"}      -> {"success": true, "ready": bool, "pid": ..., "name": ...}
+    {"rpc": "shutdown"}  -> {"success": true} and the server stops
+    anything else        -> passed to the server's handler
+
+Zero external dependencies - uses only Python standard library.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_HOST = "127.0.0.1"
+
+# Largest accepted request line (guards against runaway clients)
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+class LocalRPCError(Exception):
+    """Raised when a local RPC server cannot be reached"""
+    pass
+
+
+class LocalRPCServer:
+    """
+    Serve a handler(request_dict) -> response_dict on a localhost port.
+
+    Each connection gets its own thread and may send any number of
+    requests. The handler must be thread-safe (or lock internally).
+    """
+
+    def __init__(self, handler: Callable[[Dict], Dict], port: int, host: str = DEFAULT_HOST,
+                 name: str = "synthesis", idle_timeout: Optional[float] = None):
+        """
+        Args:
+            handler: Called for every non-rpc request
+            port: Port to bind (localhost only)
+            host: Bind address
+            name: Reported by ping
+            idle_timeout: Stop after this many seconds with no connected clients
+                          and no requests (None = never)
+        """
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.name = name
+        self.idle_timeout = idle_timeout
+        self.last_request = time.monotonic()
+        self.requests_served = 0
+        self.connections = 0
+        self.ready = threading.Event()
+        self.init_error: Optional[str] = None
+        self._server: Optional[socketserver.ThreadingTCPServer] = None
+
+    def serve_forever(self, initializer: Optional[Callable[[], None]] = None):
+        """
+        Bind, run the initializer, then serve until shutdown.
+
+        Requests arriving while the initializer runs wait for it; pings
+        answer immediately with ready=false.
+
+        Raises:
+            OSError: Port already taken (another server is running)
+        """
+        rpc = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                rpc.connections += 1
+                try:
+                    while True:
+                        line = self.rfile.readline(MAX_LINE_BYTES)
+                        if not line:
+                            return
+                        response = rpc._dispatch(line)
+                        self.wfile.write(json.dumps(response).encode('utf-8') + b"\n")
+                        self.wfile.flush()
+                finally:
+                    rpc.connections -= 1
+                    rpc.last_request = time.monotonic()
+
+        class Server(socketserver.ThreadingTCPServer):
+            daemon_threads = True
+            allow_reuse_address = sys.platform != "win32"
+
+        self._server = Server((self.host, self.port), Handler)
+
+        if self.idle_timeout:
+            threading.Thread(target=self._idle_watch, name=f"{self.name}-idle", daemon=True).start()
+
+        serve_thread = threading.Thread(target=self._server.serve_forever, name=f"{self.name}-rpc", daemon=True)
+        serve_thread.start()
+
+        try:
+            if initializer:
+                initializer()
+        except Exception as e:
+            self.init_error = str(e)
+        finally:
+            self.ready.set()
+
+        try:
+            while serve_thread.is_alive():
+                serve_thread.join(timeout=1.0)
+        finally:
+            self._server.server_close()
+
+    def shutdown(self):
+        """Stop serving (safe to call from any thread except the serving one)."""
+        if self._server:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def _dispatch(self, line: bytes) -> Dict:
+        self.last_request = time.monotonic()
+        self.requests_served += 1
+
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {"success": False, "message": f"Invalid JSON: {e}"}
+
+        rpc = request.get('rpc') if isinstance(request, dict) else None
+        if rpc == 'ping':
+            return {"success": True, "ready": self.ready.is_set(), "pid": os.getpid(),
+                    "name": self.name, "requests_served": self.requests_served,
+                    "init_error": self.init_error}
+        if rpc == 'shutdown':
+            self.shutdown()
+            return {"success": True, "message": f"{self.name} shutting down"}
+
+        self.ready.wait()
+        if self.init_error:
+            return {"success": False, "message": f"{self.name} failed to initialize: {self.init_error}"}
+
+        try:
+            return self.handler(request)
+        except Exception as e:
+            return {"success": False, "message": f"{self.name} error: {e}"}
+
+    def _idle_watch(self):
+        while True:
+            time.sleep(min(self.idle_timeout, 30))
+            if self.connections == 0 and time.monotonic() - self.last_request >= self.idle_timeout:
+                self.shutdown()
+                return
+
+
+class LocalRPCClient:
+    """
+    Persistent connection to a LocalRPCServer.
+
+    Thread-safe: calls are serialized over one socket. Reconnects once
+    if the server restarted since the last call.
+    """
+
+    def __init__(self, port: int, host: str = DEFAULT_HOST, timeout: float = 60.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _connect(self, timeout: float):
+        self.close()
+        sock = socket.create_connection((self.host, self.port), timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(self.timeout)
+        self._sock = sock
+        self._reader = sock.makefile('rb')
+
+    def call(self, request: Dict) -> Dict:
+        """
+        Send one request and wait for its response.
+
+        Raises:
+            LocalRPCError: Server not reachable
+        """
+        payload = json.dumps(request).encode('utf-8') + b"\n"
+
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    if self._sock is None:
+                        self._connect(timeout=2.0)
+                    self._sock.sendall(payload)
+                    line = self._reader.readline(MAX_LINE_BYTES)
+                    if not line:
+                        raise ConnectionResetError("Connection closed by server")
+                    return json.loads(line)
+                except (OSError, ValueError) as e:
+                    self.close()
+                    if attempt == 2 or isinstance(e, socket.timeout):
+                        raise LocalRPCError(f"{self.host}:{self.port} unavailable: {e}")
+
+    def ping(self) -> Optional[Dict]:
+        """Ping response, or None if nothing is answering on the port"""
+        try:
+            return self.call({"rpc": "ping"})
+        except LocalRPCError:
+            return None
+
+    def is_ready(self) -> bool:
+        """True if a server is answering and finished initializing"""
+        response = self.ping()
+        return bool(response and response.get('ready'))
+
+    def close(self):
+        """Close the connection (the next call reconnects)"""
+        if self._reader:
+            try:
+                self._reader.close()
+            except OSError:
+                pass
+            self._reader = None
+        if self._sock:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+
+def ensure_server(port: int, launch_args: List[str], startup_timeout: float = 120.0,
+                  host: str = DEFAULT_HOST) -> LocalRPCClient:
+    """
+    Connect to a server, starting it in the background if needed.
+
+    Args:
+        port: Server port
+        launch_args: Command line that starts the server (e.g. [sys.executable, "rag_host.py", "--serve"])
+        startup_timeout: Seconds to wait for the server to answer (model loading is slow)
+
+    Returns:
+        Connected client
+
+    Raises:
+        LocalRPCError: Server did not come up in time
+    """
+    client = LocalRPCClient(port, host)
+    process = None
+
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        response = client.ping()
+
+        if response is not None:
+            if response.get('init_error'):
+                raise LocalRPCError(f"Server failed to initialize: {response['init_error']}")
+            if response.get('ready'):
+                return client
+        elif process is None:
+            process = _spawn_detached(launch_args)
+        elif process.poll() is not None:
+            # Exited without anyone holding the port - it failed
+            raise LocalRPCError(f"Server exited during startup (code {process.returncode})")
+
+        time.sleep(0.25)
+
+    raise LocalRPCError(f"Server on port {port} not ready within {startup_timeout:.0f}s")
+
+
+def _spawn_detached(launch_args: List[str]) -> subprocess.Popen:
+    """Start a process that outlives this (short-lived) caller"""
+    kwargs = {
+        'stdin': subprocess.DEVNULL,
+        'stdout': subprocess.DEVNULL,
+        'stderr': subprocess.DEVNULL,
+        'close_fds': True
+    }
+    if sys.platform == "win32":
+        kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+    else:
+        kwargs['start_new_session'] = True
+
+    return subprocess.Popen(launch_args, **kwargs)
@@ -0,0 +1,186 @@
+"""
+Pub/Sub Hub - Synthesis.Pro
+Topic-based server-initiated pushes to connected Unity editors
+
+Each connection gets its own bounded send queue drained by a dedicated
+writer task. Publishing encodes the event once and enqueues it for every
+subscriber without awaiting any socket, so one slow editor can never
+stall the others (or the publisher).
+
+Topic patterns:
+    "console.errors"  - exact topic
+    "jobs.*"          - every topic under "jobs."
+    "*"               - everything
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+
+class ConnectionChannel:
+    """
+    Outbound queue for one connection.
+
+    When the queue is full the oldest pending event is dropped
+    (newest state is usually what the editor needs).
+    """
+
+    def __init__(self, websocket, send: Callable[[Any, str], Awaitable[None]], max_queue: int = 256):
+        """
+        Args:
+            websocket: Client connection
+            send: Coroutine that writes one text frame to the connection
+            max_queue: Pending events kept before dropping oldest
+        """
+        self.websocket = websocket
+        self._send = send
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.patterns: Set[str] = set()
+        self.sent = 0
+        self.dropped = 0
+        self._writer: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the writer task."""
+        if self._writer is None:
+            self._writer = asyncio.get_running_loop().create_task(self._write_loop())
+
+    async def close(self):
+        """Stop the writer task (pending events are discarded)."""
+        if self._writer:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._writer = None
+
+    def matches(self, topic: str) -> bool:
+        """Check if this connection subscribed to a topic."""
+        for pattern in self.patterns:
+            if pattern == topic or pattern == "*":
+                return True
+            if pattern.endswith(".*") and topic.startswith(pattern[:-1]):
+                return True
+        return False
+
+    def enqueue(self, message: str):
+        """Queue an encoded event without blocking (drop oldest on overflow)."""
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(message)
+
+    async def _write_loop(self):
+        while True:
+            message = await self.queue.get()
+            try:
+                await self._send(self.websocket, message)
+                self.sent += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Connection is going away; the server will detach us
+                pass
+
+
+class PubSubHub:
+    """
+    Fan-out of server events to subscribed connections.
+
+    All methods except publish_threadsafe must be called from the event loop.
+    """
+
+    def __init__(self, serializer, max_queue: int = 256):
+        """
+        Args:
+            serializer: MessageSerializer used to encode events once per publish
+            max_queue: Per-connection send queue size
+        """
+        self.serializer = serializer
+        self.max_queue = max_queue
+        self.channels: Dict[Any, ConnectionChannel] = {}
+        self.stats = {
+            'events_published': 0,
+            'events_delivered': 0
+        }
+        self.logger = logging.getLogger("SynthesisPubSub")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def attach(self, websocket, send: Callable[[Any, str], Awaitable[None]]) -> ConnectionChannel:
+        """Register a connection (no subscriptions yet)."""
+        self._loop = asyncio.get_running_loop()
+        channel = ConnectionChannel(websocket, send, self.max_queue)
+        channel.start()
+        self.channels[websocket] = channel
+        return channel
+
+    async def detach(self, websocket):
+        """Unregister a connection and stop its writer."""
+        channel = self.channels.pop(websocket, None)
+        if channel:
+            await channel.close()
+
+    def subscribe(self, websocket, topics: List[str]) -> List[str]:
+        """Add topic patterns for a connection. Returns current subscriptions."""
+        channel = self.channels.get(websocket)
+        if not channel:
+            return []
+        channel.patterns.update(t for t in topics if t)
+        return sorted(channel.patterns)
+
+    def unsubscribe(self, websocket, topics: Optional[List[str]] = None) -> List[str]:
+        """Remove topic patterns (all if None). Returns current subscriptions."""
+        channel = self.channels.get(websocket)
+        if not channel:
+            return []
+        if topics is None:
+            channel.patterns.clear()
+        else:
+            channel.patterns.difference_update(topics)
+        return sorted(channel.patterns)
+
+    def publish(self, topic: str, data: Any) -> int:
+        """
+        Publish an event to all matching subscribers.
+
+        Returns:
+            Number of connections the event was queued for
+        """
+        subscribers = [c for c in self.channels.values() if c.matches(topic)]
+        self.stats['events_published'] += 1
+        if not subscribers:
+            return 0
+
+        message = self.serializer.dumps({
+            "type": "event",
+            "topic": topic,
+            "data": data,
+            "timestamp": datetime.now().isoformat()
+        })
+
+        for channel in subscribers:
+            channel.enqueue(message)
+
+        self.stats['events_delivered'] += len(subscribers)
+        return len(subscribers)
+
+    def publish_threadsafe(self, topic: str, data: Any):
+        """Publish from a worker thread (scheduled onto the event loop)."""
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.publish, topic, data)
+
+    def get_stats(self) -> Dict:
+        """Hub statistics (subscriptions, queue depth, drops)."""
+        return {
+            **self.stats,
+            'connections': len(self.channels),
+            'subscriptions': sum(len(c.patterns) for c in self.channels.values()),
+            'queued': sum(c.queue.qsize() for c in self.channels.values()),
+            'dropped': sum(c.dropped for c in self.channels.values())
+        }
@@ -0,0 +1,133 @@
+"""
+Message Serialization - Synthesis.Pro
+Pluggable JSON encode/decode for WebSocket traffic
+
+Uses orjson when installed (several times faster on large payloads),
+falls back to the standard library otherwise. Both backends produce
+compact JSON that Unity parses identically.
+
+Static envelope parts (error responses) are pre-encoded once, so the
+hot error path only encodes the dynamic values.
+"""
+
+import json
+from typing import Any, Tuple, Union
+
+# Optional fast path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+# Pre-encoded error envelope:
+# {"commandId":<id>,"success":false,"message":<msg>,"timestamp":<ts>}
+_ERROR_PREFIX = '{"commandId":'
+_ERROR_MESSAGE = ',"success":false,"message":'
+_ERROR_TIMESTAMP = ',"timestamp":'
+_ERROR_SUFFIX = '}'
+
+# C-accelerated string escaper used by json.dumps itself
+_encode_string = json.encoder.encode_basestring_ascii
+
+
+class MessageSerializer:
+    """
+    JSON serializer for WebSocket messages.
+
+    Backends:
+        "auto"   - orjson if available, else stdlib
+        "orjson" - orjson (raises if not installed)
+        "json"   - stdlib only
+    """
+
+    def __init__(self, backend: str = "auto"):
+        if backend == "auto":
+            backend = "orjson" if ORJSON_AVAILABLE else "json"
+
+        if backend == "orjson" and not ORJSON_AVAILABLE:
+            raise RuntimeError("orjson not installed. Install with: pip install orjson")
+        if backend not in ("orjson", "json"):
+            raise ValueError(f"Unknown serializer backend: {backend}")
+
+        self.backend = backend
+
+        if backend == "orjson":
+            self._orjson_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def loads(self, message: Union[str, bytes]) -> Any:
+        """
+        Decode a JSON frame.
+
+        Raises json.JSONDecodeError on invalid input (orjson's error type
+        subclasses it, so callers handle both backends the same way).
+        """
+        if self.backend == "orjson":
+            return orjson.loads(message)
+        return json.loads(message)
+
+    def encode(self, data: Any) -> Tuple[str, int]:
+        """
+        Encode data for a text frame.
+
+        Returns:
+            (text, size_in_bytes)
+        """
+        if self.backend == "orjson":
+            try:
+                payload = orjson.dumps(data, option=self._orjson_options)
+                return payload.decode('utf-8'), len(payload)
+            except TypeError:
+                # Types orjson rejects (e.g. huge ints) - let stdlib try
+                pass
+
+        # ensure_ascii output is pure ASCII, so len() == byte count
+        text = json.dumps(data, separators=(',', ':'))
+        return text, len(text)
+
+    def dumps(self, data: Any) -> str:
+        """Encode data to a JSON string."""
+        return self.encode(data)[0]
+
+    def encode_error(self, command_id: str, message: str, timestamp: str) -> str:
+        """
+        Encode the standard error envelope.
+
+        Stdlib path: only the three dynamic values are escaped, the rest is
+        pre-built. orjson encodes the whole envelope faster in one call.
+        """
+        if self.backend == "orjson":
+            return orjson.dumps({
+                "commandId": command_id,
+                "success": False,
+                "message": message,
+                "timestamp": timestamp
+            }).decode('utf-8')
+
+        return (
+            _ERROR_PREFIX + _encode_value(command_id) +
+            _ERROR_MESSAGE + _encode_value(message) +
+            _ERROR_TIMESTAMP + _encode_value(timestamp) +
+            _ERROR_SUFFIX
+        )
+
+
+def _encode_value(value: Any) -> str:
+    """Encode a scalar for the pre-built envelope (C string escaper for str)"""
+    if isinstance(value, str):
+        return _encode_string(value)
+    return json.dumps(value)
+
+
+# Shared default instance
+_serializer = None
+
+
+def get_serializer() -> MessageSerializer:
+    """Get or create the default serializer"""
+    global _serializer
+    if _serializer is None:
+        _serializer = MessageSerializer()
+    return _serializer
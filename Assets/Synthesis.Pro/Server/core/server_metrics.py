@@ -0,0 +1,308 @@
+"""
+Server Metrics - Synthesis.Pro
+Latency histograms, counters and a Prometheus-style text endpoint
+
+Answers "where did the time go?" for slow commands:
+- Per-command latency (p50/p95/p99)
+- Per-stage latency (parse, queue wait, search, embedding, serialization)
+- Executor utilization for blocking RAG work
+- RAG cache hit rates
+- Bytes in/out
+
+Zero external dependencies - uses only Python standard library.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with cumulative buckets and percentile estimates.
+
+    Buckets give Prometheus-compatible output over the whole lifetime,
+    while a bounded window of recent samples gives accurate percentiles
+    for what is happening *now*.
+    """
+
+    # Upper bounds in seconds (1ms .. 30s)
+    DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                       0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, buckets: Optional[tuple] = None, window: int = 2048):
+        """
+        Args:
+            buckets: Bucket upper bounds in seconds
+            window: Number of recent samples kept for percentiles
+        """
+        self.buckets = tuple(buckets or self.DEFAULT_BUCKETS)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # Last = +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        """Record one latency sample (seconds)."""
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+            self.recent.append(seconds)
+
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    self.bucket_counts[i] += 1
+                    return
+            self.bucket_counts[-1] += 1
+
+    def percentile(self, q: float) -> float:
+        """Percentile (0-100) over the recent window, in seconds."""
+        with self._lock:
+            samples = sorted(self.recent)
+
+        if not samples:
+            return 0.0
+
+        index = min(len(samples) - 1, max(0, int(round(q / 100.0 * (len(samples) - 1)))))
+        return samples[index]
+
+    def snapshot(self) -> Dict:
+        """Summary in milliseconds (JSON friendly)."""
+        avg = self.total / self.count if self.count else 0.0
+        return {
+            'count': self.count,
+            'avg_ms': round(avg * 1000, 3),
+            'p50_ms': round(self.percentile(50) * 1000, 3),
+            'p95_ms': round(self.percentile(95) * 1000, 3),
+            'p99_ms': round(self.percentile(99) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3)
+        }
+
+    def cumulative_buckets(self) -> List[tuple]:
+        """(upper_bound, cumulative_count) pairs, ending with +Inf."""
+        with self._lock:
+            counts = list(self.bucket_counts)
+
+        result = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            running += bucket_count
+            result.append((bound, running))
+        result.append(('+Inf', running + counts[-1]))
+        return result
+
+
+class ServerMetrics:
+    """
+    Central metrics registry for a server process.
+
+    Thread-safe: stage timings are recorded from executor threads
+    as well as from the event loop.
+    """
+
+    def __init__(self, namespace: str = "synthesis"):
+        self.namespace = namespace
+        self.started = time.time()
+
+        self.command_latency: Dict[str, LatencyHistogram] = {}
+        self.stage_latency: Dict[str, LatencyHistogram] = {}
+        self.counters: Dict[str, int] = {
+            'bytes_in': 0,
+            'bytes_out': 0,
+            'messages_in': 0,
+            'messages_out': 0
+        }
+
+        # Executor utilization
+        self.executor_workers = 0
+        self.executor_busy = 0
+        self.executor_busy_seconds = 0.0
+
+        # Extra gauge sources (e.g. RAG cache stats), polled at snapshot time
+        self._collectors: Dict[str, Callable[[], Dict[str, float]]] = {}
+
+        self._lock = threading.Lock()
+
+    # ========== Recording ==========
+
+    def _histogram(self, table: Dict[str, LatencyHistogram], name: str) -> LatencyHistogram:
+        histogram = table.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = table.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def observe_command(self, command_type: str, seconds: float):
+        """Record end-to-end handler latency for a command type."""
+        self._histogram(self.command_latency, command_type).observe(seconds)
+
+    def observe_stage(self, stage: str, seconds: float):
+        """Record latency for an internal stage (search, embedding, ...)."""
+        self._histogram(self.stage_latency, stage).observe(seconds)
+
+    @contextmanager
+    def time_stage(self, stage: str):
+        """Context manager timing a block as a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(stage, time.perf_counter() - start)
+
+    def increment(self, counter: str, amount: int = 1):
+        """Increment a named counter."""
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def executor_started(self):
+        """Mark one executor worker busy."""
+        with self._lock:
+            self.executor_busy += 1
+
+    def executor_finished(self, busy_seconds: float):
+        """Mark one executor worker idle again."""
+        with self._lock:
+            self.executor_busy -= 1
+            self.executor_busy_seconds += busy_seconds
+
+    def register_collector(self, name: str, collector: Callable[[], Dict[str, float]]):
+        """
+        Register a gauge source polled on every snapshot.
+
+        Args:
+            name: Group name (e.g. "rag_cache")
+            collector: Callable returning {metric_name: value}
+        """
+        self._collectors[name] = collector
+
+    # ========== Reporting ==========
+
+    def executor_utilization(self) -> float:
+        """Fraction of executor capacity used since start (0.0-1.0)."""
+        if not self.executor_workers:
+            return 0.0
+        elapsed = max(time.time() - self.started, 1e-9)
+        return min(1.0, self.executor_busy_seconds / (elapsed * self.executor_workers))
+
+    def collect(self) -> Dict[str, Dict[str, float]]:
+        """Poll all registered collectors (failures are reported as empty)."""
+        collected = {}
+        for name, collector in list(self._collectors.items()):
+            try:
+                collected[name] = collector() or {}
+            except Exception:
+                collected[name] = {}
+        return collected
+
+    def snapshot(self) -> Dict:
+        """JSON friendly view of all metrics (used by get_stats)."""
+        return {
+            'commands': {name: h.snapshot() for name, h in sorted(self.command_latency.items())},
+            'stages': {name: h.snapshot() for name, h in sorted(self.stage_latency.items())},
+            'counters': dict(self.counters),
+            'executor': {
+                'workers': self.executor_workers,
+                'busy': self.executor_busy,
+                'busy_seconds': round(self.executor_busy_seconds, 3),
+                'utilization': round(self.executor_utilization(), 4)
+            },
+            **self.collect()
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        ns = self.namespace
+        lines = []
+
+        def histogram_lines(metric: str, label: str, table: Dict[str, LatencyHistogram]):
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in sorted(table.items()):
+                for bound, cumulative in histogram.cumulative_buckets():
+                    lines.append(f'{metric}_bucket{{{label}="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{{label}="{name}"}} {histogram.total:.6f}')
+                lines.append(f'{metric}_count{{{label}="{name}"}} {histogram.count}')
+
+        histogram_lines(f"{ns}_command_latency_seconds", "command", self.command_latency)
+        histogram_lines(f"{ns}_stage_latency_seconds", "stage", self.stage_latency)
+
+        for counter, value in sorted(self.counters.items()):
+            lines.append(f"# TYPE {ns}_{counter}_total counter")
+            lines.append(f"{ns}_{counter}_total {value}")
+
+        lines.append(f"# TYPE {ns}_executor_busy gauge")
+        lines.append(f"{ns}_executor_busy {self.executor_busy}")
+        lines.append(f"# TYPE {ns}_executor_utilization gauge")
+        lines.append(f"{ns}_executor_utilization {self.executor_utilization():.4f}")
+        lines.append(f"# TYPE {ns}_uptime_seconds gauge")
+        lines.append(f"{ns}_uptime_seconds {time.time() - self.started:.0f}")
+
+        for group, values in sorted(self.collect().items()):
+            for key, value in sorted(values.items()):
+                lines.append(f"# TYPE {ns}_{group}_{key} gauge")
+                lines.append(f"{ns}_{group}_{key} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+class MetricsEndpoint:
+    """
+    Minimal HTTP endpoint serving ServerMetrics as text.
+
+    GET /metrics on a localhost port - enough for curl or a Prometheus scrape,
+    without pulling in an HTTP framework.
+    """
+
+    def __init__(self, metrics: ServerMetrics, host: str = "localhost", port: int = 8766):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        """Start listening (returns immediately)."""
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def stop(self):
+        """Stop listening."""
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Drain headers
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=5)
+                if not line or line in (b"\r\n", b"\n"):
+                    break
+
+            parts = request_line.decode('latin-1').split()
+            path = parts[1] if len(parts) > 1 else "/"
+
+            if path.split('?')[0] in ("/", "/metrics"):
+                body = self.metrics.render_prometheus().encode('utf-8')
+                status = "200 OK"
+            else:
+                body = b"Not found\n"
+                status = "404 Not Found"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode('latin-1') + body
+            )
+            await writer.drain()
+        except Exception:
+            pass
+        finally:
+            writer.close()
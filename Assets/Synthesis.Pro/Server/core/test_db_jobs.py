@@ -0,0 +1,180 @@
+"""
+Tests for background database jobs and DatabaseManager's download/install path
+Downloads are served from local file:// URLs
+
+    python -m pytest test_db_jobs.py
+"""
+
+import asyncio
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import database_manager
+from database_manager import DOWNLOAD_CHUNK_SIZE, DatabaseManager, DownloadCancelled
+from db_jobs import DatabaseJob, DatabaseJobManager
+
+
+def _run_job(kind, func, on_success=None):
+    """Submit one job, wait for it and return (job, events)"""
+    events = []
+
+    async def run():
+        manager = DatabaseJobManager(on_event=lambda topic, job: events.append((topic, job)))
+        try:
+            job = manager.submit(kind, func, on_success)
+            assert await manager.wait(job, timeout=10)
+            return job
+        finally:
+            manager.shutdown()
+
+    return asyncio.run(run()), events
+
+
+def test_job_reports_progress_and_result():
+    """Stage changes always emit progress; updates within a stage are throttled"""
+    def work(job):
+        job.report("download", 10, 100)
+        job.report("download", 50, 100)
+        job.report("install", 0, 0)
+        return {"installed": True}
+
+    installed = []
+
+    async def on_success(job):
+        installed.append(job.status)
+
+    job, events = _run_job("update", work, on_success)
+    assert job.status == DatabaseJob.SUCCEEDED and job.result == {"installed": True}
+    assert installed == [DatabaseJob.RUNNING]  # Runs before the job is marked succeeded
+    assert [topic for topic, _ in events] == ["jobs.started", "jobs.progress", "jobs.progress", "jobs.finished"]
+    assert events[1][1]['progress']['percent'] == 10.0
+    assert events[-1][1]['status'] == DatabaseJob.SUCCEEDED
+
+
+def test_failed_job_records_error():
+    def work(job):
+        raise RuntimeError("disk full")
+
+    job, events = _run_job("setup", work)
+    assert job.status == DatabaseJob.FAILED and job.error == "disk full"
+    assert events[-1][0] == "jobs.finished"
+
+
+def test_cancel_running_job():
+    """Cancelling sets the job's event; DownloadCancelled ends it as cancelled, skipping on_success"""
+    started = threading.Event()
+    installed = []
+
+    def work(job):
+        started.set()
+        while not job.cancel_event.wait(0.01):
+            pass
+        raise DownloadCancelled("Download cancelled")
+
+    async def on_success(job):
+        installed.append(job)
+
+    async def run():
+        manager = DatabaseJobManager()
+        try:
+            job = manager.submit("update", work, on_success)
+            assert await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            assert manager.cancel(job.id) is job and job.message == "Cancelling..."
+            assert await manager.wait(job, timeout=5)
+            return job
+        finally:
+            manager.shutdown()
+
+    job = asyncio.run(run())
+    assert job.status == DatabaseJob.CANCELLED and installed == []
+
+
+def test_install_group_runs_one_job():
+    """Setup and update share a group: submitting while one is active returns it"""
+    release = threading.Event()
+
+    async def run():
+        manager = DatabaseJobManager()
+        try:
+            setup = manager.submit("setup", lambda job: release.wait(5))
+            assert manager.submit("update", lambda job: None) is setup
+            check = manager.submit("check_updates", lambda job: "latest")
+            assert check is not setup
+            release.set()
+            assert await manager.wait(setup, timeout=5) and await manager.wait(check, timeout=5)
+            assert manager.submit("update", lambda job: None) is not setup
+            assert manager.cancel("unknown") is None
+        finally:
+            release.set()
+            manager.shutdown()
+
+    asyncio.run(run())
+
+
+def _manager_with_database(directory: Path, installed: bytes, download: bytes):
+    manager = DatabaseManager(server_dir=directory)
+    manager.public_db_path.write_bytes(installed)
+    source = directory / "release.db"
+    source.write_bytes(download)
+    return manager, source.as_uri()
+
+
+def test_download_swaps_in_new_database():
+    """The download replaces the database in one step and keeps the old file as backup"""
+    directory = Path(tempfile.mkdtemp())
+    try:
+        new = b"new" * DOWNLOAD_CHUNK_SIZE
+        manager, url = _manager_with_database(directory, b"old database", new)
+        stages = []
+        assert manager._download_database(url, "v2", progress=lambda stage, done, total: stages.append(stage))
+
+        assert manager.public_db_path.read_bytes() == new
+        assert manager.public_db_path.with_suffix('.db.backup').read_bytes() == b"old database"
+        assert not manager.public_db_path.with_suffix('.db.download').exists()
+        assert stages.count("download") == 3 and stages[-1] == "install"
+        assert manager.version_info['database']['version'] == "v2"
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_cancelled_download_keeps_database():
+    directory = Path(tempfile.mkdtemp())
+    try:
+        manager, url = _manager_with_database(directory, b"old database", b"x" * (DOWNLOAD_CHUNK_SIZE * 4))
+        cancel = threading.Event()
+        try:
+            manager._download_database(url, "v2", progress=lambda *args: cancel.set(), cancel_event=cancel)
+        except DownloadCancelled:
+            pass
+        else:
+            raise AssertionError("download was not cancelled")
+
+        assert manager.public_db_path.read_bytes() == b"old database"
+        assert not manager.public_db_path.with_suffix('.db.download').exists()
+        assert 'database' not in manager.version_info
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_failed_swap_keeps_database(monkeypatch):
+    """If the final replace fails, the installed database is untouched and the download removed"""
+    directory = Path(tempfile.mkdtemp())
+    try:
+        manager, url = _manager_with_database(directory, b"old database", b"new database")
+
+        def fail_replace(src, dst):
+            raise PermissionError("database is locked")
+
+        monkeypatch.setattr(database_manager.os, "replace", fail_replace)
+        assert manager._download_database(url, "v2", progress=lambda *args: None) is False
+
+        assert manager.public_db_path.read_bytes() == b"old database"
+        assert not manager.public_db_path.with_suffix('.db.download').exists()
+        assert 'database' not in manager.version_info
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
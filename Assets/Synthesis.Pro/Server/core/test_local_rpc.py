@@ -0,0 +1,161 @@
+"""
+Tests for the localhost JSON-line RPC server and client
+
+    python -m pytest test_local_rpc.py
+"""
+
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from local_rpc import LocalRPCClient, LocalRPCError, LocalRPCServer, ensure_server
+
+# Echo server run as a separate process (a restart must drop its connections)
+SERVER_SCRIPT = """
+import os, sys
+sys.path.insert(0, sys.argv[1])
+from local_rpc import LocalRPCServer
+LocalRPCServer(lambda request: {"success": True, "echo": request, "pid": os.getpid()},
+               int(sys.argv[2]), name="echo").serve_forever()
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _echo(request):
+    if request.get("fail"):
+        raise ValueError("bad request")
+    return {"success": True, "echo": request}
+
+
+def _serve(port, initializer=None, handler=_echo, **kwargs):
+    """Start a server thread; returns (server, thread) once the port accepts connections"""
+    server = LocalRPCServer(handler, port, name="test", **kwargs)
+    thread = threading.Thread(target=server.serve_forever, args=(initializer,), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return server, thread
+        except OSError:
+            time.sleep(0.02)
+    raise AssertionError("server did not start")
+
+
+def _stop(client, thread):
+    assert client.call({"rpc": "shutdown"})["success"]
+    client.close()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_ping_answers_while_initializing():
+    """Pings answer at once; requests wait for the initializer to finish"""
+    port = _free_port()
+    release = threading.Event()
+    server, thread = _serve(port, initializer=release.wait)
+    client = LocalRPCClient(port)
+    try:
+        ping = client.ping()
+        assert ping["ready"] is False and ping["name"] == "test"
+        assert not client.is_ready()
+
+        waiting = LocalRPCClient(port)
+        responses = []
+        caller = threading.Thread(target=lambda: responses.append(waiting.call({"n": 1})))
+        caller.start()
+        time.sleep(0.2)
+        assert responses == []
+        release.set()
+        caller.join(timeout=5)
+        waiting.close()
+        assert responses == [{"success": True, "echo": {"n": 1}}]
+        assert client.is_ready()
+    finally:
+        release.set()
+        _stop(client, thread)
+
+
+def test_errors_become_responses():
+    """Handler exceptions and invalid JSON are answered, not dropped"""
+    port = _free_port()
+    server, thread = _serve(port)
+    client = LocalRPCClient(port)
+    try:
+        response = client.call({"fail": True})
+        assert response["success"] is False and "bad request" in response["message"]
+
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+            sock.sendall(b"{not json\n")
+            assert b'"success": false' in sock.makefile("rb").readline()
+
+        assert client.call({"n": 2})["echo"] == {"n": 2}
+    finally:
+        _stop(client, thread)
+
+
+def test_failed_initializer_is_reported():
+    def initializer():
+        raise RuntimeError("model missing")
+
+    port = _free_port()
+    server, thread = _serve(port, initializer=initializer)
+    client = LocalRPCClient(port)
+    try:
+        assert client.ping()["init_error"] == "model missing"
+        response = client.call({"n": 1})
+        assert response["success"] is False and "model missing" in response["message"]
+    finally:
+        _stop(client, thread)
+
+
+def test_idle_shutdown_waits_for_connected_clients():
+    """A connected client keeps an idle server alive; it stops once the client leaves"""
+    port = _free_port()
+    server, thread = _serve(port, idle_timeout=0.2)
+    client = LocalRPCClient(port)
+    assert client.call({"n": 1})["success"]
+    time.sleep(0.8)
+    assert thread.is_alive()
+
+    client.close()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_client_reconnects_after_server_restart():
+    """ensure_server starts a detached server; a client outlives a restart with one retry"""
+    port = _free_port()
+    launch_args = [sys.executable, "-c", SERVER_SCRIPT, str(Path(__file__).parent), str(port)]
+    client = ensure_server(port, launch_args, startup_timeout=30)
+    try:
+        first_pid = client.call({"n": 1})["pid"]
+        client.call({"rpc": "shutdown"})
+        while LocalRPCClient(port).ping() is not None:
+            time.sleep(0.05)
+
+        ensure_server(port, launch_args, startup_timeout=30).close()
+        response = client.call({"n": 2})
+        assert response["echo"] == {"n": 2} and response["pid"] != first_pid
+    finally:
+        client.call({"rpc": "shutdown"})
+        client.close()
+
+    # Nothing listening: calls raise, ping returns None
+    while client.ping() is not None:
+        time.sleep(0.05)
+    try:
+        client.call({"n": 3})
+    except LocalRPCError:
+        pass
+    else:
+        raise AssertionError("call without a server succeeded")
@@ -0,0 +1,120 @@
+"""
+Tests for the pub/sub hub (topic matching, fan-out, drop-oldest queues)
+
+    python -m pytest test_pubsub.py
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pubsub import ConnectionChannel, PubSubHub
+from serialization import MessageSerializer
+
+
+class Recorder:
+    """Send coroutine that records frames (optionally blocking until released)"""
+
+    def __init__(self, blocked: bool = False):
+        self.frames = []
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def __call__(self, websocket, message: str):
+        await self.release.wait()
+        self.frames.append(json.loads(message))
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_topic_matching():
+    async def run():
+        channel = ConnectionChannel("ws", Recorder())
+        channel.patterns = {"console.errors", "jobs.*"}
+        assert channel.matches("console.errors") and channel.matches("jobs.build.done")
+        assert not channel.matches("console.warnings") and not channel.matches("jobsx")
+        channel.patterns = {"*"}
+        assert channel.matches("anything")
+
+    asyncio.run(run())
+
+
+def test_full_queue_drops_oldest():
+    """No writer running: the newest max_queue events are kept"""
+    async def run():
+        channel = ConnectionChannel("ws", Recorder(), max_queue=3)
+        for i in range(5):
+            channel.enqueue(str(i))
+        assert channel.dropped == 2
+        assert [channel.queue.get_nowait() for _ in range(3)] == ["2", "3", "4"]
+
+    asyncio.run(run())
+
+
+def test_publish_fans_out_to_matching_subscribers():
+    async def run():
+        hub = PubSubHub(MessageSerializer("json"))
+        jobs, everything, idle = Recorder(), Recorder(), Recorder()
+        hub.attach("a", jobs)
+        hub.attach("b", everything)
+        hub.attach("c", idle)
+        assert hub.subscribe("a", ["jobs.*", ""]) == ["jobs.*"]
+        hub.subscribe("b", ["*"])
+
+        assert hub.publish("jobs.done", {"id": 1}) == 2
+        assert hub.publish("console.errors", {"n": 3}) == 1
+        await _settle()
+        assert [f["topic"] for f in jobs.frames] == ["jobs.done"]
+        assert [f["topic"] for f in everything.frames] == ["jobs.done", "console.errors"]
+        assert everything.frames[0]["type"] == "event" and everything.frames[0]["data"] == {"id": 1}
+        assert idle.frames == []
+
+        assert hub.unsubscribe("a") == []
+        assert hub.publish("jobs.done", {"id": 2}) == 1
+        assert hub.subscribe("missing", ["*"]) == []
+
+        stats = hub.get_stats()
+        assert stats["events_published"] == 3 and stats["events_delivered"] == 4
+        assert stats["connections"] == 3 and stats["subscriptions"] == 1
+
+        for websocket in ("a", "b", "c"):
+            await hub.detach(websocket)
+        assert hub.get_stats()["connections"] == 0
+
+    asyncio.run(run())
+
+
+def test_slow_subscriber_does_not_block_others():
+    """A stalled connection drops its oldest events while the others keep receiving"""
+    async def run():
+        hub = PubSubHub(MessageSerializer("json"), max_queue=2)
+        slow, fast = Recorder(blocked=True), Recorder()
+        hub.attach("slow", slow)
+        hub.attach("fast", fast)
+        hub.subscribe("slow", ["*"])
+        hub.subscribe("fast", ["*"])
+
+        for i in range(5):
+            hub.publish("tick", i)
+            await _settle()
+
+        assert [f["data"] for f in fast.frames] == [0, 1, 2, 3, 4]
+        assert slow.frames == []
+        # First event is held by the blocked writer; of the rest only the newest 2 are queued
+        assert hub.get_stats()["dropped"] == 2 and hub.get_stats()["queued"] == 2
+
+        slow.release.set()
+        await _settle()
+        assert [f["data"] for f in slow.frames] == [0, 3, 4]
+
+        await hub.detach("slow")
+        await hub.detach("fast")
+
+    asyncio.run(run())
@@ -0,0 +1,68 @@
+"""
+Tests for MessageSerializer (both backends, stdlib fallback)
+
+    python -m pytest test_serialization.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from serialization import ORJSON_AVAILABLE, MessageSerializer
+
+PAYLOAD = {"commandId": "42", "success": True, "data": {"name": "Spieler Ü", "values": [1, 2.5, None]}}
+
+
+def _backends():
+    return ["json", "orjson"] if ORJSON_AVAILABLE else ["json"]
+
+
+def test_backends_agree():
+    """Every backend produces JSON that decodes to the same value, with its UTF-8 size"""
+    for backend in _backends():
+        serializer = MessageSerializer(backend)
+        text, size = serializer.encode(PAYLOAD)
+        assert json.loads(text) == PAYLOAD, backend
+        assert size == len(text.encode('utf-8')), backend
+        assert serializer.loads(text) == PAYLOAD and serializer.loads(text.encode('utf-8')) == PAYLOAD
+
+
+def test_auto_backend():
+    assert MessageSerializer("auto").backend == ("orjson" if ORJSON_AVAILABLE else "json")
+    try:
+        MessageSerializer("msgpack")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown backend accepted")
+
+
+def test_fallback_for_values_orjson_rejects():
+    """Integers beyond 64 bits are encoded by the stdlib path instead of failing"""
+    data = {"big": 2 ** 70, "ok": True}
+    for backend in _backends():
+        text, size = MessageSerializer(backend).encode(data)
+        assert json.loads(text) == data and size == len(text), backend
+
+
+def test_error_envelope():
+    """The pre-built error envelope is valid JSON with escaped values"""
+    message = 'Failed: "quoted" \\ path\nnew line Ü'
+    for backend in _backends():
+        text = MessageSerializer(backend).encode_error("cmd-1", message, "2026-01-01T00:00:00")
+        assert json.loads(text) == {
+            "commandId": "cmd-1", "success": False, "message": message, "timestamp": "2026-01-01T00:00:00"
+        }, backend
+
+
+def test_invalid_input_raises_json_error():
+    """Both backends raise json.JSONDecodeError, so callers need one except clause"""
+    for backend in _backends():
+        try:
+            MessageSerializer(backend).loads("{not json")
+        except json.JSONDecodeError:
+            pass
+        else:
+            raise AssertionError(f"{backend} accepted invalid JSON")
@@ -23,9 +23,12 @@ import json
 import logging
 from typing import Dict, Set, Callable, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 import sys
 import os
 import shutil
+import time
 from pathlib import Path
 
 # Add directories to path for imports
@@ -35,10 +38,28 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))  # Synthesis.Pro/ d
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "RAG" / "core"))  # RAG/core/ directory
 
 from rag_engine_lite import SynthesisRAG  # NEW: Lightweight RAG (BM25S + transformers)
+from rag_client import connect_rag  # Shared RAG host (one model for all processes)
 from conversation_tracker import ConversationTracker
 from database_manager import DatabaseManager
+from db_jobs import DatabaseJobManager, DatabaseJob
 from rag_integration.rag_onboarding import RAGOnboardingSystem
 from context_systems.console_monitor import ConsoleMonitor
+from context_systems.resolution_detector import ResolutionDetector
+from server_metrics import ServerMetrics, MetricsEndpoint
+from serialization import MessageSerializer
+from pubsub import PubSubHub
+
+# Editor.log watching (Utilities/, standard library only)
+sys.path.append(str(Path(__file__).parent.parent.parent / "Utilities"))
+try:
+    from unity_log_detective import UnityLogDetective
+    from log_watcher import LogWatcher, watch_errors
+    EDITOR_LOG_AVAILABLE = True
+except ImportError:
+    EDITOR_LOG_AVAILABLE = False
+
+# Set SYNTHESIS_EDITOR_LOG_WATCH=0 to disable, SYNTHESIS_EDITOR_LOG to watch another log file
+EDITOR_LOG_WATCH = os.environ.get("SYNTHESIS_EDITOR_LOG_WATCH", "1") != "0"
 
 
 class SynthesisWebSocketServer:
@@ -48,16 +69,33 @@ class SynthesisWebSocketServer:
     Handles real-time communication between Unity and Python AI systems.
     """
 
-    def __init__(self, host: str = "localhost", port: int = 8765):
+    # Topics Unity can subscribe to for server-initiated pushes
+    EVENT_TOPICS = {
+        "console.errors": "Errors captured from the Unity console",
+        "console.patterns": "Captured errors that match a known historical pattern",
+        "console.resolved": "Error patterns marked resolved after they stopped occurring",
+        "editor.errors": "Compiler errors and exceptions as they are written to Editor.log",
+        "jobs.started": "A background database job started",
+        "jobs.progress": "Download progress of a background database job",
+        "jobs.finished": "A background database job succeeded, failed or was cancelled"
+    }
+
+    def __init__(self, host: str = "localhost", port: int = 8765,
+                 metrics_port: Optional[int] = 8766, executor_workers: int = 4,
+                 serializer_backend: str = "auto"):
         """
         Initialize WebSocket server
 
         Args:
             host: Host to bind to (default: localhost for security)
             port: Port to listen on (default: 8765)
+            metrics_port: Port for the text metrics endpoint (None disables it)
+            executor_workers: Worker threads for blocking RAG/DB work
+            serializer_backend: JSON backend - "auto" (orjson if installed), "orjson" or "json"
         """
         self.host = host
         self.port = port
+        self.metrics_port = metrics_port
 
         # Active connections
         self.connections: Set[websockets.WebSocketServerProtocol] = set()
@@ -65,6 +103,13 @@ class SynthesisWebSocketServer:
         # Command handlers
         self.command_handlers: Dict[str, Callable] = {}
 
+        # JSON encode/decode for all frames
+        self.serializer = MessageSerializer(serializer_backend)
+
+        # Server-initiated pushes (per-connection send queues)
+        self.pubsub = PubSubHub(self.serializer)
+        self._current_connection: ContextVar = ContextVar("current_connection", default=None)
+
         # Statistics
         self.stats = {
             'connections_total': 0,
@@ -73,11 +118,28 @@ class SynthesisWebSocketServer:
             'uptime_start': datetime.now()
         }
 
+        # Metrics (latency histograms, bytes, executor, RAG cache)
+        self.metrics = ServerMetrics(namespace="synthesis_ws")
+        self.metrics.register_collector('rag_cache', self._collect_rag_cache_stats)
+        self.metrics_endpoint = MetricsEndpoint(self.metrics, host, metrics_port) if metrics_port else None
+
+        # Executor for blocking work so the event loop keeps serving
+        self.executor = ThreadPoolExecutor(max_workers=executor_workers, thread_name_prefix="synthesis-ws")
+        self.metrics.executor_workers = executor_workers
+
+        # Database setup/update/download jobs (own threads, progress as events)
+        self.db_jobs = DatabaseJobManager(on_event=self.pubsub.publish_threadsafe)
+
         # RAG engine (initialized on first use)
         self.rag: Optional[SynthesisRAG] = None
         self.conversation_tracker: Optional[ConversationTracker] = None
         self.rag_onboarding: Optional[RAGOnboardingSystem] = None
         self.console_monitor: Optional[ConsoleMonitor] = None
+        self.resolution_detector: Optional[ResolutionDetector] = None
+
+        # Editor.log watcher (started with the server)
+        self.editor_log_watcher: Optional["LogWatcher"] = None
+        self._editor_log_task: Optional[asyncio.Task] = None
 
         # Setup logging
         self.logger = logging.getLogger("SynthesisWebSocket")
@@ -111,7 +173,11 @@ class SynthesisWebSocketServer:
         self.register_handler("audit_public_db", self._handle_audit_public_db)
         self.register_handler("check_db_updates", self._handle_check_db_updates)
         self.register_handler("update_public_db", self._handle_update_public_db)
+        self.register_handler("db_job_status", self._handle_db_job_status)
+        self.register_handler("cancel_db_job", self._handle_cancel_db_job)
         self.register_handler("console_log", self._handle_console_log)
+        self.register_handler("subscribe", self._handle_subscribe)
+        self.register_handler("unsubscribe", self._handle_unsubscribe)
 
     def register_handler(self, command_type: str, handler: Callable):
         """
@@ -130,77 +196,241 @@ class SynthesisWebSocketServer:
         self.logger.info(f"📡 Listening on ws://{self.host}:{self.port}")
         self.logger.info(f"🔒 Security: localhost-only binding")
 
+        # Start metrics endpoint
+        if self.metrics_endpoint:
+            try:
+                await self.metrics_endpoint.start()
+                self.logger.info(f"📈 Metrics on http://{self.host}:{self.metrics_port}/metrics")
+            except OSError as e:
+                self.logger.warning(f"Could not start metrics endpoint: {e}")
+
         # Initialize RAG engine
         await self._initialize_rag()
 
+        self._start_editor_log_watch()
+
         # Start server
         async with websockets.serve(self._handle_connection, self.host, self.port):
             self.logger.info(f"✅ Server ready! Waiting for Unity connections...")
             await asyncio.Future()  # Run forever
 
     async def _initialize_rag(self):
-        """Initialize RAG engine and conversation tracker"""
+        """
+        Initialize RAG engine and conversation tracker
+
+        Database setup and update checks run as background jobs, so a slow
+        download never delays serving. The RAG starts on whatever public
+        database exists and is rebuilt once a download is swapped in.
+        """
         try:
             self.logger.info("Initializing RAG engine...")
 
-            # Check and setup public database and embeddings model
-            db_manager = DatabaseManager()
+            # Model loading is slow - keep the event loop free
+            components = await self._run_blocking('rag_init', self._create_rag_components)
+            self._install_rag_components(components)
+
+            self.logger.info("✅ RAG engine initialized (dual database mode)")
+            self.logger.info("✅ RAG onboarding system ready (natural mode)")
+            self.logger.info("✅ Console monitor active (capturing errors & patterns)")
+        except Exception as e:
+            import traceback
+            self.logger.error(f"Failed to initialize RAG: {e}")
+            self.logger.error(f"Stack trace: {traceback.format_exc()}")
+            self.logger.warning("Server will run without RAG features")
+
+        self._start_db_maintenance()
+
+    def _create_rag_components(self) -> dict:
+        """Build RAG engine and dependents (blocking - run in executor)"""
+        # Create RAG with dual databases (shared host, in-process fallback)
+        rag = connect_rag(
+            database="synthesis_knowledge.db",
+            private_database="synthesis_private.db"
+        )
+
+        # Feed search/embedding timings into the latency histograms
+        rag.on_timing = self.metrics.observe_stage
 
-            # Setup database
-            if not db_manager.check_setup():
-                self.logger.info("Public database not found - running first-time setup...")
-                success = db_manager.setup_database()
-                if not success:
-                    self.logger.warning("Could not download public database")
-                    self.logger.warning("Public database will be created as you use Synthesis.Pro")
-
-            # Setup embeddings model
-            if not db_manager.check_model_setup():
-                self.logger.info("Embeddings model not found - downloading...")
-                success = db_manager.setup_model()
-                if not success:
-                    self.logger.warning("Could not download embeddings model")
-                    self.logger.warning("Semantic search will not be available")
-
-            # Check for updates (non-blocking)
-            if db_manager.check_setup() or db_manager.check_model_setup():
-                updates = db_manager.check_for_updates()
-                if updates.get('database') or updates.get('model'):
-                    update_list = []
-                    if updates.get('database'):
-                        update_list.append(f"database ({updates['database']})")
-                    if updates.get('model'):
-                        update_list.append(f"model ({updates['model']})")
-                    self.logger.info(f"Updates available: {', '.join(update_list)}")
-                    self.logger.info("Run 'python database_manager.py --update' to update")
-
-            # Create RAG with dual databases
-            self.rag = SynthesisRAG(
-                database="synthesis_knowledge.db",
-                private_database="synthesis_private.db"
+        console_monitor = ConsoleMonitor(rag)
+
+        # Scheduled job: mark error patterns resolved once they stop occurring
+        resolution_detector = None
+        if console_monitor.pattern_matcher and console_monitor.pattern_matcher.store:
+            resolution_detector = ResolutionDetector(
+                console_monitor.pattern_matcher,
+                on_resolved=lambda patterns: self.pubsub.publish_threadsafe(
+                    "console.resolved", {"patterns": patterns}
+                )
             )
 
+        return {
+            'rag': rag,
             # Create conversation tracker
-            self.conversation_tracker = ConversationTracker(self.rag)
-
+            'conversation_tracker': ConversationTracker(rag),
             # Create RAG onboarding system for natural AI interactions
-            self.rag_onboarding = RAGOnboardingSystem(
-                rag_engine=self.rag,
+            'rag_onboarding': RAGOnboardingSystem(
+                rag_engine=rag,
                 user_id="unity_session",
                 presentation_style="natural"
-            )
-
+            ),
             # Create console monitor for real-time error capture
-            self.console_monitor = ConsoleMonitor(self.rag)
+            'console_monitor': console_monitor,
+            'resolution_detector': resolution_detector
+        }
 
-            self.logger.info("✅ RAG engine initialized (dual database mode)")
-            self.logger.info("✅ RAG onboarding system ready (natural mode)")
-            self.logger.info("✅ Console monitor active (capturing errors & patterns)")
+    def _install_rag_components(self, components: dict):
+        """
+        Swap in RAG components (event loop only)
+
+        Handlers already running keep the references they started with,
+        new commands see the new set.
+        """
+        self.rag = components['rag']
+        self.conversation_tracker = components['conversation_tracker']
+        self.rag_onboarding = components['rag_onboarding']
+        self.console_monitor = components['console_monitor']
+
+        if self.resolution_detector:
+            self.resolution_detector.stop(timeout=0)
+        self.resolution_detector = components['resolution_detector']
+        if self.resolution_detector:
+            self.resolution_detector.start()
+
+    def _start_editor_log_watch(self):
+        """Publish Editor.log errors as they are written (event loop task)"""
+        if not EDITOR_LOG_AVAILABLE or not EDITOR_LOG_WATCH:
+            return
+
+        detective = UnityLogDetective(os.environ.get("SYNTHESIS_EDITOR_LOG") or None)
+        if not detective.log_path:
+            self.logger.info("Editor.log not found - log watching disabled")
+            return
+
+        detective.seek_to_end()  # Only errors written from now on
+        self.editor_log_watcher = LogWatcher(detective.log_path)
+        self._editor_log_task = asyncio.create_task(self._watch_editor_log(detective))
+        self.logger.info(f"👀 Watching {detective.log_path} ({self.editor_log_watcher.mode})")
+
+    async def _watch_editor_log(self, detective: "UnityLogDetective"):
+        try:
+            async for error in watch_errors(detective, self.editor_log_watcher):
+                self.publish_event("editor.errors", error)
+                detective.clear_errors()  # Events are the record here; keep memory flat
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            import traceback
-            self.logger.error(f"Failed to initialize RAG: {e}")
-            self.logger.error(f"Stack trace: {traceback.format_exc()}")
-            self.logger.warning("Server will run without RAG features")
+            self.logger.error(f"Editor.log watching stopped: {e}")
+        finally:
+            self.editor_log_watcher.close()
+
+    def _start_db_maintenance(self):
+        """Queue first-time database setup or an update check"""
+        try:
+            db_manager = DatabaseManager()
+        except Exception as e:
+            self.logger.warning(f"Database manager not available: {e}")
+            return
+
+        if not db_manager.check_setup():
+            job = self.db_jobs.submit('setup', self._job_setup_database,
+                                      on_success=self._on_database_installed)
+            self.logger.info(f"Public database not found - downloading in background (job {job.id})")
+        else:
+            self.db_jobs.submit('check_updates', self._job_check_updates,
+                                on_success=self._log_available_updates)
+
+    # ========== Database Jobs (worker threads) ==========
+
+    def _job_setup_database(self, job: DatabaseJob) -> dict:
+        """First-time public database download"""
+        db_manager = DatabaseManager()
+        if not db_manager.setup_database(progress=job.report, cancel_event=job.cancel_event):
+            raise RuntimeError("Could not download public database - "
+                               "it will be created as you use Synthesis.Pro")
+
+        job.message = "Public database installed"
+        return {
+            "installed": True,
+            "database": db_manager.version_info.get('database', {})
+        }
+
+    def _job_check_updates(self, job: DatabaseJob) -> dict:
+        """Compare installed versions with the latest release"""
+        db_manager = DatabaseManager()
+
+        db_info = db_manager.version_info.get('database', {})
+        model_info = db_manager.version_info.get('model', {})
+        updates = db_manager.check_for_updates()
+
+        update_list = []
+        if updates.get('database'):
+            update_list.append(f"database ({updates['database']})")
+        if updates.get('model'):
+            update_list.append(f"model ({updates['model']})")
+
+        job.message = (f"Updates available: {', '.join(update_list)}"
+                       if update_list else "Everything is up to date")
+
+        return {
+            "database": {
+                "current_version": db_info.get('version', 'unknown'),
+                "latest_version": updates.get('database', db_info.get('version', 'unknown')),
+                "update_available": bool(updates.get('database'))
+            },
+            "model": {
+                "current_version": model_info.get('version', 'unknown'),
+                "latest_version": updates.get('model', model_info.get('version', 'unknown')),
+                "update_available": bool(updates.get('model'))
+            },
+            "last_updated": db_manager.version_info.get('updated', 'unknown')
+        }
+
+    def _job_update_database(self, job: DatabaseJob) -> dict:
+        """Download and swap in the latest database"""
+        db_manager = DatabaseManager()
+
+        updates = db_manager.check_for_updates()
+        if not updates.get('database') and not updates.get('model'):
+            job.message = "Everything is already up to date"
+            return {"installed": False}
+
+        update_list = []
+        if updates.get('database'):
+            update_list.append(f"database ({updates['database']})")
+        if updates.get('model'):
+            update_list.append(f"model ({updates['model']})")
+
+        self.logger.info(f"Downloading updates: {', '.join(update_list)}")
+        if not db_manager.update_all(progress=job.report, cancel_event=job.cancel_event):
+            raise RuntimeError("Update failed")
+
+        job.message = f"Updated: {', '.join(update_list)}"
+        return {
+            "installed": True,
+            "database": db_manager.version_info.get('database', {}),
+            "model": db_manager.version_info.get('model', {})
+        }
+
+    # ========== Database Jobs (event loop callbacks) ==========
+
+    async def _on_database_installed(self, job: DatabaseJob):
+        """Hot-reload RAG indexes for the new database (model stays loaded)"""
+        if not job.result.get('installed'):
+            return
+
+        if self.rag:
+            # Searches keep using the old indexes until the new ones are swapped in
+            await self._run_blocking('rag_reload', self.rag.reload, wait=True)
+        else:
+            components = await self._run_blocking('rag_init', self._create_rag_components)
+            self._install_rag_components(components)
+        self.logger.info(f"✅ RAG reloaded after database job {job.id}")
+
+    async def _log_available_updates(self, job: DatabaseJob):
+        """Startup update check result"""
+        if job.result['database']['update_available'] or job.result['model']['update_available']:
+            self.logger.info(job.message)
+            self.logger.info("Send 'update_public_db' (or run 'python database_manager.py --update') to update")
 
     async def _handle_connection(self, websocket: websockets.WebSocketServerProtocol):
         """
@@ -212,6 +442,8 @@ class SynthesisWebSocketServer:
         # Register connection
         self.connections.add(websocket)
         self.stats['connections_total'] += 1
+        self.pubsub.attach(websocket, self._send_text)
+        self._current_connection.set(websocket)
 
         client_info = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
         self.logger.info(f"🔌 Unity connected: {client_info} (total: {len(self.connections)})")
@@ -238,6 +470,7 @@ class SynthesisWebSocketServer:
 
         finally:
             # Unregister connection
+            await self.pubsub.detach(websocket)
             self.connections.remove(websocket)
             self.logger.info(f"📊 Active connections: {len(self.connections)}")
 
@@ -249,9 +482,13 @@ class SynthesisWebSocketServer:
             websocket: Client connection
             message: JSON message string
         """
+        self.metrics.increment('messages_in')
+        self.metrics.increment('bytes_in', self._byte_size(message))
+
         try:
             # Parse JSON
-            data = json.loads(message)
+            with self.metrics.time_stage('parse'):
+                data = self.serializer.loads(message)
 
             # Extract command info
             command_id = data.get('id', 'unknown')
@@ -268,7 +505,11 @@ class SynthesisWebSocketServer:
 
             # Execute handler
             handler = self.command_handlers[command_type]
-            result = await handler(command_id, parameters)
+            handler_start = time.perf_counter()
+            try:
+                result = await handler(command_id, parameters)
+            finally:
+                self.metrics.observe_command(command_type, time.perf_counter() - handler_start)
 
             # Send result
             await self._send_message(websocket, result)
@@ -299,8 +540,11 @@ class SynthesisWebSocketServer:
             data: Data to send (will be JSON encoded)
         """
         try:
-            message = json.dumps(data)
+            with self.metrics.time_stage('serialize'):
+                message, size = self.serializer.encode(data)
             await websocket.send(message)
+            self.metrics.increment('messages_out')
+            self.metrics.increment('bytes_out', size)
         except Exception as e:
             import traceback
             self.logger.error(f"Failed to send message to client: {e}")
@@ -316,12 +560,87 @@ class SynthesisWebSocketServer:
             command_id: Command ID that failed
             error_message: Error description
         """
-        await self._send_message(websocket, {
-            "commandId": command_id,
-            "success": False,
-            "message": error_message,
-            "timestamp": datetime.now().isoformat()
-        })
+        # Error envelope is pre-encoded; only the dynamic values are serialized
+        try:
+            message = self.serializer.encode_error(command_id, error_message, datetime.now().isoformat())
+            await websocket.send(message)
+            self.metrics.increment('messages_out')
+            self.metrics.increment('bytes_out', self._byte_size(message))
+        except Exception as e:
+            self.logger.error(f"Failed to send error to client: {e}")
+
+    async def _send_text(self, websocket: websockets.WebSocketServerProtocol, message: str):
+        """
+        Send a pre-encoded frame (used by pub/sub writer tasks)
+
+        Raises on failure so the caller can decide what to do.
+        """
+        await websocket.send(message)
+        self.metrics.increment('messages_out')
+        self.metrics.increment('bytes_out', self._byte_size(message))
+
+    def publish_event(self, topic: str, data: dict) -> int:
+        """
+        Push an event to every connection subscribed to topic
+
+        Safe to call from the event loop; use pubsub.publish_threadsafe from worker threads.
+
+        Returns:
+            Number of connections the event was queued for
+        """
+        return self.pubsub.publish(topic, data)
+
+    @staticmethod
+    def _byte_size(message) -> int:
+        """UTF-8 size of a frame without re-encoding pure ASCII text"""
+        if isinstance(message, str):
+            return len(message) if message.isascii() else len(message.encode('utf-8'))
+        return len(message)
+
+    async def _run_blocking(self, stage: str, func: Callable, *args, **kwargs):
+        """
+        Run blocking work (RAG search, DB writes) in the executor
+
+        Records queue wait (submit -> start) separately from run time,
+        so a saturated executor is distinguishable from slow work.
+
+        Args:
+            stage: Stage name for the latency histogram
+            func: Blocking callable
+        """
+        submitted = time.perf_counter()
+
+        def run():
+            started = time.perf_counter()
+            self.metrics.observe_stage('queue_wait', started - submitted)
+            self.metrics.executor_started()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                self.metrics.executor_finished(elapsed)
+                self.metrics.observe_stage(stage, elapsed)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, run)
+
+    def _collect_rag_cache_stats(self) -> dict:
+        """RAG cache hit counters for the metrics registry"""
+        # Plain attribute on both engines (RemoteRAG keeps the host's last
+        # reported counters), so reading it never blocks the event loop
+        cache_stats = getattr(self.rag, 'cache_stats', None) if self.rag else None
+        if not cache_stats:
+            return {}
+
+        hits = cache_stats.get('bm25_hits', 0)
+        misses = cache_stats.get('bm25_misses', 0)
+        total = hits + misses
+        return {
+            'bm25_hits': hits,
+            'bm25_misses': misses,
+            'bm25_hit_rate': round(hits / total, 4) if total else 0.0,
+            'index_reloads': cache_stats.get('reloads', 0)
+        }
 
     # ========== Command Handlers ==========
 
@@ -353,9 +672,12 @@ class SynthesisWebSocketServer:
                     "Dual database RAG",
                     "Conversation tracking",
                     "Knowledge search",
-                    "AI chat"
+                    "AI chat",
+                    "Event subscriptions",
+                    "Background database updates"
                 ],
                 "registered_commands": list(self.command_handlers.keys()),
+                "event_topics": self.EVENT_TOPICS,
                 "rag_enabled": self.rag is not None,
                 "conversation_tracking": self.conversation_tracker is not None
             },
@@ -376,7 +698,13 @@ class SynthesisWebSocketServer:
                 "commands_processed": self.stats['commands_processed'],
                 "commands_failed": self.stats['commands_failed'],
                 "uptime_seconds": uptime,
-                "uptime_formatted": self._format_uptime(uptime)
+                "uptime_formatted": self._format_uptime(uptime),
+                "serializer": self.serializer.backend,
+                "pubsub": self.pubsub.get_stats(),
+                "db_jobs_active": sum(1 for job in self.db_jobs.jobs.values() if job.is_active),
+                "resolution_detector": self.resolution_detector.stats if self.resolution_detector else None,
+                "editor_log": self.editor_log_watcher.stats if self.editor_log_watcher else None,
+                "metrics": self.metrics.snapshot()
             },
             "timestamp": datetime.now().isoformat()
         }
@@ -412,7 +740,9 @@ class SynthesisWebSocketServer:
             # Use RAG onboarding system for natural context delivery
             context_data = None
             if self.rag_onboarding:
-                context_data = self.rag_onboarding.process_user_message(message)
+                context_data = await self._run_blocking(
+                    'context', self.rag_onboarding.process_user_message, message
+                )
 
             # Gather relevant context naturally
             helpful_context = []
@@ -420,7 +750,9 @@ class SynthesisWebSocketServer:
                 helpful_context.append(context_data.get('context', ''))
 
             # Search knowledge base for additional context
-            search_results = self.rag.search(message, top_k=3, private=True)
+            search_results = await self._run_blocking(
+                'search', self.rag.search, message, top_k=3, scope="private"
+            )
 
             # Format context naturally (not as "search results")
             context_preview = ""
@@ -497,7 +829,10 @@ class SynthesisWebSocketServer:
             }
 
         try:
-            results = self.rag.search(query, top_k=top_k, private=private)
+            results = await self._run_blocking(
+                'search', self.rag.search, query, top_k=top_k,
+                scope="private" if private else "public"
+            )
 
             return {
                 "commandId": command_id,
@@ -826,122 +1161,139 @@ class SynthesisWebSocketServer:
         """
         Check if database or model updates are available
 
-        Returns information about the current and latest versions.
+        Runs as a background job. By default waits for the result (other
+        commands keep being served meanwhile).
+
+        Parameters:
+            wait: Wait for the result (default: true)
+            timeout: Seconds to wait before returning the job instead (default: 30)
         """
-        try:
-            db_manager = DatabaseManager()
+        job = self.db_jobs.submit('check_updates', self._job_check_updates)
+
+        if parameters.get('wait', True):
+            await self.db_jobs.wait(job, parameters.get('timeout', 30))
+
+        return self._job_response(command_id, job, "Update check")
 
-            # Get current versions
-            db_info = db_manager.version_info.get('database', {})
-            model_info = db_manager.version_info.get('model', {})
-            current_updated = db_manager.version_info.get('updated', 'unknown')
+    async def _handle_update_public_db(self, command_id: str, parameters: dict) -> dict:
+        """
+        Update database and model to latest versions
 
-            # Check for updates
-            updates = db_manager.check_for_updates()
+        Starts a background download and returns its job immediately.
+        The current database keeps serving until the new file has been
+        downloaded, verified and swapped in. Subscribe to "jobs.*" for
+        progress, or poll db_job_status.
 
-            update_list = []
-            if updates.get('database'):
-                update_list.append(f"database ({updates['database']})")
-            if updates.get('model'):
-                update_list.append(f"model ({updates['model']})")
+        Parameters:
+            wait: Wait for the job to finish (default: false)
+            timeout: Seconds to wait (default: none)
+        """
+        job = self.db_jobs.submit('update', self._job_update_database,
+                                  on_success=self._on_database_installed)
 
-            if update_list:
-                message = f"Updates available: {', '.join(update_list)}"
-                update_available = True
-            else:
-                message = "Everything is up to date"
-                update_available = False
+        if parameters.get('wait', False):
+            await self.db_jobs.wait(job, parameters.get('timeout'))
+
+        return self._job_response(command_id, job, "Update")
 
+    async def _handle_db_job_status(self, command_id: str, parameters: dict) -> dict:
+        """
+        Get status of database jobs
+
+        Parameters:
+            job_id: Job to query (omit to list recent jobs)
+        """
+        job_id = parameters.get('job_id')
+
+        if not job_id:
             return {
                 "commandId": command_id,
                 "success": True,
-                "message": message,
-                "data": {
-                    "database": {
-                        "current_version": db_info.get('version', 'unknown'),
-                        "latest_version": updates.get('database', db_info.get('version', 'unknown')),
-                        "update_available": bool(updates.get('database'))
-                    },
-                    "model": {
-                        "current_version": model_info.get('version', 'unknown'),
-                        "latest_version": updates.get('model', model_info.get('version', 'unknown')),
-                        "update_available": bool(updates.get('model'))
-                    },
-                    "last_updated": current_updated
-                },
+                "message": "Database jobs",
+                "data": {"jobs": self.db_jobs.list()},
                 "timestamp": datetime.now().isoformat()
             }
 
-        except Exception as e:
-            self.logger.error(f"Update check error: {e}")
+        job = self.db_jobs.get(job_id)
+        if not job:
             return {
                 "commandId": command_id,
                 "success": False,
-                "message": f"Update check failed: {str(e)}",
+                "message": f"Unknown job: {job_id}",
                 "timestamp": datetime.now().isoformat()
             }
 
-    async def _handle_update_public_db(self, command_id: str, parameters: dict) -> dict:
-        """
-        Update database and model to latest versions
+        return {
+            "commandId": command_id,
+            "success": True,
+            "message": f"Job {job.status}",
+            "data": job.to_dict(),
+            "timestamp": datetime.now().isoformat()
+        }
 
-        Downloads and installs updates for both the Unity documentation database
-        and the embeddings model.
+    async def _handle_cancel_db_job(self, command_id: str, parameters: dict) -> dict:
         """
-        try:
-            db_manager = DatabaseManager()
+        Cancel a running database job
 
-            # Check if update is available
-            updates = db_manager.check_for_updates()
-            if not updates.get('database') and not updates.get('model'):
-                return {
-                    "commandId": command_id,
-                    "success": True,
-                    "message": "Everything is already up to date",
-                    "timestamp": datetime.now().isoformat()
-                }
+        The partial download is discarded; the installed database is untouched.
 
-            # Perform update
-            update_list = []
-            if updates.get('database'):
-                update_list.append(f"database ({updates['database']})")
-            if updates.get('model'):
-                update_list.append(f"model ({updates['model']})")
+        Parameters:
+            job_id: Job to cancel
+        """
+        job_id = parameters.get('job_id', '')
+        job = self.db_jobs.cancel(job_id)
 
-            self.logger.info(f"Downloading updates: {', '.join(update_list)}")
-            success = db_manager.update_all()
+        if not job:
+            return {
+                "commandId": command_id,
+                "success": False,
+                "message": f"Unknown job: {job_id}",
+                "timestamp": datetime.now().isoformat()
+            }
 
-            if success:
-                # Reinitialize RAG with updated database/model
-                await self._initialize_rag()
+        return {
+            "commandId": command_id,
+            "success": True,
+            "message": "Cancellation requested" if job.is_active else f"Job already {job.status}",
+            "data": job.to_dict(),
+            "timestamp": datetime.now().isoformat()
+        }
 
-                return {
-                    "commandId": command_id,
-                    "success": True,
-                    "message": f"Updated: {', '.join(update_list)}",
-                    "data": {
-                        "database": db_manager.version_info.get('database', {}),
-                        "model": db_manager.version_info.get('model', {})
-                    },
-                    "timestamp": datetime.now().isoformat()
-                }
-            else:
-                return {
-                    "commandId": command_id,
-                    "success": False,
-                    "message": "Update failed",
-                    "timestamp": datetime.now().isoformat()
-                }
+    def _job_response(self, command_id: str, job: DatabaseJob, label: str) -> dict:
+        """
+        Command response for a database job
 
-        except Exception as e:
-            self.logger.error(f"Update error: {e}")
+        Finished jobs return their result as data (plus job_id), running
+        jobs return the job itself.
+        """
+        if job.status == DatabaseJob.FAILED:
             return {
                 "commandId": command_id,
                 "success": False,
-                "message": f"Update failed: {str(e)}",
+                "message": f"{label} failed: {job.error}",
+                "data": job.to_dict(),
+                "timestamp": datetime.now().isoformat()
+            }
+
+        if job.status == DatabaseJob.SUCCEEDED:
+            data = dict(job.result or {})
+            data["job_id"] = job.id
+            return {
+                "commandId": command_id,
+                "success": True,
+                "message": job.message,
+                "data": data,
                 "timestamp": datetime.now().isoformat()
             }
 
+        return {
+            "commandId": command_id,
+            "success": job.status != DatabaseJob.CANCELLED,
+            "message": job.message or f"{label} running in background (job {job.id})",
+            "data": job.to_dict(),
+            "timestamp": datetime.now().isoformat()
+        }
+
     async def _handle_console_log(self, command_id: str, parameters: dict) -> dict:
         """
         Handle console log entries from Unity
@@ -969,13 +1321,21 @@ class SynthesisWebSocketServer:
                 }
 
             # Capture entries
-            stats = self.console_monitor.capture_batch(entries)
+            stats = await self._run_blocking('console_capture', self.console_monitor.capture_batch, entries)
 
             # Log if we captured anything interesting
             if stats['captured'] > 0:
                 self.logger.info(f"📝 Captured {stats['captured']} console entries to memory")
                 if stats.get('errors', 0) > 0:
                     self.logger.warning(f"⚠️  {stats['errors']} error(s) captured")
+                    self.publish_event("console.errors", {
+                        "captured": stats['captured'],
+                        "errors": stats['errors']
+                    })
+
+            # Push known-pattern matches so editors don't have to poll
+            for match in stats.get('pattern_matches', []):
+                self.publish_event("console.patterns", match)
 
             return {
                 "commandId": command_id,
@@ -994,6 +1354,62 @@ class SynthesisWebSocketServer:
                 "timestamp": datetime.now().isoformat()
             }
 
+    async def _handle_subscribe(self, command_id: str, parameters: dict) -> dict:
+        """
+        Subscribe this connection to server events
+
+        Parameters:
+            topics: List of topics or patterns ("jobs.*", "*")
+
+        Events arrive as: {"type": "event", "topic": ..., "data": ..., "timestamp": ...}
+        """
+        topics = parameters.get('topics', [])
+        if isinstance(topics, str):
+            topics = [topics]
+
+        if not topics:
+            return {
+                "commandId": command_id,
+                "success": False,
+                "message": "Missing 'topics' parameter",
+                "data": {"available_topics": self.EVENT_TOPICS},
+                "timestamp": datetime.now().isoformat()
+            }
+
+        subscriptions = self.pubsub.subscribe(self._current_connection.get(), topics)
+
+        return {
+            "commandId": command_id,
+            "success": True,
+            "message": f"Subscribed to {len(subscriptions)} topic(s)",
+            "data": {
+                "subscriptions": subscriptions,
+                "available_topics": self.EVENT_TOPICS
+            },
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def _handle_unsubscribe(self, command_id: str, parameters: dict) -> dict:
+        """
+        Unsubscribe this connection from server events
+
+        Parameters:
+            topics: Topics to remove (omit to remove all)
+        """
+        topics = parameters.get('topics')
+        if isinstance(topics, str):
+            topics = [topics]
+
+        subscriptions = self.pubsub.unsubscribe(self._current_connection.get(), topics)
+
+        return {
+            "commandId": command_id,
+            "success": True,
+            "message": f"{len(subscriptions)} subscription(s) remaining",
+            "data": {"subscriptions": subscriptions},
+            "timestamp": datetime.now().isoformat()
+        }
+
     def _format_uptime(self, seconds: float) -> str:
         """Format uptime in human-readable format"""
         hours = int(seconds // 3600)
@@ -1011,6 +1427,11 @@ async def main():
         await server.start()
     except KeyboardInterrupt:
         print("\n\n👋 Shutting down server...")
+        server.db_jobs.shutdown()
+        if server.resolution_detector:
+            server.resolution_detector.stop()
+        if server.editor_log_watcher:
+            server.editor_log_watcher.close()
         print(f"📊 Final stats:")
         print(f"   Total connections: {server.stats['connections_total']}")
         print(f"   Commands processed: {server.stats['commands_processed']}")
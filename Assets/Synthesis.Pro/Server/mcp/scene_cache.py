@@ -0,0 +1,474 @@
+"""
+Scene Hierarchy Cache - Synthesis.Pro MCP Server
+Server-side snapshot of Unity scene hierarchies with local indexes
+
+Fetching a large scene's hierarchy from Unity is the expensive part of
+get_scene_hierarchy; agents then look at a few entries of it. The cache
+keeps one flattened snapshot per scene and answers pages, subtrees and
+name/tag/component lookups locally.
+
+Pages are filtered server-side (component, tag, layer, active state,
+depth, name) and continue with opaque cursors. A cursor records the
+snapshot version and the last object returned, so paging survives a
+hierarchy change without skipping or repeating objects that stayed put.
+It also carries a hash of the query; a cursor used with a different
+scene, root or filter is rejected.
+
+Change detection, cheapest first:
+- Writes through the MCP server (create/modify/execute_csharp) invalidate
+- If the editor state reports a hierarchy version, an unchanged version
+  keeps the snapshot without re-fetching the hierarchy
+- Otherwise the hierarchy is re-fetched after max_age seconds and hashed;
+  an unchanged hash keeps the existing indexes
+"""
+
+import asyncio
+import base64
+import bisect
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Keys Unity/MCPForUnity may use for the node list or a hierarchy change counter.
+# Only hierarchy-specific names: a generic "version"/"hash" field (protocol,
+# package or project version) never changes and would freeze the snapshot.
+_NODE_LIST_KEYS = ("hierarchy", "gameObjects", "objects", "items", "nodes")
+_VERSION_KEYS = ("hierarchyVersion", "hierarchy_version", "sceneHash", "scene_hash")
+
+
+def _component_names(node: Dict[str, Any]) -> List[str]:
+    """Component type names of a node (components may be strings or dicts)"""
+    names = []
+    for comp in node.get("components") or []:
+        if isinstance(comp, dict):
+            comp = comp.get("type") or comp.get("name") or ""
+        if comp:
+            names.append(str(comp))
+    return names
+
+
+def _component_keys(type_name: str) -> Tuple[str, ...]:
+    """Index keys for a component: full and short name ("UnityEngine.Camera" -> "camera")"""
+    full = type_name.lower()
+    short = full.rsplit(".", 1)[-1]
+    return (full,) if short == full else (full, short)
+
+
+def encode_cursor(version: str, offset: int, last_path: str, query: str = "") -> str:
+    """Opaque pagination cursor (query: hash of the query it pages through)"""
+    data = json.dumps({"v": version, "o": offset, "p": last_path, "q": query}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Optional[Dict[str, Any]]:
+    """Cursor contents, or None if it is malformed"""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    offset = data.get("o")
+    if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+        return None
+    return data
+
+
+class SceneSnapshot:
+    """
+    Flattened hierarchy of one scene.
+
+    Nodes are stored in depth-first order, so every subtree is a
+    contiguous slice nodes[i:subtree_end[i]].
+    """
+
+    def __init__(self, scene: str, items: List[Dict[str, Any]], version: str):
+        self.scene = scene
+        self.version = version
+        self.state_version: Optional[str] = None
+        self.fetched_at = time.monotonic()
+        self.nodes: List[Dict[str, Any]] = []
+        self.subtree_end: List[int] = []
+        self._match_cache: Dict[str, List[int]] = {}
+
+        self._flatten(items)
+
+        self.by_path: Dict[str, int] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_tag: Dict[str, List[int]] = {}
+        self.by_component: Dict[str, List[int]] = {}
+        for i, node in enumerate(self.nodes):
+            self.by_path.setdefault(node["path"], i)
+            self.by_name.setdefault(node.get("name", ""), []).append(i)
+            self.by_tag.setdefault(node.get("tag") or "Untagged", []).append(i)
+            for type_name in _component_names(node):
+                for key in _component_keys(type_name):
+                    self.by_component.setdefault(key, []).append(i)
+
+    def _flatten(self, items: List[Dict[str, Any]]):
+        """Walk nested children (or rebuild the tree from paths) depth-first"""
+        nested = any(
+            isinstance(child, dict)
+            for item in items for child in (item.get("children") or [])
+        )
+
+        if not nested:
+            # Flat list: rebuild parent/child links from paths (keeping sibling order)
+            paths = [item.get("path") or item.get("name", "") for item in items]
+            known = set(paths)
+            children: Dict[Optional[str], List[Tuple[str, Dict]]] = {}
+            for path, item in zip(paths, items):
+                parent = path.rsplit("/", 1)[0] if "/" in path else None
+                children.setdefault(parent if parent in known else None, []).append((path, item))
+        else:
+            children = None
+
+        # Iterative DFS (deep hierarchies would overflow recursion)
+        if children is None:
+            stack = [(item, None, True) for item in reversed(items)]
+        else:
+            stack = [(item, None, True) for _, item in reversed(children.get(None, []))]
+
+        open_nodes: List[int] = []
+        while stack:
+            item, parent_index, parent_active = stack.pop()
+            parent = self.nodes[parent_index] if parent_index is not None else None
+            depth = parent["depth"] + 1 if parent else 0
+
+            # Close subtrees this node is not part of
+            while open_nodes and self.nodes[open_nodes[-1]]["depth"] >= depth:
+                self.subtree_end[open_nodes.pop()] = len(self.nodes)
+
+            name = item.get("name", "")
+            if children is None:
+                path = item.get("path") or (f"{parent['path']}/{name}" if parent else name)
+                kids = [c for c in (item.get("children") or []) if isinstance(c, dict)]
+            else:
+                path = item.get("path") or name
+                kids = [c for _, c in children.get(path, [])]
+
+            node = {k: v for k, v in item.items() if k != "children"}
+            active = bool(item.get("active", True))
+            node.update({
+                "name": name,
+                "path": path,
+                "parent": parent["path"] if parent else None,
+                "depth": depth,
+                "active_in_hierarchy": active and parent_active,
+                "child_count": len(kids) or len(item.get("children") or [])
+            })
+
+            index = len(self.nodes)
+            self.nodes.append(node)
+            self.subtree_end.append(index + 1)
+            open_nodes.append(index)
+
+            for kid in reversed(kids):
+                stack.append((kid, index, active and parent_active))
+
+        while open_nodes:
+            self.subtree_end[open_nodes.pop()] = len(self.nodes)
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Node by hierarchy path"""
+        index = self.by_path.get(path)
+        return self.nodes[index] if index is not None else None
+
+    def find(self, name: Optional[str] = None, tag: Optional[str] = None,
+             component: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Nodes matching all given criteria (exact name / tag, component type name)"""
+        candidates = None
+        for index_list in (
+            self.by_name.get(name, []) if name is not None else None,
+            self.by_tag.get(tag, []) if tag is not None else None,
+            self.by_component.get(component.lower(), []) if component is not None else None,
+        ):
+            if index_list is None:
+                continue
+            candidates = set(index_list) if candidates is None else candidates & set(index_list)
+
+        if candidates is None:
+            return []
+        return [self.nodes[i] for i in sorted(candidates)]
+
+    def subtree_range(self, root: Optional[str] = None) -> Optional[Tuple[int, int]]:
+        """(start, end) node indexes of a subtree (whole scene if root is None)"""
+        if root is None:
+            return 0, len(self.nodes)
+        index = self.by_path.get(root)
+        if index is None:
+            return None
+        return index, self.subtree_end[index]
+
+    def match(self, root: Optional[str] = None, include_inactive: bool = True,
+              filters: Optional[Dict[str, Any]] = None) -> Optional[List[int]]:
+        """
+        Indexes of nodes matching a query, in depth-first order
+
+        Args:
+            root: Only this GameObject's subtree (hierarchy path)
+            include_inactive: Include objects inactive in the hierarchy
+            filters: Any of
+                component - component type name ("Camera" or "UnityEngine.Camera")
+                tag       - exact tag
+                layer     - layer number or name
+                active    - True/False: active / inactive in hierarchy
+                min_depth, max_depth - depth below root (root level = 0)
+                name      - case-insensitive substring of the name
+
+        Returns:
+            Node indexes, or None if root does not exist
+        """
+        filters = {k: v for k, v in (filters or {}).items() if v is not None}
+        cache_key = self._query_key(root, include_inactive, filters)
+        if cache_key in self._match_cache:
+            return self._match_cache[cache_key]
+
+        span = self.subtree_range(root)
+        if span is None:
+            return None
+        start, end = span
+        base_depth = self.nodes[start]["depth"] if root else 0
+
+        # Narrow with the indexes first, then check the remaining criteria per node
+        candidates: Optional[List[int]] = None
+        for index_list in (
+            self.by_component.get(str(filters["component"]).lower(), []) if "component" in filters else None,
+            self.by_tag.get(filters["tag"], []) if "tag" in filters else None,
+        ):
+            if index_list is None:
+                continue
+            in_span = [i for i in index_list if start <= i < end]
+            if candidates is None:
+                candidates = in_span
+            else:
+                keep = set(in_span)
+                candidates = [i for i in candidates if i in keep]
+        if candidates is None:
+            candidates = range(start, end)
+
+        active = filters.get("active")
+        if active is None and not include_inactive:
+            active = True
+        layer = str(filters["layer"]).lower() if "layer" in filters else None
+        min_depth = filters.get("min_depth")
+        max_depth = filters.get("max_depth")
+        name = str(filters["name"]).lower() if "name" in filters else None
+
+        matches = []
+        for i in candidates:
+            node = self.nodes[i]
+            if active is not None and node["active_in_hierarchy"] != bool(active):
+                continue
+            depth = node["depth"] - base_depth
+            if min_depth is not None and depth < min_depth:
+                continue
+            if max_depth is not None and depth > max_depth:
+                continue
+            if layer is not None and str(node.get("layer", 0)).lower() != layer \
+                    and str(node.get("layerName", "")).lower() != layer:
+                continue
+            if name is not None and name not in node["name"].lower():
+                continue
+            matches.append(i)
+
+        if len(self._match_cache) >= 16:
+            self._match_cache.pop(next(iter(self._match_cache)))
+        self._match_cache[cache_key] = matches
+        return matches
+
+    def page(self, offset: int = 0, limit: int = 20, root: Optional[str] = None,
+             include_inactive: bool = True, filters: Optional[Dict[str, Any]] = None,
+             cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int, int, Optional[str]]:
+        """
+        One page of matching nodes in depth-first order
+
+        Pass the returned cursor back to get the next page. A cursor from an
+        older snapshot resumes after the last object it returned, if that
+        object still exists.
+
+        Returns:
+            (nodes, total matches, offset of the first node, next cursor or None)
+
+        Raises:
+            ValueError: The cursor was returned for a different query
+        """
+        matches = self.match(root, include_inactive, filters)
+        if matches is None:
+            return [], 0, 0, None
+
+        query = self.query_hash(root, include_inactive, filters)
+        if cursor:
+            state = decode_cursor(cursor)
+            if state and state.get("q") != query:
+                raise ValueError("Cursor belongs to a different query (scene, root, filter or "
+                                 "include_inactive changed); start again without it")
+            offset = self._resume_offset(state, matches, offset)
+
+        selected = matches[offset:offset + limit]
+        next_offset = offset + len(selected)
+        next_cursor = None
+        if selected and next_offset < len(matches):
+            next_cursor = encode_cursor(self.version, next_offset, self.nodes[selected[-1]]["path"], query)
+
+        return [self.nodes[i] for i in selected], len(matches), offset, next_cursor
+
+    def query_hash(self, root: Optional[str] = None, include_inactive: bool = True,
+                   filters: Optional[Dict[str, Any]] = None) -> str:
+        """Short hash identifying a query on this scene (stored in its cursors)"""
+        filters = {k: v for k, v in (filters or {}).items() if v is not None}
+        key = f"{self.scene}\n{self._query_key(root, include_inactive, filters)}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=6).hexdigest()
+
+    @staticmethod
+    def _query_key(root: Optional[str], include_inactive: bool, filters: Dict[str, Any]) -> str:
+        return json.dumps([root, include_inactive, filters], sort_keys=True, default=str)
+
+    def _resume_offset(self, state: Optional[Dict[str, Any]], matches: List[int], fallback: int) -> int:
+        if not state:
+            return fallback
+        if state.get("v") == self.version:
+            return state.get("o", fallback)
+
+        # Hierarchy changed: continue after the last object the cursor returned
+        last = self.by_path.get(state.get("p"))
+        if last is None:
+            return min(state.get("o", fallback), len(matches))
+        return bisect.bisect_right(matches, last)
+
+    def diff(self, previous: "SceneSnapshot") -> Dict[str, int]:
+        """Paths added/removed relative to an older snapshot"""
+        old_paths = previous.by_path.keys()
+        new_paths = self.by_path.keys()
+        return {
+            "added": len(new_paths - old_paths),
+            "removed": len(old_paths - new_paths)
+        }
+
+
+class SceneHierarchyCache:
+    """Snapshots of scene hierarchies, refreshed from a UnityBridge on demand"""
+
+    def __init__(self, unity, max_age: float = 5.0):
+        """
+        Args:
+            unity: UnityBridge
+            max_age: Seconds a snapshot is trusted before re-checking Unity
+        """
+        self.unity = unity
+        self.max_age = max_age
+        self._snapshots: Dict[str, SceneSnapshot] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.stats = {"hits": 0, "fetches": 0, "unchanged": 0, "rebuilds": 0, "invalidations": 0}
+        self.last_diff: Dict[str, int] = {}
+
+    async def get(self, scene_name: Optional[str] = None, refresh: bool = False) -> Optional[SceneSnapshot]:
+        """
+        Snapshot of a scene (None = active scene), fetching from Unity if stale
+
+        Returns:
+            SceneSnapshot, or None if Unity could not be reached
+        """
+        key = scene_name or ""
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        # Concurrent callers for the same scene wait for one fetch
+        async with lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot and not refresh and time.monotonic() - snapshot.fetched_at < self.max_age:
+                self.stats["hits"] += 1
+                return snapshot
+
+            if snapshot and not refresh and await self._state_unchanged(snapshot):
+                snapshot.fetched_at = time.monotonic()
+                self.stats["unchanged"] += 1
+                return snapshot
+
+            return await self._fetch(key, snapshot)
+
+    def peek(self, scene_name: Optional[str] = None) -> Optional[SceneSnapshot]:
+        """Snapshot of a scene if it is younger than max_age (never contacts Unity)"""
+        snapshot = self._snapshots.get(scene_name or "")
+        if snapshot and time.monotonic() - snapshot.fetched_at < self.max_age:
+            self.stats["hits"] += 1
+            return snapshot
+        return None
+
+    def invalidate(self, scene_name: Optional[str] = None):
+        """Force a re-check on next use (all scenes if scene_name is None)"""
+        self.stats["invalidations"] += 1
+        targets = [scene_name or ""] if scene_name is not None else list(self._snapshots)
+        for key in targets:
+            snapshot = self._snapshots.get(key)
+            if snapshot:
+                snapshot.fetched_at = float("-inf")
+                snapshot.state_version = None
+
+    async def _state_unchanged(self, snapshot: SceneSnapshot) -> bool:
+        """True if the editor reports the same hierarchy version as when the snapshot was taken"""
+        if snapshot.state_version is None:
+            return False
+        state_version = self._version_from(await self.unity.get_editor_state())
+        return state_version is not None and state_version == snapshot.state_version
+
+    async def _fetch(self, key: str, previous: Optional[SceneSnapshot]) -> Optional[SceneSnapshot]:
+        self.stats["fetches"] += 1
+
+        # Always fetch inactive objects too - one snapshot serves both views
+        state, result = await asyncio.gather(
+            self.unity.get_editor_state(),
+            self.unity.get_scene_hierarchy(key or None, True)
+        )
+        items, version = self._extract(result)
+        if items is None:
+            return None
+
+        if previous and previous.version == version:
+            previous.fetched_at = time.monotonic()
+            previous.state_version = self._version_from(state)
+            self.stats["unchanged"] += 1
+            return previous
+
+        snapshot = SceneSnapshot(key, items, version)
+        snapshot.state_version = self._version_from(state)
+        if previous:
+            self.last_diff = snapshot.diff(previous)
+        self._snapshots[key] = snapshot
+        self.stats["rebuilds"] += 1
+        return snapshot
+
+    @staticmethod
+    def _version_from(data: Any) -> Optional[str]:
+        if isinstance(data, dict):
+            for key in _VERSION_KEYS:
+                if data.get(key) is not None:
+                    return str(data[key])
+        return None
+
+    @classmethod
+    def _extract(cls, result: Any) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """(node list, version) from a hierarchy response, hashing it if Unity gives no version"""
+        if not result:
+            return None, None
+
+        # MCP resources/read wraps content as [{"uri": ..., "text": "<json>"}]
+        if isinstance(result, dict) and isinstance(result.get("contents"), list):
+            contents = result["contents"]
+            if contents and isinstance(contents[0], dict) and "text" in contents[0]:
+                try:
+                    result = json.loads(contents[0]["text"])
+                except ValueError:
+                    return None, None
+
+        version = cls._version_from(result)
+        items = result
+        if isinstance(result, dict):
+            items = next((result[k] for k in _NODE_LIST_KEYS if isinstance(result.get(k), list)), None)
+        if not isinstance(items, list):
+            return None, None
+
+        if version is None:
+            encoded = json.dumps(items, sort_keys=True, separators=(",", ":"), default=str)
+            version = hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+        return [item for item in items if isinstance(item, dict)], version
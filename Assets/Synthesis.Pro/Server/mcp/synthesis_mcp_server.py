@@ -7,8 +7,10 @@ Managed by MCPForUnity framework
 """
 
 import asyncio
+import functools
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 from datetime import datetime
@@ -30,15 +32,18 @@ except ImportError:
 # Our systems
 try:
     from rag_engine_lite import SynthesisRAG
+    from rag_client import connect_rag
 except ImportError:
     print("[Synthesis MCP] WARNING: RAG engine not available")
     SynthesisRAG = None
 
 try:
-    from unity_bridge import get_bridge
+    from unity_bridge import get_bridge, MODIFY_OPERATIONS
+    from scene_cache import SceneHierarchyCache
 except ImportError:
     print("[Synthesis MCP] WARNING: Unity bridge not available")
     get_bridge = None
+    MODIFY_OPERATIONS = {}
 
 try:
     from rag_onboarding import RAGOnboardingSystem
@@ -60,9 +65,14 @@ class SynthesisMCPServer:
         self.server = Server("synthesis-pro")
         self.rag = None
         self.unity = get_bridge() if get_bridge else None
+        self.scene_cache = SceneHierarchyCache(self.unity) if self.unity else None
         self.onboarding = None
         self.db_manager = None
 
+        # Blocking RAG/DB/file work runs here so tool calls never stall the loop
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="synthesis-mcp")
+        self._rag_init_task: Optional[asyncio.Task] = None
+
         # Statistics
         self.stats = {
             'start_time': datetime.now(),
@@ -71,6 +81,13 @@ class SynthesisMCPServer:
             'unity_operations': 0
         }
 
+        # Database manager (cheap - reads version file only)
+        if DatabaseManager:
+            try:
+                self.db_manager = DatabaseManager()
+            except Exception as e:
+                print(f"[Synthesis MCP] [WARNING] Database manager failed: {e}")
+
         self.setup_handlers()
 
     def setup_handlers(self):
@@ -263,7 +280,9 @@ class SynthesisMCPServer:
                 ),
                 Tool(
                     name="get_scene_hierarchy",
-                    description="Get GameObject hierarchy for a scene",
+                    description="Get GameObject hierarchy for a scene, paged and optionally filtered "
+                                "(component, tag, layer, active state, depth, name). "
+                                "Pass the returned cursor to get the next page.",
                     inputSchema={
                         "type": "object",
                         "properties": {
@@ -275,6 +294,42 @@ class SynthesisMCPServer:
                                 "type": "boolean",
                                 "description": "Include inactive GameObjects",
                                 "default": True
+                            },
+                            "root": {
+                                "type": "string",
+                                "description": "Only list this GameObject's subtree (hierarchy path, e.g. 'Canvas/Panel')"
+                            },
+                            "offset": {
+                                "type": "integer",
+                                "description": "Index of the first entry to return",
+                                "default": 0
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum entries to return",
+                                "default": 20
+                            },
+                            "cursor": {
+                                "type": "string",
+                                "description": "Cursor from a previous page of the same query (continues where it stopped; overrides offset)"
+                            },
+                            "filter": {
+                                "type": "object",
+                                "description": "Only list matching GameObjects (all given criteria must match)",
+                                "properties": {
+                                    "component": {"type": "string", "description": "Component type, e.g. 'Camera' or 'UnityEngine.Camera'"},
+                                    "tag": {"type": "string"},
+                                    "layer": {"type": ["integer", "string"], "description": "Layer number or name"},
+                                    "active": {"type": "boolean", "description": "Active (true) or inactive (false) in hierarchy"},
+                                    "min_depth": {"type": "integer", "description": "Depth below root/scene root (0 = top level)"},
+                                    "max_depth": {"type": "integer"},
+                                    "name": {"type": "string", "description": "Case-insensitive substring of the name"}
+                                }
+                            },
+                            "refresh": {
+                                "type": "boolean",
+                                "description": "Re-fetch from Unity instead of using the cached snapshot",
+                                "default": False
                             }
                         }
                     }
@@ -287,7 +342,13 @@ class SynthesisMCPServer:
                         "properties": {
                             "path": {
                                 "type": "string",
-                                "description": "GameObject path (e.g., 'Main Camera') or hierarchy path (e.g., 'Canvas/Button')"
+                                "description": "GameObject path (e.g., 'Main Camera') or hierarchy path (e.g., 'Canvas/Button'); "
+                                               "tag or component type for by_tag / by_component"
+                            },
+                            "search_method": {
+                                "type": "string",
+                                "description": "by_name, by_path, by_tag (list all with tag) or by_component (list all with component)",
+                                "default": "by_name"
                             }
                         },
                         "required": ["path"]
@@ -342,6 +403,30 @@ class SynthesisMCPServer:
                         "required": ["path", "operation", "params"]
                     }
                 ),
+                Tool(
+                    name="batch_gameobjects",
+                    description="Get and/or modify many GameObjects in one round trip to Unity. "
+                                "Items with an 'operation' are modifications, items without one are lookups.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "items": {
+                                "type": "array",
+                                "description": "Items: {path} to get, or {path, operation, params} to modify (same operations as modify_gameobject)",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "path": {"type": "string"},
+                                        "operation": {"type": "string"},
+                                        "params": {"type": "object"}
+                                    },
+                                    "required": ["path"]
+                                }
+                            }
+                        },
+                        "required": ["items"]
+                    }
+                ),
                 Tool(
                     name="execute_csharp",
                     description="Execute C# code in Unity Editor (via MCPForUnity integration)",
@@ -424,6 +509,9 @@ class SynthesisMCPServer:
             elif name == "modify_gameobject":
                 self.stats['unity_operations'] += 1
                 return await self.handle_modify_gameobject(arguments)
+            elif name == "batch_gameobjects":
+                self.stats['unity_operations'] += 1
+                return await self.handle_batch_gameobjects(arguments)
             elif name == "execute_csharp":
                 self.stats['unity_operations'] += 1
                 return await self.handle_execute_csharp(arguments)
@@ -433,24 +521,51 @@ class SynthesisMCPServer:
                     text=f"Unknown tool: {name}"
                 )]
 
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run blocking work in the executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    def start_rag_initialization(self):
+        """Begin loading RAG in the background (tools that need it wait for it)"""
+        if self._rag_init_task is None or (self._rag_init_task.done() and not self.rag):
+            self._rag_init_task = asyncio.get_running_loop().create_task(
+                self._run_blocking(self._initialize_rag_sync)
+            )
+        return self._rag_init_task
+
     async def initialize_rag(self):
-        """Initialize RAG engine and onboarding system"""
+        """
+        Initialize RAG engine and onboarding system
+
+        Concurrent callers share one initialization; a failed one is
+        retried on the next call.
+        """
         if SynthesisRAG is None:
             return False
 
+        return await asyncio.shield(self.start_rag_initialization())
+
+    def _initialize_rag_sync(self) -> bool:
+        """
+        Blocking part of initialize_rag (model load, session preview)
+
+        Runs while the stdio transport is live: run() points sys.stdout at
+        stderr for that time, so model loading messages stay off the wire.
+        """
         try:
             server_dir = Path(__file__).parent.parent
             db_dir = server_dir / "database"
 
-            self.rag = SynthesisRAG(
+            rag = connect_rag(
                 database=str(db_dir / "synthesis_knowledge.db"),
                 private_database=str(db_dir / "synthesis_private.db")
             )
 
             # Initialize RAG onboarding for session previews
-            if RAGOnboardingSystem and self.rag:
+            if RAGOnboardingSystem and rag:
                 self.onboarding = RAGOnboardingSystem(
-                    rag_engine=self.rag,
+                    rag_engine=rag,
                     user_id="mcp_session",
                     presentation_style="natural"
                 )
@@ -460,19 +575,18 @@ class SynthesisMCPServer:
                 preview = self.onboarding.start_session(session_id)
 
                 if preview:
-                    print("\n" + "="*60)
-                    print(preview)
-                    print("="*60 + "\n")
+                    print("\n" + "="*60, file=sys.stderr)
+                    print(preview, file=sys.stderr)
+                    print("="*60 + "\n", file=sys.stderr)
 
-            # Initialize database manager
-            if DatabaseManager:
-                self.db_manager = DatabaseManager()
+            # Publish only once fully ready
+            self.rag = rag
 
-            print("[Synthesis MCP] [OK] RAG engine initialized")
+            print("[Synthesis MCP] [OK] RAG engine initialized", file=sys.stderr)
             return True
 
         except Exception as e:
-            print(f"[Synthesis MCP] [WARNING] RAG initialization failed: {e}")
+            print(f"[Synthesis MCP] [WARNING] RAG initialization failed: {e}", file=sys.stderr)
             return False
 
     # ====================
@@ -495,7 +609,7 @@ class SynthesisMCPServer:
             scope = args.get("scope", "both")
             top_k = args.get("top_k", 5)
 
-            results = self.rag.search(query, top_k=top_k, scope=scope)
+            results = await self._run_blocking(self.rag.search, query, top_k=top_k, scope=scope)
 
             if not results:
                 return [TextContent(
@@ -537,7 +651,8 @@ class SynthesisMCPServer:
             error_sig = args["error_signature"]
 
             # Search for similar errors in private database
-            results = self.rag.search(
+            results = await self._run_blocking(
+                self.rag.search,
                 f"[CONSOLE:ERROR] {error_sig}",
                 top_k=10,
                 scope="private"
@@ -583,7 +698,7 @@ class SynthesisMCPServer:
 
             # Search for recent console errors
             query = f"[CONSOLE:ERROR] {error_type}" if error_type else "[CONSOLE:ERROR]"
-            results = self.rag.search(query, top_k=limit, scope="private")
+            results = await self._run_blocking(self.rag.search, query, top_k=limit, scope="private")
 
             if not results:
                 return [TextContent(
@@ -641,7 +756,7 @@ class SynthesisMCPServer:
             backup_path = backup_dir / backup_filename
 
             # Copy database
-            shutil.copy2(private_db_path, backup_path)
+            await self._run_blocking(shutil.copy2, private_db_path, backup_path)
 
             # Get backup size
             backup_size = backup_path.stat().st_size
@@ -686,10 +801,10 @@ class SynthesisMCPServer:
             # Create safety backup before overwriting
             if private_db_path.exists():
                 safety_backup = backup_dir / f"pre_restore_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-                shutil.copy2(private_db_path, safety_backup)
+                await self._run_blocking(shutil.copy2, private_db_path, safety_backup)
 
             # Restore from backup
-            shutil.copy2(backup_path, private_db_path)
+            await self._run_blocking(shutil.copy2, backup_path, private_db_path)
 
             response = f"# Database Restored\n\n"
             response += f"**Restored From:** {backup_filename}\n"
@@ -810,7 +925,7 @@ class SynthesisMCPServer:
             )]
 
         try:
-            audit_results = self.rag.audit_public_database()
+            audit_results = await self._run_blocking(self.rag.audit_public_database)
 
             formatted = f"# Public Database Audit\n\n"
             formatted += f"**Total Documents:** {audit_results['total_documents']}\n"
@@ -841,7 +956,7 @@ class SynthesisMCPServer:
             )]
 
         try:
-            updates = self.db_manager.check_for_updates()
+            updates = await self._run_blocking(self.db_manager.check_for_updates)
 
             formatted = f"# Database Update Check\n\n"
 
@@ -875,7 +990,7 @@ class SynthesisMCPServer:
 
         try:
             # Check if updates are available
-            updates = self.db_manager.check_for_updates()
+            updates = await self._run_blocking(self.db_manager.check_for_updates)
             if not updates.get('database') and not updates.get('model'):
                 return [TextContent(
                     type="text",
@@ -883,11 +998,14 @@ class SynthesisMCPServer:
                 )]
 
             # Perform update
-            success = self.db_manager.update_all()
+            success = await self._run_blocking(self.db_manager.update_all)
 
             if success:
-                # Reinitialize RAG
-                await self.initialize_rag()
+                # Hot-reload indexes (keeps the embedding model loaded)
+                if self.rag:
+                    await self._run_blocking(self.rag.reload, wait=True)
+                else:
+                    await self.initialize_rag()
 
                 formatted = "# Update Complete\n\n"
                 formatted += "✅ Database and model updated successfully\n"
@@ -931,6 +1049,16 @@ class SynthesisMCPServer:
         response += f"**RAG Queries:** {self.stats['rag_queries']}\n"
         response += f"**Unity Operations:** {self.stats['unity_operations']}\n"
 
+        if self.unity:
+            bridge = self.unity.stats
+            response += f"**Unity Requests:** {bridge['requests']} sent, {bridge['coalesced']} coalesced, "
+            response += f"{bridge['fresh_hits']} reused\n"
+
+        if self.scene_cache:
+            cache = self.scene_cache.stats
+            response += f"**Hierarchy Cache:** {cache['hits']} hits, {cache['unchanged']} unchanged, "
+            response += f"{cache['rebuilds']} rebuilds, {cache['invalidations']} invalidations\n"
+
         return [TextContent(type="text", text=response)]
 
     async def handle_get_capabilities(self, args: dict) -> list[TextContent]:
@@ -1012,14 +1140,18 @@ class SynthesisMCPServer:
             project_root = server_dir.parent.parent.parent
             assets_dir = project_root / "Assets"
 
-            # Find all .unity scene files
-            scenes = []
-            for root, dirs, files in os.walk(assets_dir):
-                for file in files:
-                    if file.endswith('.unity'):
-                        full_path = Path(root) / file
-                        rel_path = full_path.relative_to(project_root)
-                        scenes.append(str(rel_path))
+            # Find all .unity scene files (directory walk off the loop)
+            def find_scenes():
+                found = []
+                for root, dirs, files in os.walk(assets_dir):
+                    for file in files:
+                        if file.endswith('.unity'):
+                            full_path = Path(root) / file
+                            rel_path = full_path.relative_to(project_root)
+                            found.append(str(rel_path))
+                return found
+
+            scenes = await self._run_blocking(find_scenes)
 
             formatted = f"# Unity Scenes\n\n"
             formatted += f"Found {len(scenes)} scenes:\n\n"
@@ -1087,29 +1219,51 @@ class SynthesisMCPServer:
 
         scene_name = args.get("scene_name")
         include_inactive = args.get("include_inactive", True)
+        root = args.get("root")
+        offset = max(0, int(args.get("offset", 0)))
+        limit = max(1, int(args.get("limit", 20)))
 
         try:
-            hierarchy = await self.unity.get_scene_hierarchy(scene_name, include_inactive)
+            snapshot = await self.scene_cache.get(scene_name, refresh=args.get("refresh", False))
 
-            if not hierarchy:
+            if not snapshot:
                 return [TextContent(
                     type="text",
                     text=f"Could not retrieve scene hierarchy. Ensure Unity is running with MCPForUnity bridge started."
                 )]
 
+            if root and snapshot.get(root) is None:
+                return [TextContent(type="text", text=f"GameObject '{root}' not found in scene hierarchy.")]
+
+            filters = args.get("filter") or {}
+            nodes, total, offset, next_cursor = snapshot.page(
+                offset, limit,
+                root=root,
+                include_inactive=include_inactive,
+                filters=filters,
+                cursor=args.get("cursor")
+            )
+            base_depth = snapshot.get(root)["depth"] if root else 0
+
             response = f"# Scene Hierarchy\n\n"
             response += f"**Scene:** {scene_name or 'Active Scene'}\n"
+            if root:
+                response += f"**Subtree:** {root}\n"
             response += f"**Include Inactive:** {include_inactive}\n"
-            response += f"**Total GameObjects:** {len(hierarchy)}\n\n"
+            if filters:
+                response += "**Filter:** " + ", ".join(f"{k}={v}" for k, v in filters.items()) + "\n"
+            response += f"**{'Matching' if filters else 'Total'} GameObjects:** {total}\n"
+            if nodes:
+                response += f"**Showing:** {offset + 1}-{offset + len(nodes)}\n"
+            response += "\n"
 
-            for i, go in enumerate(hierarchy[:20], 1):
-                name = go.get('name', 'Unknown')
-                active = go.get('active', True)
-                status = "[Active]" if active else "[Inactive]"
-                response += f"{i}. {name} {status}\n"
+            for node in nodes:
+                status = "[Active]" if node["active_in_hierarchy"] else "[Inactive]"
+                indent = "  " * (node["depth"] - base_depth)
+                response += f"{indent}- {node['name']} {status} ({node['path']})\n"
 
-            if len(hierarchy) > 20:
-                response += f"\n... and {len(hierarchy) - 20} more\n"
+            if next_cursor:
+                response += f"\n... {total - offset - len(nodes)} more. Next page: cursor=\"{next_cursor}\"\n"
 
             return [TextContent(type="text", text=response)]
 
@@ -1128,9 +1282,14 @@ class SynthesisMCPServer:
             )]
 
         path = args["path"]
+        search_method = args.get("search_method", "by_name")
 
         try:
-            go_info = await self.unity.get_gameobject(path, "by_name")
+            # Lookups that can match many objects are answered from the cached hierarchy
+            if search_method in ("by_tag", "by_component"):
+                return await self._list_gameobjects(path, search_method)
+
+            go_info, also_matches = await self._lookup_gameobject(path, search_method)
 
             if not go_info:
                 return [TextContent(
@@ -1138,39 +1297,13 @@ class SynthesisMCPServer:
                     text=f"GameObject '{path}' not found. Ensure Unity is running with MCPForUnity bridge started."
                 )]
 
-            response = f"# GameObject: {go_info.get('name', path)}\n\n"
-
-            # Transform
-            transform = go_info.get('transform', {})
-            if transform:
-                pos = transform.get('position', {})
-                rot = transform.get('rotation', {})
-                scale = transform.get('scale', {})
-                response += "**Transform:**\n"
-                response += f"- Position: ({pos.get('x', 0):.2f}, {pos.get('y', 0):.2f}, {pos.get('z', 0):.2f})\n"
-                response += f"- Rotation: ({rot.get('x', 0):.2f}, {rot.get('y', 0):.2f}, {rot.get('z', 0):.2f})\n"
-                response += f"- Scale: ({scale.get('x', 1):.2f}, {scale.get('y', 1):.2f}, {scale.get('z', 1):.2f})\n\n"
-
-            # Components
-            components = go_info.get('components', [])
-            if components:
-                response += f"**Components:** ({len(components)})\n"
-                for comp in components:
-                    response += f"- {comp}\n"
-                response += "\n"
-
-            # Hierarchy
-            parent = go_info.get('parent')
-            children = go_info.get('children', [])
-            response += "**Hierarchy:**\n"
-            response += f"- Parent: {parent or 'None (root)'}\n"
-            response += f"- Children: {len(children)}\n\n"
+            response = self._format_gameobject(go_info, path)
 
-            # Other info
-            response += "**Other:**\n"
-            response += f"- Active: {go_info.get('active', True)}\n"
-            response += f"- Tag: {go_info.get('tag', 'Untagged')}\n"
-            response += f"- Layer: {go_info.get('layer', '0')}\n"
+            if also_matches:
+                response += f"\n**Other GameObjects named '{path}':** " + ", ".join(also_matches[:10])
+                if len(also_matches) > 10:
+                    response += f" (+{len(also_matches) - 10} more)"
+                response += "\n"
 
             return [TextContent(type="text", text=response)]
 
@@ -1180,6 +1313,103 @@ class SynthesisMCPServer:
                 text=f"Error getting GameObject info: {str(e)}"
             )]
 
+    async def _lookup_gameobject(self, target: str, search_method: str):
+        """
+        GameObject details, resolving names and paths through the hierarchy cache
+
+        Only a snapshot that is already fresh is used: fetching the whole
+        hierarchy to resolve one object costs more than asking Unity for it.
+
+        Returns:
+            (info or None, paths of other objects with the same name)
+        """
+        snapshot = self.scene_cache.peek()
+        if not snapshot:
+            return await self.unity.get_gameobject(target, search_method), []
+
+        by_path = snapshot.get(target)
+        if search_method == "by_path":
+            matches = [by_path] if by_path else []
+        else:
+            matches = snapshot.find(name=target) or ([by_path] if by_path else [])
+
+        if not matches:
+            return await self.unity.get_gameobject(target, search_method), []
+
+        node = matches[0]
+        also_matches = [m["path"] for m in matches[1:]]
+
+        # Hierarchy entries that already carry full details need no round trip
+        if "transform" in node and "components" in node:
+            return node, also_matches
+
+        info = await self.unity.get_gameobject(node["path"], "by_path")
+        return info or node, also_matches
+
+    async def _list_gameobjects(self, value: str, search_method: str, limit: int = 50) -> list[TextContent]:
+        """All GameObjects with a tag or component, from the hierarchy cache"""
+        snapshot = await self.scene_cache.get()
+        if not snapshot:
+            return [TextContent(
+                type="text",
+                text=f"Could not retrieve scene hierarchy. Ensure Unity is running with MCPForUnity bridge started."
+            )]
+
+        if search_method == "by_tag":
+            matches = snapshot.find(tag=value)
+            label = f"tag '{value}'"
+        else:
+            matches = snapshot.find(component=value)
+            label = f"component '{value}'"
+
+        response = f"# GameObjects with {label}\n\n"
+        response += f"**Matches:** {len(matches)}\n\n"
+        for node in matches[:limit]:
+            status = "[Active]" if node["active_in_hierarchy"] else "[Inactive]"
+            response += f"- {node['path']} {status}\n"
+        if len(matches) > limit:
+            response += f"\n... and {len(matches) - limit} more\n"
+
+        return [TextContent(type="text", text=response)]
+
+    def _format_gameobject(self, go_info: dict, path: str, heading: str = "#") -> str:
+        """Markdown summary of a GameObject (transform, components, hierarchy)"""
+        response = f"{heading} GameObject: {go_info.get('name', path)}\n\n"
+
+        # Transform
+        transform = go_info.get('transform', {})
+        if transform:
+            pos = transform.get('position', {})
+            rot = transform.get('rotation', {})
+            scale = transform.get('scale', {})
+            response += "**Transform:**\n"
+            response += f"- Position: ({pos.get('x', 0):.2f}, {pos.get('y', 0):.2f}, {pos.get('z', 0):.2f})\n"
+            response += f"- Rotation: ({rot.get('x', 0):.2f}, {rot.get('y', 0):.2f}, {rot.get('z', 0):.2f})\n"
+            response += f"- Scale: ({scale.get('x', 1):.2f}, {scale.get('y', 1):.2f}, {scale.get('z', 1):.2f})\n\n"
+
+        # Components
+        components = go_info.get('components', [])
+        if components:
+            response += f"**Components:** ({len(components)})\n"
+            for comp in components:
+                response += f"- {comp}\n"
+            response += "\n"
+
+        # Hierarchy
+        parent = go_info.get('parent')
+        children = go_info.get('children', [])
+        response += "**Hierarchy:**\n"
+        response += f"- Parent: {parent or 'None (root)'}\n"
+        response += f"- Children: {go_info.get('child_count', len(children))}\n\n"
+
+        # Other info
+        response += "**Other:**\n"
+        response += f"- Active: {go_info.get('active', True)}\n"
+        response += f"- Tag: {go_info.get('tag', 'Untagged')}\n"
+        response += f"- Layer: {go_info.get('layer', '0')}\n"
+
+        return response
+
     async def handle_create_gameobject(self, args: dict) -> list[TextContent]:
         """Create a new GameObject in Unity"""
         if not self.unity:
@@ -1207,6 +1437,7 @@ class SynthesisMCPServer:
 
             primitive_type = primitive_map.get(obj_type)
 
+            self.scene_cache.invalidate()
             result = await self.unity.create_gameobject(
                 name=name,
                 primitive_type=primitive_type,
@@ -1253,6 +1484,7 @@ class SynthesisMCPServer:
         params = args["params"]
 
         try:
+            self.scene_cache.invalidate()
             result = await self.unity.modify_gameobject(
                 target=path,
                 operation=operation,
@@ -1279,6 +1511,52 @@ class SynthesisMCPServer:
                 text=f"Error modifying GameObject: {str(e)}"
             )]
 
+    async def handle_batch_gameobjects(self, args: dict) -> list[TextContent]:
+        """Get and/or modify several GameObjects with one batch request"""
+        if not self.unity:
+            return [TextContent(
+                type="text",
+                text="Unity bridge not available. Ensure MCPForUnity is running."
+            )]
+
+        items = args.get("items") or []
+        if not items:
+            return [TextContent(type="text", text="No items given.")]
+
+        try:
+            if any(item.get("operation") for item in items):
+                self.scene_cache.invalidate()
+            results = await self.unity.batch_gameobjects([
+                {"target": item["path"], "operation": item.get("operation"), "params": item.get("params")}
+                for item in items
+            ])
+
+            failed = sum(1 for result in results if not result)
+            response = f"# Batch GameObjects\n\n"
+            response += f"**Items:** {len(items)} ({len(items) - failed} succeeded, {failed} failed)\n\n"
+
+            for i, (item, result) in enumerate(zip(items, results), 1):
+                path = item["path"]
+                operation = item.get("operation")
+                if operation and operation not in MODIFY_OPERATIONS:
+                    response += f"## {i}. {path}\nUnknown operation: {operation}\n\n"
+                elif not result:
+                    action = operation or "get"
+                    response += f"## {i}. {path}\n{action} failed (not found or Unity not responding)\n\n"
+                elif operation:
+                    response += f"## {i}. {path}\n**Operation:** {operation}\n"
+                    response += f"{result.get('message', 'GameObject modified successfully')}\n\n"
+                else:
+                    response += self._format_gameobject(result, path, heading=f"## {i}.") + "\n"
+
+            return [TextContent(type="text", text=response)]
+
+        except Exception as e:
+            return [TextContent(
+                type="text",
+                text=f"Error in batch GameObject operation: {str(e)}"
+            )]
+
     async def handle_execute_csharp(self, args: dict) -> list[TextContent]:
         """Execute C# code in Unity Editor"""
         if not self.unity:
@@ -1291,6 +1569,7 @@ class SynthesisMCPServer:
         context = args.get("context")
 
         try:
+            self.scene_cache.invalidate()
             result = await self.unity.execute_csharp(code)
 
             if not result:
@@ -1336,16 +1615,28 @@ class SynthesisMCPServer:
         print("  • Unity Editor operations (requires Unity + MCPForUnity)")
         print()
 
-        # Initialize RAG (includes onboarding with session preview)
-        await self.initialize_rag()
-
         # Run stdio server
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        real_stdout = sys.stdout
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                # The transport holds the real stdout now; stray prints from here on
+                # (including worker threads) must not corrupt its JSON-RPC frames
+                sys.stdout = sys.stderr
+
+                # Initialize RAG in the background (includes onboarding with session preview);
+                # tools that don't need RAG are served immediately
+                if SynthesisRAG is not None:
+                    self.start_rag_initialization()
+
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            sys.stdout = real_stdout
+            if self.unity:
+                await self.unity.close()
 
 
 async def main():
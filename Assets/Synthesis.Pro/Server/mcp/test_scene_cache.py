@@ -0,0 +1,160 @@
+"""
+Tests for the scene hierarchy cache (snapshots, filters, pagination cursors)
+Runs without Unity (a stub bridge serves the hierarchy)
+
+    python -m pytest test_scene_cache.py
+"""
+
+import asyncio
+import base64
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scene_cache import SceneHierarchyCache, SceneSnapshot, decode_cursor, encode_cursor
+
+
+def _scene(extra_root: bool = False):
+    """Nested hierarchy: 3 roots with children (optionally a 4th root at the front)"""
+    items = [
+        {"name": "Main Camera", "tag": "MainCamera", "components": ["Transform", "UnityEngine.Camera"]},
+        {"name": "Player", "tag": "Player", "components": ["Transform", "Rigidbody"], "children": [
+            {"name": "Model", "components": ["Transform", "MeshRenderer"]},
+            {"name": "Weapon", "active": False, "components": ["Transform"], "children": [
+                {"name": "Muzzle", "components": ["Transform", "ParticleSystem"]},
+            ]},
+        ]},
+        {"name": "Enemies", "components": ["Transform"], "children": [
+            {"name": f"Enemy {i}", "tag": "Enemy", "components": ["Transform", "Rigidbody"]} for i in range(5)
+        ]},
+    ]
+    if extra_root:
+        items.insert(0, {"name": "Lighting", "components": ["Transform", "Light"]})
+    return items
+
+
+def _page_all(snapshot, limit, **kwargs):
+    paths, cursor = [], None
+    while True:
+        nodes, total, _, cursor = snapshot.page(limit=limit, cursor=cursor, **kwargs)
+        paths += [node["path"] for node in nodes]
+        if not cursor:
+            return paths, total
+
+
+def test_flatten_depth_first():
+    snapshot = SceneSnapshot("", _scene(), "v1")
+    paths = [node["path"] for node in snapshot.nodes]
+    assert paths[:6] == ["Main Camera", "Player", "Player/Model", "Player/Weapon",
+                         "Player/Weapon/Muzzle", "Enemies"]
+    assert snapshot.get("Player/Weapon")["child_count"] == 1
+    assert snapshot.get("Player/Weapon/Muzzle")["active_in_hierarchy"] is False
+    assert snapshot.subtree_range("Player") == (1, 5)
+
+
+def test_cursor_pages_cover_everything_once():
+    snapshot = SceneSnapshot("", _scene(), "v1")
+    paths, total = _page_all(snapshot, limit=3)
+    assert total == len(snapshot.nodes) == 11
+    assert paths == [node["path"] for node in snapshot.nodes]
+
+
+def test_filters_and_root():
+    snapshot = SceneSnapshot("", _scene(), "v1")
+    paths, total = _page_all(snapshot, limit=2, filters={"component": "Rigidbody"})
+    assert total == 6 and paths[0] == "Player"
+    assert _page_all(snapshot, limit=10, filters={"component": "Camera"})[0] == ["Main Camera"]
+    assert _page_all(snapshot, limit=10, root="Player", include_inactive=False)[0] == ["Player", "Player/Model"]
+    assert _page_all(snapshot, limit=10, root="Enemies", filters={"min_depth": 1, "name": "enemy 3"})[0] == \
+        ["Enemies/Enemy 3"]
+    assert snapshot.page(root="Missing") == ([], 0, 0, None)
+
+
+def test_cursor_survives_hierarchy_change():
+    """A cursor from an older snapshot resumes after the last object it returned"""
+    old = SceneSnapshot("", _scene(), "v1")
+    nodes, _, _, cursor = old.page(limit=4)
+    assert [node["path"] for node in nodes][-1] == "Player/Weapon"
+    assert decode_cursor(cursor)["v"] == "v1"
+
+    new = SceneSnapshot("", _scene(extra_root=True), "v2")  # New object before the cursor
+    nodes, _, offset, _ = new.page(limit=2, cursor=cursor)
+    assert [node["path"] for node in nodes] == ["Player/Weapon/Muzzle", "Enemies"]
+    assert offset == 5
+
+    # Malformed cursor: falls back to the offset
+    nodes, _, offset, _ = new.page(offset=0, limit=1, cursor="not-a-cursor")
+    assert offset == 0 and nodes[0]["path"] == "Lighting"
+
+
+def test_cursor_is_bound_to_its_query():
+    """A cursor used with another root, filter or scene is rejected, not misapplied"""
+    snapshot = SceneSnapshot("", _scene(), "v1")
+    _, _, _, cursor = snapshot.page(limit=2, filters={"component": "Rigidbody"})
+    assert snapshot.page(limit=2, cursor=cursor, filters={"component": "Rigidbody"})[2] == 2
+
+    for query in ({"filters": {"component": "Camera"}}, {"root": "Enemies"}, {"include_inactive": False},
+                  {"filters": {"component": "Rigidbody"}, "root": "Player"}):
+        try:
+            snapshot.page(limit=2, cursor=cursor, **query)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"cursor accepted for {query}")
+
+    other_scene = SceneSnapshot("Level2", _scene(), "v1")
+    try:
+        other_scene.page(limit=2, cursor=cursor, filters={"component": "Rigidbody"})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("cursor accepted for another scene")
+
+
+def test_decode_cursor_rejects_bad_offsets():
+    def raw(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).decode("ascii")
+
+    assert decode_cursor(encode_cursor("v1", 3, "Player", "q"))["o"] == 3
+    for offset in (-1, "3", 2.5, True, None):
+        assert decode_cursor(raw({"v": "v1", "o": offset, "p": "Player"})) is None
+    assert decode_cursor(raw([1, 2])) is None
+
+
+class StubBridge:
+    def __init__(self):
+        self.calls = []
+        self.items = _scene()
+
+    async def get_editor_state(self):
+        self.calls.append("state")
+        return {"version": "6000.0.1f1", "isPlaying": False}  # Generic version: not a hierarchy version
+
+    async def get_scene_hierarchy(self, scene_name=None, include_inactive=True):
+        self.calls.append("hierarchy")
+        return {"hierarchy": self.items}
+
+
+def test_cache_refresh_and_peek():
+    async def run():
+        bridge = StubBridge()
+        cache = SceneHierarchyCache(bridge, max_age=60)
+        assert cache.peek() is None
+
+        snapshot = await cache.get()
+        assert cache.peek() is snapshot
+        assert await cache.get() is snapshot and bridge.calls.count("hierarchy") == 1
+
+        # Unchanged content keeps the snapshot (and its indexes)
+        assert await cache.get(refresh=True) is snapshot
+        assert cache.stats["unchanged"] == 1
+
+        bridge.items = _scene(extra_root=True)
+        cache.invalidate()
+        assert cache.peek() is None
+        changed = await cache.get()
+        assert changed is not snapshot and cache.last_diff == {"added": 1, "removed": 0}
+
+    asyncio.run(run())
@@ -0,0 +1,252 @@
+"""
+Tests for UnityBridge's request path (pooled session, batching, read coalescing)
+Runs without Unity: an in-process aiohttp server plays MCPForUnity's endpoint
+
+    python -m pytest test_unity_bridge_requests.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from unity_bridge import UnityBridge
+
+
+class FakeUnity:
+    """
+    JSON-RPC endpoint that answers resources/read and tools/call
+
+    mode: "batch" (answers arrays), "no_batch" (-32600 for arrays),
+    "single" (one object for an array), "html" (non-JSON page for arrays),
+    "busy" (HTTP 503 for arrays)
+    """
+
+    def __init__(self, mode: str = "batch"):
+        self.mode = mode
+        self.posts = []
+        self.peers = set()
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.reads = 0
+        self.url = None
+        self._runner = None
+
+    def _answer(self, request):
+        if request["method"] == "resources/read":
+            self.reads += 1
+            uri = request["params"]["uri"]
+            if uri.endswith("/Missing"):
+                return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32000, "message": "Not found"}}
+            return {"jsonrpc": "2.0", "id": request["id"], "result": {"uri": uri, "read": self.reads}}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": {"tool": request["params"]["name"]}}
+
+    async def _handle(self, http_request):
+        self.peers.add(http_request.transport.get_extra_info("peername"))
+        payload = await http_request.json()
+        self.posts.append(payload)
+        await self.gate.wait()
+
+        if not isinstance(payload, list):
+            return web.json_response(self._answer(payload))
+        if self.mode == "no_batch":
+            return web.json_response({"jsonrpc": "2.0", "id": None,
+                                      "error": {"code": -32600, "message": "Invalid Request"}})
+        if self.mode == "single":
+            return web.json_response(self._answer(payload[0]))
+        if self.mode == "html":
+            return web.Response(text="<html>MCP for Unity</html>", content_type="text/html")
+        if self.mode == "busy":
+            return web.Response(status=503, text="Domain reload in progress")
+        # Answer out of order: the bridge must match by id
+        return web.json_response([self._answer(item) for item in reversed(payload)])
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/mcp", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    @property
+    def batches(self):
+        return [post for post in self.posts if isinstance(post, list)]
+
+    @property
+    def singles(self):
+        return [post for post in self.posts if not isinstance(post, list)]
+
+
+def _run(test, mode: str = "batch", **bridge_kwargs):
+    """Run test(unity, bridge) against a fresh endpoint"""
+    async def run():
+        unity = await FakeUnity(mode).start()
+        bridge = UnityBridge(unity.url, **bridge_kwargs)
+        try:
+            await test(unity, bridge)
+        finally:
+            await bridge.close()
+            await unity.stop()
+
+    asyncio.run(run())
+
+
+def test_calls_reuse_pooled_connection():
+    async def test(unity, bridge):
+        for _ in range(5):
+            assert (await bridge.get_editor_state())["uri"] == "unity://editor/state"
+        assert len(unity.peers) == 1
+        assert len({post["id"] for post in unity.posts}) == 5
+
+        await bridge.close()  # A later call opens a new session
+        assert await bridge.get_project_info() is not None
+        assert len(unity.peers) == 2
+
+    _run(test)
+
+
+def test_errors_and_timeouts_return_none():
+    async def test(unity, bridge):
+        assert await bridge.get_gameobject("Missing") is None
+
+        unity.gate.clear()
+        bridge.set_timeout("unity://editor/state", 0.1)
+        assert await bridge.get_editor_state() is None
+        unity.gate.set()
+
+    _run(test)
+
+
+def test_batch_results_matched_by_id():
+    """One POST for the whole batch; out-of-order replies land in call order"""
+    async def test(unity, bridge):
+        results = await bridge.get_gameobjects(["Player", "Missing", "Camera"])
+        assert len(unity.batches) == 1 and len(unity.batches[0]) == 3
+        assert [r and r["uri"].rsplit("/", 1)[1] for r in results] == ["Player", None, "Camera"]
+
+        results = await bridge.batch_gameobjects([
+            {"target": "Player"},
+            {"target": "Player", "operation": "explode"},
+            {"target": "Player", "operation": "set_active", "params": {"active": False}},
+        ])
+        assert results[1] is None and results[2] == {"tool": "unity.set_gameobject_active"}
+        assert len(unity.batches[1]) == 2  # The unknown operation is never sent
+
+    _run(test)
+
+
+def test_endpoint_without_batches_falls_back_for_good():
+    """A -32600 reply to a batch switches to parallel requests for all later batches"""
+    async def test(unity, bridge):
+        results = await bridge.get_gameobjects(["Player", "Camera"])
+        assert [r["uri"] for r in results] == ["unity://scene/gameobject/Player", "unity://scene/gameobject/Camera"]
+        assert len(unity.batches) == 1 and len(unity.singles) == 2
+        assert bridge._batch_supported is False
+
+        await bridge.get_gameobjects(["Enemy", "Light"])
+        assert len(unity.batches) == 1 and len(unity.singles) == 4
+
+    _run(test, mode="no_batch")
+
+
+def test_single_object_reply_disables_batches():
+    async def test(unity, bridge):
+        results = await bridge.get_gameobjects(["Player", "Camera"])
+        assert all(results) and bridge._batch_supported is False
+
+    _run(test, mode="single")
+
+
+def test_transient_batch_failures_keep_batching():
+    """A 503 or a non-JSON page falls back for this call only"""
+    for mode in ("busy", "html"):
+        async def test(unity, bridge):
+            results = await bridge.get_gameobjects(["Player", "Camera"])
+            assert all(results) and len(unity.singles) == 2
+            assert bridge._batch_supported is None
+
+            unity.mode = "batch"
+            await bridge.get_gameobjects(["Enemy", "Light"])
+            assert len(unity.batches) == 2 and bridge._batch_supported is True
+
+        _run(test, mode=mode)
+
+
+def test_concurrent_identical_reads_share_one_request():
+    async def test(unity, bridge):
+        unity.gate.clear()
+        calls = [asyncio.ensure_future(bridge.get_editor_state()) for _ in range(5)]
+        calls.append(asyncio.ensure_future(bridge.get_gameobject("Player")))
+        await asyncio.sleep(0.2)
+        unity.gate.set()
+        results = await asyncio.gather(*calls)
+
+        assert len(unity.posts) == 2
+        assert all(result is results[0] for result in results[:5])
+        assert bridge.stats["coalesced"] == 4
+
+        # Nothing is reused once the request finished (read_ttl=0)
+        await bridge.get_editor_state()
+        assert len(unity.posts) == 3
+
+    _run(test)
+
+
+def test_cancelled_caller_does_not_cancel_shared_read():
+    async def test(unity, bridge):
+        unity.gate.clear()
+        first = asyncio.ensure_future(bridge.get_editor_state())
+        second = asyncio.ensure_future(bridge.get_editor_state())
+        await asyncio.sleep(0.1)
+        first.cancel()
+        unity.gate.set()
+        assert (await second)["read"] == 1
+        assert len(unity.posts) == 1
+
+    _run(test)
+
+
+def test_writes_clear_recent_reads():
+    """Within read_ttl reads are reused, until a write is sent"""
+    async def test(unity, bridge):
+        first = await bridge.get_editor_state()
+        assert await bridge.get_editor_state() is first
+        assert bridge.stats["fresh_hits"] == 1
+
+        await bridge.modify_gameobject("Player", "set_active", {"active": False})
+        assert (await bridge.get_editor_state())["read"] == 2
+        assert len(unity.posts) == 3
+
+    _run(test, read_ttl=60)
+
+
+def test_read_overtaken_by_write_is_not_reused():
+    """A read still in flight when a write starts is neither shared nor cached"""
+    async def test(unity, bridge):
+        unity.gate.clear()
+        stale = asyncio.ensure_future(bridge.get_editor_state())
+        await asyncio.sleep(0.1)
+        write = asyncio.ensure_future(bridge.execute_csharp("Debug.Log(1);"))
+        fresh = asyncio.ensure_future(bridge.get_editor_state())
+        await asyncio.sleep(0.1)
+        unity.gate.set()
+        await asyncio.gather(stale, write, fresh)
+
+        assert len(unity.posts) == 3
+        assert await bridge.get_editor_state() is fresh.result()  # Only the post-write read is cached
+        assert len(unity.posts) == 3
+
+    _run(test, read_ttl=60)
@@ -3,29 +3,179 @@ Unity Bridge for Synthesis.Pro MCP Server
 Communicates with MCPForUnity's HTTP endpoint to query and manipulate Unity Editor
 """
 
+import os
 import json
+import time
 import asyncio
-from typing import Optional, Dict, Any, List
+import itertools
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Seconds to wait for a response, keyed by tool name or resource URI.
+# Anything not listed uses DEFAULT_TIMEOUT.
+DEFAULT_TIMEOUT = 10.0
+METHOD_TIMEOUTS = {
+    "tools/list": 5.0,
+    "unity://editor/state": 5.0,
+    "unity://scene/hierarchy": 30.0,
+    "unity.execute_csharp": 60.0,
+    "unity.run_tests": 600.0,
+}
+
+# modify_gameobject operation -> MCPForUnity tool name
+MODIFY_OPERATIONS = {
+    "set_position": "unity.set_transform_position",
+    "set_rotation": "unity.set_transform_rotation",
+    "set_scale": "unity.set_transform_scale",
+    "set_active": "unity.set_gameobject_active",
+    "add_component": "unity.add_component",
+    "set_property": "unity.set_property"
+}
+
+# Methods that only read Editor state. Identical concurrent reads share one
+# request; everything else (tools/call: create, modify, execute_csharp, ...)
+# is always sent and clears recently cached reads.
+READ_METHODS = {"resources/read", "tools/list"}
+
+# Seconds a read result may be reused by later callers (0 = only share in-flight requests)
+READ_TTL = float(os.environ.get("SYNTHESIS_UNITY_READ_TTL", "0"))
+
+# Connections kept open to MCPForUnity (all requests go to one host)
+MAX_CONNECTIONS = 8
+KEEPALIVE_TIMEOUT = 60.0
+
 
 class UnityBridge:
     """Bridge to Unity Editor via MCPForUnity HTTP endpoint"""
 
-    def __init__(self, base_url: str = "http://localhost:6400"):
+    def __init__(self, base_url: str = "http://localhost:6400",
+                 timeouts: Optional[Dict[str, float]] = None,
+                 default_timeout: float = DEFAULT_TIMEOUT,
+                 read_ttl: float = READ_TTL):
         """
         Initialize Unity bridge
 
         Args:
             base_url: MCPForUnity HTTP endpoint base URL
+            timeouts: Per-method timeout overrides (tool name or resource URI -> seconds)
+            default_timeout: Timeout for methods without an entry
+            read_ttl: Seconds a read result is reused (0 = only coalesce concurrent reads)
         """
         self.base_url = base_url.rstrip('/')
         self.mcp_url = f"{self.base_url}/mcp"
+        self.timeouts = {**METHOD_TIMEOUTS, **(timeouts or {})}
+        self.default_timeout = default_timeout
+
+        # One keep-alive session for all calls (created on first use, since
+        # aiohttp sessions belong to the event loop that created them)
+        self._session = None
+        self._session_loop = None
+        self._ids = itertools.count(1)
+
+        # None until the first batch tells us whether MCPForUnity accepts them
+        self._batch_supported: Optional[bool] = None
+
+        # Single-flight reads: request key -> in-flight task / (expiry, result)
+        self.read_ttl = read_ttl
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._recent: Dict[str, Tuple[float, Any]] = {}
+        self._writes = 0
+        self.stats = {'requests': 0, 'coalesced': 0, 'fresh_hits': 0}
+
+    def set_timeout(self, key: str, seconds: float):
+        """Set the timeout for a tool name (e.g. unity.run_tests) or resource URI"""
+        self.timeouts[key] = seconds
+
+    def _timeout_for(self, method: str, params: Dict[str, Any]) -> float:
+        """Timeout for a call: tool name / resource URI first, then JSON-RPC method"""
+        key = params.get("name") or params.get("uri") or method
+        if key in self.timeouts:
+            return self.timeouts[key]
+        if key.startswith("unity://scene/gameobject/"):
+            return self.timeouts.get("unity://scene/gameobject", self.default_timeout)
+        return self.timeouts.get(method, self.default_timeout)
+
+    def _get_session(self):
+        """Shared ClientSession for the running loop (recreated if the loop changed)"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                json_serialize=json.dumps
+            )
+            self._session_loop = loop
+            # In-flight tasks belong to the old loop
+            self._inflight.clear()
+        return self._session
+
+    async def close(self):
+        """Close the pooled HTTP session (a later call opens a new one)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    def _make_request(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """JSON-RPC request object with a fresh id"""
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+            "params": params or {}
+        }
+
+    async def _post(self, payload: Any, timeout: float):
+        """
+        POST a JSON-RPC request (or batch array).
+
+        Returns:
+            (HTTP status, decoded body or response text)
+
+        Raises:
+            asyncio.TimeoutError, aiohttp.ClientError
+        """
+        session = self._get_session()
+        async with session.post(
+            self.mcp_url,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if response.status != 200:
+                return response.status, await response.text()
+            return response.status, await response.json(content_type=None)
+
+    def _unwrap(self, request: Dict[str, Any], data: Any) -> Any:
+        """Result of one JSON-RPC response, or None (logged) on error"""
+        if not isinstance(data, dict):
+            print(f"[Unity Bridge] Unexpected response to {request['method']}: {data!r}")
+            return None
+        if data.get("id") not in (request["id"], None):
+            print(f"[Unity Bridge] Response id {data.get('id')} does not match request {request['id']}")
+            return None
+        if data.get("error"):
+            error = data["error"]
+            message = error.get("message", error) if isinstance(error, dict) else error
+            print(f"[Unity Bridge] {request['method']} failed: {message}")
+            return None
+        return data.get("result")
 
     async def _call_mcp(self, method: str, params: Dict[str, Any] = None) -> Any:
         """
         Call MCPForUnity JSON-RPC endpoint
 
+        Identical concurrent reads share one request (and, within read_ttl,
+        its result). Writes are always sent and drop cached reads.
+
         Args:
             method: MCP method name
             params: Method parameters
@@ -33,39 +183,159 @@ class UnityBridge:
         Returns:
             Method result or None if failed
         """
-        try:
-            import aiohttp
-
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": method,
-                "params": params or {}
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.mcp_url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("result")
-                    else:
-                        print(f"[Unity Bridge] HTTP {response.status}: {await response.text()}")
-                        return None
-
-        except ImportError:
+        if not AIOHTTP_AVAILABLE:
             print("[Unity Bridge] aiohttp not installed. Install with: pip install aiohttp")
             return None
+
+        if method not in READ_METHODS:
+            self._write_started()
+            return await self._send(method, params)
+
+        key = json.dumps([method, params or {}], sort_keys=True, default=str)
+
+        recent = self._recent.get(key)
+        if recent and recent[0] > time.monotonic():
+            self.stats['fresh_hits'] += 1
+            return recent[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, params))
+            self._inflight[key] = task
+            writes = self._writes
+            task.add_done_callback(lambda t, key=key: self._read_done(key, t, writes))
+        else:
+            self.stats['coalesced'] += 1
+
+        # Shielded: one caller giving up must not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _write_started(self):
+        """Reads issued from now on must not reuse results that predate this write"""
+        self._writes += 1
+        self._inflight.clear()
+        self._recent.clear()
+
+    def _read_done(self, key: str, task: asyncio.Task, writes: int):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        # Only cache results no write could have overtaken
+        if self.read_ttl <= 0 or writes != self._writes or task.cancelled() \
+                or task.exception() is not None or task.result() is None:
+            return
+
+        now = time.monotonic()
+        if len(self._recent) >= 256:
+            self._recent = {k: v for k, v in self._recent.items() if v[0] > now}
+        self._recent[key] = (now + self.read_ttl, task.result())
+
+    async def _send(self, method: str, params: Optional[Dict[str, Any]]) -> Any:
+        """Send one request (no coalescing)"""
+        self.stats['requests'] += 1
+        request = self._make_request(method, params)
+        timeout = self._timeout_for(method, request["params"])
+
+        try:
+            status, data = await self._post(request, timeout)
+            if status != 200:
+                print(f"[Unity Bridge] HTTP {status}: {data}")
+                return None
+            return self._unwrap(request, data)
+
         except asyncio.TimeoutError:
-            print("[Unity Bridge] Request timed out. Is Unity Editor running with MCPForUnity bridge started?")
+            print(f"[Unity Bridge] Request timed out after {timeout:.0f}s. Is Unity Editor running with MCPForUnity bridge started?")
             return None
         except Exception as e:
             print(f"[Unity Bridge] Error calling {method}: {e}")
             return None
 
+    async def call_batch(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """
+        Send several calls as one JSON-RPC 2.0 batch request
+
+        Responses are matched back to calls by id. If the batch fails, the
+        calls are sent as parallel requests over the pooled connections
+        instead. Batching is only given up for good when the endpoint
+        clearly rejects batches (a JSON-RPC -32600 "Invalid Request" error,
+        or a single object in reply to the array); other failures, such as
+        a 503 during a domain reload, are retried as a batch next time.
+
+        Args:
+            calls: (method, params) pairs
+
+        Returns:
+            One result per call, in order (None where a call failed)
+        """
+        if not calls:
+            return []
+        if not AIOHTTP_AVAILABLE:
+            print("[Unity Bridge] aiohttp not installed. Install with: pip install aiohttp")
+            return [None] * len(calls)
+        if len(calls) == 1 or self._batch_supported is False:
+            return await self._call_parallel(calls)
+
+        if any(method not in READ_METHODS for method, _ in calls):
+            self._write_started()
+
+        self.stats['requests'] += 1
+        requests = [self._make_request(method, params) for method, params in calls]
+        timeout = max(self._timeout_for(r["method"], r["params"]) for r in requests)
+
+        try:
+            status, data = await self._post(requests, timeout)
+        except ValueError:
+            print("[Unity Bridge] Batch response was not JSON - using parallel requests")
+            return await self._call_parallel(calls)
+        except asyncio.TimeoutError:
+            print(f"[Unity Bridge] Batch of {len(calls)} timed out after {timeout:.0f}s. Is Unity Editor running with MCPForUnity bridge started?")
+            return [None] * len(calls)
+        except Exception as e:
+            print(f"[Unity Bridge] Error sending batch: {e}")
+            return [None] * len(calls)
+
+        if status != 200 or not isinstance(data, list):
+            if self._rejects_batch(status, data):
+                print("[Unity Bridge] Endpoint does not support batch requests - using parallel requests")
+                self._batch_supported = False
+            else:
+                print(f"[Unity Bridge] Batch failed (HTTP {status}) - using parallel requests")
+            return await self._call_parallel(calls)
+
+        self._batch_supported = True
+        by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+
+        results = []
+        for request in requests:
+            response = by_id.get(request["id"])
+            if response is None:
+                print(f"[Unity Bridge] No response for batched {request['method']} (id {request['id']})")
+                results.append(None)
+            else:
+                results.append(self._unwrap(request, response))
+        return results
+
+    @staticmethod
+    def _rejects_batch(status: int, data: Any) -> bool:
+        """True if a failed batch response says batches are not supported at all"""
+        if status != 200 and isinstance(data, str):
+            # Error bodies come back as text; a JSON-RPC error may still be inside
+            try:
+                data = json.loads(data)
+            except ValueError:
+                return False
+        if not isinstance(data, dict):
+            return False
+        error = data.get("error")
+        if isinstance(error, dict) and error.get("code") == -32600:
+            return True
+        # A single response object to an array request (HTTP 200): no batch support
+        return status == 200
+
+    async def _call_parallel(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """Send calls as concurrent requests (pipelined over the connection pool)"""
+        return list(await asyncio.gather(*(self._call_mcp(method, params) for method, params in calls)))
+
     async def is_connected(self) -> bool:
         """Check if Unity bridge is accessible"""
         try:
@@ -127,11 +397,14 @@ class UnityBridge:
         Returns:
             GameObject info including transform, components, children
         """
-        result = await self._call_mcp("resources/read", {
+        return await self._call_mcp(*self._gameobject_call(target, search_method))
+
+    def _gameobject_call(self, target: str, search_method: str = "by_name") -> Tuple[str, Dict[str, Any]]:
+        """(method, params) for get_gameobject"""
+        return "resources/read", {
             "uri": f"unity://scene/gameobject/{target}",
             "searchMethod": search_method
-        })
-        return result
+        }
 
     async def execute_csharp(self, code: str) -> Optional[Dict[str, Any]]:
         """
@@ -214,32 +487,82 @@ class UnityBridge:
         Returns:
             Operation result
         """
+        call = self._modify_call(target, operation, params, search_method)
+        if call is None:
+            print(f"[Unity Bridge] Unknown operation: {operation}")
+            return None
+
+        return await self._call_mcp(*call)
+
+    def _modify_call(self, target: str, operation: str, params: Dict[str, Any],
+                     search_method: str = "by_name") -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(method, params) for modify_gameobject, or None for an unknown operation"""
         tool_params = {
             "target": target,
             "searchMethod": search_method,
             **params
         }
 
-        # Map operation to MCPForUnity tool name
-        tool_name_map = {
-            "set_position": "unity.set_transform_position",
-            "set_rotation": "unity.set_transform_rotation",
-            "set_scale": "unity.set_transform_scale",
-            "set_active": "unity.set_gameobject_active",
-            "add_component": "unity.add_component",
-            "set_property": "unity.set_property"
-        }
-
-        tool_name = tool_name_map.get(operation)
+        tool_name = MODIFY_OPERATIONS.get(operation)
         if not tool_name:
-            print(f"[Unity Bridge] Unknown operation: {operation}")
             return None
 
-        result = await self._call_mcp("tools/call", {
+        return "tools/call", {
             "name": tool_name,
             "arguments": tool_params
-        })
-        return result
+        }
+
+    async def get_gameobjects(self, targets: List[str], search_method: str = "by_name") -> List[Optional[Dict[str, Any]]]:
+        """
+        Get several GameObjects in one batch request
+
+        Args:
+            targets: GameObject identifiers
+            search_method: Search method for all targets
+
+        Returns:
+            GameObject info per target, in order (None if not found)
+        """
+        return await self.call_batch([self._gameobject_call(t, search_method) for t in targets])
+
+    async def modify_gameobjects(self, modifications: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Apply several modifications in one batch request
+
+        Args:
+            modifications: Dicts with target, operation, params and optional search_method
+                           (same meaning as modify_gameobject's arguments)
+
+        Returns:
+            Operation result per modification, in order (None if it failed)
+        """
+        return await self.batch_gameobjects(modifications)
+
+    async def batch_gameobjects(self, items: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Mixed GameObject lookups and modifications in one batch request
+
+        Args:
+            items: Dicts with target and optional search_method; items that also
+                   have an operation (and params) are modifications, the rest lookups
+
+        Returns:
+            Result per item, in order (None if it failed or the operation is unknown)
+        """
+        calls = []
+        for item in items:
+            search_method = item.get("search_method", "by_name")
+            if item.get("operation"):
+                call = self._modify_call(item["target"], item["operation"], item.get("params") or {}, search_method)
+                if call is None:
+                    print(f"[Unity Bridge] Unknown operation: {item['operation']}")
+            else:
+                call = self._gameobject_call(item["target"], search_method)
+            calls.append(call)
+
+        valid = [call for call in calls if call is not None]
+        results = iter(await self.call_batch(valid))
+        return [next(results) if call is not None else None for call in calls]
 
     async def get_project_info(self) -> Optional[Dict[str, Any]]:
         """
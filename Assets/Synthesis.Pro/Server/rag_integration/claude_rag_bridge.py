@@ -14,7 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))  # Server/ directory
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "RAG" / "core"))  # RAG/core/ directory
 
-from rag_engine_lite import SynthesisRAG
+from rag_client import connect_rag
 from rag_integration.rag_onboarding import RAGOnboardingSystem
 
 
@@ -31,7 +31,7 @@ def generate_context_for_claude():
         server_dir = Path(__file__).parent.parent  # Server/ directory
         db_dir = server_dir / "database"
 
-        rag = SynthesisRAG(
+        rag = connect_rag(
             database=str(db_dir / "synthesis_knowledge.db"),
             private_database=str(db_dir / "synthesis_private.db")
         )
@@ -1,21 +1,34 @@
 """
 RAG Bridge - Python side of Unity-Python RAG integration
 Receives commands from Unity via JSON files and executes RAG operations
+
+Loading the embedding model takes seconds, so commands are served by a
+long-lived bridge daemon on a localhost port. Running this script with
+an input file is a thin client: it forwards the command to the daemon
+(starting it on first use) and writes the output file as before.
+
+Usage:
+    rag_bridge.py <input_json_file>   Execute one command (file contract)
+    rag_bridge.py --daemon            Run the bridge daemon in the foreground
+    rag_bridge.py --stop              Stop a running daemon
 """
+import os
 import sys
 import json
+import threading
 from pathlib import Path
 
-# Add Server directory (current location) and RAG directory to path for imports
-server_dir = Path(__file__).parent
-rag_dir = server_dir.parent / "RAG"
+# Add Server directory, context systems and RAG engine to path for imports
+server_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(server_dir))
-sys.path.insert(0, str(rag_dir))
+sys.path.insert(0, str(server_dir / "context_systems"))
+sys.path.insert(0, str(server_dir.parent / "RAG" / "core"))
 
-from rag_engine_lite import SynthesisRAG  # NEW: Using lightweight RAG
-from context_preview import ContextPreviewService
-from context_detector import ContextDetector
-from curiosity_trigger import CuriosityTrigger
+from core.local_rpc import LocalRPCServer, LocalRPCClient, LocalRPCError, ensure_server
+
+# Daemon settings (port 8765 = WebSocket, 8766 = metrics)
+BRIDGE_PORT = int(os.environ.get("SYNTHESIS_RAG_BRIDGE_PORT", "8767"))
+BRIDGE_IDLE_TIMEOUT = float(os.environ.get("SYNTHESIS_RAG_BRIDGE_IDLE_TIMEOUT", "1800"))
 
 
 class RAGBridgeServer:
@@ -41,10 +54,16 @@ class RAGBridgeServer:
     def initialize(self):
         """Initialize RAG engines and services"""
         try:
+            # Heavy imports live here so the thin client never loads the model stack
+            from rag_client import connect_rag
+            from context_preview import ContextPreviewService
+            from context_detector import ContextDetector
+            from curiosity_trigger import CuriosityTrigger
+
             # Initialize single RAG instance with both databases
-            # SynthesisRAG handles both public and private databases internally
+            # Served by the shared RAG host, which handles both databases
             if self.public_db.exists() or self.private_db.exists():
-                self.rag = SynthesisRAG(
+                self.rag = connect_rag(
                     database=str(self.public_db),
                     private_database=str(self.private_db)
                 )
@@ -166,12 +185,73 @@ class RAGBridgeServer:
             return {"success": False, "message": f"Unknown command: {command}"}
 
 
+def serve(port: int = BRIDGE_PORT, idle_timeout: float = BRIDGE_IDLE_TIMEOUT):
+    """
+    Run the bridge daemon: load the model once, then execute commands
+    until idle for idle_timeout seconds.
+    """
+    bridge = RAGBridgeServer()
+    lock = threading.Lock()  # RAG engine and session state are not thread-safe
+
+    def initialize():
+        if not bridge.initialize():
+            raise RuntimeError("Failed to initialize RAG bridge")
+
+    def handle(command_data: dict) -> dict:
+        with lock:
+            # Databases created after startup are picked up on next use
+            if bridge.rag is None:
+                bridge.initialize()
+            return bridge.execute_command(command_data)
+
+    server = LocalRPCServer(handle, port, name="rag_bridge", idle_timeout=idle_timeout)
+    print(f"[RAG Bridge] Daemon listening on 127.0.0.1:{port}")
+    server.serve_forever(initializer=initialize)
+
+
+def run_command(command_data: dict) -> dict:
+    """
+    Execute a command through the daemon (starting it if needed).
+
+    Falls back to a one-shot in-process bridge if the daemon cannot start.
+    """
+    try:
+        client = ensure_server(BRIDGE_PORT, [sys.executable, str(Path(__file__).resolve()), "--daemon"])
+        try:
+            return client.call(command_data)
+        finally:
+            client.close()
+    except LocalRPCError as e:
+        print(f"[RAG Bridge] Daemon unavailable ({e}) - running in-process")
+
+    bridge = RAGBridgeServer()
+    if not bridge.initialize():
+        return {"success": False, "message": "Failed to initialize RAG bridge"}
+    return bridge.execute_command(command_data)
+
+
 def main():
     """Main entry point for RAG bridge"""
     if len(sys.argv) < 2:
-        print("Usage: rag_bridge.py <input_json_file>")
+        print("Usage: rag_bridge.py <input_json_file> | --daemon | --stop")
         sys.exit(1)
 
+    if sys.argv[1] == "--daemon":
+        try:
+            serve()
+        except OSError as e:
+            print(f"[RAG Bridge] Could not bind port {BRIDGE_PORT} (already running?): {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    if sys.argv[1] == "--stop":
+        client = LocalRPCClient(BRIDGE_PORT)
+        try:
+            print(client.call({"rpc": "shutdown"}).get('message'))
+        except LocalRPCError:
+            print("[RAG Bridge] Daemon not running")
+        sys.exit(0)
+
     input_file = sys.argv[1]
 
     try:
@@ -185,14 +265,8 @@ def main():
             print("Error: No output_file specified in command data")
             sys.exit(1)
 
-        # Initialize bridge
-        bridge = RAGBridgeServer()
-
-        if not bridge.initialize():
-            result = {"success": False, "message": "Failed to initialize RAG bridge"}
-        else:
-            # Execute command
-            result = bridge.execute_command(command_data)
+        # Execute command (daemon keeps the model loaded between calls)
+        result = run_command(command_data)
 
         # Write result to output file
         with open(output_file, 'w') as f:
@@ -6,10 +6,10 @@ from datetime import datetime
 # Add RAG to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "RAG" / "core"))
 
-from rag_engine_lite import SynthesisRAG
+from rag_client import connect_rag
 
-# Initialize RAG
-rag = SynthesisRAG(
+# Initialize RAG (shared host keeps the model loaded between runs)
+rag = connect_rag(
     database=str(Path(__file__).parent / "database" / "synthesis_knowledge.db"),
     private_database=str(Path(__file__).parent / "database" / "synthesis_private.db")
 )
@@ -0,0 +1,101 @@
+"""
+Tests for LightweightRAG index snapshots (reload, read-your-writes)
+Runs without the embedding model (a hashing stand-in is passed as model=)
+
+    python -m pytest test_rag_engine_lite.py
+"""
+
+import hashlib
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# RAG/core is not importable as a package from here (Server/core is "core")
+sys.path.insert(0, str(Path(__file__).parent.parent / "RAG" / "core"))
+
+rag_engine_lite = pytest.importorskip("rag_engine_lite")
+if not rag_engine_lite.DEPS_AVAILABLE:
+    pytest.skip("numpy, bm25s or sentence-transformers not installed", allow_module_level=True)
+
+import numpy as np
+
+from rag_engine_lite import LightweightRAG
+
+
+class HashingModel:
+    """SentenceTransformer stand-in: a fixed vector per text"""
+
+    def encode(self, texts):
+        if isinstance(texts, str):
+            return self._vector(texts)
+        return np.stack([self._vector(text) for text in texts])
+
+    @staticmethod
+    def _vector(text):
+        digest = hashlib.sha256(text.encode('utf-8')).digest()
+        return np.frombuffer(digest, dtype=np.uint8)[:16].astype(np.float32)
+
+
+@pytest.fixture
+def engines(tmp_path):
+    """Two engines on the same files: ours, and another process writing to them"""
+    def engine():
+        return LightweightRAG(str(tmp_path / "public.db"), str(tmp_path / "private.db"),
+                              cache_dir=str(tmp_path / "models"), model=HashingModel())
+    return engine(), engine()
+
+
+def _texts(engine):
+    return engine._get_snapshot(engine.private_database).texts
+
+
+def test_own_write_is_visible_at_once(engines):
+    rag, _ = engines
+    assert _texts(rag) == []
+    assert rag.add_text("alpha shader error")
+    assert _texts(rag) == ["alpha shader error"]
+
+
+def test_outside_change_is_reloaded(engines):
+    """Another writer's change keeps the old snapshot serving until reload swaps the new one in"""
+    rag, other = engines
+    rag.add_text("alpha shader error")
+    assert _texts(rag) == ["alpha shader error"]
+
+    other.add_text("beta physics warning")
+    assert rag.reload(rag.private_database, wait=True)
+    assert _texts(rag) == ["alpha shader error", "beta physics warning"]
+    assert rag.cache_stats['reloads'] >= 1
+
+
+def test_late_rebuild_does_not_undo_own_write(engines):
+    """A background rebuild that started before our write is not installed over the newer indexes"""
+    rag, other = engines
+    rag.add_text("alpha shader error")
+    _texts(rag)
+
+    built, release = threading.Event(), threading.Event()
+    build_snapshot = rag._build_snapshot
+
+    def slow_first_build(db_path):
+        snapshot = build_snapshot(db_path)
+        if not built.is_set():
+            built.set()
+            release.wait(5)
+        return snapshot
+
+    rag._build_snapshot = slow_first_build
+    other.add_text("beta physics warning")
+    assert rag.reload(rag.private_database)  # Background rebuild, paused after reading the file
+    assert built.wait(5)
+
+    rag.add_text("gamma own note")
+    expected = ["alpha shader error", "beta physics warning", "gamma own note"]
+    assert _texts(rag) == expected
+
+    rebuild_done = rag._reloading[rag.private_database]
+    release.set()
+    assert rebuild_done.wait(5)
+    assert _texts(rag) == expected
@@ -0,0 +1,131 @@
+"""
+Tests for the shared RAG host and its RemoteRAG client
+Runs without the embedding model (a stand-in engine replaces LightweightRAG)
+
+    python -m pytest test_rag_host.py
+"""
+
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Server/ for core.local_rpc, RAG/core for the host and client
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "RAG" / "core"))
+
+import rag_engine_lite
+from rag_client import RemoteRAG
+from rag_host import RAGHost
+from core.local_rpc import LocalRPCClient, LocalRPCServer
+
+
+class StubEngine:
+    """LightweightRAG stand-in: substring search, slow writes, timing hook"""
+
+    def __init__(self, database, private_database, model_name=None, model=None):
+        self.database = database
+        self.private_database = private_database
+        self.model = model
+        self.docs = []
+        self.cache_stats = {'bm25_hits': 0, 'bm25_misses': 0, 'reloads': 0}
+        self.on_timing = None
+        self.active_writes = 0
+        self.max_active_writes = 0
+
+    def search(self, query, top_k=5, search_type="hybrid", scope="both"):
+        self.cache_stats['bm25_hits'] += 1
+        if self.on_timing:
+            self.on_timing('bm25', 0.002)
+        return [{"content": doc} for doc in self.docs if query in doc][:top_k]
+
+    def add_text(self, text, private=True, metadata=None, fingerprint=None):
+        self.active_writes += 1
+        self.max_active_writes = max(self.max_active_writes, self.active_writes)
+        time.sleep(0.05)
+        self.docs.append(text)
+        self.active_writes -= 1
+        return True
+
+
+@pytest.fixture
+def host(monkeypatch):
+    monkeypatch.setattr(rag_engine_lite, "LightweightRAG", StubEngine)
+    host = RAGHost()
+    host.model = "shared model"  # initialize() would load the real one
+    return host
+
+
+def _request(method, database="a.db", private_database="a_private.db", **kwargs):
+    return {"method": method, "database": database, "private_database": private_database, "kwargs": kwargs}
+
+
+def test_one_engine_per_database_pair(host):
+    engine = host.get_engine("a.db", "a_private.db")
+    assert host.get_engine("a.db", "a_private.db") is engine
+    other = host.get_engine("b.db", "b_private.db")
+    assert other is not engine and other.model is engine.model == "shared model"
+
+
+def test_requests_run_on_the_engine(host):
+    assert host.handle(_request("add_text", text="NullReferenceException in Player"))["result"] is True
+    response = host.handle(_request("search", query="Player"))
+    assert response["success"] and response["result"] == [{"content": "NullReferenceException in Player"}]
+    assert response["timings"] == [("bm25", 0.002)]
+    assert response["cache_stats"]["bm25_hits"] == 1
+
+    assert host.handle(_request("drop_tables"))["success"] is False
+    assert host.handle({"method": "search", "kwargs": {"query": "x"}})["success"] is False
+    stats = host.handle({"method": "stats"})["result"]
+    assert stats["engines"] == 1 and stats["requests"]["write"] == 1 and stats["requests"]["search"] == 1
+
+
+def test_writes_are_serialized_per_engine(host):
+    threads = [threading.Thread(target=host.handle, args=(_request("add_text", text=f"note {i}"),))
+               for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine = host.get_engine("a.db", "a_private.db")
+    assert len(engine.docs) == 4 and engine.max_active_writes == 1
+
+
+def test_remote_rag_round_trip(host, tmp_path):
+    """RemoteRAG calls reach the host engine; stage timings and cache counters come back"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = LocalRPCServer(host.handle, port, name="rag_host")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    client = LocalRPCClient(port)
+    while client.ping() is None:
+        time.sleep(0.02)
+    try:
+        rag = RemoteRAG(str(tmp_path / "public.db"), client=client)
+        timings = []
+        rag.on_timing = lambda stage, seconds: timings.append(stage)
+
+        assert rag.add_text("Shader error in Water")
+        assert rag.search("Water") == [{"content": "Shader error in Water"}]
+        assert timings == ["rag_rpc", "bm25", "rag_rpc"]
+        assert rag.cache_stats["bm25_hits"] == 1
+
+        engine = host.get_engine(rag.public_database, rag.private_database)
+        assert engine.private_database == str(tmp_path / "public_private.db")
+
+        try:
+            rag.add_ai_note("note")  # Not implemented by the stand-in: host reports the error
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("host error was not raised")
+    finally:
+        client.call({"rpc": "shutdown"})
+        client.close()
+        thread.join(timeout=5)
@@ -18,6 +18,7 @@ from datetime import datetime
 
 # Import our detective components
 from unity_log_detective import UnityLogDetective
+from log_watcher import LogWatcher
 from kb_detective import KnowledgeBaseDetective
 from debug_prompt_generator import DebugPromptGenerator
 
@@ -81,6 +82,7 @@ class DetectiveMode:
             enable_ai_confidence_tracking: If True, track AI solution feedback and calculate confidence scores (Phase 4)
         """
         self.log_detective = UnityLogDetective(unity_log_path)
+        self.log_watcher: Optional[LogWatcher] = None  # Created by watch_and_investigate
         self.kb_detective = KnowledgeBaseDetective(kb_path)
         self.prompt_generator = DebugPromptGenerator()
 
@@ -160,13 +162,18 @@ class DetectiveMode:
             'session_start': datetime.now().isoformat()
         }
 
-    def watch_and_investigate(self, check_interval: float = 1.0, max_investigations: int = 0):
+    def watch_and_investigate(self, check_interval: float = 1.0, max_investigations: int = 0,
+                              idle_interval: float = 30.0):
         """
         Watch Unity logs and automatically investigate errors.
 
+        Wakes up when the log changes (inotify on Linux, polling elsewhere).
+        With nothing pending it only checks every idle_interval seconds.
+
         Args:
-            check_interval: How often to check logs (seconds)
+            check_interval: Seconds between checks while errors are pending (polling interval)
             max_investigations: Maximum investigations to run (0 = unlimited)
+            idle_interval: Seconds between checks with nothing pending
         """
         print("🔍 Detective Mode - Active")
         print("=" * 70)
@@ -188,6 +195,9 @@ class DetectiveMode:
             print()
 
         investigations_run = 0
+        self.log_watcher = LogWatcher(self.log_detective.log_path, poll_interval=check_interval)
+        print(f"Log watching: {self.log_watcher.mode}")
+        print()
 
         try:
             while True:
@@ -272,11 +282,18 @@ class DetectiveMode:
                     print(f"⚠️ Error: {result['message']}")
                     time.sleep(5)  # Wait before retrying
 
-                time.sleep(check_interval)
+                # Sleep until the log changes; wake up sooner only for pending work
+                if self.log_detective.has_unread_data:
+                    continue
+                pending = self.error_batch or self.log_detective.has_pending_error
+                timeout = min(check_interval, self.batch_window) if pending else idle_interval
+                self.log_watcher.wait(timeout)
 
         except KeyboardInterrupt:
             print("\n\n🛑 Detective Mode stopped by user")
             self.print_session_summary()
+        finally:
+            self.log_watcher.close()
 
     def get_ai_solution(self, debug_prompt: str) -> Optional[str]:
         """
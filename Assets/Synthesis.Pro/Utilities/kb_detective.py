@@ -76,11 +76,22 @@ class KnowledgeBaseDetective:
                     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     conversation_id INTEGER,
                     times_occurred INTEGER DEFAULT 1,
+                    fingerprint TEXT,
                     FOREIGN KEY (conversation_id) REFERENCES ai_conversations(id)
                 )
             """)
 
+            # Stack fingerprint (same crash, see stack_fingerprint.py) for older tables
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(error_solutions)")}
+            if 'fingerprint' not in columns:
+                cursor.execute("ALTER TABLE error_solutions ADD COLUMN fingerprint TEXT")
+
             # Create indexes for fast lookups
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_error_fingerprint
+                ON error_solutions(fingerprint)
+            """)
+
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_error_type
                 ON error_solutions(error_type)
@@ -118,9 +129,10 @@ class KnowledgeBaseDetective:
         error_type = error.get('type', 'Unknown')
         file_path = error.get('file_path', '')
         file_name = Path(file_path).name if file_path else ''
+        fingerprint = error.get('fingerprint')
 
         # Check cache first (Phase 3 Performance Optimization)
-        cache_key = (error_type, file_name)
+        cache_key = (error_type, file_name, fingerprint)
         if cache_key in self._search_cache:
             cached_result, timestamp = self._search_cache[cache_key]
             # Check if cache is still valid (within TTL)
@@ -135,11 +147,37 @@ class KnowledgeBaseDetective:
             message = error.get('message', '')
 
             similar_errors = []
+            seen_ids = set()
+
+            # Strategy 0: Same stack fingerprint (exact crash, indexed lookup)
+            if fingerprint:
+                cursor.execute("""
+                    SELECT id, error_type, file_path, error_message, solution,
+                           fix_applied, timestamp, times_occurred
+                    FROM error_solutions
+                    WHERE fingerprint = ?
+                    ORDER BY timestamp DESC
+                    LIMIT 3
+                """, (fingerprint,))
+
+                for row in cursor.fetchall():
+                    seen_ids.add(row[0])
+                    similar_errors.append({
+                        'source': 'error_solutions',
+                        'error_type': row[1],
+                        'file_path': row[2],
+                        'problem': row[3],
+                        'solution': row[4],
+                        'fix': row[5],
+                        'date': self._format_date(row[6]),
+                        'occurrences': row[7],
+                        'similarity': 1.0  # Same exception and stack frames
+                    })
 
             # Strategy 1: Search error_solutions table (most precise)
             if file_name:
                 cursor.execute("""
-                    SELECT error_type, file_path, error_message, solution,
+                    SELECT id, error_type, file_path, error_message, solution,
                            fix_applied, timestamp, times_occurred
                     FROM error_solutions
                     WHERE error_type = ?
@@ -149,15 +187,17 @@ class KnowledgeBaseDetective:
                 """, (error_type, f'%{file_name}%', f'%{file_name.replace(".cs", "")}%'))
 
                 for row in cursor.fetchall():
+                    if row[0] in seen_ids:
+                        continue
                     similar_errors.append({
                         'source': 'error_solutions',
-                        'error_type': row[0],
-                        'file_path': row[1],
-                        'problem': row[2],
-                        'solution': row[3],
-                        'fix': row[4],
-                        'date': self._format_date(row[5]),
-                        'occurrences': row[6],
+                        'error_type': row[1],
+                        'file_path': row[2],
+                        'problem': row[3],
+                        'solution': row[4],
+                        'fix': row[5],
+                        'date': self._format_date(row[6]),
+                        'occurrences': row[7],
                         'similarity': 0.95  # High confidence - exact error type + file
                     })
 
@@ -381,16 +421,17 @@ class KnowledgeBaseDetective:
                         fix_applied = ?,
                         timestamp = CURRENT_TIMESTAMP,
                         times_occurred = times_occurred + 1,
-                        conversation_id = ?
+                        conversation_id = ?,
+                        fingerprint = COALESCE(?, fingerprint)
                     WHERE id = ?
-                """, (solution, fix_code, conversation_id, solution_id))
+                """, (solution, fix_code, conversation_id, error.get('fingerprint'), solution_id))
             else:
                 # Insert new record
                 cursor.execute("""
                     INSERT INTO error_solutions
                     (error_type, file_path, line_number, error_message,
-                     code_context, solution, fix_applied, conversation_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                     code_context, solution, fix_applied, conversation_id, fingerprint)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     error.get('type', 'Unknown'),
                     error.get('file_path', 'Unknown'),
@@ -399,7 +440,8 @@ class KnowledgeBaseDetective:
                     error.get('code_context', ''),
                     solution,
                     fix_code,
-                    conversation_id
+                    conversation_id,
+                    error.get('fingerprint')
                 ))
                 solution_id = cursor.lastrowid
 
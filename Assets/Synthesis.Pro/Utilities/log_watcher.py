@@ -0,0 +1,294 @@
+"""
+Log Watcher - wake up when Unity's Editor.log changes instead of polling
+Part of Synthesis AI Detective Mode
+
+On Linux the log's directory is watched with inotify (through ctypes), so
+a write wakes the watcher right away and an idle editor costs no wakeups.
+Elsewhere, or if inotify is unavailable, the file is polled with os.stat.
+Either way, wait() returns when the log (or its replacement) changed, or
+when the timeout expires.
+
+    watcher = LogWatcher(detective.log_path)
+    while True:
+        result = detective.watch_log()
+        ...
+        watcher.wait(timeout=30)
+
+    async for error in watch_errors(detective):   # asyncio consumers
+        ...
+
+Zero external dependencies - uses only Python standard library.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Directory events that can concern the log (written, replaced, rotated, removed)
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_MOVE_SELF)
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len (+ name)
+
+# Seconds between wakeups with no change while something is still pending
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class _Inotify:
+    """Minimal inotify binding via ctypes (Linux only)"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+    def add_watch(self, path: str, mask: int) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), path)
+        return wd
+
+    def read_events(self):
+        """Pending events as (wd, mask, name) without blocking"""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset + _EVENT.size <= len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                events.append((wd, mask, os.fsdecode(name)))
+        return events
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class LogWatcher:
+    """
+    Waits for changes to one log file.
+
+    inotify watches the file's directory rather than the file itself, so
+    a log that is deleted, rotated or recreated (Unity renames Editor.log
+    to Editor-prev.log on start) is still followed. Telling a rotation
+    from an append is left to the reader (UnityLogDetective compares the
+    file's inode).
+    """
+
+    def __init__(self, path: str, poll_interval: float = DEFAULT_POLL_INTERVAL, use_inotify: bool = True):
+        """
+        Args:
+            path: Log file to watch (it and its directory may not exist yet)
+            poll_interval: Seconds between checks when polling
+            use_inotify: Use inotify when available (Linux)
+        """
+        self.path = str(path)
+        self.name = Path(self.path).name
+        self.directory = str(Path(self.path).parent)
+        self.poll_interval = poll_interval
+
+        self._inotify: Optional[_Inotify] = None
+        self._wd: Optional[int] = None
+        self._recheck = False  # Watch (re)established: changes before it are not in the event queue
+        self._last_stat = self._stat()
+        self.stats = {'mode': 'polling', 'wakeups': 0, 'events': 0}
+
+        if use_inotify and path and sys.platform.startswith('linux'):
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                print(f"[LogWatcher] inotify unavailable, polling instead: {e}")
+        self._ensure_watch()
+
+    @property
+    def mode(self) -> str:
+        return 'inotify' if self._wd is not None else 'polling'
+
+    def _ensure_watch(self) -> bool:
+        """(Re)watch the directory; False until it exists"""
+        if self._inotify is None:
+            return False
+        if self._wd is None and os.path.isdir(self.directory):
+            try:
+                self._wd = self._inotify.add_watch(self.directory, WATCH_MASK)
+                self._recheck = True
+            except OSError as e:
+                print(f"[LogWatcher] Could not watch {self.directory}: {e}")
+                self._inotify.close()
+                self._inotify = None
+        self.stats['mode'] = self.mode
+        return self._wd is not None
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _drain(self) -> bool:
+        """Consume queued inotify events; True if any concerns the log"""
+        relevant = False
+        for wd, mask, name in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW:
+                relevant = True
+            elif wd == self._wd and mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                self._wd = None  # Directory gone: poll until it is back
+                relevant = True
+            elif name == self.name:
+                relevant = True
+        if relevant:
+            self.stats['events'] += 1
+        return relevant
+
+    def _changed(self) -> bool:
+        """Log written, replaced or removed since the last wakeup (one write can
+        queue several events, e.g. IN_MODIFY then IN_CLOSE_WRITE)"""
+        current = self._stat()
+        changed = current != self._last_stat
+        self._last_stat = current
+        return changed
+
+    def _missed_change(self) -> bool:
+        """After (re)watching: did the log change while it was not watched?"""
+        if not self._recheck:
+            return False
+        self._recheck = False
+        if self._changed():
+            self.stats['wakeups'] += 1
+            return True
+        return False
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the log changed or timeout seconds passed.
+
+        Args:
+            timeout: Seconds to wait at most (None: until a change)
+
+        Returns:
+            True if the log changed, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+
+            if self._ensure_watch():
+                if self._missed_change():
+                    return True
+                ready, _, _ = select.select([self._inotify.fd], [], [], remaining)
+                if ready and self._drain() and self._changed():
+                    self.stats['wakeups'] += 1
+                    return True
+            else:
+                time.sleep(self.poll_interval if remaining is None else min(self.poll_interval, remaining))
+                if self._changed():
+                    self.stats['wakeups'] += 1
+                    return True
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """wait() for asyncio: the inotify descriptor is watched by the event loop"""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+
+            if self._ensure_watch():
+                if self._missed_change():
+                    return True
+                ready = asyncio.Event()
+                try:
+                    loop.add_reader(self._inotify.fd, ready.set)
+                except NotImplementedError:  # Event loop without fd readers (not on Linux)
+                    return await loop.run_in_executor(None, self.wait, remaining)
+                try:
+                    await asyncio.wait_for(ready.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return False
+                finally:
+                    loop.remove_reader(self._inotify.fd)
+                if self._drain() and self._changed():
+                    self.stats['wakeups'] += 1
+                    return True
+            else:
+                await asyncio.sleep(self.poll_interval if remaining is None else min(self.poll_interval, remaining))
+                if self._changed():
+                    self.stats['wakeups'] += 1
+                    return True
+
+            if deadline is not None and loop.time() >= deadline:
+                return False
+
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._wd = None
+
+
+async def watch_errors(detective, watcher: Optional[LogWatcher] = None,
+                       idle_timeout: float = 30.0) -> AsyncIterator[Dict]:
+    """
+    Parsed errors from a UnityLogDetective's log, as they are written.
+
+    Log reads run in the default executor, so the event loop never blocks
+    on a large append. An exception at the end of the log is yielded once
+    its stack trace ends or the log has been quiet for poll_interval.
+
+    Args:
+        detective: UnityLogDetective (its position and parser state are used)
+        watcher: LogWatcher to use (default: one for detective.log_path, closed on exit)
+        idle_timeout: Seconds between checks with nothing pending (catches missed events)
+    """
+    own_watcher = watcher is None
+    watcher = watcher or LogWatcher(detective.log_path)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            result = await loop.run_in_executor(None, detective.watch_log)
+            for error in result.get('errors', []):
+                yield error
+
+            if detective.has_unread_data:
+                continue  # Read limit reached: keep reading before waiting
+            await watcher.wait_async(watcher.poll_interval if detective.has_pending_error else idle_timeout)
+    finally:
+        if own_watcher:
+            watcher.close()
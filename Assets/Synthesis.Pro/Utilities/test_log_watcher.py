@@ -0,0 +1,119 @@
+"""
+Tests for LogWatcher (inotify and polling) and watch_errors
+
+    python -m pytest test_log_watcher.py
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from log_watcher import LogWatcher, watch_errors
+from unity_log_detective import UnityLogDetective
+
+
+def _append_later(path: Path, data: bytes, delay: float = 0.1):
+    def write():
+        time.sleep(delay)
+        with open(path, 'ab') as f:
+            f.write(data)
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+
+def _check_watcher(use_inotify: bool):
+    directory = Path(tempfile.mkdtemp())
+    watcher = None
+    try:
+        path = directory / "Editor.log"
+        path.write_bytes(b"start\n")
+        watcher = LogWatcher(str(path), poll_interval=0.05, use_inotify=use_inotify)
+
+        assert watcher.wait(timeout=0.2) is False  # Nothing written
+
+        writer = _append_later(path, b"more\n")
+        start = time.monotonic()
+        assert watcher.wait(timeout=5) is True
+        assert time.monotonic() - start < 2
+        writer.join()
+
+        # Leftover events of that write and other files in the directory do not wake it
+        (directory / "other.txt").write_bytes(b"x")
+        assert watcher.wait(timeout=0.2) is False
+
+        # Rotation: the log replaced by a new file
+        os.replace(path, directory / "Editor-prev.log")
+        path.write_bytes(b"new\n")
+        assert watcher.wait(timeout=5) is True
+        return watcher.mode
+    finally:
+        if watcher:
+            watcher.close()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_polling_watcher():
+    assert _check_watcher(use_inotify=False) == 'polling'
+
+
+def test_inotify_watcher():
+    """Uses inotify on Linux (falls back to polling elsewhere)"""
+    mode = _check_watcher(use_inotify=True)
+    assert mode == ('inotify' if sys.platform.startswith('linux') else 'polling')
+
+
+def test_missing_directory_is_picked_up():
+    """A log whose directory does not exist yet is found once it is created"""
+    directory = Path(tempfile.mkdtemp())
+    watcher = None
+    try:
+        path = directory / "Logs" / "Editor.log"
+        watcher = LogWatcher(str(path), poll_interval=0.05)
+        assert watcher.wait(timeout=0.1) is False
+
+        path.parent.mkdir()
+        path.write_bytes(b"hello\n")
+        assert watcher.wait(timeout=5) is True
+    finally:
+        if watcher:
+            watcher.close()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_watch_errors_yields_new_errors():
+    """The async iterator yields errors as they are appended, pending exceptions once quiet"""
+    directory = Path(tempfile.mkdtemp())
+    try:
+        path = directory / "Editor.log"
+        path.write_bytes(b"Assertion failed: old\n")
+        detective = UnityLogDetective(log_path=str(path))
+        detective.seek_to_end()
+
+        async def collect():
+            watcher = LogWatcher(str(path), poll_interval=0.05)
+            errors = []
+            iterator = watch_errors(detective, watcher, idle_timeout=0.2)
+            try:
+                writer = _append_later(path, b"Assertion failed: new\nNullReferenceException: last\n")
+                async for error in iterator:
+                    errors.append(error['message'])
+                    if len(errors) == 2:
+                        break
+                writer.join()
+            finally:
+                await iterator.aclose()
+                watcher.close()
+            return errors
+
+        errors = asyncio.run(asyncio.wait_for(collect(), timeout=10))
+        assert errors == ['new', 'last'], errors
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,131 @@
+"""
+Tests for UnityLogDetective's streaming log parser
+
+    python -m pytest test_unity_log_detective.py
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from unity_log_detective import MAX_LINE_BYTES, LogStreamParser, UnityLogDetective
+
+SAMPLE_LOG = """Initialize engine version: 2022.3.10f1
+Assets/Scripts/Player.cs(12,5): error CS0246: The type or namespace name 'Foo' could not be found
+NullReferenceException: Object reference not set to an instance of an object
+  at Game.Player.Update () [0x00008] in /Project/Assets/Scripts/Player.cs:19
+  at UnityEngine.Internal.Loop.Run () [0x00000] in <a1b2c3>:0
+
+Assertion failed: health >= 0
+IndexOutOfRangeException: Index was outside the bounds of the array.
+  at Game.Inventory.Get (System.Int32 index) [0x00001] in /Project/Assets/Scripts/Inventory.cs:88
+Refreshing native plugins (Ünïcode → ok)
+InvalidOperationException: Collection was modified
+  at Game.Spawner.Tick () [0x00020] in /Project/Assets/Scripts/Spawner.cs:7
+"""
+
+
+def _detective() -> UnityLogDetective:
+    return UnityLogDetective(log_path=os.devnull)
+
+
+def _parse(chunks, patterns):
+    parser = LogStreamParser(patterns)
+    errors = []
+    for chunk in chunks:
+        errors += parser.feed(chunk)
+    return errors + parser.flush(end_of_input=True)
+
+
+def _comparable(errors):
+    return [{k: v for k, v in error.items() if k != 'timestamp'} for error in errors]
+
+
+def test_results_independent_of_read_boundaries():
+    """Any split of the log into reads gives the same errors as one read"""
+    patterns = _detective().patterns
+    data = SAMPLE_LOG.encode('utf-8')
+    expected = _comparable(_parse([data], patterns))
+    assert [e['type'] for e in expected] == [
+        'CompilerError', 'NullReferenceException', 'Assertion', 'IndexOutOfRangeException',
+        'InvalidOperationException'
+    ], expected
+    assert expected[1]['file_path'].endswith('Player.cs') and expected[1]['line'] == 19
+    assert expected[1]['fingerprint']
+
+    rng = random.Random(49)
+    for _ in range(50):
+        cuts = sorted(rng.sample(range(1, len(data)), rng.randint(1, 12)))
+        chunks = [data[a:b] for a, b in zip([0] + cuts, cuts + [len(data)])]
+        assert _comparable(_parse(chunks, patterns)) == expected, cuts
+
+    # Byte by byte, including splits inside multi-byte characters
+    assert _comparable(_parse([data[i:i + 1] for i in range(len(data))], patterns)) == expected
+
+
+def test_pending_exception_waits_for_frames():
+    """An exception at the end of a read is only reported once its stack trace ended"""
+    parser = LogStreamParser(_detective().patterns)
+    assert parser.feed(b"NullReferenceException: boom\n  at Game.A.B () [0x0] in /P/Assets/A.cs:3\n") == []
+    assert parser.has_pending
+    errors = parser.feed(b"  at Game.C.D () [0x0] in /P/Assets/C.cs:9\nplain line\n")
+    assert len(errors) == 1 and len(errors[0]['stack_trace']) == 2
+    assert not parser.has_pending
+
+
+def test_crlf_bom_and_invalid_utf8():
+    """Windows line endings, a BOM and undecodable bytes do not break parsing"""
+    patterns = _detective().patterns
+    data = b"\xef\xbb\xbfNullReferenceException: caf\xe9 \xff\r\n" \
+           b"  at Game.A.B () [0x0] in /P/Assets/A.cs:3\r\n" \
+           b"Assertion failed: ok\r\n"
+    errors = _parse([data], patterns)
+    assert [e['type'] for e in errors] == ['NullReferenceException', 'Assertion']
+    assert errors[0]['line'] == 3 and not errors[0]['message'].endswith('\r')
+    assert errors[1]['message'] == 'ok'
+
+
+def test_over_long_line_is_capped():
+    """A huge line is cut to MAX_LINE_BYTES and does not swallow the next lines"""
+    patterns = _detective().patterns
+    huge = b"NullReferenceException: " + b"x" * (MAX_LINE_BYTES * 3) + b"\n"
+    tail = b"Assertion failed: after\n"
+    for chunks in ([huge + tail], [huge[:1000], huge[1000:MAX_LINE_BYTES * 2], huge[MAX_LINE_BYTES * 2:] + tail]):
+        parser = LogStreamParser(patterns)
+        errors = []
+        for chunk in chunks:
+            errors += parser.feed(chunk)
+            assert len(parser._partial) <= MAX_LINE_BYTES
+        errors += parser.flush(end_of_input=True)
+        assert [e['type'] for e in errors] == ['NullReferenceException', 'Assertion']
+        assert len(errors[0]['message']) < MAX_LINE_BYTES
+
+
+def test_watch_log_follows_appends_and_rotation():
+    """watch_log reads only new content and starts over when the file is replaced"""
+    directory = tempfile.mkdtemp()
+    try:
+        path = Path(directory) / "Editor.log"
+        path.write_bytes(b"Assertion failed: one\nNullReferenceException: two\n")
+        detective = UnityLogDetective(log_path=str(path))
+
+        result = detective.watch_log()
+        assert [e['message'] for e in result['errors']] == ['one']
+        assert detective.has_pending_error
+        assert [e['message'] for e in detective.watch_log()['errors']] == ['two']  # Quiet: flushed
+
+        with open(path, 'ab') as f:
+            f.write(b"Assertion failed: three\n")
+        assert [e['message'] for e in detective.watch_log()['errors']] == ['three']
+
+        # Unity restart: Editor.log renamed away, a new (smaller) file written
+        os.replace(path, Path(directory) / "Editor-prev.log")
+        path.write_bytes(b"Assertion failed: four\n")
+        assert [e['message'] for e in detective.watch_log()['errors']] == ['four']
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -1,11 +1,20 @@
 """
 Unity Console Reporter for Detective Mode
 Sends investigation results to Unity's console in real-time via HTTP
+
+Reports are queued and posted by a background thread, so a slow or
+absent Unity HTTP server never slows down an investigation. Lines queued
+close together are merged into one POST; when the queue is full the
+oldest lines are dropped.
 """
 
+import atexit
+import threading
+import time
 import requests
 import json
-from typing import Dict, Optional
+from collections import deque
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 
@@ -15,16 +24,36 @@ class UnityConsoleReporter:
     Uses the existing SynLink HTTP server on port 9765.
     """
 
-    def __init__(self, unity_http_port: int = 9765):
+    # Longest merged message per POST (Unity console truncates very long entries)
+    MAX_MESSAGE_CHARS = 8000
+
+    def __init__(self, unity_http_port: int = 9765, max_queue: int = 500,
+                 max_batch: int = 20, linger: float = 0.05):
         """
         Initialize Unity Console Reporter.
 
         Args:
             unity_http_port: Port for Unity's HTTP server (default: 9765)
+            max_queue: Queued lines kept before the oldest are dropped
+            max_batch: Most lines sent in one POST
+            linger: Seconds the sender waits for more lines before posting
         """
         self.unity_http_port = unity_http_port
         self.base_url = f"http://localhost:{unity_http_port}/"
         self.enabled = True
+        self.max_batch = max_batch
+        self.linger = linger
+
+        # Pooled keep-alive connection for the ping and the sender thread
+        self.session = requests.Session()
+
+        self._queue: deque = deque(maxlen=max_queue)
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+        self._sender: Optional[threading.Thread] = None
+        self.stats = {'queued': 0, 'sent': 0, 'posts': 0, 'dropped': 0, 'failed': 0}
+
         self.test_connection()
 
     def test_connection(self) -> bool:
@@ -35,7 +64,7 @@ class UnityConsoleReporter:
             True if connected, False otherwise
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 json={"command": "ping"},
                 timeout=2
@@ -58,34 +87,132 @@ class UnityConsoleReporter:
 
     def send_log(self, message: str, log_type: str = "log") -> bool:
         """
-        Send a log message to Unity console.
+        Queue a log message for Unity console (returns immediately).
 
         Args:
             message: Message to log
             log_type: Type of log (log, warning, error)
 
         Returns:
-            True if successful, False otherwise
+            True if queued, False if reporting is disabled
         """
-        if not self.enabled:
+        if not self.enabled or self._closed:
             return False
 
-        try:
-            response = requests.post(
-                self.base_url,
-                json={
-                    "command": "log",
-                    "args": {
-                        "message": message,
-                        "type": log_type
-                    }
-                },
-                timeout=5
-            )
-            return response.status_code == 200
-        except Exception as e:
-            # Silently fail - don't spam console if Unity disconnects
-            return False
+        with self._cond:
+            if len(self._queue) == self._queue.maxlen:
+                # deque(maxlen) drops the oldest line on append
+                self.stats['dropped'] += 1
+            self._queue.append((log_type, message))
+            self.stats['queued'] += 1
+            self._cond.notify()
+
+        if self._sender is None:
+            self._start_sender()
+        return True
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        Wait until queued messages have been posted.
+
+        Returns:
+            True if the queue drained within timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._sender is None:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 2.0):
+        """Flush (up to timeout), stop the sender and close the HTTP session."""
+        if self._closed:
+            return
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._sender is not None:
+            self._sender.join(timeout=1.0)
+        self.session.close()
+
+    def _start_sender(self):
+        with self._cond:
+            if self._sender is not None:
+                return
+            self._sender = threading.Thread(target=self._send_loop, name="unity-console-reporter", daemon=True)
+            self._sender.start()
+        # Deliver what is queued when the process exits (e.g. the session summary)
+        atexit.register(self.close)
+
+    def _send_loop(self):
+        failures = 0
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+
+            # Let a burst of reports (one investigation step after another) accumulate
+            if self.linger > 0:
+                time.sleep(self.linger)
+
+            with self._cond:
+                batch = [self._queue.popleft() for _ in range(min(self.max_batch, len(self._queue)))]
+                self._in_flight = len(batch)
+
+            ok = self._post_batch(batch)
+
+            with self._cond:
+                self._in_flight = 0
+                self._cond.notify_all()
+
+            if ok:
+                failures = 0
+            else:
+                # Unity unreachable: back off instead of spinning on timeouts
+                failures += 1
+                time.sleep(min(0.5 * 2 ** failures, 10.0))
+
+    def _post_batch(self, batch: List[Tuple[str, str]]) -> bool:
+        """Post queued lines, merging consecutive lines of the same type into one message"""
+        messages: List[List] = []  # [log_type, text, line count]
+        for log_type, message in batch:
+            if messages and messages[-1][0] == log_type \
+                    and len(messages[-1][1]) + len(message) < self.MAX_MESSAGE_CHARS:
+                messages[-1][1] += "\n\n" + message
+                messages[-1][2] += 1
+            else:
+                messages.append([log_type, message, 1])
+
+        for i, (log_type, message, count) in enumerate(messages):
+            try:
+                response = self.session.post(
+                    self.base_url,
+                    json={
+                        "command": "log",
+                        "args": {
+                            "message": message,
+                            "type": log_type
+                        }
+                    },
+                    timeout=5
+                )
+            except Exception:
+                # Silently fail - don't spam console if Unity disconnects
+                self.stats['failed'] += sum(m[2] for m in messages[i:])
+                return False
+
+            self.stats['posts'] += 1
+            if response.status_code == 200:
+                self.stats['sent'] += count
+            else:
+                self.stats['failed'] += count
+        return True
 
     def report_error_detected(self, error: Dict) -> bool:
         """
@@ -341,7 +468,8 @@ def test_unity_console_reporter():
     ])
     reporter.report_investigation_complete(0.85)
 
-    print("Test messages sent to Unity console!")
+    reporter.flush()
+    print(f"Test messages sent to Unity console! ({reporter.stats['posts']} POSTs)")
 
 
 if __name__ == "__main__":
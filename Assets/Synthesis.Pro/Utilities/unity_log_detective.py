@@ -3,18 +3,215 @@ Unity Log Detective - Real-time Unity error monitoring and analysis
 Part of Synthesis AI Detective Mode
 
 Monitors Unity's Editor.log for errors, parses stack traces, and prepares
-structured error reports for AI debugging assistance.
+structured error reports for AI debugging assistance. The log is parsed as
+a stream of lines, so reads can stop anywhere (mid-line, mid-stack-trace)
+and huge appends are processed in bounded chunks.
 
 Zero external dependencies - uses only Python standard library.
 """
 
 import os
 import re
+import sys
 import time
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+# Stack fingerprints shared with the server's console capture
+sys.path.insert(0, str(Path(__file__).parent.parent / "Server" / "context_systems"))
+from stack_fingerprint import fingerprint, parse_frame
+
+# Log bytes read per watch_log call (the rest is read on the next call)
+MAX_READ_BYTES = 4 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+# Longer lines are cut (e.g. serialized data dumped to the log)
+MAX_LINE_BYTES = 16 * 1024
+
+# Frames kept per exception (fingerprint), and non-frame lines allowed
+# between an exception and its first frame
+MAX_FRAMES = 32
+MAX_MESSAGE_LINES = 5
+
+
+class LogStreamParser:
+    """
+    Incremental, line-oriented parser for Editor.log content.
+
+    Feed bytes as they are read. A line split across reads, and an
+    exception whose stack trace continues in the next read, are carried
+    over, so results never depend on where a read stopped. Memory is
+    bounded by one line plus one pending exception.
+
+    States: idle, or collecting the frames of a pending exception (until
+    the first line that is not a frame).
+    """
+
+    def __init__(self, patterns: Dict):
+        self.patterns = patterns
+        self._partial = bytearray()  # Incomplete last line
+        self._overflow = False  # Dropping the rest of an over-long line
+        self._pending: Optional[Dict] = None  # Exception still collecting frames
+        self._frames: List[Dict] = []
+        self._message_lines = 0
+
+    @property
+    def has_pending(self) -> bool:
+        """An exception is waiting for more frames"""
+        return self._pending is not None
+
+    def reset(self):
+        """Forget carried-over state (log truncated or replaced)"""
+        self._partial.clear()
+        self._overflow = False
+        self._pending = None
+        self._frames = []
+        self._message_lines = 0
+
+    def feed(self, data: bytes) -> List[Dict]:
+        """
+        Parse the next bytes of the log.
+
+        Returns:
+            Errors completed by these bytes
+        """
+        errors = []
+        start = 0
+        while True:
+            end = data.find(b'\n', start)
+            if end < 0:
+                self._carry(data[start:])
+                break
+
+            if self._partial or self._overflow:
+                self._carry(data[start:end])
+                raw = bytes(self._partial)
+                self._partial.clear()
+                self._overflow = False
+            else:
+                raw = data[start:end][:MAX_LINE_BYTES]
+            self._line(self._decode(raw), errors)
+            start = end + 1
+        return errors
+
+    def flush(self, end_of_input: bool = False) -> List[Dict]:
+        """
+        Finish a pending exception (e.g. once the log went quiet).
+
+        Args:
+            end_of_input: Also parse an unterminated last line (no more data follows)
+        """
+        errors = []
+        if end_of_input and (self._partial or self._overflow):
+            raw = bytes(self._partial)
+            self._partial.clear()
+            self._overflow = False
+            self._line(self._decode(raw), errors)
+        if self._pending is not None and not self._partial:
+            errors.append(self._finish())
+        return errors
+
+    def _carry(self, piece: bytes):
+        if self._overflow:
+            return
+        room = MAX_LINE_BYTES - len(self._partial)
+        if len(piece) > room:
+            self._partial += piece[:room]
+            self._overflow = True
+        else:
+            self._partial += piece
+
+    @staticmethod
+    def _decode(raw: bytes) -> str:
+        # Windows line endings, a BOM at the start of the file, invalid bytes
+        line = raw.decode('utf-8', errors='replace').rstrip('\r')
+        return line[1:] if line.startswith('\ufeff') else line
+
+    def _line(self, line: str, errors: List[Dict]):
+        if self._pending is not None:
+            frame = parse_frame(line)
+            if frame:
+                if len(self._frames) < MAX_FRAMES:
+                    self._frames.append(frame)
+                return
+
+        error = self._header(line)
+        if self._pending is not None:
+            if error is None and not self._frames and self._message_lines < MAX_MESSAGE_LINES:
+                self._message_lines += 1  # Message continues before the stack trace
+                return
+            errors.append(self._finish())
+
+        if error is None:
+            return
+        if error['severity'] == 'exception':
+            self._pending = error
+        else:
+            errors.append(error)
+
+    def _header(self, line: str) -> Optional[Dict]:
+        """Error starting on this line (cheap substring checks before the regexes)"""
+        if 'error' in line:
+            match = self.patterns['compiler_error'].match(line)
+            if match:
+                return {
+                    'type': 'CompilerError',
+                    'severity': 'error',
+                    'file_path': match.group(1).strip(),
+                    'line': int(match.group(2)),
+                    'column': int(match.group(3)),
+                    'error_code': match.group(4).strip(),
+                    'message': match.group(5).strip(),
+                    'timestamp': datetime.now().isoformat(),
+                    'stack_trace': None
+                }
+
+        if 'Exception' in line:
+            match = self.patterns['exception'].match(line)
+            if match:
+                return {
+                    'type': match.group(1).strip(),
+                    'severity': 'exception',
+                    'message': match.group(2).strip(),
+                    'timestamp': datetime.now().isoformat()
+                }
+
+        if line.startswith('Assertion'):
+            match = self.patterns['assertion'].match(line)
+            if match:
+                return {
+                    'type': 'Assertion',
+                    'severity': 'assertion',
+                    'message': match.group(1).strip(),
+                    'timestamp': datetime.now().isoformat()
+                }
+
+        return None
+
+    def _finish(self) -> Dict:
+        """Complete the pending exception with its frames"""
+        pending, frames = self._pending, self._frames
+        self._pending, self._frames, self._message_lines = None, [], 0
+
+        # First frame in project code is usually the error location
+        location = next((frame for frame in frames if frame['file'] and 'Assets' in frame['file']), None)
+
+        return {
+            'type': pending['type'],
+            'severity': 'exception',
+            'file_path': location['file'] if location else 'Unknown',
+            'line': (location['line'] or 0) if location else 0,
+            'method': location['method'] if location else 'Unknown',
+            'message': pending['message'],
+            'timestamp': pending['timestamp'],
+            'stack_trace': [  # Limit to first 10 frames
+                {'method': frame['method'], 'file': frame['file'] or 'Unknown', 'line': frame['line'] or 0}
+                for frame in frames[:10]
+            ],
+            'fingerprint': fingerprint(pending['type'], (frame['method'] for frame in frames))
+        }
+
 
 class UnityLogDetective:
     """
@@ -31,6 +228,7 @@ class UnityLogDetective:
         """
         self.log_path = log_path or self._find_unity_log()
         self.last_position = 0
+        self._log_identity = None  # (device, inode) of the file last_position refers to
         self.detected_errors = []
 
         # Code context cache (Phase 3 Performance Optimization)
@@ -71,6 +269,9 @@ class UnityLogDetective:
             )
         }
 
+        # Carries partial lines and stack traces between reads
+        self._parser = LogStreamParser(self.patterns)
+
     def _find_unity_log(self) -> str:
         """
         Auto-detect Unity Editor.log location based on OS.
@@ -114,6 +315,10 @@ class UnityLogDetective:
         """
         Check for new errors in the log file.
 
+        Reads at most MAX_READ_BYTES per call (the rest on the next call).
+        An exception at the end of the new content is reported once its
+        stack trace has ended, or on the next call with no new content.
+
         Args:
             check_interval: How often to check (seconds)
 
@@ -128,30 +333,43 @@ class UnityLogDetective:
             }
 
         try:
-            # Get current file size
-            file_size = os.path.getsize(self.log_path)
-
-            # If file was truncated (Unity restart), reset position
-            if file_size < self.last_position:
-                self.last_position = 0
-
-            # Only read new content
+            # Get current file size and identity
+            stat = os.stat(self.log_path)
+            file_size = stat.st_size
+            identity = (stat.st_dev, stat.st_ino)
+
+            # If the file was replaced (Unity restart rotates Editor.log) or
+            # truncated, start over at the beginning of the new content
+            if identity != self._log_identity or file_size < self.last_position:
+                if self._log_identity is not None:
+                    self.last_position = 0
+                    self._parser.reset()
+                self._log_identity = identity
+
+            # Only read new content, in bounded chunks
+            errors = []
             if file_size > self.last_position:
-                with open(self.log_path, 'r', encoding='utf-8', errors='ignore') as f:
+                with open(self.log_path, 'rb') as f:
                     f.seek(self.last_position)
-                    new_content = f.read()
+                    remaining = MAX_READ_BYTES
+                    while remaining > 0:
+                        chunk = f.read(min(READ_CHUNK_BYTES, remaining))
+                        if not chunk:
+                            break
+                        remaining -= len(chunk)
+                        errors.extend(self._parser.feed(chunk))
                     self.last_position = f.tell()
-
-                    # Parse new errors
-                    errors = self._parse_errors(new_content)
-
-                    if errors:
-                        self.detected_errors.extend(errors)
-                        return {
-                            'status': 'errors_found',
-                            'count': len(errors),
-                            'errors': errors
-                        }
+            else:
+                # Log went quiet: an exception waiting for more frames is complete
+                errors = self._parser.flush()
+
+            if errors:
+                self.detected_errors.extend(errors)
+                return {
+                    'status': 'errors_found',
+                    'count': len(errors),
+                    'errors': errors
+                }
 
             return {
                 'status': 'no_new_errors',
@@ -165,83 +383,41 @@ class UnityLogDetective:
                 'errors': []
             }
 
+    @property
+    def has_pending_error(self) -> bool:
+        """An error at the end of the log is not complete yet (see watch_log)"""
+        return self._parser.has_pending
+
+    @property
+    def has_unread_data(self) -> bool:
+        """The last watch_log stopped at MAX_READ_BYTES before the end of the log"""
+        try:
+            return os.path.getsize(self.log_path) > self.last_position
+        except OSError:
+            return False
+
+    def seek_to_end(self):
+        """Skip existing log content: watch_log reports only errors written from now on"""
+        try:
+            stat = os.stat(self.log_path)
+        except OSError:
+            return
+        self.last_position = stat.st_size
+        self._log_identity = (stat.st_dev, stat.st_ino)
+        self._parser.reset()
+
     def _parse_errors(self, content: str) -> List[Dict]:
         """
-        Parse error information from log content.
+        Parse error information from complete log content.
 
         Args:
             content: Raw log content to parse
 
         Returns:
-            List of structured error dictionaries
+            List of structured error dictionaries, in log order
         """
-        errors = []
-
-        # Find all compiler errors
-        for match in self.patterns['compiler_error'].finditer(content):
-            errors.append({
-                'type': 'CompilerError',
-                'severity': 'error',
-                'file_path': match.group(1).strip(),
-                'line': int(match.group(2)),
-                'column': int(match.group(3)),
-                'error_code': match.group(4).strip(),
-                'message': match.group(5).strip(),
-                'timestamp': datetime.now().isoformat(),
-                'stack_trace': None
-            })
-
-        # Find all runtime exceptions
-        exception_matches = list(self.patterns['exception'].finditer(content))
-        for i, match in enumerate(exception_matches):
-            exception_type = match.group(1).strip()
-            exception_message = match.group(2).strip()
-
-            # Try to find stack trace for this exception
-            # Look ahead in content for stack trace lines
-            exception_end = match.end()
-            content_after = content[exception_end:exception_end + 2000]  # Look ahead 2KB
-
-            stack_traces = []
-            file_path = None
-            line_number = None
-            method_name = None
-
-            for stack_match in self.patterns['stack_trace'].finditer(content_after):
-                stack_info = {
-                    'method': stack_match.group(1).strip(),
-                    'file': stack_match.group(2).strip(),
-                    'line': int(stack_match.group(3))
-                }
-                stack_traces.append(stack_info)
-
-                # First stack frame is usually the error location
-                if not file_path and 'Assets' in stack_info['file']:
-                    file_path = stack_info['file']
-                    line_number = stack_info['line']
-                    method_name = stack_info['method']
-
-            errors.append({
-                'type': exception_type,
-                'severity': 'exception',
-                'file_path': file_path or 'Unknown',
-                'line': line_number or 0,
-                'method': method_name or 'Unknown',
-                'message': exception_message,
-                'timestamp': datetime.now().isoformat(),
-                'stack_trace': stack_traces[:10]  # Limit to first 10 frames
-            })
-
-        # Find assertions
-        for match in self.patterns['assertion'].finditer(content):
-            errors.append({
-                'type': 'Assertion',
-                'severity': 'assertion',
-                'message': match.group(1).strip(),
-                'timestamp': datetime.now().isoformat()
-            })
-
-        return errors
+        parser = LogStreamParser(self.patterns)
+        return parser.feed(content.encode('utf-8')) + parser.flush(end_of_input=True)
 
     def get_error_summary(self) -> Dict:
         """